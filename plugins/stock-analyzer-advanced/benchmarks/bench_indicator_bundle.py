@@ -0,0 +1,69 @@
+"""indicator_bundle 벤치마크
+
+get_ti_full_analysis가 쓰던 개별 지표 호출(rsi, macd, bollinger, stochastic, sma×3)과
+indicator_bundle(last_only=True)의 종목당 계산 시간 비교
+
+실행:
+    python benchmarks/bench_indicator_bundle.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from utils.indicators import sma, rsi, macd, bollinger, stochastic, indicator_bundle
+
+
+def _sample(rows: int) -> pd.DataFrame:
+    np.random.seed(42)
+    close = 70000 + np.cumsum(np.random.randn(rows) * 800)
+    return pd.DataFrame({"고가": close * 1.02, "저가": close * 0.98, "종가": close})
+
+
+def per_indicator(df: pd.DataFrame) -> dict:
+    """기존 방식: 지표별 pandas 계산 후 마지막 값"""
+    close, high, low = df["종가"], df["고가"], df["저가"]
+    macd_line, signal_line, hist = macd(close)
+    upper, middle, lower = bollinger(close)
+    k, d = stochastic(high, low, close)
+    return {
+        "rsi": rsi(close).iloc[-1],
+        "macd": macd_line.iloc[-1],
+        "macd_signal": signal_line.iloc[-1],
+        "macd_hist": hist.iloc[-1],
+        "bb_upper": upper.iloc[-1],
+        "bb_middle": middle.iloc[-1],
+        "bb_lower": lower.iloc[-1],
+        "stoch_k": k.iloc[-1],
+        "stoch_d": d.iloc[-1],
+        "ma5": sma(close, 5).iloc[-1],
+        "ma20": sma(close, 20).iloc[-1],
+        "ma60": sma(close, 60).iloc[-1],
+    }
+
+
+def bundle(df: pd.DataFrame) -> dict:
+    return indicator_bundle(df["고가"], df["저가"], df["종가"])
+
+
+def main(repeat: int = 200) -> None:
+    print(f"{'rows':>6} {'per-indicator':>15} {'bundle':>10} {'speedup':>8}")
+    for rows in (60, 252):
+        df = _sample(rows)
+
+        expected = per_indicator(df)
+        actual = bundle(df)
+        for key, value in expected.items():
+            assert np.isclose(actual[key], value, rtol=1e-10, equal_nan=True), key
+
+        base = min(timeit.repeat(lambda: per_indicator(df), number=repeat, repeat=5)) / repeat
+        fused = min(timeit.repeat(lambda: bundle(df), number=repeat, repeat=5)) / repeat
+        print(f"{rows:>6} {base * 1e6:>13.0f}us {fused * 1e6:>8.0f}us {base / fused:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
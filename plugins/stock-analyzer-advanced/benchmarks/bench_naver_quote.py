@@ -0,0 +1,142 @@
+"""네이버 시세 조회 벤치마크
+
+종목당 전송 바이트와 파싱 시간 비교
+- get_naver_stock_info (기존): item/main.naver 전체 + 전체 BeautifulSoup 트리
+- 부분 파싱: 같은 페이지에서 시세 영역만 트리로 만듦 (SoupStrainer)
+- get_naver_quote: 폴링 API JSON (+ 시가총액/외국인비율은 시장 스냅샷)
+경로별 비교는 저장된 응답을 돌려주는 가짜 http_get으로 실제 get_naver_quote를 호출해
+요청 수/전송 바이트/시간을 잰다 (스냅샷 있음/없음, 필요한 항목이 PER/PBR뿐인 경우)
+
+실행:
+    python benchmarks/bench_naver_quote.py                          # tests/fixtures 샘플 (실제 페이지 크기로 부풀림)
+    python benchmarks/bench_naver_quote.py saved_main.html saved.json  # 저장해 둔 실제 응답 (같은 종목)
+"""
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import market_snapshot, web_scraper
+from utils.web_scraper import get_naver_quote, get_naver_stock_info, parse_polling_quote, parse_stock_info_html
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# 실제 종목 페이지는 뉴스/공시/재무 요약/동일업종 비교 표가 대부분이므로 그만큼 채워 넣음
+TARGET_BYTES = 250_000
+FILLER = (
+    '<div class="section"><table class="tb_type1"><tbody>'
+    + "".join(
+        f'<tr><th scope="row"><a href="/item/news_read.naver?article_id={r}">항목 {r}</a></th>'
+        + "".join(f'<td class="num"><span class="tah p11">{r * 100 + c:,}</span></td>' for c in range(8))
+        + "</tr>"
+        for r in range(30)
+    )
+    + "</tbody></table></div>\n"
+)
+
+
+def _padded(html: str) -> str:
+    """샘플 페이지 본문(#content)에 관련 없는 표를 붙여 실제 페이지 크기로 만듦"""
+    fillers = []
+    size = len(html.encode("utf-8"))
+    while size < TARGET_BYTES:
+        fillers.append(FILLER)
+        size += len(FILLER.encode("utf-8"))
+    return html.replace('<div id="content">', '<div id="content">\n' + "".join(fillers), 1)
+
+
+def _ticker(payload: dict) -> str:
+    return payload["result"]["areas"][0]["datas"][0]["cd"]
+
+
+class _SavedResponses:
+    """저장된 응답을 돌려주며 요청 수/바이트를 세는 http_get 대역"""
+
+    def __init__(self, html: str, raw_json: str):
+        self.html = html
+        self.raw_json = raw_json
+        self.requests = 0
+        self.bytes = 0
+
+    def __call__(self, url: str, **kwargs):
+        self.requests += 1
+        if "polling" in url:
+            self.bytes += len(self.raw_json.encode("utf-8"))
+            return _Response(self.raw_json)
+        self.bytes += len(self.html.encode("utf-8"))
+        return _Response(self.html)
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def bench_paths(html: str, raw_json: str, ticker: str, repeat: int) -> None:
+    """get_naver_stock_info / get_naver_quote 경로별 요청 수, 전송 바이트, 시간"""
+    page = parse_stock_info_html(html)
+    snapshot_row = {"market_cap": page.get("market_cap"), "foreign_ratio": page.get("foreign_ratio")}
+    cases = [
+        ("stock_info", None, lambda: get_naver_stock_info(ticker)),
+        ("quote+snapshot", snapshot_row, lambda: get_naver_quote(ticker)),
+        ("quote, no snapshot", None, lambda: get_naver_quote(ticker)),
+        ("quote per/pbr", None, lambda: get_naver_quote(ticker, fields=("per", "pbr"))),
+    ]
+
+    original_get, original_lookup = web_scraper.http_get, market_snapshot.lookup_snapshot
+    print(f"{'path':>18} {'reqs':>5} {'bytes':>10} {'time':>10} {'speedup':>8}")
+    try:
+        base = None
+        for name, row, func in cases:
+            responses = _SavedResponses(html, raw_json)
+            web_scraper.http_get = responses
+            market_snapshot.lookup_snapshot = lambda ticker, row=row: row
+            result = func()
+            assert all(result[key] == value for key, value in page.items() if key in result), name
+            requests, size = responses.requests, responses.bytes
+            elapsed = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+            base = base or elapsed
+            print(f"{name:>18} {requests:>5} {size / 1024:>7.1f}KiB {elapsed * 1e3:>8.2f}ms {base / elapsed:>7.1f}x")
+    finally:
+        web_scraper.http_get, market_snapshot.lookup_snapshot = original_get, original_lookup
+
+
+def main(paths: list, repeat: int = 20) -> None:
+    if paths:
+        html = Path(paths[0]).read_text(encoding="utf-8")
+        raw_json = Path(paths[1]).read_text(encoding="utf-8")
+    else:
+        html = _padded((FIXTURE_DIR / "naver_item_main.html").read_text(encoding="utf-8"))
+        raw_json = (FIXTURE_DIR / "naver_polling.json").read_text(encoding="utf-8")
+    ticker = _ticker(json.loads(raw_json))
+
+    full = parse_stock_info_html(html, targeted=False)
+    assert parse_stock_info_html(html) == full
+    polled = parse_polling_quote(json.loads(raw_json), ticker)
+    assert polled is not None
+
+    engines = [
+        ("full tree", len(html.encode("utf-8")), lambda: parse_stock_info_html(html, targeted=False)),
+        ("SoupStrainer", len(html.encode("utf-8")), lambda: parse_stock_info_html(html)),
+        ("polling JSON", len(raw_json.encode("utf-8")), lambda: parse_polling_quote(json.loads(raw_json), ticker)),
+    ]
+
+    print(f"ticker {ticker}: 페이지 항목 {len(full)}개, 폴링 항목 {len(polled)}개 (나머지는 시장 스냅샷)")
+    print(f"{'engine':>14} {'bytes':>10} {'parse':>10} {'speedup':>8}")
+    base = None
+    for name, size, func in engines:
+        elapsed = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+        base = base or elapsed
+        print(f"{name:>14} {size / 1024:>7.1f}KiB {elapsed * 1e3:>8.2f}ms {base / elapsed:>7.1f}x")
+
+    print()
+    bench_paths(html, raw_json, ticker, repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -85,3 +85,15 @@ def sample_market_cap_df():
         '상장주식수': [5969782550],
         '외국인보유주식수': [3000000000],
     }, index=dates)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """로컬 캐시를 테스트별 임시 디렉토리로 격리 (메모리 종목 마스터 포함)"""
+    from utils.ticker_master import clear_ticker_master
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(cache_dir))
+    clear_ticker_master()
+    yield cache_dir
+    clear_ticker_master()
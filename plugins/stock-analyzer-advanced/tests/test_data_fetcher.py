@@ -4,6 +4,13 @@ import pandas as pd
 from datetime import datetime
 
 
+@pytest.fixture
+def no_master_network(mocker):
+    """종목 마스터 생성 시 Naver/KRX 실제 요청 차단 (테스트에서 필요하면 다시 patch)"""
+    mocker.patch('utils.web_scraper.get_naver_stock_list', return_value=None)
+    mocker.patch('utils.web_scraper.get_krx_listing_dates', return_value=None)
+
+
 class TestGetOhlcv:
     """get_ohlcv() 테스트"""
 
@@ -64,6 +71,7 @@ class TestGetOhlcv:
         assert "005930" in call_args[0]
 
 
+@pytest.mark.usefixtures("no_master_network")
 class TestGetTickerName:
     """get_ticker_name() 테스트"""
 
@@ -98,6 +106,7 @@ class TestGetTickerName:
         assert result is None
 
 
+@pytest.mark.usefixtures("no_master_network")
 class TestGetTickerList:
     """get_ticker_list() 테스트"""
 
@@ -281,6 +290,7 @@ def test_get_market_cap_with_fallback():
 # Tests for deprecated functions are in test_deprecated.py
 
 
+@pytest.mark.usefixtures("no_master_network")
 class TestGetTickerListWithFallback:
     """get_ticker_list() Naver fallback 테스트"""
 
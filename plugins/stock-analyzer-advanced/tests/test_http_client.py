@@ -0,0 +1,177 @@
+"""http_client.py 테스트"""
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+
+def _response(status_code=200, content=b"ok", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(mocker):
+    """백오프/rate limit 대기 제거"""
+    return mocker.patch('utils.http_client.time.sleep')
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_without_wait(self, no_sleep):
+        """버스트 크기까지는 대기 없이 획득"""
+        from utils.http_client import TokenBucket
+
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        no_sleep.assert_not_called()
+
+    def test_waits_when_empty(self, no_sleep):
+        """토큰 소진 시 충전 시간만큼 대기"""
+        from utils.http_client import TokenBucket
+
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.acquire()
+
+        # sleep 후 토큰이 충전된 상태로 만듦
+        no_sleep.side_effect = lambda s: setattr(bucket, '_tokens', 1.0)
+        waited = bucket.acquire()
+
+        assert waited > 0
+        assert no_sleep.called
+
+
+class TestHttpGet:
+    """http_get() 테스트"""
+
+    def test_returns_response(self):
+        """정상 응답 반환 및 메트릭 기록"""
+        from utils.http_client import http_get, get_metrics, reset_metrics
+
+        reset_metrics()
+        session = MagicMock()
+        session.get.return_value = _response(content=b"hello")
+
+        response = http_get("https://example.com/a", session=session)
+
+        assert response.content == b"hello"
+        metrics = get_metrics()["example.com"]
+        assert metrics["requests"] == 1
+        assert metrics["bytes"] == 5
+        assert metrics["retries"] == 0
+
+    def test_retries_on_5xx(self):
+        """5xx 응답은 재시도 후 성공"""
+        from utils.http_client import http_get, get_metrics, reset_metrics
+
+        reset_metrics()
+        session = MagicMock()
+        session.get.side_effect = [_response(503), _response(200)]
+
+        response = http_get("https://example.com/b", session=session, retries=2)
+
+        assert response.status_code == 200
+        assert session.get.call_count == 2
+        assert get_metrics()["example.com"]["retries"] == 1
+
+    def test_retries_on_connection_error(self):
+        """연결 오류는 재시도 소진 후 예외 전파"""
+        from utils.http_client import http_get, get_metrics, reset_metrics
+
+        reset_metrics()
+        session = MagicMock()
+        session.get.side_effect = requests.ConnectionError("reset")
+
+        with pytest.raises(requests.ConnectionError):
+            http_get("https://example.com/c", session=session, retries=2)
+
+        assert session.get.call_count == 3
+        assert get_metrics()["example.com"]["errors"] == 1
+
+    def test_metrics_consistent_under_concurrency(self):
+        """같은 호스트로 동시에 요청해도 메트릭 누락 없음"""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+        from utils.http_client import http_get, get_metrics, reset_metrics
+
+        reset_metrics()
+        session = MagicMock()
+        session.get.return_value = _response(content=b"ok")
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # 스레드 전환을 잦게 해 경합 유도
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: http_get("https://example.com/m", session=session), range(4000)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        metrics = get_metrics()["example.com"]
+        assert metrics["requests"] == 4000
+        assert metrics["bytes"] == 8000
+
+    def test_metrics_record_holds_host_lock(self):
+        """카운터 누적은 호스트별 잠금을 잡은 뒤에만 반영"""
+        import threading
+        from utils.http_client import HostMetrics
+
+        metrics = HostMetrics()
+        with metrics._lock:
+            worker = threading.Thread(target=metrics.record, kwargs={"requests": 1, "bytes": 10})
+            worker.start()
+            worker.join(timeout=0.1)
+            assert worker.is_alive()
+            assert metrics.requests == 0
+        worker.join()
+
+        assert metrics.as_dict() == {
+            "requests": 1, "errors": 0, "retries": 0, "throttled": 0.0, "elapsed": 0.0, "bytes": 10,
+        }
+
+    def test_no_retry_on_4xx(self):
+        """4xx(429 제외)는 재시도하지 않음"""
+        from utils.http_client import http_get
+
+        session = MagicMock()
+        session.get.return_value = _response(404)
+
+        with pytest.raises(requests.HTTPError):
+            http_get("https://example.com/d", session=session, retries=2)
+
+        assert session.get.call_count == 1
+
+    def test_respects_retry_after(self, no_sleep):
+        """429 응답의 Retry-After 헤더만큼 대기"""
+        from utils.http_client import http_get
+
+        session = MagicMock()
+        session.get.side_effect = [_response(429, headers={"Retry-After": "3"}), _response(200)]
+
+        http_get("https://example.com/e", session=session)
+
+        no_sleep.assert_called_once_with(3.0)
+
+
+class TestSessionPooling:
+    """호스트별 세션/rate limit 테스트"""
+
+    def test_same_host_shares_session(self):
+        """같은 호스트는 같은 세션 재사용"""
+        from utils.http_client import get_session
+
+        assert get_session("finance.naver.com") is get_session("finance.naver.com")
+        assert get_session("finance.naver.com") is not get_session("comp.fnguide.com")
+
+    def test_subdomains_share_bucket(self):
+        """하위 도메인은 같은 rate limit 버킷 공유"""
+        from utils.http_client import _get_bucket
+
+        assert _get_bucket("finance.naver.com") is _get_bucket("m.stock.naver.com")
+        assert _get_bucket("example.com") is None
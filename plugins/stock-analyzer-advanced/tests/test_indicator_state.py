@@ -0,0 +1,118 @@
+"""indicator_state.py 테스트"""
+import pytest
+import pandas as pd
+import numpy as np
+
+
+def _assert_close(actual, expected):
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, equal_nan=True)
+
+
+class TestRecursiveStates:
+    """EMA/RSI/MACD 상태 테스트"""
+
+    def test_ema_matches_series(self, sample_close_series):
+        """매 봉 갱신 값이 ema()와 동일"""
+        from utils.indicators import ema
+        from utils.indicator_state import EMAState
+
+        state = EMAState(12)
+        streamed = [state.update(x) for x in sample_close_series]
+
+        assert streamed == ema(sample_close_series, 12).tolist()
+
+    def test_rsi_from_history_then_update(self, sample_close_series):
+        """과거 데이터로 초기화 후 갱신한 값이 rsi() 마지막 값과 동일"""
+        from utils.indicators import rsi
+        from utils.indicator_state import RSIState
+
+        state = RSIState.from_history(sample_close_series.iloc[:-1], period=14)
+        value = state.update(sample_close_series.iloc[-1])
+
+        assert value == rsi(sample_close_series).iloc[-1]
+
+    def test_rsi_all_gains(self):
+        """하락 없는 구간은 100"""
+        from utils.indicator_state import RSIState
+
+        state = RSIState.from_history(pd.Series(range(1, 30)))
+
+        assert state.value == 100.0
+
+    def test_macd_matches_series(self, sample_close_series):
+        """MACD 세 값이 macd() 마지막 값과 동일"""
+        from utils.indicators import macd
+        from utils.indicator_state import MACDState
+
+        state = MACDState.from_history(sample_close_series)
+
+        expected = [part.iloc[-1] for part in macd(sample_close_series)]
+        assert list(state.value) == expected
+
+
+class TestWindowStates:
+    """SMA/볼린저/스토캐스틱 상태 테스트"""
+
+    def test_sma_streaming(self, sample_close_series):
+        """매 봉 갱신 값이 sma()와 동일 (warm-up NaN 포함)"""
+        from utils.indicators import sma
+        from utils.indicator_state import SMAState
+
+        state = SMAState(20)
+        streamed = [state.update(x) for x in sample_close_series]
+
+        _assert_close(streamed, sma(sample_close_series, 20))
+
+    def test_bollinger_streaming(self, sample_close_series):
+        """매 봉 갱신 값이 bollinger()와 동일"""
+        from utils.indicators import bollinger
+        from utils.indicator_state import BollingerState
+
+        state = BollingerState(20)
+        streamed = np.array([state.update(x) for x in sample_close_series])
+
+        for i, expected in enumerate(bollinger(sample_close_series)):
+            _assert_close(streamed[:, i], expected)
+
+    def test_stochastic_streaming(self, sample_high_series, sample_low_series, sample_close_series):
+        """매 봉 갱신 값이 stochastic()과 동일"""
+        from utils.indicators import stochastic
+        from utils.indicator_state import StochasticState
+
+        state = StochasticState()
+        streamed = np.array([
+            state.update(h, l, c)
+            for h, l, c in zip(sample_high_series, sample_low_series, sample_close_series)
+        ])
+
+        k, d = stochastic(sample_high_series, sample_low_series, sample_close_series)
+        _assert_close(streamed[:, 0], k)
+        _assert_close(streamed[:, 1], d)
+
+
+class TestPeek:
+    """peek() 테스트 (장중 틱 갱신)"""
+
+    @pytest.mark.parametrize("cls,params,columns", [
+        ("EMAState", {"period": 12}, 1),
+        ("RSIState", {}, 1),
+        ("MACDState", {}, 1),
+        ("SMAState", {"period": 20}, 1),
+        ("BollingerState", {}, 1),
+        ("StochasticState", {}, 3),
+    ])
+    def test_peek_equals_update_without_mutation(self, sample_ohlcv_df, cls, params, columns):
+        """peek 결과는 update 결과와 같고 상태는 바뀌지 않음"""
+        import utils.indicator_state as module
+
+        history = [sample_ohlcv_df['고가'], sample_ohlcv_df['저가'], sample_ohlcv_df['종가']][-columns:]
+        state = getattr(module, cls).from_history(*[s.iloc[:-1] for s in history], **params)
+        before = state.value
+        tick = [float(s.iloc[-1]) for s in history]
+
+        peeked = state.peek(*tick)
+        peeked_again = state.peek(*tick)
+
+        assert state.value == before or np.isnan(before).all()
+        _assert_close(peeked_again, peeked)
+        _assert_close(state.update(*tick), peeked)
@@ -254,3 +254,191 @@ class TestSupportResistance:
         result = support_resistance(sample_high_series, sample_low_series, sample_close_series)
 
         assert result['s2'] < result['s1'] < result['pivot'] < result['r1'] < result['r2']
+
+
+class TestMatrixInput:
+    """(날짜 × 종목) DataFrame/ndarray 입력 테스트"""
+
+    @pytest.fixture
+    def wide(self):
+        """종목 4개 샘플 (거래일 부족 + 중간 결측 포함)"""
+        np.random.seed(3)
+        close = pd.DataFrame(
+            70000 + np.cumsum(np.random.randn(80, 4) * 800, axis=0),
+            columns=["A", "B", "C", "D"],
+        )
+        close.iloc[:25, 2] = np.nan   # C: 상장 55일
+        close.iloc[40, 3] = np.nan    # D: 거래정지 1일
+        close.iloc[50:55, 1] = 65000.0  # B: 상수 구간
+        high = close * 1.02
+        low = close * 0.98
+        return high, low, close
+
+    @staticmethod
+    def _assert_columns_match(result, expected_fn, frame):
+        for col in frame.columns:
+            expected = expected_fn(frame[col])
+            np.testing.assert_allclose(result[col].to_numpy(), expected.to_numpy(), rtol=1e-10, equal_nan=True)
+
+    @pytest.mark.parametrize("name,kwargs", [
+        ("sma", {"period": 20}),
+        ("ema", {"period": 12}),
+        ("rsi", {}),
+    ])
+    def test_single_output_matches_series(self, wide, name, kwargs):
+        """DataFrame 결과가 종목별 Series 결과와 동일"""
+        import utils.indicators as ind
+
+        _, _, close = wide
+        fn = getattr(ind, name)
+        result = fn(close, **kwargs)
+
+        assert isinstance(result, pd.DataFrame)
+        assert result.index.equals(close.index)
+        self._assert_columns_match(result, lambda s: fn(s, **kwargs), close)
+
+    def test_macd_bollinger_match_series(self, wide):
+        """MACD/볼린저 밴드 DataFrame 결과가 종목별 Series 결과와 동일"""
+        from utils.indicators import macd, bollinger
+
+        _, _, close = wide
+        for i, part in enumerate(macd(close)):
+            self._assert_columns_match(part, lambda s: macd(s)[i], close)
+        for i, part in enumerate(bollinger(close)):
+            self._assert_columns_match(part, lambda s: bollinger(s)[i], close)
+
+    def test_stochastic_matches_series(self, wide):
+        """스토캐스틱 DataFrame 결과가 종목별 Series 결과와 동일"""
+        from utils.indicators import stochastic
+
+        high, low, close = wide
+        k, d = stochastic(high, low, close)
+        for col in close.columns:
+            k_s, d_s = stochastic(high[col], low[col], close[col])
+            np.testing.assert_allclose(k[col], k_s, rtol=1e-10, equal_nan=True)
+            np.testing.assert_allclose(d[col], d_s, rtol=1e-10, equal_nan=True)
+
+    def test_ndarray_keeps_shape(self, wide):
+        """ndarray 입력은 같은 모양의 ndarray 반환"""
+        from utils.indicators import rsi
+
+        _, _, close = wide
+        matrix = rsi(close.to_numpy())
+        vector = rsi(close["A"].to_numpy())
+
+        assert isinstance(matrix, np.ndarray) and matrix.shape == close.shape
+        assert vector.shape == (len(close),)
+        np.testing.assert_allclose(vector, matrix[:, 0], equal_nan=True)
+
+
+class TestIndicatorBundle:
+    """indicator_bundle() 테스트"""
+
+    @staticmethod
+    def _expected(high, low, close):
+        from utils.indicators import sma, rsi, macd, bollinger, stochastic
+
+        macd_line, signal_line, hist = macd(close)
+        upper, middle, lower = bollinger(close)
+        k, d = stochastic(high, low, close)
+        return {
+            "rsi": rsi(close), "macd": macd_line, "macd_signal": signal_line, "macd_hist": hist,
+            "bb_upper": upper, "bb_middle": middle, "bb_lower": lower,
+            "stoch_k": k, "stoch_d": d,
+            "ma5": sma(close, 5), "ma20": sma(close, 20), "ma60": sma(close, 60),
+        }
+
+    def test_last_only_matches_functions(self, sample_high_series, sample_low_series, sample_close_series):
+        """마지막 값이 개별 지표 함수와 동일"""
+        from utils.indicators import indicator_bundle
+
+        result = indicator_bundle(sample_high_series, sample_low_series, sample_close_series)
+        expected = self._expected(sample_high_series, sample_low_series, sample_close_series)
+
+        assert set(result) == set(expected)
+        for key, series in expected.items():
+            np.testing.assert_allclose(result[key], series.iloc[-1], rtol=1e-10, equal_nan=True, err_msg=key)
+
+    def test_full_history_matches_functions(self, sample_high_series, sample_low_series, sample_close_series):
+        """last_only=False면 전체 구간이 개별 지표 함수와 동일"""
+        from utils.indicators import indicator_bundle
+
+        result = indicator_bundle(sample_high_series, sample_low_series, sample_close_series, last_only=False)
+        expected = self._expected(sample_high_series, sample_low_series, sample_close_series)
+
+        for key, series in expected.items():
+            assert len(result[key]) == len(series)
+            np.testing.assert_allclose(result[key], series.to_numpy(), rtol=1e-10, equal_nan=True, err_msg=key)
+
+    def test_short_history_warm_up(self, sample_high_series, sample_low_series, sample_close_series):
+        """기간보다 짧은 데이터는 해당 지표만 NaN"""
+        from utils.indicators import indicator_bundle
+
+        result = indicator_bundle(sample_high_series[:15], sample_low_series[:15], sample_close_series[:15])
+
+        assert np.isnan(result["ma20"]) and np.isnan(result["bb_middle"]) and np.isnan(result["stoch_d"])
+        assert not np.isnan(result["stoch_k"])
+        assert not np.isnan(result["rsi"])
+
+
+class TestLastOnly:
+    """last_only=True 테스트"""
+
+    CASES = [
+        ("sma", lambda f, h, l, c: f(c, 20)),
+        ("ema", lambda f, h, l, c: f(c, 12)),
+        ("rsi", lambda f, h, l, c: f(c)),
+        ("macd", lambda f, h, l, c: f(c)),
+        ("bollinger", lambda f, h, l, c: f(c)),
+        ("stochastic", lambda f, h, l, c: f(h, l, c)),
+    ]
+
+    @staticmethod
+    def _call(name, call, h, l, c, **kwargs):
+        import utils.indicators as ind
+
+        fn = getattr(ind, name)
+        return call(lambda *args: fn(*args, **kwargs), h, l, c)
+
+    @staticmethod
+    def _as_tuple(result):
+        return result if isinstance(result, tuple) else (result,)
+
+    @pytest.mark.parametrize("name,call", CASES)
+    def test_series_returns_last_value(self, sample_ohlcv_df, name, call):
+        """Series 입력은 전체 계산 결과의 마지막 값(float) 반환"""
+        h, l, c = sample_ohlcv_df['고가'], sample_ohlcv_df['저가'], sample_ohlcv_df['종가']
+
+        full = self._as_tuple(self._call(name, call, h, l, c))
+        last = self._as_tuple(self._call(name, call, h, l, c, last_only=True))
+
+        for f, v in zip(full, last):
+            assert isinstance(v, float)
+            np.testing.assert_allclose(v, f.iloc[-1], rtol=1e-10)
+
+    @pytest.mark.parametrize("name,call", CASES)
+    def test_dataframe_returns_series_per_ticker(self, sample_ohlcv_df, name, call):
+        """DataFrame 입력은 종목별 마지막 값 Series 반환"""
+        close = pd.DataFrame({"A": sample_ohlcv_df['종가'], "B": sample_ohlcv_df['종가'][::-1].to_numpy()})
+        h, l = close * 1.02, close * 0.98
+
+        full = self._as_tuple(self._call(name, call, h, l, close))
+        last = self._as_tuple(self._call(name, call, h, l, close, last_only=True))
+
+        for f, v in zip(full, last):
+            assert list(v.index) == ["A", "B"]
+            np.testing.assert_allclose(v.to_numpy(), f.iloc[-1].to_numpy(), rtol=1e-10)
+
+    def test_recursive_values_exact(self, sample_close_series):
+        """재귀 지표(EMA/RSI)는 전체 계산과 같은 값"""
+        from utils.indicators import ema, rsi
+
+        assert ema(sample_close_series, 12, last_only=True) == ema(sample_close_series, 12).iloc[-1]
+        assert rsi(sample_close_series, last_only=True) == rsi(sample_close_series).iloc[-1]
+
+    def test_short_input_returns_nan(self, sample_close_series):
+        """기간보다 짧으면 NaN"""
+        from utils.indicators import sma, bollinger
+
+        assert np.isnan(sma(sample_close_series[:10], 20, last_only=True))
+        assert all(np.isnan(v) for v in bollinger(sample_close_series[:10], last_only=True))
@@ -0,0 +1,119 @@
+"""market_snapshot.py 테스트"""
+import pytest
+from datetime import datetime
+
+
+STOCKS = {
+    "KOSPI": [
+        {"code": "005930", "name": "삼성전자", "price": 70000, "change": -900, "change_pct": -1.27,
+         "market_cap": 4178000, "listed_shares": 5969783, "volume": 12345678, "per": 12.5, "roe": 9.0},
+    ],
+    "KOSDAQ": [
+        {"code": "247540", "name": "에코프로비엠", "price": 200000, "change": 1000, "change_pct": 0.5,
+         "market_cap": 195600, "listed_shares": 97801, "volume": 500000, "per": None, "roe": -1.0},
+    ],
+}
+
+
+@pytest.fixture
+def stock_list(mocker):
+    """get_naver_stock_list mock + 메모리 스냅샷 초기화"""
+    from utils import market_snapshot
+
+    market_snapshot.clear_market_snapshot()
+    mock = mocker.patch('utils.market_snapshot.get_naver_stock_list',
+                        side_effect=lambda market, use_cache=True: STOCKS[market])
+    yield mock
+    market_snapshot.clear_market_snapshot()
+
+
+class TestGetMarketSnapshot:
+    """get_market_snapshot() 테스트"""
+
+    def test_builds_all_markets(self, stock_list):
+        """시장별 리스트 → 종목코드 인덱스 DataFrame"""
+        from utils.market_snapshot import get_market_snapshot
+
+        df = get_market_snapshot(now=datetime(2025, 3, 3, 10))
+
+        assert list(df.index) == ["005930", "247540"]
+        assert df.loc["247540", "market"] == "KOSDAQ"
+        assert df.loc["005930", "per"] == 12.5
+
+    def test_fresh_snapshot_reused(self, stock_list):
+        """유효 시간 이내 재조회 시 네트워크 없음"""
+        from utils.market_snapshot import get_market_snapshot
+
+        get_market_snapshot(now=datetime(2025, 3, 3, 10))
+        get_market_snapshot(now=datetime(2025, 3, 3, 10, 20))
+
+        assert stock_list.call_count == 2
+
+    def test_stale_snapshot_rebuilt(self, stock_list):
+        """장중 유효 시간이 지나면 다시 생성, 장 마감 후 스냅샷은 당일 계속 사용"""
+        from utils.market_snapshot import get_market_snapshot
+
+        get_market_snapshot(now=datetime(2025, 3, 3, 10))
+        get_market_snapshot(now=datetime(2025, 3, 3, 16, 30))
+        get_market_snapshot(now=datetime(2025, 3, 3, 23, 0))
+
+        assert stock_list.call_count == 4
+
+    def test_disk_snapshot_survives_restart(self, stock_list):
+        """메모리가 비어도 디스크 스냅샷 사용"""
+        from utils.market_snapshot import get_market_snapshot, clear_market_snapshot, lookup_snapshot
+
+        get_market_snapshot(now=datetime(2025, 3, 3, 10))
+        clear_market_snapshot()
+
+        row = lookup_snapshot("005930", now=datetime(2025, 3, 3, 10, 5))
+
+        assert stock_list.call_count == 2
+        assert row["market_cap"] == 4178000
+        assert isinstance(row["price"], int)
+
+
+class TestSnapshotFallback:
+    """get_market_cap / get_fundamental 스냅샷 연동 테스트"""
+
+    def test_market_cap_served_from_snapshot(self, stock_list, mock_pykrx_stock, mocker):
+        """pykrx 실패 + 신선한 스냅샷 → 종목 페이지 조회 없이 응답"""
+        from utils.market_snapshot import get_market_snapshot
+        from utils.data_fetcher import get_market_cap
+
+        get_market_snapshot()
+        mock_pykrx_stock.get_market_cap.side_effect = Exception("KRX down")
+        naver = mocker.patch('utils.web_scraper.get_naver_stock_info')
+
+        result = get_market_cap("005930")
+
+        naver.assert_not_called()
+        assert result["시가총액"] == 4178000 * 100000000
+        assert result["상장주식수"] == 5969783 * 1000
+
+    def test_fundamental_keeps_real_pbr(self, stock_list, mock_pykrx_stock, mocker):
+        """스냅샷에는 PBR이 없으므로 신선한 스냅샷이 있어도 네이버 시세의 실제 PER/PBR 사용"""
+        from utils.market_snapshot import get_market_snapshot
+        from utils.data_fetcher import get_fundamental
+
+        get_market_snapshot()
+        mock_pykrx_stock.get_market_fundamental.side_effect = Exception("KRX down")
+        naver = mocker.patch('utils.web_scraper.get_naver_quote', return_value={"per": 13.1, "pbr": 1.2})
+
+        result = get_fundamental("005930")
+
+        naver.assert_called_once_with("005930", fields=("per", "pbr"))
+        assert result["PER"] == 13.1
+        assert result["PBR"] == 1.2
+
+    def test_past_date_skips_snapshot(self, stock_list, mock_pykrx_stock, mocker):
+        """과거 날짜 조회는 스냅샷 사용 안 함"""
+        from utils.market_snapshot import get_market_snapshot
+        from utils.data_fetcher import get_market_cap
+
+        get_market_snapshot()
+        mock_pykrx_stock.get_market_cap.side_effect = Exception("KRX down")
+        naver = mocker.patch('utils.web_scraper.get_naver_stock_info', return_value=None)
+
+        assert get_market_cap("005930", date="20200102") is None
+        naver.assert_called_once()
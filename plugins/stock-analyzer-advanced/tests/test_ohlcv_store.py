@@ -0,0 +1,276 @@
+"""ohlcv_store.py 테스트"""
+import pytest
+import pandas as pd
+from datetime import datetime
+
+
+@pytest.fixture
+def market():
+    """영업일 기준 가상 시세 + 호출 기록하는 fetch"""
+    dates = pd.bdate_range("2025-01-01", "2025-06-30", name="날짜")
+    state = {
+        "df": pd.DataFrame({
+            "시가": range(1000, 1000 + len(dates)),
+            "종가": range(1010, 1010 + len(dates)),
+        }, index=dates),
+        "calls": [],
+    }
+
+    def fetch(fromdate, todate):
+        state["calls"].append((fromdate, todate))
+        df = state["df"]
+        return df[(df.index >= pd.Timestamp(fromdate)) & (df.index <= pd.Timestamp(todate))].copy()
+
+    state["fetch"] = fetch
+    return state
+
+
+class TestGetCachedOhlcv:
+    """get_cached_ohlcv() 테스트"""
+
+    def test_first_call_fetches_full_range(self, market):
+        """캐시가 없으면 전체 구간 다운로드"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        result = get_cached_ohlcv(
+            "005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+            market["fetch"], now=datetime(2025, 4, 1, 9),
+        )
+
+        assert market["calls"] == [("20250301", "20250331")]
+        assert result.index[0] == pd.Timestamp("2025-03-03")
+        assert result.index[-1] == pd.Timestamp("2025-03-31")
+
+    def test_cached_range_served_from_disk(self, market):
+        """확정된 구간 재조회 시 네트워크 호출 없음"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        args = ("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True, market["fetch"])
+        first = get_cached_ohlcv(*args, now=datetime(2025, 4, 1, 9))
+        second = get_cached_ohlcv(*args, now=datetime(2025, 4, 2, 9))
+
+        assert len(market["calls"]) == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    def test_fetches_only_missing_tail(self, market):
+        """마지막 저장일 이후 구간만 추가 다운로드"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                         market["fetch"], now=datetime(2025, 4, 1, 9))
+        result = get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 4, 10), True,
+                                  market["fetch"], now=datetime(2025, 4, 11, 9))
+
+        assert market["calls"][1] == ("20250331", "20250410")
+        expected = market["df"].loc["2025-03-03":"2025-04-10"]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_intraday_bar_refetched(self, market):
+        """장중에 받은 당일 봉은 다음 조회 때 다시 받음"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        args = ("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True, market["fetch"])
+        get_cached_ohlcv(*args, now=datetime(2025, 3, 31, 10))
+        market["df"].loc["2025-03-31", "종가"] = 9999
+        result = get_cached_ohlcv(*args, now=datetime(2025, 3, 31, 17))
+
+        # 직전 확정 봉(3/28)부터 다시 받음
+        assert market["calls"][1] == ("20250328", "20250331")
+        assert result.loc["2025-03-31", "종가"] == 9999
+
+    def test_restatement_triggers_full_refetch(self, market):
+        """수정주가 재산정(겹치는 날 종가 변경) 감지 시 전체 재다운로드"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                         market["fetch"], now=datetime(2025, 4, 1, 9))
+        market["df"]["종가"] = market["df"]["종가"] // 2  # 액면분할
+        result = get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 4, 10), True,
+                                  market["fetch"], now=datetime(2025, 4, 11, 9))
+
+        assert market["calls"][-1] == ("20250301", "20250410")
+        expected = market["df"].loc["2025-03-03":"2025-04-10"]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+    def test_fetches_only_missing_head(self, market):
+        """저장 구간보다 이른 기간은 앞부분만 다운로드"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                         market["fetch"], now=datetime(2025, 4, 1, 9))
+        result = get_cached_ohlcv("005930", datetime(2025, 2, 1), datetime(2025, 3, 31), True,
+                                  market["fetch"], now=datetime(2025, 4, 1, 10))
+
+        # 첫 저장 봉(3/3)까지 겹쳐 받음
+        assert market["calls"][1] == ("20250201", "20250303")
+        assert result.index[0] == pd.Timestamp("2025-02-03")
+        assert result.index.is_monotonic_increasing
+        assert not result.index.duplicated().any()
+
+    def test_failed_tail_fetch_keeps_range(self, market):
+        """뒤쪽 조회가 빈 결과(실패)면 저장 구간을 늘리지 않고 다음 조회 때 다시 받음"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                         market["fetch"], now=datetime(2025, 4, 1, 9))
+        failed = get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 4, 10), True,
+                                  lambda s, e: pd.DataFrame(), now=datetime(2025, 4, 11, 9))
+        result = get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 4, 10), True,
+                                  market["fetch"], now=datetime(2025, 4, 11, 10))
+
+        assert failed.index[-1] == pd.Timestamp("2025-03-31")
+        assert market["calls"][-1] == ("20250331", "20250410")
+        assert result.index[-1] == pd.Timestamp("2025-04-10")
+
+    def test_failed_head_fetch_keeps_range(self, market):
+        """앞쪽 조회가 빈 결과(실패)면 저장 구간을 늘리지 않고 다음 조회 때 다시 받음"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                         market["fetch"], now=datetime(2025, 4, 1, 9))
+        get_cached_ohlcv("005930", datetime(2025, 2, 1), datetime(2025, 3, 31), True,
+                         lambda s, e: pd.DataFrame(), now=datetime(2025, 4, 1, 10))
+        result = get_cached_ohlcv("005930", datetime(2025, 2, 1), datetime(2025, 3, 31), True,
+                                  market["fetch"], now=datetime(2025, 4, 1, 11))
+
+        assert market["calls"][-1] == ("20250201", "20250303")
+        assert result.index[0] == pd.Timestamp("2025-02-03")
+
+    def test_head_without_trading_days_cached(self, market):
+        """거래일 없는 앞쪽 구간(상장 전)은 한 번 확인 후 다시 받지 않음"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                         market["fetch"], now=datetime(2025, 4, 1, 9))
+        market["df"] = market["df"].loc["2025-03-03":]  # 3/3 상장
+        for hour in (10, 11):
+            result = get_cached_ohlcv("005930", datetime(2025, 2, 1), datetime(2025, 3, 31), True,
+                                      market["fetch"], now=datetime(2025, 4, 1, hour))
+
+        assert len(market["calls"]) == 2
+        assert result.index[0] == pd.Timestamp("2025-03-03")
+
+    def test_adjusted_flag_is_separate_key(self, market):
+        """수정주가/원주가는 별도 캐시"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        for adjusted in (True, False):
+            get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), adjusted,
+                             market["fetch"], now=datetime(2025, 4, 1, 9))
+
+        assert len(market["calls"]) == 2
+
+    def test_unwritable_cache_dir_returns_fetched_data(self, market, tmp_path, monkeypatch):
+        """캐시 저장 실패해도 받은 데이터 반환"""
+        from utils.ohlcv_store import get_cached_ohlcv
+
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(blocker / "cache"))
+
+        result = get_cached_ohlcv("005930", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                                  market["fetch"], now=datetime(2025, 4, 1, 9))
+
+        assert result.index[-1] == pd.Timestamp("2025-03-31")
+        assert not (blocker / "cache").exists()
+
+    def test_empty_fetch_returns_none(self):
+        """데이터가 없으면 None, 캐시 저장 안 함"""
+        from utils.ohlcv_store import get_cached_ohlcv, get_cache_dir
+
+        result = get_cached_ohlcv("INVALID", datetime(2025, 3, 1), datetime(2025, 3, 31), True,
+                                  lambda s, e: pd.DataFrame(), now=datetime(2025, 4, 1))
+
+        assert result is None
+        assert not (get_cache_dir() / "ohlcv").exists()
+
+
+class TestWriteAtomic:
+    """write_atomic() 테스트"""
+
+    def test_concurrent_writers_use_distinct_tmp_files(self, tmp_path):
+        """동시 저장 시 임시 파일이 겹치지 않고 최종 파일은 완전한 내용 하나"""
+        import threading
+        from utils.ohlcv_store import write_atomic
+
+        path = tmp_path / "data.json"
+        tmp_names = []
+        barrier = threading.Barrier(4)
+
+        def write(tmp, text):
+            tmp_names.append(tmp.name)
+            barrier.wait()  # 모든 스레드가 임시 파일을 연 상태에서 쓰기
+            tmp.write_text(text)
+
+        threads = [
+            threading.Thread(target=write_atomic, args=(path, lambda tmp, i=i: write(tmp, str(i) * 1000)))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(tmp_names)) == 4
+        assert path.read_text() in {str(i) * 1000 for i in range(4)}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_write_removes_tmp(self, tmp_path):
+        """쓰기 실패 시 임시 파일 정리, 기존 파일 유지"""
+        from utils.ohlcv_store import write_atomic
+
+        path = tmp_path / "data.json"
+        path.write_text("old")
+
+        def fail(tmp):
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            write_atomic(path, fail)
+
+        assert path.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestGetOhlcvCache:
+    """get_ohlcv() 캐시 연동 테스트"""
+
+    def test_second_call_uses_cache(self, mock_pykrx_stock, sample_ohlcv_df):
+        """확정된 과거 구간 재조회 시 pykrx 호출 없음"""
+        from utils.data_fetcher import get_ohlcv
+
+        mock_pykrx_stock.get_market_ohlcv_by_date.return_value = sample_ohlcv_df
+        end_date = sample_ohlcv_df.index[-5].strftime("%Y%m%d")
+
+        first = get_ohlcv("005930", days=20, end_date=end_date)
+        second = get_ohlcv("005930", days=20, end_date=end_date)
+
+        assert mock_pykrx_stock.get_market_ohlcv_by_date.call_count == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    def test_use_cache_false_bypasses_store(self, mock_pykrx_stock, sample_ohlcv_df, isolated_cache_dir):
+        """use_cache=False면 매번 pykrx 호출, 캐시 파일 없음"""
+        from utils.data_fetcher import get_ohlcv
+
+        mock_pykrx_stock.get_market_ohlcv_by_date.return_value = sample_ohlcv_df
+
+        get_ohlcv("005930", days=20, use_cache=False)
+        get_ohlcv("005930", days=20, use_cache=False)
+
+        assert mock_pykrx_stock.get_market_ohlcv_by_date.call_count == 2
+        assert not isolated_cache_dir.exists()
+
+    def test_cache_write_failure_keeps_fetched_data(self, mock_pykrx_stock, sample_ohlcv_df,
+                                                    tmp_path, monkeypatch):
+        """캐시 디렉토리에 쓸 수 없어도 pykrx에서 받은 데이터 반환"""
+        from utils.data_fetcher import get_ohlcv
+
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(blocker / "cache"))
+        mock_pykrx_stock.get_market_ohlcv_by_date.return_value = sample_ohlcv_df
+
+        result = get_ohlcv("005930", days=20)
+
+        assert result is not None
+        assert len(result) == 20
@@ -0,0 +1,188 @@
+"""ti_analyzer.py 테스트"""
+import time
+
+import pytest
+import pandas as pd
+import numpy as np
+
+
+@pytest.fixture
+def year_ohlcv_df():
+    """1년치(252 영업일) 샘플 OHLCV"""
+    dates = pd.bdate_range(end="2025-06-30", periods=252, name="날짜")
+    np.random.seed(7)
+    prices = 70000 + np.cumsum(np.random.randn(252) * 800)
+    return pd.DataFrame({
+        '시가': (prices * 0.99).astype(int),
+        '고가': (prices * 1.02).astype(int),
+        '저가': (prices * 0.98).astype(int),
+        '종가': prices.astype(int),
+        '거래량': np.random.randint(1000000, 5000000, 252),
+    }, index=dates)
+
+
+@pytest.fixture
+def mock_sources(mocker, year_ohlcv_df):
+    """ti_analyzer가 사용하는 조회 함수 mock"""
+    mocks = {
+        "ohlcv": mocker.patch('utils.ti_analyzer.get_ohlcv', return_value=year_ohlcv_df),
+        "name": mocker.patch('utils.ti_analyzer.get_ticker_name', return_value="삼성전자"),
+        "naver": mocker.patch('utils.ti_analyzer.get_naver_quote',
+                              return_value={"name": "삼성전자", "price": int(year_ohlcv_df['종가'].iloc[-1])}),
+    }
+    return mocks
+
+
+class TestGetTiFullAnalysis:
+    """get_ti_full_analysis() 테스트"""
+
+    def test_fetches_ohlcv_once(self, mock_sources):
+        """OHLCV는 1년치 한 번만 조회"""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        get_ti_full_analysis("005930")
+
+        mock_sources["ohlcv"].assert_called_once_with("005930", days=252)
+
+    def test_indicators_use_last_60_days(self, mock_sources, year_ohlcv_df):
+        """지표는 최근 60일 구간 기준으로 계산"""
+        from utils.ti_analyzer import get_ti_full_analysis
+        from utils.indicators import rsi, sma
+
+        result = get_ti_full_analysis("005930")
+
+        close = year_ohlcv_df['종가'].tail(60)
+        assert result["indicators"]["rsi"]["value"] == round(rsi(close).iloc[-1], 1)
+        assert result["indicators"]["ma"]["ma60"] == round(sma(close, 60).iloc[-1], 0)
+
+    def test_week52_uses_full_frame(self, mock_sources, year_ohlcv_df):
+        """52주 고저는 1년 전체 구간 기준"""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        result = get_ti_full_analysis("005930")
+
+        assert result["week52"]["high"] == int(year_ohlcv_df['고가'].max())
+        assert result["week52"]["low"] == int(year_ohlcv_df['저가'].min())
+
+    def test_lookups_run_concurrently(self, mock_sources, year_ohlcv_df):
+        """종목명/시세/OHLCV 조회가 동시에 실행됨"""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        def slow(value):
+            def inner(*args, **kwargs):
+                time.sleep(0.2)
+                return value
+            return inner
+
+        mock_sources["ohlcv"].side_effect = slow(year_ohlcv_df)
+        mock_sources["name"].side_effect = slow("삼성전자")
+        mock_sources["naver"].side_effect = slow({"price": 70000})
+
+        start = time.perf_counter()
+        result = get_ti_full_analysis("005930")
+        elapsed = time.perf_counter() - start
+
+        assert result["meta"]["name"] == "삼성전자"
+        assert elapsed < 0.5
+
+    def test_ohlcv_failure_keeps_price_info(self, mock_sources):
+        """OHLCV 실패 시 지표 섹션만 None"""
+        from utils.ti_analyzer import get_ti_full_analysis
+
+        mock_sources["ohlcv"].return_value = None
+
+        result = get_ti_full_analysis("005930")
+
+        assert result["price_info"] is not None
+        assert result["week52"] is None
+        assert result["indicators"] is None
+        assert result["signals"] is None
+
+
+class TestGetTiBatchAnalysis:
+    """get_ti_batch_analysis() 테스트"""
+
+    @pytest.fixture
+    def universe(self, mocker, year_ohlcv_df):
+        """종목별 OHLCV: 정상 / 상장 30일 / 조회 실패"""
+        frames = {
+            "005930": year_ohlcv_df,
+            "000660": (year_ohlcv_df * 1.5).astype(int),
+            "NEW001": year_ohlcv_df.tail(30),
+            "FAIL01": None,
+        }
+        mocker.patch('utils.ti_analyzer.get_ohlcv', side_effect=lambda t, days: frames[t])
+        mocker.patch('utils.ti_analyzer.get_ticker_name', side_effect=lambda t: f"name_{t}")
+        return frames
+
+    def test_returns_row_per_ticker(self, universe):
+        """조회 성공 종목만 행으로 반환"""
+        from utils.ti_analyzer import get_ti_batch_analysis
+
+        result = get_ti_batch_analysis(list(universe), workers=4)
+
+        assert list(result.index) == ["005930", "000660", "NEW001"]
+        assert result.loc["000660", "name"] == "name_000660"
+
+    def test_matches_single_analysis(self, universe, mocker):
+        """지표 값이 단일 종목 분석과 동일"""
+        from utils.ti_analyzer import get_ti_batch_analysis, get_ti_full_analysis
+
+        batch = get_ti_batch_analysis(["005930", "000660"])
+
+        for ticker in ["005930", "000660"]:
+            mocker.patch('utils.ti_analyzer.get_naver_quote',
+                         return_value={"price": int(universe[ticker]['종가'].iloc[-1])})
+            single = get_ti_full_analysis(ticker)
+            row = batch.loc[ticker]
+            ind = single["indicators"]
+
+            assert round(row["rsi"], 1) == ind["rsi"]["value"]
+            assert round(row["macd"], 2) == ind["macd"]["macd"]
+            assert round(row["bb_position"], 1) == ind["bollinger"]["position_pct"]
+            assert round(row["stoch_k"], 1) == ind["stochastic"]["k"]
+            assert row["ma_alignment"] == ind["ma"]["alignment"]
+            assert row["rsi_signal"] == single["signals"]["rsi_signal"]
+            assert row["macd_trend"] == single["signals"]["macd_signal"]
+            assert row["high_52w"] == single["week52"]["high"]
+            assert str(row["high_52w_date"]) == single["week52"]["high_date"]
+            assert round(row["position_52w"], 1) == single["week52"]["position_pct"]
+
+    def test_short_history_ticker(self, universe):
+        """거래일이 부족한 종목은 해당 종목 Series 기준으로 계산"""
+        from utils.ti_analyzer import get_ti_batch_analysis
+        from utils.indicators import rsi
+
+        result = get_ti_batch_analysis(["005930", "NEW001"])
+
+        expected = rsi(universe["NEW001"]['종가']).iloc[-1]
+        assert result.loc["NEW001", "rsi"] == pytest.approx(expected)
+        assert pd.isna(result.loc["NEW001", "ma60"])
+        assert pd.isna(result.loc["NEW001", "ma_alignment"])
+
+    def test_all_failed_returns_empty(self, universe):
+        """전부 실패 시 빈 DataFrame"""
+        from utils.ti_analyzer import get_ti_batch_analysis
+
+        result = get_ti_batch_analysis(["FAIL01"])
+
+        assert result.empty
+
+
+@pytest.mark.parametrize("module", ["ti_analyzer", "financial_scraper"])
+def test_script_mode_imports(module):
+    """python utils/<module>.py 직접 실행 시에도 패키지 상대 import 해석"""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    utils_dir = Path(__file__).resolve().parent.parent / "utils"
+    # 스크립트 실행과 같은 sys.path[0], __main__ 블록(네트워크 요청)은 실행하지 않음
+    code = (
+        "import runpy, sys; "
+        f"sys.path[0] = {str(utils_dir)!r}; "
+        f"runpy.run_path({str(utils_dir / (module + '.py'))!r}, run_name='script')"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,172 @@
+"""ticker_master.py 테스트"""
+import pytest
+from datetime import datetime
+
+
+ROWS = {
+    "KOSPI": [
+        {"code": "005930", "name": "삼성전자", "listing_date": "1975-06-11"},
+        {"code": "000660", "name": "SK하이닉스", "listing_date": "1996-12-26"},
+    ],
+    "KOSDAQ": [
+        {"code": "247540", "name": "에코프로비엠", "listing_date": "2019-03-05"},
+    ],
+}
+
+MONDAY = datetime(2025, 3, 3, 10)
+
+
+@pytest.fixture
+def fetch(mocker):
+    """시장별 종목 목록 fetch mock"""
+    return mocker.Mock(side_effect=lambda market: ROWS[market])
+
+
+class TestTickerMaster:
+    """TickerMaster 조회 테스트"""
+
+    def test_name_and_reverse_lookup(self, fetch):
+        """종목코드 → 종목명, 종목명/별칭 → 종목코드 (공백/대소문자 무시)"""
+        from utils.ticker_master import get_ticker_master
+
+        master = get_ticker_master(fetch, now=MONDAY)
+
+        assert master.name("000660") == "SK하이닉스"
+        assert master.code("sk하이닉스") == "000660"
+        assert master.code("하닉") == "000660"
+        assert master.code("삼전") == "005930"
+        assert master.code("없는종목") is None
+        assert master.get("247540") == {
+            "name": "에코프로비엠",
+            "market": "KOSDAQ",
+            "listing_date": "2019-03-05",
+            "aliases": ["에코프로비엠"],
+        }
+
+    def test_codes_by_market(self, fetch):
+        """시장별 종목코드"""
+        from utils.ticker_master import get_ticker_master
+
+        master = get_ticker_master(fetch, now=MONDAY)
+
+        assert master.codes("KOSPI") == ["005930", "000660"]
+        assert master.codes("KOSDAQ") == ["247540"]
+        assert len(master) == 3
+
+    def test_name_wins_over_alias(self):
+        """별칭이 다른 종목의 종목명과 겹치면 종목명 우선"""
+        from utils.ticker_master import TickerMaster
+
+        master = TickerMaster({
+            "000001": {"name": "가나", "market": "KOSPI", "listing_date": None, "aliases": ["가나", "다라"]},
+            "000002": {"name": "다라", "market": "KOSPI", "listing_date": None, "aliases": ["다라"]},
+        }, "20250303")
+
+        assert master.code("다라") == "000002"
+
+
+class TestGetTickerMaster:
+    """get_ticker_master() 캐시 테스트"""
+
+    def test_built_once_per_trading_day(self, fetch):
+        """같은 거래일(주말 포함)에는 다시 받지 않음"""
+        from utils.ticker_master import get_ticker_master
+
+        get_ticker_master(fetch, now=datetime(2025, 3, 7, 9))
+        get_ticker_master(fetch, now=datetime(2025, 3, 8, 12))   # 토요일 → 금요일 마스터
+        assert fetch.call_count == 2
+
+        get_ticker_master(fetch, now=datetime(2025, 3, 10, 9))   # 월요일
+        assert fetch.call_count == 4
+
+    def test_disk_master_survives_restart(self, fetch, isolated_cache_dir):
+        """메모리가 비어도 디스크 마스터 사용"""
+        from utils.ticker_master import get_ticker_master, clear_ticker_master
+
+        get_ticker_master(fetch, now=MONDAY)
+        clear_ticker_master()
+        master = get_ticker_master(fetch, now=MONDAY)
+
+        assert fetch.call_count == 2
+        assert master.code("삼전") == "005930"
+        assert (isolated_cache_dir / "ticker_master" / "20250303.json").exists()
+
+    def test_failure_serves_previous_master(self, fetch, mocker):
+        """생성 실패 시 이전 마스터로 응답하고 RETRY_INTERVAL 동안 재시도 안 함"""
+        from utils.ticker_master import get_ticker_master
+
+        get_ticker_master(fetch, now=MONDAY)
+        failing = mocker.Mock(return_value=None)
+
+        master = get_ticker_master(failing, now=datetime(2025, 3, 4, 9))
+        get_ticker_master(failing, now=datetime(2025, 3, 4, 9, 5))
+
+        assert master.day == "20250303"
+        assert master.name("005930") == "삼성전자"
+        assert failing.call_count == 2  # 시장 2개 × 1회
+
+        get_ticker_master(failing, now=datetime(2025, 3, 4, 9, 20))
+        assert failing.call_count == 4
+
+    def test_partial_master_not_cached(self, fetch, mocker):
+        """한 시장이라도 실패하면 일부 시장만 담긴 마스터를 저장하지 않고 RETRY_INTERVAL 뒤 재시도"""
+        from utils.ticker_master import get_ticker_master
+
+        kosdaq_down = mocker.Mock(side_effect=lambda market: ROWS[market] if market == "KOSPI" else None)
+
+        assert get_ticker_master(kosdaq_down, now=MONDAY) is None
+        assert get_ticker_master(fetch, now=datetime(2025, 3, 3, 10, 5)) is None
+        assert fetch.call_count == 0
+
+        master = get_ticker_master(fetch, now=datetime(2025, 3, 3, 10, 20))
+        assert master.code("에코프로비엠") == "247540"
+        assert fetch.call_count == 2
+
+
+class TestDataFetcherIntegration:
+    """get_ticker_name / get_ticker_code / get_ticker_list 마스터 연동 테스트"""
+
+    @pytest.fixture
+    def pykrx_listing(self, mock_pykrx_stock, mocker):
+        names = {row["code"]: row["name"] for rows in ROWS.values() for row in rows}
+        mock_pykrx_stock.get_market_ticker_list.side_effect = (
+            lambda date, market: [row["code"] for row in ROWS[market]]
+        )
+        mock_pykrx_stock.get_market_ticker_name.side_effect = names.get
+        mocker.patch('utils.web_scraper.get_krx_listing_dates',
+                     side_effect=lambda market: {row["code"]: row["listing_date"] for row in ROWS[market]})
+        return mock_pykrx_stock
+
+    def test_names_resolved_without_per_ticker_calls(self, pykrx_listing):
+        """마스터 생성 후 종목명 조회는 pykrx 추가 호출 없음"""
+        from utils.data_fetcher import get_ticker_name, get_ticker_master
+
+        assert get_ticker_master().get("005930")["listing_date"] == "1975-06-11"
+        calls = pykrx_listing.get_market_ticker_name.call_count
+
+        assert get_ticker_name("000660") == "SK하이닉스"
+        assert get_ticker_name("247540") == "에코프로비엠"
+        assert pykrx_listing.get_market_ticker_name.call_count == calls
+
+    def test_unknown_ticker_falls_back_to_pykrx(self, pykrx_listing):
+        """마스터에 없는 종목은 pykrx 개별 조회"""
+        from utils.data_fetcher import get_ticker_name
+
+        pykrx_listing.get_market_ticker_name.side_effect = lambda code: "신규상장" if code == "999990" else None
+
+        assert get_ticker_name("999990") == "신규상장"
+
+    def test_reverse_lookup(self, pykrx_listing):
+        """종목명/별칭 → 종목코드"""
+        from utils.data_fetcher import get_ticker_code
+
+        assert get_ticker_code("삼성전자") == "005930"
+        assert get_ticker_code("하이닉스") == "000660"
+
+    def test_ticker_list_from_master(self, pykrx_listing):
+        """당일 종목 리스트는 마스터에서, 반복 조회 시 pykrx 재호출 없음"""
+        from utils.data_fetcher import get_ticker_list
+
+        assert get_ticker_list(market="KOSDAQ") == ["247540"]
+        assert get_ticker_list(market="KOSPI") == ["005930", "000660"]
+        assert pykrx_listing.get_market_ticker_list.call_count == 2
@@ -1,7 +1,12 @@
 # tests/test_web_scraper.py
 """웹 스크래퍼 유틸리티 테스트"""
+import json
+from pathlib import Path
+
 import pytest
 
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
 
 def test_get_naver_stock_info_market_cap():
     """시가총액 파싱 테스트 - 숫자(억 단위)로 반환되어야 함"""
@@ -53,3 +58,231 @@ def test_get_naver_stock_info_market_cap_parsing_edge_cases():
 
     # 숫자만 있는 경우
     assert _parse_market_cap("1234") == 1234
+
+
+SECTOR_LIST_HTML = """
+<table class="type_1">
+<tr><td><a href="/sise/sise_group_detail.naver?type=upjong&no=278">반도체와반도체장비</a></td></tr>
+<tr><td><a href="/sise/sise_group_detail.naver?type=upjong&no=261">제약</a></td></tr>
+</table>
+"""
+
+SECTOR_DETAIL_HTML = {
+    "278": '<table class="type_5"><tr><td class="name"><a href="/item/main.naver?code=005930">삼성전자</a></td></tr>'
+           '<tr><td class="name"><a href="/item/main.naver?code=000660">SK하이닉스</a></td></tr></table>',
+    "261": '<table class="type_5"><tr><td class="name"><a href="/item/main.naver?code=207940">삼성바이오로직스</a></td></tr></table>',
+}
+
+
+def test_get_naver_sector_map(mocker):
+    """업종 목록 + 업종별 구성 종목 → 종목별 업종 매핑"""
+    from utils.web_scraper import get_naver_sector_map
+
+    def fake_get(url, **kwargs):
+        html = SECTOR_LIST_HTML if "sise_group.naver" in url else SECTOR_DETAIL_HTML[url.split("no=")[-1]]
+        return mocker.Mock(text=html)
+
+    mocker.patch('utils.web_scraper.http_get', side_effect=fake_get)
+
+    result = get_naver_sector_map()
+
+    assert result == {"005930": "반도체와반도체장비", "000660": "반도체와반도체장비", "207940": "제약"}
+
+
+def test_get_naver_sector_map_failure_returns_none(mocker):
+    """업종 목록 조회 실패 시 None"""
+    from utils.web_scraper import get_naver_sector_map
+
+    mocker.patch('utils.web_scraper.http_get', side_effect=Exception("network"))
+
+    assert get_naver_sector_map() is None
+
+
+def _market_sum_page(page, last_page=3, per_page=2):
+    """sise_market_sum 페이지 (기본 컬럼 구성)"""
+    rows = ""
+    for i in range(per_page):
+        code = f"{page:03d}{i:03d}"
+        rows += (
+            f'<tr><td class="no">{i}</td><td><a href="/item/main.naver?code={code}" class="tltle">종목{code}</a></td>'
+            f'<td class="number">{page},000</td><td class="number">100</td><td class="number">-1.25%</td>'
+            f'<td class="number">500</td><td class="number">{page}0,000</td><td class="number">1,000</td>'
+            f'<td class="number">12.5</td><td class="number">{i},234</td><td class="number">N/A</td><td>5.0</td></tr>'
+        )
+    return (
+        '<table class="type_2"><thead><tr>'
+        '<th>N</th><th>종목명</th><th>현재가</th><th>전일비</th><th>등락률</th><th>액면가</th>'
+        '<th>시가총액</th><th>상장주식수</th><th>외국인비율</th><th>거래량</th><th>PER</th><th>ROE</th>'
+        f'</tr></thead><tbody>{rows}</tbody></table>'
+        f'<table class="Nnavi"><tr><td class="pgRR"><a href="/sise/sise_market_sum.naver?&page={last_page}">맨뒤</a></td></tr></table>'
+    )
+
+
+class TestGetNaverStockList:
+    """get_naver_stock_list() 테스트 (네트워크 mock)"""
+
+    @pytest.fixture
+    def naver_pages(self, mocker):
+        import utils.web_scraper as web_scraper
+
+        web_scraper._stock_list_cache.clear()
+
+        def fake_get(url, **kwargs):
+            page = int(url.split("page=")[-1])
+            return mocker.Mock(text=_market_sum_page(page))
+
+        yield mocker.patch('utils.web_scraper.http_get', side_effect=fake_get)
+        web_scraper._stock_list_cache.clear()
+
+    def test_fetches_discovered_pages_only(self, naver_pages):
+        """첫 페이지에서 알아낸 마지막 페이지까지만 조회"""
+        from utils.web_scraper import get_naver_stock_list
+
+        result = get_naver_stock_list("KOSDAQ")
+
+        assert naver_pages.call_count == 3
+        assert [s["code"] for s in result] == ["001000", "001001", "002000", "002001", "003000", "003001"]
+
+    def test_parses_extra_columns(self, naver_pages):
+        """가격/시가총액/외국인비율/거래량/PER/ROE 컬럼 파싱 (전일비 부호는 등락률 기준)"""
+        from utils.web_scraper import get_naver_stock_list
+
+        first = get_naver_stock_list("KOSPI")[2]
+
+        assert first == {
+            "code": "002000", "name": "종목002000", "price": 2000, "change": -100, "change_pct": -1.25,
+            "market_cap": 20000, "listed_shares": 1000, "foreign_ratio": 12.5, "volume": 234, "per": None, "roe": 5.0,
+        }
+
+    def test_cached_per_day(self, naver_pages, isolated_cache_dir):
+        """같은 날 재조회 시 캐시 사용 (메모리 비워도 디스크 캐시)"""
+        import utils.web_scraper as web_scraper
+
+        web_scraper.get_naver_stock_list("KOSPI")
+        web_scraper._stock_list_cache.clear()
+        result = web_scraper.get_naver_stock_list("KOSPI")
+
+        assert naver_pages.call_count == 3
+        assert len(result) == 6
+        assert list((isolated_cache_dir / "stock_list").glob("KOSPI_*.json"))
+
+
+ITEM_MAIN_HTML = (FIXTURE_DIR / "naver_item_main.html").read_text(encoding="utf-8")
+POLLING_JSON = json.loads((FIXTURE_DIR / "naver_polling.json").read_text(encoding="utf-8"))
+
+
+class TestNaverQuote:
+    """get_naver_quote() / 종목 페이지 부분 파싱 테스트 (저장된 응답 사용)"""
+
+    def test_targeted_parse_matches_full_tree(self):
+        """시세 영역만 파싱해도 전체 트리 파싱과 같은 결과"""
+        from utils.web_scraper import parse_stock_info_html, QUOTE_KEYS
+
+        result = parse_stock_info_html(ITEM_MAIN_HTML)
+
+        assert result == parse_stock_info_html(ITEM_MAIN_HTML, targeted=False)
+        assert set(result) == set(QUOTE_KEYS)
+        assert result["change"] == -900
+        assert result["market_cap"] == 4184800
+        assert result["foreign_ratio"] == 50.12
+
+    def test_polling_quote_matches_page(self):
+        """폴링 API 시세 항목이 페이지 값과 일치"""
+        from utils.web_scraper import parse_polling_quote, parse_stock_info_html
+
+        quote = parse_polling_quote(POLLING_JSON, "123450")
+        page = parse_stock_info_html(ITEM_MAIN_HTML)
+
+        assert quote == {k: page[k] for k in quote}
+        assert "market_cap" not in quote
+
+    def test_polling_quote_other_ticker(self):
+        """요청하지 않은 종목 응답은 무시"""
+        from utils.web_scraper import parse_polling_quote
+
+        assert parse_polling_quote(POLLING_JSON, "005930") is None
+        assert parse_polling_quote({"result": None}, "123450") is None
+
+    @pytest.fixture
+    def naver_responses(self, mocker):
+        def fake_get(url, **kwargs):
+            if "polling" in url:
+                return mocker.Mock(json=mocker.Mock(return_value=POLLING_JSON))
+            return mocker.Mock(text=ITEM_MAIN_HTML)
+
+        return mocker.patch("utils.web_scraper.http_get", side_effect=fake_get)
+
+    def test_snapshot_fills_rest_without_page(self, naver_responses, mocker):
+        """신선한 시장 스냅샷이 있으면 폴링 요청 하나로 전체 항목"""
+        from utils.web_scraper import get_naver_quote, QUOTE_KEYS
+
+        mocker.patch("utils.market_snapshot.lookup_snapshot",
+                     return_value={"market_cap": 4184800, "foreign_ratio": 50.12})
+
+        quote = get_naver_quote("123450")
+
+        assert naver_responses.call_count == 1
+        assert set(quote) == set(QUOTE_KEYS)
+        assert quote["market_cap"] == 4184800
+
+    def test_page_only_without_snapshot(self, naver_responses, mocker):
+        """스냅샷이 없으면 폴링 없이 종목 페이지 요청 하나로 get_naver_stock_info와 같은 결과"""
+        from utils.web_scraper import get_naver_quote, parse_stock_info_html, NAVER_ITEM_URL
+
+        mocker.patch("utils.market_snapshot.lookup_snapshot", return_value=None)
+
+        assert get_naver_quote("123450") == parse_stock_info_html(ITEM_MAIN_HTML)
+        assert [c.args[0] for c in naver_responses.call_args_list] == [NAVER_ITEM_URL.format(ticker="123450")]
+
+    def test_polling_only_for_polling_fields(self, naver_responses, mocker):
+        """필요한 항목이 폴링 API에 모두 있으면 스냅샷 없이도 폴링 요청 하나"""
+        from utils.web_scraper import get_naver_quote, parse_stock_info_html
+
+        lookup = mocker.patch("utils.market_snapshot.lookup_snapshot", return_value=None)
+
+        quote = get_naver_quote("123450", fields=("per", "pbr"))
+
+        assert naver_responses.call_count == 1
+        assert "polling" in naver_responses.call_args.args[0]
+        lookup.assert_not_called()
+        page = parse_stock_info_html(ITEM_MAIN_HTML)
+        assert (quote["per"], quote["pbr"]) == (page["per"], page["pbr"])
+
+    def test_polling_quotes_batched(self, mocker):
+        """여러 종목을 묶어 요청하고, 묶음 응답에 빠진 종목만 따로 요청"""
+        import copy
+        from utils.web_scraper import get_naver_polling_quotes
+
+        def payload(codes):
+            data = copy.deepcopy(POLLING_JSON)
+            template = data["result"]["areas"][0]["datas"][0]
+            data["result"]["areas"][0]["datas"] = [{**template, "cd": code} for code in codes]
+            return data
+
+        def fake_get(url, **kwargs):
+            codes = url.rsplit(":", 1)[1].split(",")
+            # 묶음 응답에서 000003이 빠지는 경우
+            returned = [c for c in codes if c != "000003" or len(codes) == 1]
+            return mocker.Mock(json=mocker.Mock(return_value=payload(returned)))
+
+        mock_get = mocker.patch("utils.web_scraper.http_get", side_effect=fake_get)
+        tickers = [f"{i:06d}" for i in range(1, 6)]
+
+        quotes = get_naver_polling_quotes(tickers + ["000001"], batch_size=3, workers=1)
+
+        assert sorted(quotes) == tickers
+        assert quotes["000003"]["pbr"] == round(70100 / 50817, 2)
+        assert mock_get.call_count == 3  # 묶음 2개 + 빠진 종목 1개
+
+    def test_polling_failure_uses_page(self, naver_responses, mocker):
+        """폴링 API 실패 시 종목 페이지 결과"""
+        from utils.web_scraper import get_naver_quote, parse_stock_info_html
+
+        def fake_get(url, **kwargs):
+            if "polling" in url:
+                raise ConnectionError("polling unavailable")
+            return mocker.Mock(text=ITEM_MAIN_HTML)
+
+        naver_responses.side_effect = fake_get
+
+        assert get_naver_quote("123450") == parse_stock_info_html(ITEM_MAIN_HTML)
@@ -6,10 +6,15 @@ pykrx 기반 데이터 조회 및 기술지표 유틸리티
 from utils.data_fetcher import (
     get_ohlcv,
     get_ticker_name,
+    get_ticker_code,
     get_ticker_list,
+    get_ticker_master,
     get_fundamental,
     get_market_cap,
 )
+from utils.market_snapshot import (
+    get_market_snapshot,
+)
 from utils.deprecated import (
     get_investor_trading,
     get_short_selling,
@@ -22,15 +27,30 @@ from utils.indicators import (
     bollinger,
     stochastic,
     support_resistance,
+    indicator_bundle,
+)
+from utils.indicator_state import (
+    EMAState,
+    RSIState,
+    MACDState,
+    SMAState,
+    BollingerState,
+    StochasticState,
 )
 from utils.web_scraper import (
     get_naver_stock_info,
+    get_naver_quote,
     get_naver_stock_news,
     get_naver_discussion,
+    get_naver_sector_list,
+    get_naver_sector_stocks,
+    get_naver_sector_map,
+    get_krx_listing_dates,
     clean_playwright_result,
 )
 from utils.ti_analyzer import (
     get_ti_full_analysis,
+    get_ti_batch_analysis,
     print_ti_report,
     get_rsi_signal,
     get_ma_alignment,
@@ -47,9 +67,12 @@ __all__ = [
     # data_fetcher
     'get_ohlcv',
     'get_ticker_name',
+    'get_ticker_code',
     'get_ticker_list',
+    'get_ticker_master',
     'get_fundamental',
     'get_market_cap',
+    'get_market_snapshot',
     'get_investor_trading',
     'get_short_selling',
     # indicators
@@ -60,13 +83,27 @@ __all__ = [
     'bollinger',
     'stochastic',
     'support_resistance',
+    'indicator_bundle',
+    # indicator_state
+    'EMAState',
+    'RSIState',
+    'MACDState',
+    'SMAState',
+    'BollingerState',
+    'StochasticState',
     # web_scraper
     'get_naver_stock_info',
+    'get_naver_quote',
     'get_naver_stock_news',
     'get_naver_discussion',
+    'get_naver_sector_list',
+    'get_naver_sector_stocks',
+    'get_naver_sector_map',
+    'get_krx_listing_dates',
     'clean_playwright_result',
     # ti_analyzer
     'get_ti_full_analysis',
+    'get_ti_batch_analysis',
     'print_ti_report',
     'get_rsi_signal',
     'get_ma_alignment',
@@ -15,17 +15,21 @@ def get_ohlcv(
     days: int = 60,
     end_date: Optional[str] = None,
     frequency: str = "d",
-    adjusted: bool = True
+    adjusted: bool = True,
+    use_cache: bool = True
 ) -> Optional[pd.DataFrame]:
     """
     OHLCV 데이터 조회
 
+    일봉은 로컬 캐시(utils.ohlcv_store)를 거쳐 마지막 저장일 이후 구간만 다운로드
+
     Args:
         ticker: 종목코드 (예: "005930")
         days: 조회 일수 (기본 60)
         end_date: 종료일 YYYYMMDD (기본 오늘)
         frequency: "d"(일), "m"(월), "y"(연)
         adjusted: True=수정주가, False=원주가
+        use_cache: 일봉 로컬 캐시 사용 여부
 
     Returns:
         DataFrame or None (실패 시)
@@ -43,9 +47,17 @@ def get_ohlcv(
         start = start_dt.strftime("%Y%m%d")
         end = end_dt.strftime("%Y%m%d")
 
-        df = stock.get_market_ohlcv_by_date(start, end, ticker)
+        if use_cache and frequency == "d":
+            from .ohlcv_store import get_cached_ohlcv
+
+            def fetch(fromdate: str, todate: str) -> pd.DataFrame:
+                return stock.get_market_ohlcv_by_date(fromdate, todate, ticker, adjusted=adjusted)
 
-        if df.empty:
+            df = get_cached_ohlcv(ticker, start_dt, end_dt, adjusted, fetch)
+        else:
+            df = stock.get_market_ohlcv_by_date(start, end, ticker, freq=frequency, adjusted=adjusted)
+
+        if df is None or df.empty:
             return None
 
         # days 개수만큼 자르기
@@ -55,9 +67,65 @@ def get_ohlcv(
         return None
 
 
+def _is_today(date: Optional[str]) -> bool:
+    """조회일이 오늘(또는 미지정)인지 - 스냅샷은 당일 시세만 보유"""
+    return date is None or date == datetime.now().strftime("%Y%m%d")
+
+
+def _fetch_master_rows(market: str) -> Optional[list]:
+    """종목 마스터용 시장별 종목 목록 (pykrx 우선, 실패 시 Naver) + KRX 상장일"""
+    rows = None
+    try:
+        date = datetime.now().strftime("%Y%m%d")
+        rows = []
+        for code in stock.get_market_ticker_list(date, market=market):
+            name = stock.get_market_ticker_name(code)
+            # 상장폐지/미존재 코드는 빈 DataFrame이 돌아옴
+            if isinstance(name, str) and name:
+                rows.append({"code": code, "name": name})
+    except Exception:
+        rows = None
+
+    if not rows:
+        try:
+            from .web_scraper import get_naver_stock_list
+            stocks = get_naver_stock_list(market)
+            rows = [{"code": s["code"], "name": s["name"]} for s in stocks or []]
+        except Exception:
+            rows = None
+    if not rows:
+        return None
+
+    try:
+        from .web_scraper import get_krx_listing_dates
+        listing_dates = get_krx_listing_dates(market) or {}
+    except Exception:
+        listing_dates = {}
+    for row in rows:
+        row["listing_date"] = listing_dates.get(row["code"])
+    return rows
+
+
+def get_ticker_master(refresh: bool = False):
+    """
+    거래일 단위로 캐시된 종목 마스터 조회 (utils.ticker_master)
+
+    Args:
+        refresh: True면 당일 마스터가 있어도 다시 생성
+
+    Returns:
+        TickerMaster (name/code/aliases/codes 조회) or None (실패 시)
+    """
+    try:
+        from .ticker_master import get_ticker_master as _get_master
+        return _get_master(_fetch_master_rows, refresh=refresh)
+    except Exception:
+        return None
+
+
 def get_ticker_name(ticker: str) -> Optional[str]:
     """
-    종목명 조회
+    종목명 조회 (종목 마스터 우선, 없는 종목만 pykrx 조회)
 
     Args:
         ticker: 종목코드 (예: "005930")
@@ -69,6 +137,12 @@ def get_ticker_name(ticker: str) -> Optional[str]:
         >>> get_ticker_name("005930")
         "삼성전자"
     """
+    master = get_ticker_master()
+    if master is not None:
+        name = master.name(ticker)
+        if name:
+            return name
+
     try:
         name = stock.get_market_ticker_name(ticker)
         if not name:
@@ -78,12 +152,30 @@ def get_ticker_name(ticker: str) -> Optional[str]:
         return None
 
 
+def get_ticker_code(name: str) -> Optional[str]:
+    """
+    종목명/별칭 → 종목코드 역조회
+
+    Args:
+        name: 종목명 또는 별칭 (예: "삼성전자", "삼전", 공백/대소문자 무시)
+
+    Returns:
+        종목코드 or None (마스터 없음/일치 종목 없음)
+
+    Example:
+        >>> get_ticker_code("SK하이닉스")
+        "000660"
+    """
+    master = get_ticker_master()
+    return master.code(name) if master is not None else None
+
+
 def get_ticker_list(
     date: Optional[str] = None,
     market: str = "KOSPI"
 ) -> Optional[list]:
     """
-    전체 종목 리스트 조회 (pykrx 우선, 실패 시 Naver fallback)
+    전체 종목 리스트 조회 (당일 KOSPI/KOSDAQ은 종목 마스터, 그 외 pykrx 우선, 실패 시 Naver fallback)
 
     Args:
         date: 조회일 YYYYMMDD (기본 오늘)
@@ -92,6 +184,14 @@ def get_ticker_list(
     Returns:
         ['005930', '000660', ...] or None (실패 시)
     """
+    # 0차: 종목 마스터 (거래일당 한 번 생성)
+    if _is_today(date) and market in ("KOSPI", "KOSDAQ"):
+        master = get_ticker_master()
+        if master is not None:
+            codes = master.codes(market)
+            if codes:
+                return codes
+
     # 1차: pykrx
     try:
         if date is None:
@@ -104,7 +204,7 @@ def get_ticker_list(
 
     # 2차: Naver fallback
     try:
-        from utils.web_scraper import get_naver_stock_list
+        from .web_scraper import get_naver_stock_list
         stocks = get_naver_stock_list(market)
         if stocks:
             return [s["code"] for s in stocks]
@@ -156,9 +256,11 @@ def get_fundamental(
         pass
 
     # 2차 시도: 네이버 금융 fallback
+    # (시장 스냅샷은 PBR 컬럼이 없어 사용하지 않음 - 폴링 API/종목 페이지는 실제 PBR 제공)
     try:
-        from utils.web_scraper import get_naver_stock_info
-        info = get_naver_stock_info(ticker)
+        from .web_scraper import get_naver_quote
+        # PER/PBR만 필요하므로 폴링 API 요청 하나로 응답 (종목 페이지 미조회)
+        info = get_naver_quote(ticker, fields=("per", "pbr"))
         if info and (info.get("per") is not None or info.get("pbr") is not None):
             return {
                 "BPS": 0,  # 네이버에서 제공 안 함
@@ -214,9 +316,25 @@ def get_market_cap(
     except Exception:
         pass
 
-    # 2차: Naver fallback
+    # 2차: 신선한 시장 스냅샷 (당일 조회만, 네트워크 없음)
+    if _is_today(date):
+        try:
+            from .market_snapshot import lookup_snapshot
+            row = lookup_snapshot(ticker)
+            if row and row.get("market_cap"):
+                return {
+                    "시가총액": int(row["market_cap"]) * 100000000,  # 억→원
+                    "거래량": int(row.get("volume") or 0),
+                    "거래대금": None,  # 스냅샷 미제공
+                    "상장주식수": int(row["listed_shares"]) * 1000 if row.get("listed_shares") else None,  # 천주→주
+                    "외국인보유주식수": None,  # 스냅샷 미제공
+                }
+        except Exception:
+            pass
+
+    # 3차: Naver fallback
     try:
-        from utils.web_scraper import get_naver_stock_info
+        from .web_scraper import get_naver_stock_info
         info = get_naver_stock_info(ticker)
         if info and info.get("market_cap"):
             return {
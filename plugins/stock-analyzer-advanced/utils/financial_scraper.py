@@ -3,11 +3,20 @@
 FnGuide 우선 (div ID 기반 파싱)
 모든 숫자에 출처 명시
 """
+import html as html_lib
 import re
-import time
 from typing import Optional
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+if not __package__:
+    # 스크립트로 직접 실행 (python utils/financial_scraper.py) 시 utils 패키지 하위 모듈로 import
+    import sys
+    from pathlib import Path
+    # sys.path[0](utils 디렉토리)를 플러그인 루트로 교체 (utils/deprecated.py가 deprecated 패키지를 가리지 않게)
+    sys.path[0] = str(Path(__file__).resolve().parent.parent)
+    __package__ = "utils"
+
+from .http_client import http_get
 
 # FnGuide 테이블 ID
 FNGUIDE_URL = "https://comp.fnguide.com/SVO2/ASP/SVD_Finance.asp"
@@ -160,20 +169,43 @@ def _parse_fnguide_table(soup: BeautifulSoup, div_id: str, metrics: dict) -> Opt
     return {k: v for k, v in result.items() if v} or None
 
 
-def _extract_company_name(soup: BeautifulSoup) -> Optional[str]:
-    """회사명 추출"""
-    # h1.giName 시도
-    name_elem = soup.find("h1", class_="giName")
-    if name_elem:
-        return name_elem.text.strip()
+def _fnguide_soup(html: str) -> BeautifulSoup:
+    """FnGuide 재무 테이블 div만 트리로 만든 BeautifulSoup (페이지 전체 파싱 생략)"""
+    return BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("div", id=list(FNGUIDE_TABLE_IDS)))
 
-    # title에서 추출
-    title = soup.find("title")
-    if title:
-        title_text = title.text.strip()
-        match = re.match(r"([^(]+)\(", title_text)
-        if match:
-            return match.group(1).strip()
+
+# 회사명 추출용 정규식 (Tier 2 fnguide 파서도 tier1_bridge로 같은 함수 사용)
+_GINAME_RE = re.compile(r"<h1[^>]*class=[\"'][^\"']*\bgiName\b[^>]*>(.*?)</h1>", re.IGNORECASE | re.DOTALL)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def extract_company_name_from_html(html: str) -> Optional[str]:
+    """원본 HTML에서 회사명 추출 (h1.giName → title 순, 트리 생성 없이 정규식)"""
+    match = _GINAME_RE.search(html)
+    if match:
+        name = html_lib.unescape(_TAG_RE.sub("", match.group(1))).strip()
+        if name:
+            return name
+
+    match = _TITLE_RE.search(html)
+    if match:
+        return name_from_title(html_lib.unescape(match.group(1)).strip())
+
+    return None
+
+
+def name_from_title(title_text: str) -> Optional[str]:
+    """<title> 텍스트에서 회사명 추출"""
+    match = re.match(r"([^(]+)\(", title_text)
+    if match:
+        return match.group(1).strip()
+    if " - " in title_text:
+        return title_text.split(" - ")[0].strip()
+    if "FnGuide" in title_text:
+        parts = title_text.replace("FnGuide", "").strip(" -")
+        if parts:
+            return parts
     return None
 
 
@@ -295,72 +327,66 @@ def get_fnguide_financial(ticker: str, retry: int = 2) -> Optional[dict]:
     """
     url = f"{FNGUIDE_URL}?pGB=1&gicode=A{ticker}"
 
-    for attempt in range(retry + 1):
-        try:
-            response = requests.get(url, headers=FNGUIDE_HEADERS, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 종목명 추출
-            name = _extract_company_name(soup)
-
-            # 테이블 파싱
-            income_annual = _parse_fnguide_table(soup, "divSonikY", INCOME_METRICS)
-            balance_annual = _parse_fnguide_table(soup, "divDaechaY", BALANCE_METRICS)
-            cash_annual = _parse_fnguide_table(soup, "divCashY", CASH_FLOW_METRICS)
-
-            if not income_annual:
-                raise ValueError("Failed to parse income data")
-
-            # FCF 계산
-            if cash_annual:
-                for year, data in cash_annual.items():
-                    ocf = data.get("operating_cash_flow")
-                    icf = data.get("investing_cash_flow")
-                    if ocf is not None and icf is not None:
-                        data["fcf"] = ocf + icf
-
-            # 누적 기간 감지
-            period_labels = _detect_accumulated_periods(income_annual, soup)
-
-            # 성장률 계산 (완결 연도 기준)
-            growth = _calculate_growth(income_annual, period_labels)
-
-            # 재무비율 계산
-            ratios = _calculate_ratios(income_annual, balance_annual)
-
-            # 최신 연도
-            years = sorted(income_annual.keys(), reverse=True)
-            latest_year = years[0] if years else None
-
-            # latest 구성
-            latest = {}
-            if latest_year and latest_year in income_annual:
-                latest.update(income_annual[latest_year])
-            if balance_annual and latest_year in balance_annual:
-                latest.update(balance_annual[latest_year])
-
-            return {
-                "source": "FnGuide",
-                "ticker": ticker,
-                "name": name,
-                "period": f"{latest_year}/12" if latest_year else None,
-                "annual": income_annual,
-                "balance": balance_annual or {},
-                "cash_flow": cash_annual or {},
-                "latest": latest,
-                "growth": growth,
-                "ratios": ratios,
-                "period_labels": period_labels,
-            }
-
-        except Exception as e:
-            if attempt < retry:
-                time.sleep(1)
-                continue
-            return None
+    try:
+        # 네트워크 오류/5xx 재시도는 공유 HTTP 레이어가 담당 (지수 백오프)
+        response = http_get(url, headers=FNGUIDE_HEADERS, timeout=15, retries=retry)
+        soup = _fnguide_soup(response.text)
+
+        # 종목명 추출
+        name = extract_company_name_from_html(response.text)
+
+        # 테이블 파싱
+        income_annual = _parse_fnguide_table(soup, "divSonikY", INCOME_METRICS)
+        balance_annual = _parse_fnguide_table(soup, "divDaechaY", BALANCE_METRICS)
+        cash_annual = _parse_fnguide_table(soup, "divCashY", CASH_FLOW_METRICS)
+
+        if not income_annual:
+            raise ValueError("Failed to parse income data")
+
+        # FCF 계산
+        if cash_annual:
+            for year, data in cash_annual.items():
+                ocf = data.get("operating_cash_flow")
+                icf = data.get("investing_cash_flow")
+                if ocf is not None and icf is not None:
+                    data["fcf"] = ocf + icf
+
+        # 누적 기간 감지
+        period_labels = _detect_accumulated_periods(income_annual, soup)
+
+        # 성장률 계산 (완결 연도 기준)
+        growth = _calculate_growth(income_annual, period_labels)
+
+        # 재무비율 계산
+        ratios = _calculate_ratios(income_annual, balance_annual)
+
+        # 최신 연도
+        years = sorted(income_annual.keys(), reverse=True)
+        latest_year = years[0] if years else None
+
+        # latest 구성
+        latest = {}
+        if latest_year and latest_year in income_annual:
+            latest.update(income_annual[latest_year])
+        if balance_annual and latest_year in balance_annual:
+            latest.update(balance_annual[latest_year])
+
+        return {
+            "source": "FnGuide",
+            "ticker": ticker,
+            "name": name,
+            "period": f"{latest_year}/12" if latest_year else None,
+            "annual": income_annual,
+            "balance": balance_annual or {},
+            "cash_flow": cash_annual or {},
+            "latest": latest,
+            "growth": growth,
+            "ratios": ratios,
+            "period_labels": period_labels,
+        }
 
-    return None
+    except Exception:
+        return None
 
 
 def get_naver_financial(ticker: str) -> Optional[dict]:
@@ -382,12 +408,7 @@ def get_naver_financial(ticker: str) -> Optional[dict]:
     try:
         # 네이버 기업정보 페이지
         url = f"https://finance.naver.com/item/coinfo.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        response = http_get(url, timeout=15)
 
         soup = BeautifulSoup(response.text, "html.parser")
 
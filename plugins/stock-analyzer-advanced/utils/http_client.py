@@ -0,0 +1,265 @@
+"""공유 HTTP 클라이언트
+
+모든 스크래퍼(Tier 1 utils, Tier 2 fi_plus/si_plus)가 사용하는 공통 fetch 레이어
+- 호스트별 keep-alive 세션 (커넥션 풀링, TCP/TLS 핸드셰이크 재사용)
+- 도메인별 토큰 버킷 rate limit (naver.com, fnguide.com, reddit.com)
+- 지터를 섞은 지수 백오프 재시도 (연결 오류, 429, 5xx)
+- 호스트별 요청 메트릭
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+}
+
+# 도메인 → (초당 요청 수, 버스트 크기)
+# 하위 도메인도 매칭됨 (예: finance.naver.com → naver.com)
+RATE_LIMITS = {
+    "naver.com": (5.0, 10),
+    "fnguide.com": (2.0, 4),
+    "reddit.com": (1.0, 1),
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 백오프 상한 (초)
+MAX_BACKOFF = 10.0
+
+# 호스트당 커넥션 풀 크기 (동시 요청 수 기준)
+POOL_MAXSIZE = 16
+
+
+class TokenBucket:
+    """토큰 버킷 rate limiter (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: 초당 충전 토큰 수
+            capacity: 버스트 허용 크기
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득 (없으면 충전될 때까지 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+@dataclass
+class HostMetrics:
+    """호스트별 요청 메트릭 (같은 호스트로 동시에 요청하는 스레드들이 공유)"""
+    requests: int = 0        # 실제 전송한 요청 수 (재시도 포함)
+    errors: int = 0          # 최종 실패 수
+    retries: int = 0         # 재시도 수
+    throttled: float = 0.0   # rate limit 대기 누적 (초)
+    elapsed: float = 0.0     # 응답 대기 누적 (초)
+    bytes: int = 0           # 수신 바이트 누적
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def record(self, **deltas: float) -> None:
+        """
+        카운터 누적 (호스트별 잠금 안에서, `+=`는 스레드 간 원자적이지 않음)
+
+        Args:
+            **deltas: 필드명 → 증가량 (예: requests=1, elapsed=0.12)
+        """
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def as_dict(self) -> dict:
+        """현재 카운터 (잠금 안에서 한 번에 읽음)"""
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
+
+
+_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_buckets: Dict[str, Optional[TokenBucket]] = {}
+_metrics: Dict[str, HostMetrics] = {}
+
+
+def _rate_limit_domain(host: str) -> Optional[str]:
+    """호스트에 적용할 rate limit 도메인 (없으면 None)"""
+    for domain in RATE_LIMITS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return None
+
+
+def get_session(host: str) -> requests.Session:
+    """
+    호스트별 keep-alive 세션 조회 (없으면 생성)
+
+    Args:
+        host: 호스트명 (예: "finance.naver.com")
+
+    Returns:
+        커넥션 풀이 설정된 requests.Session
+    """
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def _get_bucket(host: str) -> Optional[TokenBucket]:
+    """rate limit 도메인 단위 토큰 버킷 (하위 도메인끼리 공유)"""
+    domain = _rate_limit_domain(host)
+    if domain is None:
+        return None
+    with _lock:
+        if domain not in _buckets:
+            rate, capacity = RATE_LIMITS[domain]
+            _buckets[domain] = TokenBucket(rate, capacity)
+        return _buckets[domain]
+
+
+def _host_metrics(host: str) -> HostMetrics:
+    with _lock:
+        if host not in _metrics:
+            _metrics[host] = HostMetrics()
+        return _metrics[host]
+
+
+def set_rate_limit(domain: str, rate: float, capacity: int) -> None:
+    """
+    도메인 rate limit 변경
+
+    Args:
+        domain: 도메인 (예: "naver.com")
+        rate: 초당 요청 수
+        capacity: 버스트 크기
+    """
+    with _lock:
+        RATE_LIMITS[domain] = (rate, capacity)
+        _buckets.pop(domain, None)
+
+
+def _backoff_delay(attempt: int, backoff: float, response: Optional[requests.Response] = None) -> float:
+    """재시도 대기 시간 (Retry-After 우선, 없으면 지터 포함 지수 백오프)"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After") if response.headers else None
+        if retry_after and str(retry_after).isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+    return min(backoff * (2 ** attempt) * random.uniform(0.5, 1.5), MAX_BACKOFF)
+
+
+def http_get(
+    url: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float = 10,
+    retries: int = 2,
+    backoff: float = 0.5,
+    session: Optional[requests.Session] = None,
+) -> requests.Response:
+    """
+    공유 세션으로 GET 요청 (rate limit + 재시도)
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        headers: 추가 헤더 (세션 기본 헤더에 병합)
+        timeout: 요청 타임아웃 (초)
+        retries: 재시도 횟수 (연결 오류, 429, 5xx 대상)
+        backoff: 백오프 기준 시간 (초)
+        session: 사용할 세션 (기본: 호스트별 공유 세션)
+
+    Returns:
+        requests.Response (2xx)
+
+    Raises:
+        requests.RequestException: 재시도 후에도 실패한 경우
+    """
+    host = urlsplit(url).hostname or ""
+    session = session or get_session(host)
+    bucket = _get_bucket(host)
+    metrics = _host_metrics(host)
+
+    for attempt in range(retries + 1):
+        if bucket is not None:
+            metrics.record(throttled=bucket.acquire())
+
+        start = time.monotonic()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt < retries:
+                metrics.record(requests=1, elapsed=time.monotonic() - start, retries=1)
+                time.sleep(_backoff_delay(attempt, backoff))
+                continue
+            metrics.record(requests=1, elapsed=time.monotonic() - start, errors=1)
+            raise
+
+        metrics.record(requests=1, elapsed=time.monotonic() - start)
+
+        if response.status_code in RETRY_STATUS and attempt < retries:
+            metrics.record(retries=1)
+            time.sleep(_backoff_delay(attempt, backoff, response))
+            continue
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            metrics.record(errors=1)
+            raise
+
+        metrics.record(bytes=len(response.content or b""))
+        return response
+
+    # retries < 0 인 경우에만 도달
+    raise requests.RequestException(f"No request attempted: {url}")
+
+
+def get_metrics() -> Dict[str, dict]:
+    """
+    호스트별 요청 메트릭 조회
+
+    Returns:
+        {"finance.naver.com": {"requests": 12, "errors": 0, ...}, ...}
+    """
+    with _lock:
+        metrics = dict(_metrics)
+    return {host: m.as_dict() for host, m in metrics.items()}
+
+
+def reset_metrics() -> None:
+    """요청 메트릭 초기화"""
+    with _lock:
+        _metrics.clear()
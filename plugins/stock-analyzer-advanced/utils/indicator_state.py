@@ -0,0 +1,322 @@
+"""증분 기술지표 상태
+
+indicators.py 함수의 스트리밍 버전
+과거 데이터로 초기화(from_history)한 뒤 새 봉이 들어올 때마다 O(1)로 갱신한다.
+- update(...): 봉 확정 시 상태에 반영하고 최신 값 반환
+- peek(...): 상태를 바꾸지 않고 "현재 봉이 이 가격으로 끝나면"의 값 반환 (장중 틱 갱신용)
+
+EMA/RSI/MACD는 pandas ewm(adjust=False)과 같은 재귀를 그대로 따르므로
+indicators.py 결과와 같은 값이 나오고, 이동창 지표(SMA/볼린저/스토캐스틱)는
+링 버퍼 + 이동 통계 / 단조 deque로 계산한다 (부동소수점 오차 범위 내 동일).
+"""
+import math
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+
+from .indicators import _ewm_alpha, _ewm_step
+
+NAN = float("nan")
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """pandas/NumPy와 같은 0 나눗셈 규칙 (x/0 → ±inf, 0/0 → NaN)"""
+    if denominator == 0:
+        if numerator == 0 or numerator != numerator:
+            return NAN
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+
+class IndicatorState:
+    """증분 지표 상태 공통 베이스"""
+
+    @classmethod
+    def from_history(cls, *series, **params):
+        """
+        과거 데이터로 상태 초기화
+
+        Args:
+            *series: update()에 넘길 순서대로의 Series/배열 (예: close 또는 high, low, close)
+            **params: 생성자 파라미터 (period 등)
+
+        Returns:
+            마지막 봉까지 반영된 상태 객체
+        """
+        state = cls(**params)
+        columns = [np.asarray(s, dtype=float).tolist() for s in series]
+        for values in zip(*columns):
+            state.update(*values)
+        return state
+
+
+class EMAState(IndicatorState):
+    """지수이동평균 상태 (ema()와 동일한 재귀)"""
+
+    def __init__(self, period: int = None, alpha: float = None):
+        """
+        Args:
+            period: EMA 기간 (span)
+            alpha: 평활 계수 (period 대신 지정, 예: Wilder 1/period)
+        """
+        self.alpha = _ewm_alpha(span=period) if alpha is None else _ewm_alpha(alpha=alpha)
+        self._weighted = NAN
+        self._old_wt = 1.0
+
+    def _step(self, x: float) -> Tuple[float, float]:
+        return _ewm_step(self._weighted, self._old_wt, x, self.alpha)
+
+    @property
+    def value(self) -> float:
+        return self._weighted
+
+    def update(self, x: float) -> float:
+        self._weighted, self._old_wt = self._step(x)
+        return self._weighted
+
+    def peek(self, x: float) -> float:
+        return self._step(x)[0]
+
+
+class RSIState(IndicatorState):
+    """RSI 상태 (Wilder 평활, rsi()와 동일)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gain = EMAState(alpha=1 / period)
+        self._loss = EMAState(alpha=1 / period)
+        self._prev = NAN
+        self._value = NAN
+
+    def _changes(self, x: float) -> Tuple[float, float]:
+        delta = x - self._prev
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        return gain, loss
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        rs = _divide(avg_gain, avg_loss)
+        return 100 - (100 / (1 + rs))
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def update(self, close: float) -> float:
+        gain, loss = self._changes(close)
+        self._value = self._rsi(self._gain.update(gain), self._loss.update(loss))
+        self._prev = close
+        return self._value
+
+    def peek(self, close: float) -> float:
+        gain, loss = self._changes(close)
+        return self._rsi(self._gain.peek(gain), self._loss.peek(loss))
+
+
+class MACDState(IndicatorState):
+    """MACD 상태 (macd()와 동일)"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = EMAState(fast)
+        self._slow = EMAState(slow)
+        self._signal = EMAState(signal)
+        self._value = (NAN, NAN, NAN)
+
+    @property
+    def value(self) -> Tuple[float, float, float]:
+        """(macd_line, signal_line, histogram)"""
+        return self._value
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        line = self._fast.update(close) - self._slow.update(close)
+        signal = self._signal.update(line)
+        self._value = (line, signal, line - signal)
+        return self._value
+
+    def peek(self, close: float) -> Tuple[float, float, float]:
+        line = self._fast.peek(close) - self._slow.peek(close)
+        signal = self._signal.peek(line)
+        return line, signal, line - signal
+
+
+class _RollingStats:
+    """고정 길이 창의 평균/분산 (링 버퍼 + 이동 Welford)
+
+    창에 NaN이 있으면 pandas rolling처럼 NaN 반환
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque()
+        self._nan_count = 0
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @staticmethod
+    def _add(n, mean, m2, x):
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        return n, mean, m2
+
+    @staticmethod
+    def _remove(n, mean, m2, x):
+        n -= 1
+        if n == 0:
+            return 0, 0.0, 0.0
+        delta = x - mean
+        mean -= delta / n
+        m2 -= delta * (x - mean)
+        return n, mean, max(m2, 0.0)
+
+    def _next(self, x: float):
+        """x 추가 후의 (n, mean, m2, nan_count) 계산 (상태 변경 없음)"""
+        n, mean, m2, nan_count = self._n, self._mean, self._m2, self._nan_count
+        if len(self._values) == self.window:
+            oldest = self._values[0]
+            if oldest != oldest:
+                nan_count -= 1
+            else:
+                n, mean, m2 = self._remove(n, mean, m2, oldest)
+        if x != x:
+            nan_count += 1
+        else:
+            n, mean, m2 = self._add(n, mean, m2, x)
+        return n, mean, m2, nan_count
+
+    def _stats(self, n, mean, m2, nan_count, size) -> Tuple[float, float]:
+        if size < self.window or nan_count:
+            return NAN, NAN
+        std = math.sqrt(m2 / (n - 1)) if n > 1 else NAN
+        return mean, std
+
+    def update(self, x: float) -> Tuple[float, float]:
+        """x 추가 후 (평균, 표본표준편차)"""
+        self._n, self._mean, self._m2, self._nan_count = self._next(x)
+        self._values.append(x)
+        if len(self._values) > self.window:
+            self._values.popleft()
+        return self._stats(self._n, self._mean, self._m2, self._nan_count, len(self._values))
+
+    def peek(self, x: float) -> Tuple[float, float]:
+        n, mean, m2, nan_count = self._next(x)
+        return self._stats(n, mean, m2, nan_count, min(len(self._values) + 1, self.window))
+
+
+class SMAState(IndicatorState):
+    """단순이동평균 상태 (sma()와 동일)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._window = _RollingStats(period)
+        self._value = NAN
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def update(self, close: float) -> float:
+        self._value = self._window.update(close)[0]
+        return self._value
+
+    def peek(self, close: float) -> float:
+        return self._window.peek(close)[0]
+
+
+class BollingerState(IndicatorState):
+    """볼린저 밴드 상태 (bollinger()와 동일)"""
+
+    def __init__(self, period: int = 20, std: float = 2.0):
+        self.period = period
+        self.std = std
+        self._window = _RollingStats(period)
+        self._value = (NAN, NAN, NAN)
+
+    def _bands(self, mean: float, std_dev: float) -> Tuple[float, float, float]:
+        return mean + std_dev * self.std, mean, mean - std_dev * self.std
+
+    @property
+    def value(self) -> Tuple[float, float, float]:
+        """(upper, middle, lower)"""
+        return self._value
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        self._value = self._bands(*self._window.update(close))
+        return self._value
+
+    def peek(self, close: float) -> Tuple[float, float, float]:
+        return self._bands(*self._window.peek(close))
+
+
+class StochasticState(IndicatorState):
+    """스토캐스틱 상태 (stochastic()과 동일)
+
+    최고가/최저가는 단조 deque로 O(1) 갱신
+    """
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self.k_period = k_period
+        self.d_period = d_period
+        self._index = -1
+        self._last_nan = -k_period     # 마지막 고가/저가 NaN 위치
+        self._highs = deque()          # (index, high) 내림차순
+        self._lows = deque()           # (index, low) 오름차순
+        self._d = _RollingStats(d_period)
+        self._value = (NAN, NAN)
+
+    def _extreme(self, queue: deque, x: float, start: int, is_max: bool) -> float:
+        """창 시작(start) 이후 저장된 값과 x 중 최고/최저값"""
+        best = x
+        for index, value in queue:
+            if index >= start:
+                best = max(best, value) if is_max else min(best, value)
+                break
+        return best
+
+    def _k(self, high: float, low: float, close: float, index: int, last_nan: int) -> float:
+        if index < self.k_period - 1 or index - last_nan < self.k_period:
+            return NAN
+        start = index - self.k_period + 1
+        highest = self._extreme(self._highs, high, start, True)
+        lowest = self._extreme(self._lows, low, start, False)
+        return _divide(100 * (close - lowest), highest - lowest)
+
+    @property
+    def value(self) -> Tuple[float, float]:
+        """(%K, %D)"""
+        return self._value
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        self._index += 1
+        index = self._index
+        if high != high or low != low:
+            self._last_nan = index
+        k = self._k(high, low, close, index, self._last_nan)
+
+        if high == high:
+            while self._highs and self._highs[-1][1] <= high:
+                self._highs.pop()
+            self._highs.append((index, high))
+        if low == low:
+            while self._lows and self._lows[-1][1] >= low:
+                self._lows.pop()
+            self._lows.append((index, low))
+        start = index - self.k_period + 1
+        while self._highs and self._highs[0][0] < start:
+            self._highs.popleft()
+        while self._lows and self._lows[0][0] < start:
+            self._lows.popleft()
+
+        d = self._d.update(k)[0]
+        self._value = (k, d)
+        return self._value
+
+    def peek(self, high: float, low: float, close: float) -> Tuple[float, float]:
+        index = self._index + 1
+        last_nan = index if (high != high or low != low) else self._last_nan
+        k = self._k(high, low, close, index, last_nan)
+        return k, self._d.peek(k)[0]
@@ -1,66 +1,209 @@
 """기술지표 함수
 
 순수 함수로 구현된 기술지표 계산 유틸리티
-입력: pandas Series
-출력: pandas Series 또는 tuple
+입력: pandas Series, 또는 (날짜 × 종목) DataFrame / ndarray
+출력: 입력과 같은 타입 또는 tuple
+
+DataFrame/ndarray 입력은 NumPy 커널로 모든 종목을 한 번에 계산하며
+종목별 Series로 계산한 결과와 같은 값을 반환한다 (pandas rolling/ewm 규칙 동일).
 """
-from typing import Tuple
+import math
+from typing import Tuple, Union
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ArrayLike = Union[pd.Series, pd.DataFrame, np.ndarray]
+
+
+def _is_matrix(x) -> bool:
+    """NumPy 커널 대상 입력 여부 (DataFrame / ndarray)"""
+    return isinstance(x, (pd.DataFrame, np.ndarray))
+
+
+def _as_matrix(x) -> np.ndarray:
+    """DataFrame / ndarray → (날짜 × 종목) float64 2-D 배열"""
+    values = x.to_numpy(dtype=float) if isinstance(x, pd.DataFrame) else np.asarray(x, dtype=float)
+    return values.reshape(len(values), -1)
+
+
+def _wrap(values: np.ndarray, like):
+    """계산 결과를 입력과 같은 타입/모양으로 복원"""
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(values, index=like.index, columns=like.columns)
+    if np.ndim(like) == 1:
+        return values[:, 0]
+    return values
+
+
+def _wrap_last(values: np.ndarray, like):
+    """마지막 행 결과 복원 (Series/1-D → float, DataFrame → 종목별 Series, 2-D → 1-D 배열)"""
+    if isinstance(like, pd.DataFrame):
+        return pd.Series(values, index=like.columns)
+    if np.ndim(like) == 1:
+        return float(values[0])
+    return values
+
+
+def _ewm_alpha(span: float = None, alpha: float = None) -> float:
+    """pandas ewm과 같은 방식으로 alpha 산출 (com 경유)"""
+    com = (span - 1) / 2.0 if span is not None else 1.0 / alpha - 1
+    return 1.0 / (1.0 + com)
+
 
+def _ewm_mean(values: np.ndarray, alpha: float, last_only: bool = False) -> np.ndarray:
+    """ewm(adjust=False).mean() 재귀를 열 단위로 동시에 계산
 
-def sma(close: pd.Series, period: int) -> pd.Series:
+    pandas 구현과 같은 순서로 연산 (ignore_na=False):
+    - 첫 관측값부터 시작, 이전 값이 있으면 결측 구간에도 가중치 감쇠
+    - 값이 같으면 갱신하지 않음 (상수 구간 수치 오차 방지)
+
+    last_only=True면 중간 결과를 저장하지 않고 마지막 행(1-D)만 반환
+    """
+    if len(values) == 0:
+        return np.full(values.shape[1], np.nan) if last_only else np.empty_like(values)
+    if last_only and values.shape[1] == 1:
+        # 단일 종목은 스칼라 재귀가 배열 연산보다 빠름
+        weighted, old_wt = math.nan, 1.0
+        for x in values[:, 0].tolist():
+            weighted, old_wt = _ewm_step(weighted, old_wt, x, alpha)
+        return np.array([weighted])
+
+    out = None if last_only else np.empty_like(values)
+
+    weighted = values[0].copy()
+    old_wt = np.ones(values.shape[1])
+    old_wt_factor = 1.0 - alpha
+    if out is not None:
+        out[0] = weighted
+
+    for i in range(1, len(values)):
+        cur = values[i]
+        is_obs = ~np.isnan(cur)
+        has_prev = ~np.isnan(weighted)
+
+        old_wt = np.where(has_prev, old_wt * old_wt_factor, old_wt)
+        with np.errstate(invalid="ignore"):
+            blended = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(has_prev & is_obs & (weighted != cur), blended, weighted)
+        old_wt = np.where(has_prev & is_obs, 1.0, old_wt)
+        weighted = np.where(~has_prev & is_obs, cur, weighted)
+        if out is not None:
+            out[i] = weighted
+
+    return weighted if out is None else out
+
+
+def _ewm_step(weighted: float, old_wt: float, x: float, alpha: float) -> Tuple[float, float]:
+    """ewm(adjust=False).mean() 재귀 한 단계 (스칼라, _ewm_mean과 같은 연산 순서)
+
+    Returns:
+        (새 평균, 새 가중치)
+    """
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if x == x:
+            if weighted != x:
+                weighted = (old_wt * weighted + alpha * x) / (old_wt + alpha)
+            old_wt = 1.0
+    elif x == x:
+        weighted = x
+    return weighted, old_wt
+
+
+def _rolling(values: np.ndarray, window: int, func, **kwargs) -> np.ndarray:
+    """rolling(window) 집계를 열 단위로 동시에 계산 (창에 NaN 포함 시 NaN)"""
+    out = np.full_like(values, np.nan)
+    if len(values) >= window:
+        windows = sliding_window_view(values, window, axis=0)
+        out[window - 1:] = func(windows, axis=-1, **kwargs)
+    return out
+
+
+def sma(close: ArrayLike, period: int, last_only: bool = False) -> ArrayLike:
     """
     단순이동평균 (Simple Moving Average)
 
     Args:
-        close: 종가 Series
+        close: 종가 Series (또는 날짜 × 종목 DataFrame/ndarray)
         period: 이동평균 기간
+        last_only: True면 마지막 값만 계산 (마지막 period개만 사용)
 
     Returns:
-        SMA Series
+        SMA Series (입력과 같은 타입)
+        last_only=True: float (DataFrame 입력은 종목별 Series)
 
     Formula:
         SMA = sum(close[n-period:n]) / period
     """
+    if last_only:
+        values = _as_matrix(close)
+        if len(values) < period:
+            return _wrap_last(np.full(values.shape[1], np.nan), close)
+        return _wrap_last(values[-period:].mean(axis=0), close)
+    if _is_matrix(close):
+        return _wrap(_rolling(_as_matrix(close), period, np.mean), close)
     return close.rolling(window=period).mean()
 
 
-def ema(close: pd.Series, period: int) -> pd.Series:
+def ema(close: ArrayLike, period: int, last_only: bool = False) -> ArrayLike:
     """
     지수이동평균 (Exponential Moving Average)
 
     Args:
-        close: 종가 Series
+        close: 종가 Series (또는 날짜 × 종목 DataFrame/ndarray)
         period: 이동평균 기간
+        last_only: True면 마지막 값만 계산
+            (재귀식이라 첫 값부터 전체를 훑되 중간 Series는 만들지 않음 → 값은 동일)
 
     Returns:
-        EMA Series
+        EMA Series (입력과 같은 타입)
+        last_only=True: float (DataFrame 입력은 종목별 Series)
 
     Formula:
         EMA = close * k + EMA_prev * (1-k)
         k = 2 / (period + 1)
     """
+    if last_only:
+        return _wrap_last(_ewm_mean(_as_matrix(close), _ewm_alpha(span=period), last_only=True), close)
+    if _is_matrix(close):
+        return _wrap(_ewm_mean(_as_matrix(close), _ewm_alpha(span=period)), close)
     return close.ewm(span=period, adjust=False).mean()
 
 
-def rsi(close: pd.Series, period: int = 14) -> pd.Series:
+def rsi(close: ArrayLike, period: int = 14, last_only: bool = False) -> ArrayLike:
     """
     RSI (Relative Strength Index)
 
     Args:
-        close: 종가 Series
+        close: 종가 Series (또는 날짜 × 종목 DataFrame/ndarray)
         period: RSI 기간 (기본 14)
+        last_only: True면 마지막 값만 계산 (Wilder 평활 재귀는 전체 구간 반영)
 
     Returns:
-        RSI Series (0-100)
+        RSI Series (0-100, 입력과 같은 타입)
+        last_only=True: float (DataFrame 입력은 종목별 Series)
 
     해석:
         > 70: 과매수 (매도 고려)
         < 30: 과매도 (매수 고려)
         50 기준 상승/하락 추세 판단
     """
+    if _is_matrix(close) or last_only:
+        values = _as_matrix(close)
+        delta = np.full_like(values, np.nan)
+        delta[1:] = values[1:] - values[:-1]
+
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+
+        alpha = _ewm_alpha(alpha=1 / period)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = _ewm_mean(gain, alpha, last_only) / _ewm_mean(loss, alpha, last_only)
+            rsi_values = 100 - (100 / (1 + rs))
+        return _wrap_last(rsi_values, close) if last_only else _wrap(rsi_values, close)
+
     delta = close.diff()
 
     gain = delta.where(delta > 0, 0.0)
@@ -77,28 +220,53 @@ def rsi(close: pd.Series, period: int = 14) -> pd.Series:
 
 
 def macd(
-    close: pd.Series,
+    close: ArrayLike,
     fast: int = 12,
     slow: int = 26,
-    signal: int = 9
-) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    signal: int = 9,
+    last_only: bool = False
+) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
     """
     MACD (Moving Average Convergence Divergence)
 
     Args:
-        close: 종가 Series
+        close: 종가 Series (또는 날짜 × 종목 DataFrame/ndarray)
         fast: 단기 EMA 기간 (기본 12)
         slow: 장기 EMA 기간 (기본 26)
         signal: 시그널 EMA 기간 (기본 9)
+        last_only: True면 세 값의 마지막 값만 계산 (EMA 재귀는 전체 구간 반영)
 
     Returns:
         (macd_line, signal_line, histogram)
+        last_only=True: float 3개 (DataFrame 입력은 종목별 Series)
 
     해석:
         macd > signal (골든크로스): 매수 신호
         macd < signal (데드크로스): 매도 신호
         histogram 방향: 모멘텀 강도
     """
+    if last_only:
+        values = _as_matrix(close)
+        alpha_fast, alpha_slow, alpha_signal = _ewm_alpha(span=fast), _ewm_alpha(span=slow), _ewm_alpha(span=signal)
+        if values.shape[1] == 1:
+            fast_w = slow_w = signal_w = line = math.nan
+            fast_o = slow_o = signal_o = 1.0
+            for x in values[:, 0].tolist():
+                fast_w, fast_o = _ewm_step(fast_w, fast_o, x, alpha_fast)
+                slow_w, slow_o = _ewm_step(slow_w, slow_o, x, alpha_slow)
+                line = fast_w - slow_w
+                signal_w, signal_o = _ewm_step(signal_w, signal_o, line, alpha_signal)
+            last_line, last_signal = np.array([line]), np.array([signal_w])
+        else:
+            lines = _ewm_mean(values, alpha_fast) - _ewm_mean(values, alpha_slow)
+            last_line = lines[-1] if len(lines) else np.full(values.shape[1], np.nan)
+            last_signal = _ewm_mean(lines, alpha_signal, last_only=True)
+        return (
+            _wrap_last(last_line, close),
+            _wrap_last(last_signal, close),
+            _wrap_last(last_line - last_signal, close),
+        )
+
     ema_fast = ema(close, fast)
     ema_slow = ema(close, slow)
 
@@ -110,20 +278,23 @@ def macd(
 
 
 def bollinger(
-    close: pd.Series,
+    close: ArrayLike,
     period: int = 20,
-    std: float = 2.0
-) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    std: float = 2.0,
+    last_only: bool = False
+) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
     """
     볼린저 밴드
 
     Args:
-        close: 종가 Series
+        close: 종가 Series (또는 날짜 × 종목 DataFrame/ndarray)
         period: SMA 기간 (기본 20)
         std: 표준편차 배수 (기본 2.0)
+        last_only: True면 마지막 값만 계산 (마지막 period개만 사용)
 
     Returns:
         (upper, middle, lower)
+        last_only=True: float 3개 (DataFrame 입력은 종목별 Series)
 
     해석:
         가격 > upper: 과매수, 하락 가능
@@ -131,8 +302,25 @@ def bollinger(
         밴드 수축: 변동성 감소, 돌파 임박
         밴드 확장: 변동성 증가
     """
+    if last_only:
+        values = _as_matrix(close)
+        if len(values) < period:
+            nan = np.full(values.shape[1], np.nan)
+            return _wrap_last(nan, close), _wrap_last(nan, close), _wrap_last(nan, close)
+        window = values[-period:]
+        middle = window.mean(axis=0)
+        std_dev = window.std(axis=0, ddof=1)
+        return (
+            _wrap_last(middle + std_dev * std, close),
+            _wrap_last(middle, close),
+            _wrap_last(middle - std_dev * std, close),
+        )
+
     middle = sma(close, period)
-    std_dev = close.rolling(window=period).std()
+    if _is_matrix(close):
+        std_dev = _wrap(_rolling(_as_matrix(close), period, np.std, ddof=1), close)
+    else:
+        std_dev = close.rolling(window=period).std()
 
     upper = middle + (std_dev * std)
     lower = middle - (std_dev * std)
@@ -141,24 +329,27 @@ def bollinger(
 
 
 def stochastic(
-    high: pd.Series,
-    low: pd.Series,
-    close: pd.Series,
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
     k_period: int = 14,
-    d_period: int = 3
-) -> Tuple[pd.Series, pd.Series]:
+    d_period: int = 3,
+    last_only: bool = False
+) -> Tuple[ArrayLike, ArrayLike]:
     """
     스토캐스틱 오실레이터
 
     Args:
-        high: 고가 Series
-        low: 저가 Series
-        close: 종가 Series
+        high: 고가 Series (또는 날짜 × 종목 DataFrame/ndarray)
+        low: 저가 Series (high와 같은 타입)
+        close: 종가 Series (high와 같은 타입)
         k_period: %K 기간 (기본 14)
         d_period: %D 기간 (기본 3)
+        last_only: True면 마지막 값만 계산 (마지막 k_period + d_period - 1개만 사용)
 
     Returns:
         (%K, %D)
+        last_only=True: float 2개 (DataFrame 입력은 종목별 Series)
 
     해석:
         > 80: 과매수
@@ -166,6 +357,25 @@ def stochastic(
         %K > %D 상향돌파: 매수
         %K < %D 하향돌파: 매도
     """
+    if last_only:
+        rows = k_period + d_period - 1
+        k, d = stochastic(
+            _as_matrix(high)[-rows:], _as_matrix(low)[-rows:], _as_matrix(close)[-rows:],
+            k_period, d_period,
+        )
+        if len(k) == 0:
+            k = d = np.full((1, k.shape[1]), np.nan)
+        return _wrap_last(k[-1], close), _wrap_last(d[-1], close)
+
+    if _is_matrix(close):
+        lowest_low = _rolling(_as_matrix(low), k_period, np.min)
+        highest_high = _rolling(_as_matrix(high), k_period, np.max)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k = 100 * (_as_matrix(close) - lowest_low) / (highest_high - lowest_low)
+        d = _rolling(k, d_period, np.mean)
+        return _wrap(k, close), _wrap(d, close)
+
     lowest_low = low.rolling(window=k_period).min()
     highest_high = high.rolling(window=k_period).max()
 
@@ -224,3 +434,156 @@ def support_resistance(
         "s1": float(s1),
         "s2": float(s2),
     }
+
+
+# 기본 기간 (ti_analyzer 리포트 기준)
+BUNDLE_MA_PERIODS = (5, 20, 60)
+
+
+def _window_mean(values: list, period: int) -> float:
+    """마지막 period개 평균 (부족하거나 NaN 포함 시 NaN)"""
+    if len(values) < period:
+        return math.nan
+    return math.fsum(values[-period:]) / period
+
+
+def _window_std(values: list, period: int, mean: float) -> float:
+    """마지막 period개 표본표준편차"""
+    if len(values) < period or mean != mean:
+        return math.nan
+    return math.sqrt(math.fsum((x - mean) ** 2 for x in values[-period:]) / (period - 1))
+
+
+def _last_stochastic(h: list, l: list, c: list, k_period: int = 14, d_period: int = 3) -> Tuple[float, float]:
+    """마지막 %K, %D (%D에 필요한 마지막 d_period개 %K만 계산)"""
+    n = len(c)
+    ks = []
+    for end in range(max(n - d_period, 0), n):
+        start = end - k_period + 1
+        window_h = h[start:end + 1]
+        window_l = l[start:end + 1]
+        if start < 0 or any(x != x for x in window_h + window_l):
+            ks.append(math.nan)
+            continue
+        lowest = min(window_l)
+        numerator = 100 * (c[end] - lowest)
+        denominator = max(window_h) - lowest
+        if denominator == 0:
+            ks.append(math.nan if numerator == 0 or numerator != numerator
+                      else math.copysign(math.inf, numerator))
+        else:
+            ks.append(numerator / denominator)
+    return (ks[-1] if ks else math.nan), _window_mean(ks, d_period)
+
+
+def indicator_bundle(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    last_only: bool = True
+) -> dict:
+    """
+    TI 지표 묶음 한 번에 계산 (RSI, MACD, 볼린저, 스토캐스틱, MA5/20/60)
+
+    재귀 지표(RSI의 Wilder 평활, MACD의 EMA 3개)는 float64 배열을 한 번만 순회하며
+    함께 갱신하고, 이동창 지표는 필요한 창만 계산한다.
+    각 지표 함수(rsi, macd, bollinger, stochastic, sma)의 기본 파라미터와 같은 값을 반환한다.
+
+    Args:
+        high: 고가 Series/1-D 배열
+        low: 저가 Series/1-D 배열
+        close: 종가 Series/1-D 배열
+        last_only: True면 마지막 값(float)만, False면 전체 구간 배열(ndarray) 반환
+
+    Returns:
+        {
+            "rsi", "macd", "macd_signal", "macd_hist",
+            "bb_upper", "bb_middle", "bb_lower",
+            "stoch_k", "stoch_d", "ma5", "ma20", "ma60"
+        }
+    """
+    h = np.asarray(high, dtype=float).tolist()
+    l = np.asarray(low, dtype=float).tolist()
+    c = np.asarray(close, dtype=float).tolist()
+    n = len(c)
+
+    alpha_rsi = _ewm_alpha(alpha=1 / 14)
+    alpha_fast = _ewm_alpha(span=12)
+    alpha_slow = _ewm_alpha(span=26)
+    alpha_signal = _ewm_alpha(span=9)
+
+    nan = math.nan
+    gain_w = loss_w = fast_w = slow_w = signal_w = nan
+    gain_o = loss_o = fast_o = slow_o = signal_o = 1.0
+    prev = nan
+    rsi_value = macd_value = signal_value = nan
+
+    if not last_only:
+        rsi_out = np.empty(n)
+        macd_out = np.empty(n)
+        signal_out = np.empty(n)
+
+    # 재귀 지표: 한 번 순회
+    for i in range(n):
+        x = c[i]
+        delta = x - prev
+        prev = x
+        gain_w, gain_o = _ewm_step(gain_w, gain_o, delta if delta > 0 else 0.0, alpha_rsi)
+        loss_w, loss_o = _ewm_step(loss_w, loss_o, -delta if delta < 0 else 0.0, alpha_rsi)
+        fast_w, fast_o = _ewm_step(fast_w, fast_o, x, alpha_fast)
+        slow_w, slow_o = _ewm_step(slow_w, slow_o, x, alpha_slow)
+        macd_value = fast_w - slow_w
+        signal_w, signal_o = _ewm_step(signal_w, signal_o, macd_value, alpha_signal)
+        signal_value = signal_w
+
+        if loss_w == 0:
+            rs = nan if gain_w == 0 or gain_w != gain_w else math.inf
+        else:
+            rs = gain_w / loss_w
+        rsi_value = 100 - (100 / (1 + rs))
+
+        if not last_only:
+            rsi_out[i] = rsi_value
+            macd_out[i] = macd_value
+            signal_out[i] = signal_value
+
+    if not last_only:
+        values = np.asarray(c)
+        upper, middle, lower = bollinger(values)
+        k, d = stochastic(np.asarray(h), np.asarray(l), values)
+        result = {
+            "rsi": rsi_out,
+            "macd": macd_out,
+            "macd_signal": signal_out,
+            "macd_hist": macd_out - signal_out,
+            "bb_upper": upper,
+            "bb_middle": middle,
+            "bb_lower": lower,
+            "stoch_k": k,
+            "stoch_d": d,
+        }
+        for period in BUNDLE_MA_PERIODS:
+            result[f"ma{period}"] = sma(values, period)
+        return result
+
+    # 이동창 지표: 마지막 창만 계산
+    middle = _window_mean(c, 20)
+    std_dev = _window_std(c, 20, middle)
+
+    k_last, d_last = _last_stochastic(h, l, c)
+
+    result = {
+        "rsi": rsi_value,
+        "macd": macd_value,
+        "macd_signal": signal_value,
+        "macd_hist": macd_value - signal_value,
+        "bb_upper": middle + std_dev * 2.0,
+        "bb_middle": middle,
+        "bb_lower": middle - std_dev * 2.0,
+        "stoch_k": k_last,
+        "stoch_d": d_last,
+    }
+    for period in BUNDLE_MA_PERIODS:
+        result[f"ma{period}"] = _window_mean(c, period)
+    return result
+
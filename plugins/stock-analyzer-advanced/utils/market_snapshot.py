@@ -0,0 +1,185 @@
+"""시장 전체 시세 스냅샷
+
+네이버 시가총액 페이지(sise_market_sum, 시장당 약 40페이지)로
+전 종목의 현재가/등락/시가총액/외국인비율/거래량/PER/ROE를 한 번에 DataFrame으로 만든다.
+종목마다 시세 페이지를 받는 대신 스냅샷 한 번으로 조회하므로
+여러 종목을 볼 때는 get_market_snapshot()을 먼저 호출해 두면
+get_market_cap의 네이버 fallback은 네트워크 없이, get_naver_quote는 폴링 요청 하나로 스냅샷과 함께 응답한다.
+- 저장 위치: local/cache/market_snapshot (STOCK_ANALYZER_CACHE_DIR 환경 변수로 변경)
+- 신선도: 같은 날 SNAPSHOT_MAX_AGE 이내, 또는 장 마감 후 받은 스냅샷
+"""
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from .ohlcv_store import MARKET_CLOSE, PARQUET_AVAILABLE, get_cache_dir, write_atomic
+from .web_scraper import get_naver_stock_list
+
+MARKETS = ("KOSPI", "KOSDAQ")
+SNAPSHOT_MAX_AGE = timedelta(minutes=30)
+
+COLUMNS = [
+    "name", "market", "price", "change", "change_pct",
+    "market_cap", "listed_shares", "foreign_ratio", "volume", "per", "roe",
+]
+
+# market → (DataFrame, fetched_at)
+_memory: dict = {}
+_lock = threading.Lock()
+
+
+def _paths(market: str) -> Tuple[Path, Path]:
+    """(데이터 파일, 메타 파일) 경로"""
+    base = get_cache_dir() / "market_snapshot" / market
+    ext = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+    return base.with_suffix(ext), base.with_suffix(".json")
+
+
+def _is_fresh(fetched_at: datetime, now: datetime, max_age: timedelta) -> bool:
+    """같은 날짜이고 max_age 이내이거나 장 마감 후 받은 스냅샷인지"""
+    if fetched_at.date() != now.date():
+        return False
+    return now - fetched_at <= max_age or fetched_at.time() >= MARKET_CLOSE
+
+
+def _load(market: str) -> Tuple[Optional[pd.DataFrame], Optional[datetime]]:
+    """메모리 → 디스크 순으로 스냅샷 로드"""
+    with _lock:
+        if market in _memory:
+            return _memory[market]
+
+    data_path, meta_path = _paths(market)
+    if not (data_path.exists() and meta_path.exists()):
+        return None, None
+    try:
+        fetched_at = datetime.fromisoformat(json.loads(meta_path.read_text())["fetched_at"])
+        df = pd.read_parquet(data_path) if PARQUET_AVAILABLE else pd.read_pickle(data_path)
+    except Exception:
+        return None, None
+
+    with _lock:
+        _memory[market] = (df, fetched_at)
+    return df, fetched_at
+
+
+def _save(market: str, df: pd.DataFrame, fetched_at: datetime) -> None:
+    """메모리 + 디스크 저장 (임시 파일 → rename)"""
+    with _lock:
+        _memory[market] = (df, fetched_at)
+
+    data_path, meta_path = _paths(market)
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(data_path, df.to_parquet if PARQUET_AVAILABLE else df.to_pickle)
+        meta = {"fetched_at": fetched_at.isoformat(timespec="seconds")}
+        write_atomic(meta_path, lambda tmp: tmp.write_text(json.dumps(meta)))
+    except Exception:
+        pass
+
+
+def build_market_snapshot(market: str = "KOSPI") -> Optional[pd.DataFrame]:
+    """
+    시장 스냅샷 생성 (네트워크, 캐시 미사용)
+
+    Args:
+        market: "KOSPI" 또는 "KOSDAQ"
+
+    Returns:
+        종목코드 인덱스 DataFrame
+        (name, market, price, change, change_pct, market_cap(억), listed_shares(천주), foreign_ratio(%),
+         volume, per, roe)
+        or None
+    """
+    stocks = get_naver_stock_list(market, use_cache=False)
+    if not stocks:
+        return None
+
+    df = pd.DataFrame(stocks).drop_duplicates("code").set_index("code")
+    df.index.name = "ticker"
+    df["market"] = market
+    for column in COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+    df = df[COLUMNS]
+    for column in ("per", "roe", "change_pct", "foreign_ratio"):
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    return df
+
+
+def get_market_snapshot(
+    markets: Tuple[str, ...] = MARKETS,
+    refresh: bool = False,
+    max_age: timedelta = SNAPSHOT_MAX_AGE,
+    now: Optional[datetime] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    시장 스냅샷 조회 (오래된 시장만 다시 생성)
+
+    Args:
+        markets: 대상 시장
+        refresh: True면 무조건 다시 생성
+        max_age: 장중 스냅샷 유효 시간
+        now: 현재 시각 (테스트용)
+
+    Returns:
+        종목코드 인덱스 DataFrame or None (전부 실패)
+    """
+    now = now or datetime.now()
+    frames = []
+    for market in markets:
+        df, fetched_at = (None, None) if refresh else _load(market)
+        if df is None or not _is_fresh(fetched_at, now, max_age):
+            fresh = build_market_snapshot(market)
+            if fresh is not None:
+                df = fresh
+                _save(market, df, now)
+        if df is not None:
+            frames.append(df)
+
+    if not frames:
+        return None
+    return pd.concat(frames)
+
+
+def _to_python(value):
+    """NumPy 스칼라 → 파이썬 값, 결측 → None"""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def lookup_snapshot(
+    ticker: str,
+    max_age: timedelta = SNAPSHOT_MAX_AGE,
+    now: Optional[datetime] = None,
+) -> Optional[dict]:
+    """
+    신선한 스냅샷에서 종목 행 조회 (네트워크 없음)
+
+    Args:
+        ticker: 종목코드
+        max_age: 장중 스냅샷 유효 시간
+        now: 현재 시각 (테스트용)
+
+    Returns:
+        {"name": ..., "price": ..., "market_cap": ..., ...} or None (스냅샷 없음/오래됨/종목 없음)
+    """
+    now = now or datetime.now()
+    for market in MARKETS:
+        df, fetched_at = _load(market)
+        if df is None or not _is_fresh(fetched_at, now, max_age):
+            continue
+        if ticker in df.index:
+            row = df.loc[ticker]
+            return {k: _to_python(v) for k, v in row.items()}
+    return None
+
+
+def clear_market_snapshot() -> None:
+    """메모리 스냅샷 비우기 (디스크 파일은 유지)"""
+    with _lock:
+        _memory.clear()
@@ -0,0 +1,250 @@
+"""OHLCV 로컬 캐시
+
+종목/수정주가 여부별로 일봉 OHLCV를 디스크에 저장하고
+마지막 저장일 이후 구간만 pykrx에서 추가로 받아온다.
+- 저장 포맷: Parquet (pyarrow 설치 시), 없으면 pickle
+- 저장 위치: local/cache/ohlcv (STOCK_ANALYZER_CACHE_DIR 환경 변수로 변경)
+- 수정주가 재산정(액면분할, 유무상증자 등) 감지 시 전체 재다운로드
+"""
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta, time as dtime
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "STOCK_ANALYZER_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "local" / "cache"
+
+# 이 시각 이후에 받은 당일 봉은 확정된 것으로 간주 (장 마감 15:30 + 여유)
+MARKET_CLOSE = dtime(16, 0)
+
+# 재산정 판단 기준 (겹치는 날짜의 종가 상대 오차)
+RESTATEMENT_TOLERANCE = 1e-6
+
+CLOSE_COLUMN = "종가"
+
+# fetch(start "YYYYMMDD", end "YYYYMMDD") -> DataFrame
+Fetcher = Callable[[str, str], Optional[pd.DataFrame]]
+
+
+def get_cache_dir() -> Path:
+    """캐시 루트 디렉토리 (환경 변수 우선)"""
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def write_atomic(path: Path, write: Callable[[Path], None]) -> None:
+    """
+    임시 파일에 쓴 뒤 rename으로 원자적 교체
+
+    임시 파일명은 호출마다 고유하므로 여러 프로세스/스레드가 같은 캐시 파일을
+    동시에 저장해도 서로의 임시 파일을 덮어쓰지 않는다.
+
+    Args:
+        path: 최종 파일 경로
+        write: 임시 파일 경로를 받아 내용을 쓰는 함수
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as f:
+        tmp = Path(f.name)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _paths(ticker: str, adjusted: bool) -> Tuple[Path, Path]:
+    """(데이터 파일, 메타 파일) 경로"""
+    base = get_cache_dir() / "ohlcv" / f"{ticker}_{'adj' if adjusted else 'raw'}"
+    ext = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+    return base.with_suffix(ext), base.with_suffix(".json")
+
+
+def _load(ticker: str, adjusted: bool) -> Tuple[Optional[pd.DataFrame], Optional[dict]]:
+    """캐시 로드 (없거나 손상 시 (None, None))"""
+    data_path, meta_path = _paths(ticker, adjusted)
+    if not (data_path.exists() and meta_path.exists()):
+        return None, None
+    try:
+        meta = json.loads(meta_path.read_text())
+        if PARQUET_AVAILABLE:
+            df = pd.read_parquet(data_path)
+        else:
+            df = pd.read_pickle(data_path)
+        return df, meta
+    except Exception:
+        return None, None
+
+
+def _save(ticker: str, adjusted: bool, df: pd.DataFrame, meta: dict) -> None:
+    """캐시 저장 (임시 파일 → rename으로 원자적 교체, 실패해도 받은 데이터는 그대로 반환)"""
+    data_path, meta_path = _paths(ticker, adjusted)
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(data_path, df.to_parquet if PARQUET_AVAILABLE else df.to_pickle)
+        write_atomic(meta_path, lambda tmp: tmp.write_text(json.dumps(meta)))
+    except Exception as e:
+        logger.warning("OHLCV 캐시 저장 실패 (ticker=%s): %s", ticker, e)
+
+
+def _is_final(day: pd.Timestamp, fetched_at: datetime) -> bool:
+    """day의 봉이 fetched_at 시점에 이미 확정되어 있었는지"""
+    return day.date() < fetched_at.date() or fetched_at.time() >= MARKET_CLOSE
+
+
+def _is_restated(cached: pd.DataFrame, fresh: pd.DataFrame, anchor: pd.Timestamp) -> bool:
+    """겹치는 기준일 종가가 달라졌으면 수정주가 재산정으로 판단"""
+    if anchor not in cached.index or anchor not in fresh.index:
+        return False
+    column = CLOSE_COLUMN if CLOSE_COLUMN in cached.columns else cached.columns[0]
+    old = float(cached.at[anchor, column])
+    new = float(fresh.at[anchor, column])
+    return abs(new - old) > RESTATEMENT_TOLERANCE * max(abs(old), 1.0)
+
+
+def _fmt(dt: datetime) -> str:
+    return dt.strftime("%Y%m%d")
+
+
+def _full_fetch(
+    ticker: str,
+    adjusted: bool,
+    start: datetime,
+    end: datetime,
+    fetch: Fetcher,
+    now: datetime,
+) -> Optional[pd.DataFrame]:
+    """전체 구간 다운로드 후 캐시 교체"""
+    df = fetch(_fmt(start), _fmt(end))
+    if df is None or df.empty:
+        return None
+    df = df.sort_index()
+    _save(ticker, adjusted, df, {
+        "start": _fmt(start),
+        "end": _fmt(end),
+        "fetched_at": now.isoformat(timespec="seconds"),
+    })
+    return df
+
+
+def get_cached_ohlcv(
+    ticker: str,
+    start: datetime,
+    end: datetime,
+    adjusted: bool,
+    fetch: Fetcher,
+    now: Optional[datetime] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    캐시 기반 일봉 OHLCV 조회 (부족한 구간만 fetch)
+
+    Args:
+        ticker: 종목코드
+        start: 조회 시작일
+        end: 조회 종료일
+        adjusted: 수정주가 여부 (캐시 키)
+        fetch: 구간 다운로드 함수 fetch("YYYYMMDD", "YYYYMMDD") -> DataFrame
+        now: 현재 시각 (테스트용)
+
+    Returns:
+        [start, end] 구간 DataFrame or None (데이터 없음)
+
+    Raises:
+        fetch에서 발생한 예외
+    """
+    now = now or datetime.now()
+    end = min(end, now)
+    start_day = pd.Timestamp(start.date())
+    end_day = pd.Timestamp(end.date())
+
+    cached, meta = _load(ticker, adjusted)
+    if cached is None or cached.empty:
+        df = _full_fetch(ticker, adjusted, start, end, fetch, now)
+    else:
+        df = cached
+        covered_start = pd.Timestamp(datetime.strptime(meta["start"], "%Y%m%d"))
+        covered_end = pd.Timestamp(datetime.strptime(meta["end"], "%Y%m%d"))
+        fetched_at = datetime.fromisoformat(meta["fetched_at"])
+        changed = False
+
+        # 1) 뒤쪽: 마지막 확정 봉부터 다시 받아 재산정 여부 확인 + 미확정 봉 교체
+        if end_day > covered_end or (end_day == covered_end and not _is_final(covered_end, fetched_at)):
+            if _is_final(df.index[-1], fetched_at) or len(df) < 2:
+                anchor = df.index[-1]
+            else:
+                anchor = df.index[-2]
+
+            tail = fetch(_fmt(anchor), _fmt(end))
+            if tail is not None and not tail.empty:
+                tail = tail.sort_index()
+                if _is_restated(df, tail, anchor):
+                    return _slice(
+                        _full_fetch(ticker, adjusted, min(start, covered_start.to_pydatetime()), end, fetch, now),
+                        start_day, end_day,
+                    )
+                df = pd.concat([df[df.index < tail.index[0]], tail])
+                # 기준일 봉이 포함되므로 빈 결과는 조회 실패 → 받은 경우에만 구간 확장
+                covered_end = end_day
+                fetched_at = now
+                changed = True
+
+        # 2) 앞쪽: 저장된 구간보다 이른 기간 요청 시 앞부분만 추가
+        #    첫 저장 봉까지 겹쳐 받아 빈 결과(조회 실패)와 거래일 없는 구간(상장 전 등)을 구분
+        if start_day < covered_start:
+            first = df.index[0]
+            head = fetch(_fmt(start), _fmt(first))
+            if head is not None and not head.empty:
+                head = head.sort_index()
+                df = pd.concat([head[head.index < first], df])
+                covered_start = start_day
+                changed = True
+
+        if changed:
+            _save(ticker, adjusted, df, {
+                "start": _fmt(covered_start),
+                "end": _fmt(covered_end),
+                "fetched_at": fetched_at.isoformat(timespec="seconds"),
+            })
+
+    return _slice(df, start_day, end_day)
+
+
+def _slice(df: Optional[pd.DataFrame], start_day: pd.Timestamp, end_day: pd.Timestamp) -> Optional[pd.DataFrame]:
+    """[start_day, end_day] 날짜 구간 추출"""
+    if df is None:
+        return None
+    result = df[(df.index >= start_day) & (df.index < end_day + timedelta(days=1))]
+    return result if not result.empty else None
+
+
+def clear_ohlcv_cache(ticker: Optional[str] = None) -> int:
+    """
+    OHLCV 캐시 삭제
+
+    Args:
+        ticker: 종목코드 (None이면 전체)
+
+    Returns:
+        삭제한 파일 수
+    """
+    cache_dir = get_cache_dir() / "ohlcv"
+    if not cache_dir.exists():
+        return 0
+    pattern = f"{ticker}_*" if ticker else "*"
+    removed = 0
+    for path in cache_dir.glob(pattern):
+        path.unlink()
+        removed += 1
+    return removed
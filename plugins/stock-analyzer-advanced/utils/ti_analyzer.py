@@ -3,12 +3,32 @@
 TI 워커 에이전트가 사용하는 통합 분석 함수
 숫자 데이터 + 52주 고저 + 기술지표 + 신호 판단을 한 번에 처리
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from utils.data_fetcher import get_ohlcv, get_ticker_name
-from utils.indicators import sma, ema, rsi, macd, bollinger, stochastic, support_resistance
-from utils.web_scraper import get_naver_stock_info
+import numpy as np
+import pandas as pd
+
+if not __package__:
+    # 스크립트로 직접 실행 (python utils/ti_analyzer.py) 시 utils 패키지 하위 모듈로 import
+    import sys
+    from pathlib import Path
+    # sys.path[0](utils 디렉토리)를 플러그인 루트로 교체 (utils/deprecated.py가 deprecated 패키지를 가리지 않게)
+    sys.path[0] = str(Path(__file__).resolve().parent.parent)
+    __package__ = "utils"
+
+from .data_fetcher import get_ohlcv, get_ticker_name
+from .indicators import (
+    sma, rsi, macd, bollinger, stochastic, support_resistance, indicator_bundle,
+)
+from .web_scraper import get_naver_quote
+
+# 52주 고저 구간 (영업일)
+WEEK52_DAYS = 252
+
+# 기술지표 계산 구간 (영업일)
+INDICATOR_DAYS = 60
 
 
 def get_rsi_signal(rsi_value: float) -> str:
@@ -48,10 +68,131 @@ def get_ma_alignment(current: float, ma5: float, ma20: float, ma60: float) -> st
         return "혼조"
 
 
+def _build_price_info(naver_info: Optional[dict]) -> Optional[dict]:
+    """네이버 시세 → price_info 섹션"""
+    if not naver_info:
+        return None
+    return {
+        "name": naver_info.get("name"),
+        "price": naver_info.get("price"),
+        "change": naver_info.get("change"),
+        "change_pct": naver_info.get("change_pct"),
+        "open": naver_info.get("open"),
+        "high": naver_info.get("high"),
+        "low": naver_info.get("low"),
+        "volume": naver_info.get("volume"),
+        "market_cap": naver_info.get("market_cap"),
+        "per": naver_info.get("per"),
+        "pbr": naver_info.get("pbr"),
+        "foreign_ratio": naver_info.get("foreign_ratio"),
+    }
+
+
+def _build_week52(df_year: pd.DataFrame, current_price: Optional[float]) -> dict:
+    """1년 OHLCV → week52 섹션"""
+    high_52w = df_year['고가'].max()
+    low_52w = df_year['저가'].min()
+    high_date = df_year['고가'].idxmax()
+    low_date = df_year['저가'].idxmin()
+
+    # 현재가 위치 계산
+    position_pct = None
+    if current_price and high_52w > low_52w:
+        position_pct = (current_price - low_52w) / (high_52w - low_52w) * 100
+
+    return {
+        "high": int(high_52w),
+        "high_date": str(high_date),
+        "low": int(low_52w),
+        "low_date": str(low_date),
+        "position_pct": round(position_pct, 1) if position_pct else None,
+    }
+
+
+def _apply_indicators(result: dict, df: pd.DataFrame) -> None:
+    """지표 구간 OHLCV → indicators / support_resistance / signals 섹션"""
+    close = df['종가']
+    high = df['고가']
+    low = df['저가']
+
+    # RSI / MACD / 볼린저 / 스토캐스틱 / 이동평균을 한 번에 계산 (마지막 값만)
+    bundle = indicator_bundle(high, low, close)
+
+    rsi_val = bundle["rsi"]
+    rsi_signal_str = get_rsi_signal(rsi_val)
+
+    macd_signal_str = "상승" if bundle["macd"] > bundle["macd_signal"] else "하락"
+
+    current = close.iloc[-1]
+    bb_position = (current - bundle["bb_lower"]) / (bundle["bb_upper"] - bundle["bb_lower"]) * 100
+
+    k_val = bundle["stoch_k"]
+    stoch_signal = "과매수" if k_val > 80 else ("과매도" if k_val < 20 else "중립")
+
+    ma5_val = bundle["ma5"]
+    ma20_val = bundle["ma20"]
+    ma60_val = bundle["ma60"] if len(close) >= 60 else None
+
+    # 배열 판단
+    ma_alignment_str = None
+    if ma60_val:
+        ma_alignment_str = get_ma_alignment(current, ma5_val, ma20_val, ma60_val)
+
+    result["indicators"] = {
+        "rsi": {
+            "value": round(rsi_val, 1),
+            "signal": rsi_signal_str,
+        },
+        "macd": {
+            "macd": round(bundle["macd"], 2),
+            "signal": round(bundle["macd_signal"], 2),
+            "histogram": round(bundle["macd_hist"], 2),
+            "trend": macd_signal_str,
+        },
+        "bollinger": {
+            "upper": round(bundle["bb_upper"], 0),
+            "middle": round(bundle["bb_middle"], 0),
+            "lower": round(bundle["bb_lower"], 0),
+            "position_pct": round(bb_position, 1),
+        },
+        "stochastic": {
+            "k": round(k_val, 1),
+            "d": round(bundle["stoch_d"], 1),
+            "signal": stoch_signal,
+        },
+        "ma": {
+            "ma5": round(ma5_val, 0),
+            "ma20": round(ma20_val, 0),
+            "ma60": round(ma60_val, 0) if ma60_val else None,
+            "alignment": ma_alignment_str,
+        },
+    }
+
+    # 지지/저항선
+    sr = support_resistance(high, low, close)
+    result["support_resistance"] = {
+        "pivot": round(sr["pivot"], 0),
+        "r1": round(sr["r1"], 0),
+        "r2": round(sr["r2"], 0),
+        "s1": round(sr["s1"], 0),
+        "s2": round(sr["s2"], 0),
+    }
+
+    # 종합 신호
+    result["signals"] = {
+        "rsi_signal": rsi_signal_str,
+        "macd_signal": macd_signal_str,
+        "stochastic_signal": stoch_signal,
+        "ma_alignment": ma_alignment_str,
+    }
+
+
 def get_ti_full_analysis(ticker: str) -> dict:
     """TI 워커를 위한 통합 분석 함수
 
     숫자 데이터, 52주 고저, 기술지표, 신호 판단을 모두 수행
+    - OHLCV는 1년치를 한 번만 조회하고 52주/지표 구간을 슬라이스로 사용
+    - 종목명, 네이버 시세, OHLCV 조회는 동시에 실행
 
     Args:
         ticker: 종목코드 (예: "005930")
@@ -79,135 +220,165 @@ def get_ti_full_analysis(ticker: str) -> dict:
         "signals": None,
     }
 
-    # 1. 종목명 조회
-    name = get_ticker_name(ticker)
-    result["meta"]["name"] = name
+    # 1. 종목명 / 숫자 데이터 (Naver Finance) / OHLCV (pykrx) 동시 조회
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        name_future = executor.submit(get_ticker_name, ticker)
+        naver_future = executor.submit(get_naver_quote, ticker)
+        ohlcv_future = executor.submit(get_ohlcv, ticker, days=WEEK52_DAYS)
 
-    # 2. 숫자 데이터 (Naver Finance)
-    naver_info = get_naver_stock_info(ticker)
-    if naver_info:
-        result["price_info"] = {
-            "name": naver_info.get("name"),
-            "price": naver_info.get("price"),
-            "change": naver_info.get("change"),
-            "change_pct": naver_info.get("change_pct"),
-            "open": naver_info.get("open"),
-            "high": naver_info.get("high"),
-            "low": naver_info.get("low"),
-            "volume": naver_info.get("volume"),
-            "market_cap": naver_info.get("market_cap"),
-            "per": naver_info.get("per"),
-            "pbr": naver_info.get("pbr"),
-            "foreign_ratio": naver_info.get("foreign_ratio"),
-        }
+        name = name_future.result()
+        naver_info = naver_future.result()
+        df_year = ohlcv_future.result()
 
-    # 3. 52주 고저 (pykrx)
-    df_year = get_ohlcv(ticker, days=252)
-    if df_year is not None and not df_year.empty:
-        high_52w = df_year['고가'].max()
-        low_52w = df_year['저가'].min()
-        high_date = df_year['고가'].idxmax()
-        low_date = df_year['저가'].idxmin()
-
-        # 현재가 위치 계산
-        current_price = naver_info.get("price") if naver_info else None
-        position_pct = None
-        if current_price and high_52w > low_52w:
-            position_pct = (current_price - low_52w) / (high_52w - low_52w) * 100
-
-        result["week52"] = {
-            "high": int(high_52w),
-            "high_date": str(high_date),
-            "low": int(low_52w),
-            "low_date": str(low_date),
-            "position_pct": round(position_pct, 1) if position_pct else None,
-        }
+    result["meta"]["name"] = name
+    result["price_info"] = _build_price_info(naver_info)
 
-    # 4. 기술지표 (pykrx 60일 데이터)
-    df = get_ohlcv(ticker, days=60)
-    if df is not None and not df.empty:
-        close = df['종가']
-        high = df['고가']
-        low = df['저가']
-
-        # RSI
-        rsi_val = rsi(close).iloc[-1]
-        rsi_signal_str = get_rsi_signal(rsi_val)
-
-        # MACD
-        macd_line, signal_line, hist = macd(close)
-        macd_signal_str = "상승" if macd_line.iloc[-1] > signal_line.iloc[-1] else "하락"
-
-        # 볼린저 밴드
-        upper, middle, lower = bollinger(close)
-        current = close.iloc[-1]
-        bb_position = (current - lower.iloc[-1]) / (upper.iloc[-1] - lower.iloc[-1]) * 100
-
-        # 스토캐스틱
-        k, d = stochastic(high, low, close)
-        stoch_signal = "과매수" if k.iloc[-1] > 80 else ("과매도" if k.iloc[-1] < 20 else "중립")
-
-        # 이동평균
-        ma5_val = sma(close, 5).iloc[-1]
-        ma20_val = sma(close, 20).iloc[-1]
-        ma60_val = sma(close, 60).iloc[-1] if len(close) >= 60 else None
-
-        # 배열 판단
-        ma_alignment_str = None
-        if ma60_val:
-            ma_alignment_str = get_ma_alignment(current, ma5_val, ma20_val, ma60_val)
-
-        result["indicators"] = {
-            "rsi": {
-                "value": round(rsi_val, 1),
-                "signal": rsi_signal_str,
-            },
-            "macd": {
-                "macd": round(macd_line.iloc[-1], 2),
-                "signal": round(signal_line.iloc[-1], 2),
-                "histogram": round(hist.iloc[-1], 2),
-                "trend": macd_signal_str,
-            },
-            "bollinger": {
-                "upper": round(upper.iloc[-1], 0),
-                "middle": round(middle.iloc[-1], 0),
-                "lower": round(lower.iloc[-1], 0),
-                "position_pct": round(bb_position, 1),
-            },
-            "stochastic": {
-                "k": round(k.iloc[-1], 1),
-                "d": round(d.iloc[-1], 1),
-                "signal": stoch_signal,
-            },
-            "ma": {
-                "ma5": round(ma5_val, 0),
-                "ma20": round(ma20_val, 0),
-                "ma60": round(ma60_val, 0) if ma60_val else None,
-                "alignment": ma_alignment_str,
-            },
-        }
+    if df_year is None or df_year.empty:
+        return result
 
-        # 지지/저항선
-        sr = support_resistance(high, low, close)
-        result["support_resistance"] = {
-            "pivot": round(sr["pivot"], 0),
-            "r1": round(sr["r1"], 0),
-            "r2": round(sr["r2"], 0),
-            "s1": round(sr["s1"], 0),
-            "s2": round(sr["s2"], 0),
-        }
+    # 2. 52주 고저
+    current_price = naver_info.get("price") if naver_info else None
+    result["week52"] = _build_week52(df_year, current_price)
 
-        # 종합 신호
-        result["signals"] = {
-            "rsi_signal": rsi_signal_str,
-            "macd_signal": macd_signal_str,
-            "stochastic_signal": stoch_signal,
-            "ma_alignment": ma_alignment_str,
-        }
+    # 3. 기술지표 (최근 60일 구간)
+    _apply_indicators(result, df_year.tail(INDICATOR_DAYS))
 
     return result
 
 
+def _fetch_for_batch(ticker: str) -> Tuple[str, Optional[str], Optional[pd.DataFrame]]:
+    """배치 워커: 종목명 + 1년 OHLCV 조회"""
+    try:
+        return ticker, get_ticker_name(ticker), get_ohlcv(ticker, days=WEEK52_DAYS)
+    except Exception:
+        return ticker, None, None
+
+
+def _wide_matrix(frames: Dict[str, pd.DataFrame], column: str, rows: int) -> pd.DataFrame:
+    """(거래일 × 종목) 행렬 구성
+
+    각 종목의 마지막 봉을 기준으로 정렬 (행 = 최근 rows개 거래일 위치)
+    거래일 수가 부족한 종목은 앞부분이 NaN → 종목별 Series로 계산한 결과와 동일
+    """
+    data = np.full((rows, len(frames)), np.nan)
+    for j, df in enumerate(frames.values()):
+        values = df[column].to_numpy(dtype=float)[-rows:]
+        data[rows - len(values):, j] = values
+    return pd.DataFrame(data, columns=list(frames.keys()))
+
+
+def get_ti_batch_analysis(tickers: List[str], workers: int = 8) -> pd.DataFrame:
+    """여러 종목 TI 배치 분석 (유니버스 스크리닝용)
+
+    OHLCV는 bounded 스레드 풀로 병렬 조회하고,
+    지표는 (거래일 × 종목) 종가/고가/저가 행렬에 한 번에 계산한다.
+    지표 값은 get_ti_full_analysis와 동일 (최근 60일 구간 기준),
+    52주 위치는 네이버 현재가 대신 마지막 종가 기준.
+
+    Args:
+        tickers: 종목코드 리스트
+        workers: 동시 조회 스레드 수 (기본 8)
+
+    Returns:
+        종목코드 index DataFrame (조회 실패 종목 제외)
+        columns: name, date, close, high_52w, high_52w_date, low_52w, low_52w_date,
+                 position_52w, rsi, rsi_signal, macd, macd_signal, macd_hist, macd_trend,
+                 bb_upper, bb_middle, bb_lower, bb_position, stoch_k, stoch_d, stoch_signal,
+                 ma5, ma20, ma60, ma_alignment
+    """
+    names = {}
+    frames = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for ticker, name, df in executor.map(_fetch_for_batch, dict.fromkeys(tickers)):
+            if df is not None and not df.empty:
+                names[ticker] = name
+                frames[ticker] = df
+
+    if not frames:
+        return pd.DataFrame()
+
+    index = pd.Index(list(frames.keys()), name="ticker")
+
+    # 52주 고저 (1년 전체 구간)
+    high_year = _wide_matrix(frames, '고가', WEEK52_DAYS)
+    low_year = _wide_matrix(frames, '저가', WEEK52_DAYS)
+    dates_year = np.full((WEEK52_DAYS, len(frames)), np.datetime64("NaT"), dtype="datetime64[ns]")
+    for j, df in enumerate(frames.values()):
+        values = df.index.to_numpy(dtype="datetime64[ns]")[-WEEK52_DAYS:]
+        dates_year[WEEK52_DAYS - len(values):, j] = values
+    cols = np.arange(len(frames))
+    high_pos = np.nanargmax(high_year.to_numpy(), axis=0)
+    low_pos = np.nanargmin(low_year.to_numpy(), axis=0)
+
+    # 기술지표 (최근 60일 구간)
+    close = _wide_matrix(frames, '종가', INDICATOR_DAYS)
+    high = _wide_matrix(frames, '고가', INDICATOR_DAYS)
+    low = _wide_matrix(frames, '저가', INDICATOR_DAYS)
+
+    # 마지막 값만 필요하므로 last_only (종목별 Series)
+    rsi_last = rsi(close, last_only=True)
+    macd_line, signal_line, hist = macd(close, last_only=True)
+    upper, middle, lower = bollinger(close, last_only=True)
+    k, d = stochastic(high, low, close, last_only=True)
+    ma5 = sma(close, 5, last_only=True)
+    ma20 = sma(close, 20, last_only=True)
+    ma60 = sma(close, 60, last_only=True)
+
+    current = close.iloc[-1]
+    high_52w = high_year.max()
+    low_52w = low_year.min()
+    week52_range = (high_52w - low_52w).where(high_52w > low_52w)
+
+    result = pd.DataFrame({
+        "name": pd.Series(names),
+        "date": pd.Series({t: df.index[-1] for t, df in frames.items()}),
+        "close": current,
+        "high_52w": high_52w,
+        "high_52w_date": pd.Series(dates_year[high_pos, cols], index=high_year.columns),
+        "low_52w": low_52w,
+        "low_52w_date": pd.Series(dates_year[low_pos, cols], index=low_year.columns),
+        "position_52w": (current - low_52w) / week52_range * 100,
+        "rsi": rsi_last,
+        "macd": macd_line,
+        "macd_signal": signal_line,
+        "macd_hist": hist,
+        "bb_upper": upper,
+        "bb_middle": middle,
+        "bb_lower": lower,
+        "bb_position": (current - lower) / (upper - lower) * 100,
+        "stoch_k": k,
+        "stoch_d": d,
+        "ma5": ma5,
+        "ma20": ma20,
+        "ma60": ma60,
+    }).reindex(index)
+
+    # 신호 판단 (get_rsi_signal / get_ma_alignment 와 동일 기준)
+    result["rsi_signal"] = np.select(
+        [result["rsi"] > 70, result["rsi"] < 30], ["과매수", "과매도"], "중립")
+    result["macd_trend"] = np.where(result["macd"] > result["macd_signal"], "상승", "하락")
+    result["stoch_signal"] = np.select(
+        [result["stoch_k"] > 80, result["stoch_k"] < 20], ["과매수", "과매도"], "중립")
+    alignment = np.select(
+        [
+            (result["close"] > result["ma5"]) & (result["ma5"] > result["ma20"]) & (result["ma20"] > result["ma60"]),
+            (result["close"] < result["ma5"]) & (result["ma5"] < result["ma20"]) & (result["ma20"] < result["ma60"]),
+        ],
+        ["완전 정배열", "완전 역배열"],
+        "혼조",
+    )
+    result["ma_alignment"] = pd.Series(alignment, index=result.index).where(result["ma60"].notna())
+
+    return result[[
+        "name", "date", "close",
+        "high_52w", "high_52w_date", "low_52w", "low_52w_date", "position_52w",
+        "rsi", "rsi_signal", "macd", "macd_signal", "macd_hist", "macd_trend",
+        "bb_upper", "bb_middle", "bb_lower", "bb_position",
+        "stoch_k", "stoch_d", "stoch_signal",
+        "ma5", "ma20", "ma60", "ma_alignment",
+    ]]
+
+
 def print_ti_report(ticker: str) -> None:
     """TI 리포트 출력 (TI 에이전트 호출용)
 
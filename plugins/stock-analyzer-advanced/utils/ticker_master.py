@@ -0,0 +1,249 @@
+"""종목 마스터 (종목코드 ↔ 종목명)
+
+KOSPI/KOSDAQ 전 종목의 종목명, 시장, 상장일, 별칭을 거래일마다 한 번 받아
+메모리 dict + 디스크(JSON)에 보관한다.
+종목명 조회와 역조회(종목명/별칭 → 종목코드)가 모두 딕셔너리 조회(O(1))다.
+- 저장 위치: local/cache/ticker_master/{YYYYMMDD}.json (STOCK_ANALYZER_CACHE_DIR 환경 변수로 변경)
+- 갱신: 거래일 단위 (주말에는 직전 금요일 마스터 재사용)
+- 다운로드 실패 시 가장 최근에 저장된 마스터로 응답 (한 시장이라도 실패하면 실패로 간주)
+"""
+import json
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .ohlcv_store import get_cache_dir, write_atomic
+
+MARKETS = ("KOSPI", "KOSDAQ")
+
+# fetch(market) -> [{"code": "005930", "name": "삼성전자", "listing_date": "1975-06-11" or None}, ...] or None
+Fetcher = Callable[[str], Optional[List[dict]]]
+
+# 자주 쓰이는 약칭 (종목명/공백 제거 종목명은 자동으로 별칭 등록)
+COMMON_ALIASES = {
+    "005930": ["삼전"],
+    "000660": ["하이닉스", "하닉"],
+    "005380": ["현차"],
+    "035420": ["네이버"],
+    "207940": ["삼바"],
+    "373220": ["엔솔", "LG엔솔"],
+}
+
+# 생성 실패 후 재시도까지 대기 시간 (실패한 날 종목마다 다시 받지 않도록)
+RETRY_INTERVAL = timedelta(minutes=10)
+
+# 거래일(YYYYMMDD) → TickerMaster
+_memory: dict = {}
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+# 거래일 → 마지막 생성 실패 시각
+_failures: dict = {}
+
+
+def normalize_name(text: str) -> str:
+    """역조회 키 정규화 (공백 제거 + 영문 대문자)"""
+    return re.sub(r"\s+", "", text).upper()
+
+
+def trading_day(now: Optional[datetime] = None) -> str:
+    """마스터 기준 거래일 YYYYMMDD (토/일 → 직전 금요일)"""
+    day = (now or datetime.now()).date()
+    if day.weekday() >= 5:
+        day -= timedelta(days=day.weekday() - 4)
+    return day.strftime("%Y%m%d")
+
+
+class TickerMaster:
+    """종목코드 → 종목 정보 + 종목명/별칭 → 종목코드 역색인"""
+
+    def __init__(self, tickers: Dict[str, dict], day: str):
+        """
+        Args:
+            tickers: {"005930": {"name", "market", "listing_date", "aliases"}, ...}
+            day: 기준 거래일 YYYYMMDD
+        """
+        self.tickers = tickers
+        self.day = day
+        self._by_name: Dict[str, str] = {}
+        # 종목명이 별칭보다 우선 (별칭이 다른 종목명과 겹치는 경우)
+        for code, entry in tickers.items():
+            self._by_name.setdefault(normalize_name(entry["name"]), code)
+        for code, entry in tickers.items():
+            for alias in entry["aliases"]:
+                self._by_name.setdefault(normalize_name(alias), code)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.tickers
+
+    def get(self, ticker: str) -> Optional[dict]:
+        """종목 정보 (name, market, listing_date, aliases) or None"""
+        return self.tickers.get(ticker)
+
+    def name(self, ticker: str) -> Optional[str]:
+        """종목코드 → 종목명"""
+        entry = self.tickers.get(ticker)
+        return entry["name"] if entry else None
+
+    def code(self, name: str) -> Optional[str]:
+        """종목명/별칭 → 종목코드 (공백/대소문자 무시)"""
+        return self._by_name.get(normalize_name(name))
+
+    def aliases(self, ticker: str) -> List[str]:
+        """검색어로 쓸 종목 별칭 (종목명 포함)"""
+        entry = self.tickers.get(ticker)
+        return list(entry["aliases"]) if entry else []
+
+    def codes(self, market: Optional[str] = None) -> List[str]:
+        """종목코드 리스트 (market 지정 시 해당 시장만)"""
+        return [code for code, entry in self.tickers.items() if market is None or entry["market"] == market]
+
+
+def _aliases(code: str, name: str) -> List[str]:
+    candidates = [name, name.replace(" ", ""), *COMMON_ALIASES.get(code, [])]
+    return list(dict.fromkeys(a for a in candidates if a))
+
+
+def build_ticker_master(fetch: Fetcher, markets: tuple = MARKETS) -> Optional[Dict[str, dict]]:
+    """
+    시장별 종목 목록으로 마스터 생성
+
+    Args:
+        fetch: 시장별 종목 목록 조회 함수 fetch(market) -> [{"code", "name", "listing_date"}, ...]
+        markets: 대상 시장
+
+    Returns:
+        {"005930": {"name", "market", "listing_date", "aliases"}, ...}
+        or None (한 시장이라도 종목 목록을 못 받으면 - 일부 시장만 담긴 마스터를 하루 동안 쓰지 않도록)
+    """
+    tickers: Dict[str, dict] = {}
+    complete = True
+    for market in markets:
+        try:
+            rows = fetch(market)
+        except Exception:
+            rows = None
+        if not rows:
+            complete = False
+        for row in rows or []:
+            code, name = row.get("code"), row.get("name")
+            if not code or not name or code in tickers:
+                continue
+            tickers[code] = {
+                "name": name,
+                "market": market,
+                "listing_date": row.get("listing_date"),
+                "aliases": _aliases(code, name),
+            }
+    return tickers if complete and tickers else None
+
+
+def _path(day: str) -> Path:
+    return get_cache_dir() / "ticker_master" / f"{day}.json"
+
+
+def _load_disk(day: Optional[str] = None) -> Optional[TickerMaster]:
+    """디스크 마스터 로드 (day=None이면 가장 최근 파일)"""
+    if day is None:
+        files = sorted((get_cache_dir() / "ticker_master").glob("*.json"))
+        if not files:
+            return None
+        path = files[-1]
+    else:
+        path = _path(day)
+        if not path.exists():
+            return None
+    try:
+        return TickerMaster(json.loads(path.read_text(encoding="utf-8")), path.stem)
+    except Exception:
+        return None
+
+
+def _save_disk(master: TickerMaster) -> None:
+    """임시 파일 → rename으로 원자적 저장 (실패해도 메모리 마스터는 유지)"""
+    path = _path(master.day)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(master.tickers, ensure_ascii=False)
+        write_atomic(path, lambda tmp: tmp.write_text(payload, encoding="utf-8"))
+    except Exception:
+        pass
+
+
+def _cached(day: str) -> Optional[TickerMaster]:
+    """메모리 → 디스크 순으로 해당 거래일 마스터 조회"""
+    with _lock:
+        if day in _memory:
+            return _memory[day]
+    master = _load_disk(day)
+    if master is not None:
+        with _lock:
+            _memory[day] = master
+    return master
+
+
+def _latest() -> Optional[TickerMaster]:
+    """가장 최근 마스터 (메모리 우선, 없으면 디스크의 마지막 파일)"""
+    with _lock:
+        if _memory:
+            return _memory[max(_memory)]
+    return _load_disk()
+
+
+def get_ticker_master(
+    fetch: Fetcher,
+    refresh: bool = False,
+    now: Optional[datetime] = None,
+) -> Optional[TickerMaster]:
+    """
+    거래일 기준 종목 마스터 (메모리 → 디스크 → fetch 순)
+
+    Args:
+        fetch: 시장별 종목 목록 조회 함수 (build_ticker_master 참고)
+        refresh: True면 당일 마스터가 있어도 다시 생성
+        now: 현재 시각 (테스트용)
+
+    Returns:
+        TickerMaster or None (생성 실패 + 저장된 마스터 없음)
+    """
+    now = now or datetime.now()
+    day = trading_day(now)
+    if not refresh:
+        master = _cached(day)
+        if master is not None:
+            return master
+
+    # 동시에 여러 스레드가 요청해도 생성은 한 번만
+    with _build_lock:
+        if not refresh:
+            master = _cached(day)
+            if master is not None:
+                return master
+
+        # 최근 실패했으면 RETRY_INTERVAL 동안은 다시 받지 않고 이전 마스터로 응답
+        failed_at = _failures.get(day)
+        if not refresh and failed_at is not None and now - failed_at < RETRY_INTERVAL:
+            return _latest()
+        tickers = build_ticker_master(fetch)
+        if tickers is None:
+            _failures[day] = now
+            return _latest()
+
+        master = TickerMaster(tickers, day)
+        with _lock:
+            _memory.clear()
+            _memory[day] = master
+        _failures.pop(day, None)
+        _save_disk(master)
+        return master
+
+
+def clear_ticker_master() -> None:
+    """메모리 마스터/실패 기록 비우기 (디스크 파일은 유지)"""
+    with _lock:
+        _memory.clear()
+    _failures.clear()
@@ -3,10 +3,134 @@
 네이버 금융 등에서 데이터를 추출하는 함수들
 Playwright 결과를 후처리하거나 requests로 직접 스크래핑
 """
+import json
 import re
-from typing import Optional
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .http_client import http_get
+from .ohlcv_store import get_cache_dir, write_atomic
+
+
+NAVER_ITEM_URL = "https://finance.naver.com/item/main.naver?code={ticker}"
+NAVER_POLLING_URL = "https://polling.finance.naver.com/api/realtime?query=SERVICE_ITEM:{ticker}"
+
+# get_naver_stock_info / get_naver_quote 결과 키
+QUOTE_KEYS = (
+    "name", "price", "change", "change_pct", "volume", "prev_close",
+    "open", "high", "low", "market_cap", "per", "pbr", "foreign_ratio",
+)
+
+# 폴링 API가 주는 항목 (PER/PBR은 응답의 EPS/BPS로 계산)
+POLLING_KEYS = frozenset(("name", "price", "change", "change_pct", "volume", "prev_close", "open", "high", "low", "per", "pbr"))
+# 폴링 API에 없어 시장 스냅샷에서 채우는 항목
+SNAPSHOT_QUOTE_KEYS = ("market_cap", "foreign_ratio")
+
+# 종목 페이지에서 시세를 읽는 영역만 파싱 (나머지 뉴스/공시/재무 표는 트리로 만들지 않음)
+QUOTE_STRAINER = SoupStrainer(class_=["wrap_company", "no_today", "no_exday", "no_info", "aside_invest_info"])
+
+# 폴링 API 등락 구분 (rf): 4=하한, 5=하락
+_POLLING_DOWN = {"4", "5"}
+
+# 폴링 API 요청 하나에 묶어 보내는 종목 수 (SERVICE_ITEM:코드1,코드2,...)
+POLLING_BATCH_SIZE = 50
+
+
+def _parse_stock_info(soup: BeautifulSoup) -> dict:
+    """종목 메인 페이지 → 시세/투자정보 dict (없는 항목은 키 생략)"""
+    result = {}
+
+    # 종목명
+    wrap_company = soup.select_one("div.wrap_company h2 a")
+    if wrap_company:
+        result["name"] = wrap_company.text.strip()
+
+    # 현재가
+    no_today = soup.select_one("p.no_today span.blind")
+    if no_today:
+        result["price"] = _parse_number(no_today.text)
+
+    # 전일대비
+    no_exday = soup.select("p.no_exday span.blind")
+    if len(no_exday) >= 2:
+        change = _parse_number(no_exday[0].text)
+        change_pct = _parse_float(no_exday[1].text.replace("%", ""))
+
+        # 상승/하락 판단
+        ico = soup.select_one("p.no_exday em")
+        if ico and "down" in str(ico.get("class", [])):
+            change = -change
+            change_pct = -change_pct
+
+        result["change"] = change
+        result["change_pct"] = change_pct
+
+    # 시세 테이블 (전일, 시가, 고가, 저가, 거래량)
+    table = soup.select_one("table.no_info")
+    if table:
+        rows = table.select("tr")
+        for row in rows:
+            tds = row.select("td")
+            for td in tds:
+                text = td.text.strip()
+                blind = td.select_one("span.blind")
+                if blind:
+                    value = _parse_number(blind.text)
+                    if "전일" in text:
+                        result["prev_close"] = value
+                    elif "시가" in text:
+                        result["open"] = value
+                    elif "고가" in text:
+                        result["high"] = value
+                    elif "저가" in text:
+                        result["low"] = value
+                    elif "거래량" in text:
+                        result["volume"] = value
+
+    # 투자정보 (시가총액, PER, PBR, 외국인비율)
+    aside = soup.select_one("div.aside_invest_info")
+    if aside:
+        items = aside.select("tr")
+        for item in items:
+            th = item.select_one("th")
+            td = item.select_one("td")
+            if th and td:
+                label = th.text.strip()
+                value_elem = td.select_one("em") or td
+                value_text = value_elem.text.strip()
+
+                if label == "시가총액":  # 정확 매칭 (시가총액순위와 구분)
+                    result["market_cap"] = _parse_market_cap(value_text)
+                elif "PER" in label:
+                    result["per"] = _parse_float(value_text)
+                elif "PBR" in label:
+                    result["pbr"] = _parse_float(value_text)
+                elif "외국인" in label:
+                    result["foreign_ratio"] = _parse_float(value_text.replace("%", ""))
+
+    return result
+
+
+def parse_stock_info_html(html: str, targeted: bool = True) -> Optional[dict]:
+    """
+    종목 메인 페이지 HTML 파싱
+
+    Args:
+        html: item/main.naver HTML
+        targeted: True면 시세 영역만 트리로 만듦 (결과 동일, 파싱 시간/메모리 절감)
+
+    Returns:
+        get_naver_stock_info와 같은 dict or None (항목 없음)
+    """
+    if targeted:
+        soup = BeautifulSoup(html, "html.parser", parse_only=QUOTE_STRAINER)
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+    result = _parse_stock_info(soup)
+    return result if result else None
 
 
 def get_naver_stock_info(ticker: str) -> Optional[dict]:
@@ -35,91 +159,150 @@ def get_naver_stock_info(ticker: str) -> Optional[dict]:
         or None (실패 시)
     """
     try:
-        url = f"https://finance.naver.com/item/main.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        response = http_get(NAVER_ITEM_URL.format(ticker=ticker), timeout=10)
+        return parse_stock_info_html(response.text)
+    except Exception:
+        return None
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+def parse_polling_quote(payload: dict, ticker: str) -> Optional[dict]:
+    """
+    네이버 실시간 폴링 API 응답 파싱
 
-        result = {}
-
-        # 종목명
-        wrap_company = soup.select_one("div.wrap_company h2 a")
-        if wrap_company:
-            result["name"] = wrap_company.text.strip()
-
-        # 현재가
-        no_today = soup.select_one("p.no_today span.blind")
-        if no_today:
-            result["price"] = _parse_number(no_today.text)
-
-        # 전일대비
-        no_exday = soup.select("p.no_exday span.blind")
-        if len(no_exday) >= 2:
-            change = _parse_number(no_exday[0].text)
-            change_pct = _parse_float(no_exday[1].text.replace("%", ""))
-
-            # 상승/하락 판단
-            ico = soup.select_one("p.no_exday em")
-            if ico and "down" in str(ico.get("class", [])):
-                change = -change
-                change_pct = -change_pct
-
-            result["change"] = change
-            result["change_pct"] = change_pct
-
-        # 시세 테이블 (전일, 시가, 고가, 저가, 거래량)
-        table = soup.select_one("table.no_info")
-        if table:
-            rows = table.select("tr")
-            for row in rows:
-                tds = row.select("td")
-                for td in tds:
-                    text = td.text.strip()
-                    blind = td.select_one("span.blind")
-                    if blind:
-                        value = _parse_number(blind.text)
-                        if "전일" in text:
-                            result["prev_close"] = value
-                        elif "시가" in text:
-                            result["open"] = value
-                        elif "고가" in text:
-                            result["high"] = value
-                        elif "저가" in text:
-                            result["low"] = value
-                        elif "거래량" in text:
-                            result["volume"] = value
-
-        # 투자정보 (시가총액, PER, PBR, 외국인비율)
-        aside = soup.select_one("div.aside_invest_info")
-        if aside:
-            items = aside.select("tr")
-            for item in items:
-                th = item.select_one("th")
-                td = item.select_one("td")
-                if th and td:
-                    label = th.text.strip()
-                    value_elem = td.select_one("em") or td
-                    value_text = value_elem.text.strip()
-
-                    if label == "시가총액":  # 정확 매칭 (시가총액순위와 구분)
-                        result["market_cap"] = _parse_market_cap(value_text)
-                    elif "PER" in label:
-                        result["per"] = _parse_float(value_text)
-                    elif "PBR" in label:
-                        result["pbr"] = _parse_float(value_text)
-                    elif "외국인" in label:
-                        result["foreign_ratio"] = _parse_float(value_text.replace("%", ""))
-
-        return result if result else None
+    Args:
+        payload: polling.finance.naver.com/api/realtime JSON
+        ticker: 요청한 종목코드 (응답 종목 확인용)
 
-    except Exception:
+    Returns:
+        시세 항목 dict (name, price, change, change_pct, volume, prev_close, open, high, low, per, pbr)
+        or None (종목 없음/형식 다름)
+    """
+    try:
+        areas = payload["result"]["areas"]
+        item = next(d for area in areas for d in area.get("datas", []) if d.get("cd") == ticker)
+    except (KeyError, TypeError, StopIteration):
         return None
 
+    if item.get("nv") is None:
+        return None
+
+    sign = -1 if str(item.get("rf")) in _POLLING_DOWN else 1
+    price = int(item["nv"])
+    quote = {
+        "name": item.get("nm"),
+        "price": price,
+        "change": sign * abs(int(item.get("cv") or 0)),
+        "change_pct": sign * abs(float(item.get("cr") or 0)),
+        "volume": int(item.get("aq") or 0),
+        "prev_close": int(item.get("sv") or 0),
+        "open": int(item.get("ov") or 0),
+        "high": int(item.get("hv") or 0),
+        "low": int(item.get("lv") or 0),
+    }
+    # 페이지의 PER/PBR과 같은 기준 (현재가 / 최근 결산 EPS, BPS)
+    for key, base in (("per", "eps"), ("pbr", "bps")):
+        value = item.get(base)
+        if value:
+            quote[key] = round(price / float(value), 2)
+    return {k: v for k, v in quote.items() if v is not None}
+
+
+def get_naver_quote(
+    ticker: str,
+    use_snapshot: bool = True,
+    fields: Iterable[str] = QUOTE_KEYS,
+) -> Optional[dict]:
+    """
+    경량 시세 조회 (get_naver_stock_info와 같은 결과 형식)
+
+    필요한 항목(fields)을 채울 수 있는 가장 가벼운 경로 하나만 요청한다.
+    1) 실시간 폴링 API(JSON, 약 1KB)로 현재가/등락/시고저/거래량/PER/PBR
+    2) 시가총액/외국인비율은 신선한 시장 스냅샷(utils.market_snapshot)에서 (네트워크 없음)
+    3) 폴링 + 스냅샷으로 fields를 못 채우면 폴링 없이 종목 페이지만 받아 시세 영역만 파싱
+       (폴링이 실패하거나 항목이 빠졌을 때도 종목 페이지로 채움)
+
+    Args:
+        ticker: 종목코드
+        use_snapshot: 시장 스냅샷 사용 여부
+        fields: 호출자가 필요한 항목 (기본: 전체 QUOTE_KEYS)
+
+    Returns:
+        get_naver_stock_info와 같은 키의 dict (fields 외 항목이 더 있을 수 있음) or None (실패 시)
+    """
+    needed = set(fields)
+    extra = {}
+    if use_snapshot and needed - POLLING_KEYS:
+        try:
+            from .market_snapshot import lookup_snapshot
+            row = lookup_snapshot(ticker) or {}
+        except Exception:
+            row = {}
+        extra = {key: row[key] for key in SNAPSHOT_QUOTE_KEYS if row.get(key) is not None}
+
+    quote = None
+    if needed <= POLLING_KEYS | set(extra):
+        try:
+            response = http_get(NAVER_POLLING_URL.format(ticker=ticker), timeout=10)
+            quote = parse_polling_quote(response.json(), ticker)
+        except Exception:
+            quote = None
+        if quote is not None:
+            quote.update(extra)
+            if needed <= set(quote):
+                return quote
+
+    page = get_naver_stock_info(ticker)
+    if page is None:
+        return quote
+    # 폴링 값이 더 최신이므로 우선
+    return {**page, **(quote or {})}
+
+
+def get_naver_polling_quotes(
+    tickers: list,
+    batch_size: int = POLLING_BATCH_SIZE,
+    workers: int = 8,
+) -> dict:
+    """
+    여러 종목 폴링 시세 (요청 하나에 batch_size 종목씩)
+
+    전 종목 PER/PBR처럼 종목 수가 많을 때 종목 페이지(item/main) 대신 사용한다.
+    묶음 응답에 빠진 종목은 한 종목씩 다시 요청한다.
+
+    Args:
+        tickers: 종목코드 리스트
+        batch_size: 요청당 종목 수
+        workers: 동시 요청 수 (호스트별 속도 제한은 http_client가 담당)
+
+    Returns:
+        {ticker: parse_polling_quote 결과} (조회 실패 종목은 제외)
+    """
+    unique = list(dict.fromkeys(tickers))
+
+    def fetch(batch: list) -> dict:
+        try:
+            response = http_get(NAVER_POLLING_URL.format(ticker=",".join(batch)), timeout=10)
+            payload = response.json()
+        except Exception:
+            payload = None
+        quotes = {}
+        for ticker in batch:
+            quote = parse_polling_quote(payload, ticker) if payload is not None else None
+            if quote is None and len(batch) > 1:
+                quote = fetch([ticker]).get(ticker)
+            if quote is not None:
+                quotes[ticker] = quote
+        return quotes
+
+    batches = [unique[i:i + batch_size] for i in range(0, len(unique), max(1, batch_size))]
+    if not batches:
+        return {}
+    result = {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+        for quotes in executor.map(fetch, batches):
+            result.update(quotes)
+    return result
+
 
 def get_naver_stock_news(ticker: str, limit: int = 5) -> Optional[list]:
     """
@@ -138,12 +321,7 @@ def get_naver_stock_news(ticker: str, limit: int = 5) -> Optional[list]:
     """
     try:
         url = f"https://finance.naver.com/item/news.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = http_get(url, timeout=10)
 
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -187,12 +365,7 @@ def get_naver_discussion(ticker: str, limit: int = 10) -> Optional[list]:
     """
     try:
         url = f"https://finance.naver.com/item/board.naver?code={ticker}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = http_get(url, timeout=10)
 
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -266,41 +439,280 @@ def _parse_float(text: str) -> float:
         return 0.0
 
 
-def get_naver_stock_list(market: str = "KOSPI") -> Optional[list]:
+NAVER_MARKET_SUM_URL = "https://finance.naver.com/sise/sise_market_sum.naver?sosok={sosok}&page={page}"
+STOCK_LIST_MAX_PAGES = 50
+
+# 시가총액 페이지 컬럼명 → 결과 키 (기본 노출 컬럼)
+STOCK_LIST_COLUMNS = {
+    "현재가": "price",
+    "전일비": "change",
+    "등락률": "change_pct",
+    "시가총액": "market_cap",        # 억
+    "상장주식수": "listed_shares",   # 천주
+    "외국인비율": "foreign_ratio",   # %
+    "거래량": "volume",
+    "PER": "per",
+    "ROE": "roe",
+}
+_FLOAT_COLUMNS = {"change_pct", "foreign_ratio", "per", "roe"}
+
+# (market, 날짜) → 종목 리스트 (당일 재조회 방지)
+_stock_list_cache: dict = {}
+
+
+def _parse_stock_list_page(html: str) -> Tuple[list, Optional[int]]:
+    """
+    시가총액 페이지 파싱
+
+    Returns:
+        (종목 리스트, 마지막 페이지 번호 or None)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    last_page = None
+    last_link = soup.select_one("td.pgRR a")
+    if last_link:
+        match = re.search(r"page=(\d+)", last_link.get("href", ""))
+        if match:
+            last_page = int(match.group(1))
+
+    table = soup.select_one("table.type_2")
+    if table is None:
+        return [], last_page
+
+    headers = [th.get_text(strip=True) for th in table.select("thead th")]
+    columns = {i: STOCK_LIST_COLUMNS[h] for i, h in enumerate(headers) if h in STOCK_LIST_COLUMNS}
+
+    stocks = []
+    for row in table.select("tr"):
+        link = row.select_one("a.tltle")
+        if not link:
+            continue
+        href = link.get("href", "")
+        code = href.split("code=")[-1] if "code=" in href else ""
+        if not (code and len(code) == 6):
+            continue
+
+        item = {"code": code, "name": link.get_text(strip=True)}
+        cells = row.select("td")
+        for i, key in columns.items():
+            if i >= len(cells):
+                continue
+            text = cells[i].get_text(strip=True)
+            if key in _FLOAT_COLUMNS:
+                item[key] = _parse_float(text) if re.search(r"\d", text) else None
+            else:
+                item[key] = _parse_number(text)
+        # 전일비 셀은 부호 없이 표시되므로 등락률 부호를 따름
+        if item.get("change") and (item.get("change_pct") or 0) < 0:
+            item["change"] = -abs(item["change"])
+        stocks.append(item)
+
+    return stocks, last_page
+
+
+def _stock_list_cache_path(market: str, day: str) -> Path:
+    """디스크 캐시 경로"""
+    return get_cache_dir() / "stock_list" / f"{market}_{day}.json"
+
+
+def get_naver_stock_list(market: str = "KOSPI", workers: int = 8, use_cache: bool = True) -> Optional[list]:
     """
     네이버 금융에서 종목 리스트 조회
 
+    첫 페이지에서 전체 페이지 수를 확인한 뒤 나머지 페이지를 동시에 받는다.
+    결과는 당일 동안 메모리/디스크에 캐시한다 (가격 컬럼은 최초 조회 시점 기준).
+
     Args:
         market: "KOSPI" 또는 "KOSDAQ"
+        workers: 동시 요청 수 (호스트별 속도 제한은 http_client가 담당)
+        use_cache: 당일 캐시 사용 여부
+
+    Returns:
+        [
+            {"code": "005930", "name": "삼성전자", "price": 70000, "change": -900, "change_pct": -1.27,
+             "market_cap": 4178000, "listed_shares": 5969783, "foreign_ratio": 50.1, "volume": 12345678,
+             "per": 12.5, "roe": 9.0},
+            ...
+        ]
+        or None
+    """
+    day = datetime.now().strftime("%Y%m%d")
+    key = (market, day)
+    path = _stock_list_cache_path(market, day)
+    if use_cache:
+        if key in _stock_list_cache:
+            return _stock_list_cache[key]
+        if path.exists():
+            try:
+                stocks = json.loads(path.read_text(encoding="utf-8"))
+                _stock_list_cache[key] = stocks
+                return stocks
+            except Exception:
+                pass
+
+    sosok = "0" if market == "KOSPI" else "1"
+
+    def fetch_page(page: int) -> list:
+        resp = http_get(NAVER_MARKET_SUM_URL.format(sosok=sosok, page=page), timeout=10)
+        return _parse_stock_list_page(resp.text)[0]
+
+    try:
+        resp = http_get(NAVER_MARKET_SUM_URL.format(sosok=sosok, page=1), timeout=10)
+        all_stocks, last_page = _parse_stock_list_page(resp.text)
+        if not all_stocks:
+            return None
+
+        if last_page:
+            pages = range(2, min(last_page, STOCK_LIST_MAX_PAGES) + 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page_stocks in executor.map(fetch_page, pages):
+                    all_stocks.extend(page_stocks)
+        else:
+            # 페이지 수를 모르면 빈 페이지가 나올 때까지 순차 조회
+            for page in range(2, STOCK_LIST_MAX_PAGES + 1):
+                page_stocks = fetch_page(page)
+                if not page_stocks:
+                    break
+                all_stocks.extend(page_stocks)
+    except Exception:
+        return None
+
+    _stock_list_cache[key] = all_stocks
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(all_stocks, ensure_ascii=False)
+        write_atomic(path, lambda tmp: tmp.write_text(payload, encoding="utf-8"))
+    except Exception:
+        pass
+    return all_stocks
+
+
+NAVER_SECTOR_URL = "https://finance.naver.com/sise/sise_group.naver?type=upjong"
+NAVER_SECTOR_DETAIL_URL = "https://finance.naver.com/sise/sise_group_detail.naver?type=upjong&no={no}"
+
+
+def get_naver_sector_list() -> Optional[list]:
+    """
+    네이버 금융 업종 목록 조회
+
+    Returns:
+        [{"no": "278", "name": "반도체와반도체장비"}, ...] or None
+    """
+    try:
+        resp = http_get(NAVER_SECTOR_URL, timeout=10)
+        soup = BeautifulSoup(resp.text, "html.parser")
+
+        sectors = []
+        seen = set()
+        for link in soup.select('a[href*="sise_group_detail"]'):
+            match = re.search(r"no=(\d+)", link.get("href", ""))
+            name = link.get_text(strip=True)
+            if match and name and match.group(1) not in seen:
+                seen.add(match.group(1))
+                sectors.append({"no": match.group(1), "name": name})
+
+        return sectors if sectors else None
+    except Exception:
+        return None
+
+
+def get_naver_sector_stocks(sector_no: str) -> Optional[list]:
+    """
+    네이버 금융 업종 구성 종목 조회
+
+    Args:
+        sector_no: 업종 번호 (get_naver_sector_list의 "no")
 
     Returns:
         [{"code": "005930", "name": "삼성전자"}, ...] or None
     """
-    market_code = "0" if market == "KOSPI" else "1"
-    url = f"https://finance.naver.com/sise/sise_market_sum.naver?sosok={market_code}"
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+    try:
+        resp = http_get(NAVER_SECTOR_DETAIL_URL.format(no=sector_no), timeout=10)
+        soup = BeautifulSoup(resp.text, "html.parser")
+
+        stocks = []
+        seen = set()
+        for link in soup.select('a[href*="/item/main.naver?code="]'):
+            code = link.get("href", "").split("code=")[-1][:6]
+            name = link.get_text(strip=True)
+            if len(code) == 6 and name and code not in seen:
+                seen.add(code)
+                stocks.append({"code": code, "name": name})
+
+        return stocks if stocks else None
+    except Exception:
+        return None
+
+
+def get_naver_sector_map(workers: int = 8) -> Optional[dict]:
+    """
+    전 종목 업종 매핑 (업종 페이지 동시 조회)
+
+    Args:
+        workers: 동시 요청 수 (호스트별 속도 제한은 http_client가 담당)
+
+    Returns:
+        {"005930": "반도체와반도체장비", ...} or None
+    """
+    sectors = get_naver_sector_list()
+    if not sectors:
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        members = executor.map(lambda s: get_naver_sector_stocks(s["no"]), sectors)
+        sector_map = {}
+        for sector, stocks in zip(sectors, members):
+            for item in stocks or []:
+                sector_map.setdefault(item["code"], sector["name"])
+
+    return sector_map if sector_map else None
+
+
+KRX_CORP_LIST_URL = "https://kind.krx.co.kr/corpgeneral/corpList.do?method=download&marketType={market_type}"
+KRX_MARKET_TYPES = {"KOSPI": "stockMkt", "KOSDAQ": "kosdaqMkt"}
+
+
+def get_krx_listing_dates(market: str = "KOSPI") -> Optional[dict]:
+    """
+    KRX 상장법인목록(KIND)에서 종목별 상장일 조회
+
+    Args:
+        market: "KOSPI" 또는 "KOSDAQ"
+
+    Returns:
+        {"005930": "1975-06-11", ...} or None
+    """
+    market_type = KRX_MARKET_TYPES.get(market)
+    if market_type is None:
+        return None
 
     try:
-        all_stocks = []
-        for page in range(1, 50):  # 최대 50페이지
-            resp = requests.get(f"{url}&page={page}", headers=headers, timeout=10)
-            soup = BeautifulSoup(resp.text, "html.parser")
-            rows = soup.select("table.type_2 tr")
-            page_stocks = []
-
-            for row in rows:
-                link = row.select_one("a.tltle")
-                if link:
-                    href = link.get("href", "")
-                    code = href.split("code=")[-1] if "code=" in href else ""
-                    if code and len(code) == 6:
-                        page_stocks.append({"code": code, "name": link.get_text(strip=True)})
-
-            if not page_stocks:
-                break
-            all_stocks.extend(page_stocks)
-
-        return all_stocks if all_stocks else None
+        resp = http_get(KRX_CORP_LIST_URL.format(market_type=market_type), timeout=10)
+        resp.encoding = "euc-kr"
+        soup = BeautifulSoup(resp.text, "html.parser")
+
+        table = soup.find("table")
+        if table is None:
+            return None
+        headers = [th.get_text(strip=True) for th in table.select("th")]
+        if "종목코드" not in headers or "상장일" not in headers:
+            return None
+        code_idx = headers.index("종목코드")
+        date_idx = headers.index("상장일")
+
+        dates = {}
+        for row in table.select("tr"):
+            cells = row.select("td")
+            if len(cells) <= max(code_idx, date_idx):
+                continue
+            # 엑셀용 표라 앞자리 0이 빠진 코드가 섞여 있음
+            code = cells[code_idx].get_text(strip=True).zfill(6)
+            listed = cells[date_idx].get_text(strip=True)
+            if code.isalnum() and listed:
+                dates[code] = listed
+
+        return dates if dates else None
     except Exception:
         return None
 
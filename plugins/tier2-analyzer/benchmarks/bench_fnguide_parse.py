@@ -0,0 +1,110 @@
+"""FnGuide 파싱 벤치마크
+
+페이지 전체 BeautifulSoup 트리 파싱(기존 방식)과 parse_fnguide_page의
+SoupStrainer / lxml 백엔드의 파싱 시간, 최대 메모리(tracemalloc) 비교
+(tracemalloc은 파이썬 객체 할당만 추적하므로 lxml(libxml2) 내부 메모리는 제외됨)
+
+실행:
+    python benchmarks/bench_fnguide_parse.py                  # tests/fixtures 샘플 (실제 페이지 크기로 부풀림)
+    python benchmarks/bench_fnguide_parse.py saved_page.html  # 저장해 둔 실제 FnGuide 페이지
+"""
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from utils.fi_plus.fnguide import parser
+from utils.fi_plus.fnguide.page_cache import PAGE_TABLES
+
+LXML_INSTALLED = parser.LXML_AVAILABLE
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# 실제 스냅샷 페이지(~300KB)는 메뉴/다른 재무 테이블이 대부분이므로 그만큼 채워 넣음
+TARGET_BYTES = 300_000
+FILLER = (
+    '<div class="um_table" id="divFiller{i}"><table><thead><tr><th>항목</th>'
+    + "".join(f"<th>20{y}/12</th>" for y in range(19, 25))
+    + "</tr></thead><tbody>"
+    + "".join(
+        f'<tr class="acd_dep2_sub"><th><div>항목{r}</div></th>'
+        + "".join(f'<td class="r" title="{r * 1000 + c:,}">{r * 1000 + c:,}</td>' for c in range(6))
+        + "</tr>"
+        for r in range(20)
+    )
+    + "</tbody></table></div>\n"
+)
+
+
+def _padded(html: str) -> str:
+    """샘플 HTML에 관련 없는 테이블을 붙여 실제 페이지 크기로 만듦"""
+    fillers = []
+    size = len(html.encode("utf-8"))
+    i = 0
+    while size < TARGET_BYTES:
+        block = FILLER.format(i=i)
+        fillers.append(block)
+        size += len(block.encode("utf-8"))
+        i += 1
+    return html.replace("<body>", "<body>\n" + "".join(fillers), 1)
+
+
+def full_tree(html: str) -> dict:
+    """기존 방식: 전체 트리 파싱 후 테이블별 추출"""
+    soup = BeautifulSoup(html, "html.parser")
+    tables = {div_id: parser.parse_fnguide_table(soup, div_id, metrics) for div_id, metrics in PAGE_TABLES.items()}
+    return {"name": parser.extract_company_name(soup), "tables": tables}
+
+
+def strained(html: str) -> dict:
+    parser.LXML_AVAILABLE = False
+    try:
+        return parser.parse_fnguide_page(html, PAGE_TABLES)
+    finally:
+        parser.LXML_AVAILABLE = LXML_INSTALLED
+
+
+def lxml_xpath(html: str) -> dict:
+    return parser.parse_fnguide_page(html, PAGE_TABLES)
+
+
+def _peak_kib(func, html: str) -> float:
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main(paths: list, repeat: int = 10) -> None:
+    if paths:
+        pages = [(Path(p).name, Path(p).read_text(encoding="utf-8")) for p in paths]
+    else:
+        pages = [(f"{p.name} (padded)", _padded(p.read_text(encoding="utf-8"))) for p in sorted(FIXTURE_DIR.glob("fnguide*.html"))]
+
+    backends = [("full tree", full_tree), ("SoupStrainer", strained)]
+    if LXML_INSTALLED:
+        backends.append(("lxml XPath", lxml_xpath))
+    else:
+        print("lxml 미설치: lxml 백엔드 생략 (pip install lxml)")
+
+    for label, html in pages:
+        print(f"\n{label}: {len(html.encode('utf-8')) / 1024:.0f} KiB")
+        print(f"{'backend':>14} {'time':>10} {'peak mem':>12} {'speedup':>8}")
+
+        expected = full_tree(html)
+        base = None
+        for name, func in backends:
+            assert func(html) == expected, name
+            elapsed = min(timeit.repeat(lambda: func(html), number=repeat, repeat=3)) / repeat
+            peak = _peak_kib(func, html)
+            base = base or elapsed
+            print(f"{name:>14} {elapsed * 1e3:>8.1f}ms {peak:>9.0f}KiB {base / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+"""SI+ 키워드 매칭 벤치마크
+
+메시지마다 키워드 목록을 `kw in text`로 반복하던 기존 방식(스팸/센티먼트/루머)과
+KeywordMatcher(pyahocorasick 미설치 시 정규식 한 번 훑기 / 설치 시 Aho-Corasick)의 처리 시간 비교
+
+실행:
+    python benchmarks/bench_keyword_matcher.py          # 합성 메시지 100,000개
+    python benchmarks/bench_keyword_matcher.py 20000    # 메시지 수 지정
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.si_plus.base import (
+    BULLISH_KEYWORDS,
+    BEARISH_KEYWORDS,
+    RUMOR_INDICATORS,
+    FACT_INDICATORS,
+    SPAM_PATTERNS,
+)
+from utils.si_plus.keyword_matcher import AHOCORASICK_AVAILABLE, KeywordMatcher, get_default_matcher
+
+# 텔레그램/종토방 메시지 길이(수십~수백 자)에 맞춘 합성 문장 조각
+FILLER_WORDS = [
+    "삼성전자", "오늘", "장중", "외국인", "기관", "매수세", "거래량", "차트", "실적", "발표",
+    "반도체", "업황", "전망", "목표가", "리포트", "시장", "코스피", "지수", "환율", "금리",
+]
+KEYWORDS = BULLISH_KEYWORDS + BEARISH_KEYWORDS + RUMOR_INDICATORS + FACT_INDICATORS + SPAM_PATTERNS
+
+
+def _messages(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 40))]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(KEYWORDS))
+        messages.append(" ".join(words))
+    return messages
+
+
+def legacy_scan(text: str) -> tuple:
+    """기존 방식: 목록마다 `kw in text` 반복 (is_spam + analyze_sentiment + classify_rumor)"""
+    text_lower = text.lower()
+    spam = any(p.lower() in text_lower for p in SPAM_PATTERNS)
+    bullish = [kw for kw in BULLISH_KEYWORDS if kw in text]
+    bearish = [kw for kw in BEARISH_KEYWORDS if kw in text]
+    rumor = [ind for ind in RUMOR_INDICATORS if ind in text]
+    fact = [ind for ind in FACT_INDICATORS if ind in text]
+    return spam, bullish, bearish, rumor, fact
+
+
+def matcher_scan(matcher: KeywordMatcher, text: str) -> tuple:
+    hits = matcher.scan(text)
+    return bool(hits["spam"]), hits["bullish"], hits["bearish"], hits["rumor"], hits["fact"]
+
+
+def _timed(func, messages: list) -> float:
+    start = time.perf_counter()
+    for text in messages:
+        func(text)
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    messages = _messages(count)
+    engines = [("legacy kw in text", legacy_scan)]
+    fallback = KeywordMatcher(get_default_matcher().categories, ignore_case=("spam",), use_automaton=False)
+    engines.append(("regex", lambda text: matcher_scan(fallback, text)))
+    if AHOCORASICK_AVAILABLE:
+        automaton = KeywordMatcher(get_default_matcher().categories, ignore_case=("spam",), use_automaton=True)
+        engines.append(("aho-corasick", lambda text: matcher_scan(automaton, text)))
+
+    for name, func in engines[1:]:
+        assert all(func(text) == legacy_scan(text) for text in messages[:5000]), name
+
+    print(f"메시지 {count:,}개, 키워드 {len(KEYWORDS)}개 (pyahocorasick {'설치' if AHOCORASICK_AVAILABLE else '미설치'})")
+    print(f"{'engine':>18} {'total':>9} {'per msg':>9} {'speedup':>8}")
+    base = None
+    for name, func in engines:
+        elapsed = min(_timed(func, messages) for _ in range(3))
+        base = base or elapsed
+        print(f"{name:>18} {elapsed:>8.2f}s {elapsed / count * 1e6:>7.1f}us {base / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
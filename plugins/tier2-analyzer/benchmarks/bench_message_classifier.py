@@ -0,0 +1,96 @@
+"""SI+ 수집 후 분석 벤치마크
+
+UnifiedCollector.collect의 기존 후처리(filter_spam → analyze_sentiment →
+classify_rumor 루프 + {**msg} 복사 → 리포트의 테마 집계)와
+MessageClassifier 단일 패스(메시지당 키워드 스캔 1회, 원본 dict 유지)의 처리 시간 비교
+
+실행:
+    python benchmarks/bench_message_classifier.py          # 합성 메시지 100,000개
+    python benchmarks/bench_message_classifier.py 20000    # 메시지 수 지정
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_keyword_matcher import _messages
+
+from utils.si_plus.base import (
+    MessageClassifier,
+    analyze_sentiment,
+    classify_rumor,
+    count_themes,
+    filter_spam,
+)
+from utils.si_plus.keyword_matcher import AHOCORASICK_AVAILABLE
+
+THEMES = ["반도체", "HBM", "AI", "2차전지"]
+
+
+def _collected(count: int) -> list:
+    """수집기 출력 형식의 메시지"""
+    return [
+        {
+            "text": text,
+            "date": "2026-01-20T09:00:00",
+            "source": ("telegram", "naver", "reddit")[i % 3],
+            "match_type": "theme" if i % 4 == 0 else "direct",
+            "matched_keyword": THEMES[i % len(THEMES)] if i % 4 == 0 else "삼성전자",
+        }
+        for i, text in enumerate(_messages(count))
+    ]
+
+
+def legacy_pipeline(messages: list) -> dict:
+    all_messages = filter_spam(messages)
+    sentiment = analyze_sentiment(all_messages) if all_messages else {}
+    rumors = []
+    facts = []
+    for msg in all_messages:
+        classification = classify_rumor(msg.get("text", ""))
+        if classification["is_rumor"]:
+            rumors.append({**msg, "rumor_confidence": classification["confidence"]})
+        else:
+            facts.append({**msg, "fact_confidence": classification["confidence"]})
+    return {
+        "messages": all_messages,
+        "sentiment": sentiment,
+        "rumors": rumors[:10],
+        "facts": facts[:10],
+        "rumor_count": len(rumors),
+        "theme_counts": count_themes(all_messages),
+    }
+
+
+def single_pass(messages: list) -> dict:
+    classifier = MessageClassifier()
+    classifier.extend(messages)
+    return classifier.result()
+
+
+def main(count: int = 100_000) -> None:
+    messages = _collected(count)
+
+    legacy = legacy_pipeline(messages)
+    result = single_pass(messages)
+    for key in legacy:
+        assert result[key] == legacy[key], key
+
+    print(f"메시지 {count:,}개 (스팸 {count - len(legacy['messages']):,}개, "
+          f"pyahocorasick {'설치' if AHOCORASICK_AVAILABLE else '미설치'})")
+    print(f"{'pipeline':>12} {'total':>9} {'per msg':>9} {'speedup':>8}")
+    base = None
+    for name, func in [("legacy", legacy_pipeline), ("single pass", single_pass)]:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func(messages)
+            timings.append(time.perf_counter() - start)
+        elapsed = min(timings)
+        base = base or elapsed
+        print(f"{name:>12} {elapsed:>8.2f}s {elapsed / count * 1e6:>7.1f}us {base / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
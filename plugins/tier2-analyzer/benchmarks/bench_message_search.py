@@ -0,0 +1,90 @@
+"""SI+ 아카이브 키워드 검색 벤치마크
+
+아카이브에 저장된 메시지에서 키워드 검색 시
+- 전체 메시지를 읽어 파이썬에서 `query in text` 필터 (기존 종토방 검색 방식)
+- SQLite 본문 스캔 (instr, FTS5 미지원 시 대체 경로)
+- FTS5 trigram 인덱스
+의 검색어당 처리 시간 비교 (네트워크 요청 없음)
+
+실행:
+    python benchmarks/bench_message_search.py           # 합성 메시지 200,000개
+    python benchmarks/bench_message_search.py 50000     # 메시지 수 지정
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_keyword_matcher import KEYWORDS, _messages
+
+from utils.si_plus.message_archive import FTS_MIN_QUERY_LENGTH, MessageArchive
+
+TICKERS = [f"{code:06d}" for code in range(5930, 5930 + 40 * 7, 7)]
+QUERIES = [kw for kw in KEYWORDS if len(kw) >= FTS_MIN_QUERY_LENGTH][:20]
+
+
+def _fill(archive: MessageArchive, count: int) -> None:
+    """종목 토론방 형식 메시지를 종목별로 저장"""
+    by_ticker = {}
+    for i, text in enumerate(_messages(count)):
+        ticker = TICKERS[i % len(TICKERS)]
+        by_ticker.setdefault(ticker, []).append({
+            "id": str(i), "text": text, "title": text, "source": "naver", "ticker": ticker,
+        })
+    for ticker, messages in by_ticker.items():
+        archive.record("naver", ticker, messages)
+
+
+def _python_filter(archive: MessageArchive, query: str) -> list:
+    matched = []
+    for ticker in TICKERS:
+        matched.extend(m for m in archive.get_messages("naver", ticker) if query in m["text"])
+    return matched
+
+
+def _timed(func) -> float:
+    """검색어 하나당 평균 시간"""
+    start = time.perf_counter()
+    for query in QUERIES:
+        func(query)
+    return (time.perf_counter() - start) / len(QUERIES)
+
+
+def main(count: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = MessageArchive(Path(tmp) / "messages.sqlite")
+        start = time.perf_counter()
+        _fill(archive, count)
+        fill_time = time.perf_counter() - start
+        if not archive.fts:
+            print("FTS5 trigram 미지원 SQLite - 본문 스캔만 측정")
+
+        def _scan(query: str) -> list:
+            fts, archive.fts = archive.fts, False
+            try:
+                return archive.search(query, source="naver")
+            finally:
+                archive.fts = fts
+
+        for query in QUERIES[:5]:
+            expected = sorted(m["id"] for m in _python_filter(archive, query))
+            assert sorted(m["id"] for m in _scan(query)) == expected, query
+            assert sorted(m["id"] for m in archive.search(query, source="naver")) == expected, query
+
+        engines = [("python filter", lambda q: _python_filter(archive, q)), ("sqlite scan", _scan)]
+        if archive.fts:
+            engines.append(("fts5 trigram", lambda q: archive.search(q, source="naver")))
+
+        print(f"메시지 {count:,}개 저장 {fill_time:.1f}s, 검색어 {len(QUERIES)}개")
+        print(f"{'engine':>14} {'per query':>10} {'speedup':>8}")
+        base = None
+        for name, func in engines:
+            elapsed = _timed(func)
+            base = base or elapsed
+            print(f"{name:>14} {elapsed * 1e3:>8.1f}ms {base / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,104 @@
+"""SI+ 메시지 저장소 벤치마크
+
+수집기 출력 형식(telegram/naver/reddit, 여러 종목)의 메시지를
+- dict 리스트 (기존)
+- MessageStore (범주형 + Arrow 문자열 컬럼)
+로 들고 있을 때의 메모리와 소스/테마별 건수 집계 시간 비교
+(dict 리스트는 tracemalloc, MessageStore는 Arrow 버퍼까지 포함하는 memory_usage()로 측정)
+
+실행:
+    python benchmarks/bench_message_store.py           # 합성 메시지 300,000개
+    python benchmarks/bench_message_store.py 50000     # 메시지 수 지정
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_keyword_matcher import _messages
+
+from utils.si_plus.base import count_themes
+from utils.si_plus.message_store import ARROW_STRINGS, MessageStore
+
+TICKERS = [f"{code:06d}" for code in range(5930, 5930 + 40 * 7, 7)]
+CHANNELS = ["siglab", "FastStockNews", "stockmarket_kr", "hedgehog", "valuechain"]
+THEMES = ["반도체", "HBM", "AI", "2차전지", "로봇", "원전"]
+
+
+def _collected(count: int) -> list:
+    """여러 종목에 걸친 수집기 출력 형식 메시지"""
+    messages = []
+    for i, text in enumerate(_messages(count)):
+        source = ("telegram", "naver", "reddit")[i % 3]
+        theme = i % 4 == 0
+        msg = {
+            "id": i if source == "telegram" else f"{source}-{i}",
+            "text": text,
+            "date": f"2026-01-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}:00",
+            "source": source,
+            "match_type": "theme" if theme else "direct",
+            "matched_keyword": THEMES[i % len(THEMES)] if theme else TICKERS[i % len(TICKERS)],
+        }
+        if source == "telegram":
+            msg.update(views=i % 5000, forwards=i % 50, channel=CHANNELS[i % len(CHANNELS)], keyword=msg["matched_keyword"])
+        elif source == "naver":
+            msg.update(title=text, views=i % 300, score=i % 20, ticker=TICKERS[i % len(TICKERS)],
+                       url=f"https://finance.naver.com/item/board_read.naver?nid={i}")
+        else:
+            msg.update(title=text[:40], score=i % 100, num_comments=i % 30, subreddit="stocks",
+                       author=f"user{i % 997}", url=f"https://reddit.com/r/stocks/comments/{i:x}")
+        messages.append(msg)
+    return messages
+
+
+def _traced(build):
+    """build()가 만든 객체와 그 파이썬 할당 크기"""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def _timed(func, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _legacy_counts(messages: list) -> tuple:
+    by_source = {}
+    for msg in messages:
+        by_source[msg["source"]] = by_source.get(msg["source"], 0) + 1
+    return by_source, count_themes(messages)
+
+
+def main(count: int = 300_000) -> None:
+    messages, list_bytes = _traced(lambda: _collected(count))
+    store = MessageStore.from_messages(messages)
+    assert store.to_messages() == messages
+    assert store.count_by("source") == _legacy_counts(messages)[0]
+    assert store.count_by("matched_keyword", match_type="theme") == _legacy_counts(messages)[1]
+
+    print(f"메시지 {count:,}개, 종목 {len(TICKERS)}개 (Arrow 문자열 {'사용' if ARROW_STRINGS else '미사용'})")
+    print(f"{'container':>12} {'memory':>10}")
+    print(f"{'dict list':>12} {list_bytes / 2**20:>7.1f}MiB")
+    print(f"{'MessageStore':>12} {store.memory_usage() / 2**20:>7.1f}MiB")
+    print()
+
+    list_time = _timed(lambda: _legacy_counts(messages))
+    store_time = _timed(lambda: (store.count_by("source"), store.count_by("matched_keyword", match_type="theme")))
+    print(f"{'group-by':>12} {'time':>10} {'speedup':>8}")
+    print(f"{'dict list':>12} {list_time * 1e3:>8.1f}ms {1.0:>7.1f}x")
+    print(f"{'MessageStore':>12} {store_time * 1e3:>8.1f}ms {list_time / store_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
@@ -0,0 +1,14 @@
+"""Tier 2 테스트 공통 fixture"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """로컬 캐시를 테스트별 임시 디렉토리로 격리"""
+    from utils.fi_plus.fnguide.page_cache import clear_fnguide_cache
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("TIER2_ANALYZER_CACHE_DIR", str(cache_dir))
+    clear_fnguide_cache()
+    yield cache_dir
+    clear_fnguide_cache()
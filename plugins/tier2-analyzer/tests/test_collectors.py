@@ -87,6 +87,76 @@ class TestTelegramCollector:
         assert "theme_count" in stats
 
 
+    @pytest.mark.asyncio
+    async def test_collect_reuses_single_client(self):
+        """collect 1회에 클라이언트 연결 1번, 채널당 get_entity 1번"""
+        from utils.si_plus import TelegramCollector
+
+        collector = TelegramCollector(["ch1", "ch2"])
+
+        mock_client = MagicMock()
+        mock_client.get_entity = AsyncMock(side_effect=lambda ch: f"entity:{ch}")
+        next_id = iter(range(1000))
+
+        def _iter_messages(entity, search, limit):
+            async def _gen():
+                msg = MagicMock()
+                msg.id = next(next_id)
+                msg.text = f"{search} 관련 메시지"
+                msg.date.strftime.return_value = "2024-01-15 10:00:00"
+                msg.views = 0
+                msg.forwards = 0
+                yield msg
+            return _gen()
+
+        mock_client.iter_messages = _iter_messages
+
+        with patch('utils.si_plus.telegram_collector.get_client') as mock_get_client:
+            mock_get_client.return_value.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_get_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await collector.collect(
+                ticker="005930",
+                aliases=["삼성전자"],
+                theme_keywords=["반도체"],
+            )
+
+        assert mock_get_client.call_count == 1
+        assert mock_client.get_entity.await_count == 2
+        assert result["stats"]["channels"]["ch1"]["by_keyword"] == {"005930": 1, "삼성전자": 1, "반도체": 1}
+        assert result["stats"]["direct_count"] == 4
+        assert result["stats"]["theme_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_bounded_concurrency(self):
+        """동시 검색 수는 max_concurrency를 넘지 않음"""
+        from utils.si_plus import TelegramCollector
+
+        collector = TelegramCollector(["ch1", "ch2", "ch3"], max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def _fake_search(channel, keyword, limit=100):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        mock_client = MagicMock()
+        mock_client.get_entity = AsyncMock(return_value=MagicMock())
+
+        with patch('utils.si_plus.telegram_collector.get_client') as mock_get_client, \
+                patch.object(collector, 'search_messages', side_effect=_fake_search):
+            mock_get_client.return_value.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_get_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            await collector.collect(ticker="005930", aliases=["a", "b", "c"])
+
+        assert peak <= 2
+
+
 # ============================================================
 # RedditCollector 테스트
 # ============================================================
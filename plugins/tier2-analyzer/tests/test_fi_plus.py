@@ -3,6 +3,10 @@
 utils/fi_plus 패키지의 import 및 기본 기능 테스트
 """
 
+import json
+from pathlib import Path
+
+import pandas as pd
 import pytest
 
 
@@ -93,3 +97,331 @@ class TestMetricMappings:
 
         assert "divCashY" in METRIC_MAPPINGS
         assert METRIC_MAPPINGS["divCashY"]["영업활동으로인한현금흐름"] == "operating_cash_flow"
+
+
+FIXTURE_HTML = Path(__file__).parent / "fixtures" / "fnguide_sample.html"
+
+
+class TestFnguidePageCache:
+    """FnGuide 파싱 결과 캐시 테스트"""
+
+    @pytest.fixture
+    def fake_fetch(self, mocker):
+        """샘플 HTML을 반환하는 _fetch_fnguide_page mock"""
+        html = FIXTURE_HTML.read_text(encoding="utf-8")
+        return mocker.patch("utils.fi_plus.fnguide._fetch_fnguide_page", return_value=html)
+
+    def test_statements_share_single_fetch(self, fake_fetch):
+        """여러 재무제표 요청이 페이지를 한 번만 받음"""
+        from utils.fi_plus import (
+            get_annual_income,
+            get_quarterly_income,
+            get_annual_balance_sheet,
+            get_annual_cash_flow,
+            get_full_financials,
+        )
+
+        income = get_annual_income("000001")
+        quarterly = get_quarterly_income("000001")
+        balance = get_annual_balance_sheet("000001")
+        cash = get_annual_cash_flow("000001")
+        full = get_full_financials("000001")
+
+        assert fake_fetch.call_count == 1
+        assert income["name"] == "테스트전자"
+        assert income["annual"]["2024"]["revenue"] == 1320
+        assert "2025Q1" in quarterly["quarterly"]
+        assert balance["ratios"]["debt_ratio"] == 50.0
+        assert cash["annual"]["2024"]["fcf"] == 120
+        assert full["cash_flow"]["annual"]["2024"]["fcf"] == 120
+
+    def test_returned_data_does_not_mutate_cache(self, fake_fetch):
+        """반환값을 수정해도 캐시는 그대로"""
+        from utils.fi_plus import get_annual_income
+
+        first = get_annual_income("000001")
+        first["annual"]["2024"]["revenue"] = 0
+
+        assert get_annual_income("000001")["annual"]["2024"]["revenue"] == 1320
+
+    def test_expired_entry_refetched(self, fake_fetch, mocker):
+        """TTL이 지나면 다시 받음"""
+        from utils.fi_plus import get_annual_income
+        from utils.fi_plus.fnguide import page_cache
+
+        get_annual_income("000001")
+        mocker.patch.object(page_cache.time, "time", return_value=page_cache.time.time() + page_cache.DEFAULT_TTL + 1)
+        get_annual_income("000001")
+
+        assert fake_fetch.call_count == 2
+
+    def test_disk_cache_survives_memory_clear(self, fake_fetch, isolated_cache_dir):
+        """메모리 캐시가 비어도 디스크 캐시에서 복원"""
+        from utils.fi_plus import get_annual_income
+        from utils.fi_plus.fnguide import page_cache
+
+        get_annual_income("000001")
+        page_cache._memory.clear()
+        result = get_annual_income("000001")
+
+        assert fake_fetch.call_count == 1
+        assert (isolated_cache_dir / "fnguide" / "000001.json").exists()
+        assert result["annual"]["2024"]["revenue"] == 1320
+
+    def test_concurrent_disk_writes_use_unique_tmp_files(self, isolated_cache_dir, mocker):
+        """같은 종목 동시 저장 시 임시 파일이 겹치지 않음 (Tier 1 write_atomic 공유)"""
+        import threading
+        from utils.fi_plus.fnguide import page_cache
+        from utils.tier1_bridge import load_tier1_module
+
+        assert page_cache.write_atomic is load_tier1_module("ohlcv_store").write_atomic
+
+        tmp_names = []
+        barrier = threading.Barrier(4)
+        original = page_cache.write_atomic
+
+        def spy(path, write):
+            def _write(tmp):
+                tmp_names.append(tmp.name)
+                barrier.wait()  # 모든 스레드가 임시 파일을 연 상태에서 쓰기
+                write(tmp)
+            original(path, _write)
+
+        mocker.patch.object(page_cache, "write_atomic", side_effect=spy)
+        threads = [
+            threading.Thread(target=page_cache._save_disk, args=("000001", {"fetched_at": i, "name": "회사"}))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        cache_dir = isolated_cache_dir / "fnguide"
+        assert len(set(tmp_names)) == 4
+        assert [p.name for p in cache_dir.iterdir()] == ["000001.json"]
+        assert json.loads((cache_dir / "000001.json").read_text(encoding="utf-8"))["fetched_at"] in range(4)
+
+    def test_failed_fetch_not_cached(self, mocker):
+        """조회 실패는 캐시하지 않음"""
+        from utils.fi_plus import get_annual_income
+
+        fetch = mocker.patch("utils.fi_plus.fnguide._fetch_fnguide_page", return_value=None)
+
+        assert get_annual_income("000001") is None
+        assert get_annual_income("000001") is None
+        assert fetch.call_count == 2
+
+
+class TestParseFnguidePage:
+    """parse_fnguide_page() 백엔드 테스트"""
+
+    @pytest.fixture
+    def html(self):
+        return FIXTURE_HTML.read_text(encoding="utf-8")
+
+    def _full_tree(self, html):
+        """기존 방식: 전체 트리 파싱 후 테이블별 추출"""
+        from bs4 import BeautifulSoup
+        from utils.fi_plus.fnguide.page_cache import PAGE_TABLES
+        from utils.fi_plus.fnguide.parser import extract_company_name, parse_fnguide_table
+
+        soup = BeautifulSoup(html, "html.parser")
+        tables = {div_id: parse_fnguide_table(soup, div_id, metrics) for div_id, metrics in PAGE_TABLES.items()}
+        return {"name": extract_company_name(soup), "tables": tables}
+
+    @pytest.mark.parametrize("use_lxml", [False, True])
+    def test_matches_full_tree_parse(self, html, use_lxml, mocker):
+        """SoupStrainer/lxml 결과가 전체 트리 파싱과 동일"""
+        from utils.fi_plus.fnguide import parser
+        from utils.fi_plus.fnguide.page_cache import PAGE_TABLES
+
+        if use_lxml and not parser.LXML_AVAILABLE:
+            pytest.skip("lxml 미설치")
+        mocker.patch.object(parser, "LXML_AVAILABLE", use_lxml)
+
+        assert parser.parse_fnguide_page(html, PAGE_TABLES) == self._full_tree(html)
+
+    def test_name_from_title_fallback(self):
+        """h1.giName이 없으면 title에서 회사명 추출"""
+        from utils.fi_plus.fnguide.parser import extract_company_name_from_html
+
+        html = "<html><head><title>삼성전자(A005930) | 재무제표</title></head></html>"
+
+        assert extract_company_name_from_html(html) == "삼성전자"
+
+    def test_company_name_shared_with_tier1(self):
+        """회사명 추출은 Tier 1 재무 스크래퍼와 같은 함수 (복사본 없음)"""
+        from utils.tier1_bridge import load_tier1_module
+        from utils.fi_plus.fnguide import parser
+
+        financial_scraper = load_tier1_module("financial_scraper")
+
+        assert parser.extract_company_name_from_html is financial_scraper.extract_company_name_from_html
+        assert financial_scraper.extract_company_name_from_html(
+            "<title>삼성전자 - FnGuide</title>"
+        ) == "삼성전자"
+
+    def test_missing_name_returns_none(self):
+        """회사명이 없으면 None"""
+        from utils.fi_plus.fnguide.parser import parse_fnguide_page
+
+        assert parse_fnguide_page("<html><body></body></html>", {"divSonikY": []}) is None
+
+
+class TestCrawlFinancials:
+    """crawl_financials() 일괄 수집 테스트"""
+
+    @pytest.fixture
+    def pages(self):
+        """종목별 HTML (회사명만 바꾼 샘플) + 호출 기록"""
+        html = FIXTURE_HTML.read_text(encoding="utf-8")
+        state = {"calls": [], "fail": set()}
+
+        def fetch(ticker):
+            state["calls"].append(ticker)
+            if ticker in state["fail"]:
+                return None
+            return html.replace("테스트전자", f"회사{ticker}")
+
+        state["fetch"] = fetch
+        return state
+
+    def test_writes_long_format_rows(self, pages, tmp_path):
+        """종목×재무제표×기간×항목 long 포맷으로 저장"""
+        from utils.fi_plus import crawl_financials, load_batch_financials
+
+        stats = crawl_financials(["000001", "000002"], out_dir=tmp_path, parse_workers=0, fetch=pages["fetch"])
+        df = load_batch_financials(tmp_path)
+
+        assert stats["done"] == 2
+        assert set(df["ticker"]) == {"000001", "000002"}
+        row = df[(df["ticker"] == "000002") & (df["statement"] == "income_annual")
+                 & (df["period"] == "2024") & (df["metric"] == "revenue")]
+        assert row["value"].item() == 1320
+        assert row["name"].item() == "회사000002"
+
+    def test_resume_skips_completed(self, pages, tmp_path):
+        """재실행 시 완료 종목은 건너뛰고 실패 종목만 다시 수집"""
+        from utils.fi_plus import crawl_financials, load_batch_financials
+
+        pages["fail"] = {"000003"}
+        first = crawl_financials(["000001", "000002", "000003"], out_dir=tmp_path,
+                                 parse_workers=0, chunk_size=2, fetch=pages["fetch"])
+        pages["fail"] = set()
+        pages["calls"].clear()
+        second = crawl_financials(["000001", "000002", "000003", "000004"], out_dir=tmp_path,
+                                  parse_workers=0, chunk_size=2, fetch=pages["fetch"])
+
+        assert first["failed"] == ["000003"]
+        assert sorted(pages["calls"]) == ["000003", "000004"]
+        assert second["skipped"] == 2
+        assert second["failed"] == []
+        assert load_batch_financials(tmp_path)["ticker"].nunique() == 4
+
+    def test_empty_page_not_marked_done(self, pages, tmp_path):
+        """오류/빈 페이지(회사명·테이블 없음)는 실패로 기록하고 재실행 시 다시 수집"""
+        from utils.fi_plus import crawl_financials
+
+        fetch = pages["fetch"]
+        broken = {
+            "000002": "<html><body>일시적인 오류입니다</body></html>",
+            "000003": "<html><body><h1 class='giName'>회사000003</h1></body></html>",
+        }
+        first = crawl_financials(["000001", "000002", "000003"], out_dir=tmp_path, parse_workers=0,
+                                 fetch=lambda t: broken.get(t) or fetch(t))
+        pages["calls"].clear()
+        second = crawl_financials(["000001", "000002", "000003"], out_dir=tmp_path,
+                                  parse_workers=0, fetch=fetch)
+
+        assert first["done"] == 1
+        assert sorted(first["failed"]) == ["000002", "000003"]
+        assert sorted(pages["calls"]) == ["000002", "000003"]
+        assert second["failed"] == []
+
+    def test_process_pool_matches_inline(self, pages, tmp_path):
+        """프로세스 풀 파싱 결과가 인라인 파싱과 동일"""
+        from utils.fi_plus import crawl_financials, load_batch_financials
+
+        tickers = ["000001", "000002", "000003"]
+        crawl_financials(tickers, out_dir=tmp_path / "inline", parse_workers=0, fetch=pages["fetch"])
+        crawl_financials(tickers, out_dir=tmp_path / "pool", parse_workers=2, fetch=pages["fetch"])
+
+        def load(path):
+            df = load_batch_financials(path)
+            return df.sort_values(["ticker", "statement", "period", "metric"]).reset_index(drop=True)
+
+        pd.testing.assert_frame_equal(load(tmp_path / "inline"), load(tmp_path / "pool"))
+
+
+def _financials(ticker, revenues, liabilities, equity, quarters=("Q1", "Q2", "Q3", "Q4")):
+    """get_full_financials 형태의 합성 결과"""
+    years = [str(2021 + i) for i in range(len(revenues))]
+    latest = years[-1]
+    return {
+        "ticker": ticker,
+        "name": f"회사{ticker}",
+        "income_statement": {
+            "annual": {y: {"revenue": r} for y, r in zip(years, revenues)},
+            "quarterly": {f"{latest}{q}": {"revenue": revenues[-1] / 4} for q in quarters},
+        },
+        "balance_sheet": {"annual": {latest: {"total_liabilities": liabilities, "total_equity": equity}}},
+        "cash_flow": {"annual": {}},
+    }
+
+
+class TestFinancialWarehouse:
+    """FinancialWarehouse 테스트"""
+
+    @pytest.fixture
+    def warehouse(self, tmp_path):
+        from utils.fi_plus import FinancialWarehouse
+
+        wh = FinancialWarehouse(tmp_path / "fin.sqlite")
+        wh.add_financials(_financials("000001", [100, 130, 170, 220], 50, 100))   # CAGR 30%, 부채 50%
+        wh.add_financials(_financials("000002", [100, 130, 170, 220], 300, 100))  # CAGR 30%, 부채 300%
+        wh.add_financials(_financials("000003", [100, 105, 110, 115], 50, 100))   # CAGR 5%
+        return wh
+
+    def test_screen_cagr_and_debt_ratio(self, warehouse):
+        """매출 CAGR > 20%, 부채비율 < 100% 스크리닝"""
+        result = warehouse.screen(min_revenue_cagr=20, max_debt_ratio=100)
+
+        assert list(result["ticker"]) == ["000001"]
+        assert result["revenue_cagr"].iloc[0] == pytest.approx(((220 / 100) ** (1 / 3) - 1) * 100)
+        assert result["debt_ratio"].iloc[0] == 50
+        assert result["name"].iloc[0] == "회사000001"
+
+    def test_screen_skips_accumulated_year(self, warehouse):
+        """4분기 미완료 연도는 CAGR 계산에서 제외 (직전 완결 연도 기준)"""
+        warehouse.add_financials(_financials("000004", [100, 130, 170, 220, 50], 50, 100, quarters=("Q1",)))
+
+        result = warehouse.screen(years=3).set_index("ticker")
+
+        assert result.loc["000004", "period"] == "2024"
+        assert result.loc["000004", "revenue_cagr"] == pytest.approx(((220 / 100) ** (1 / 3) - 1) * 100)
+
+    def test_upsert_replaces_values(self, warehouse):
+        """같은 종목 재저장 시 값 갱신 (중복 행 없음)"""
+        warehouse.add_financials(_financials("000003", [100, 105, 110, 300], 50, 100))
+
+        revenue = warehouse.get_metric("income_annual", "revenue", period="2024")
+        count = warehouse.query("SELECT count(*) AS n FROM financials WHERE ticker = '000003'")["n"].item()
+
+        assert revenue.loc["000003", "2024"] == 300
+        assert count == 4 + 4 + 2
+
+    def test_add_batch_from_crawler(self, tmp_path):
+        """crawl_financials 결과도 같은 스키마로 적재"""
+        from utils.fi_plus import FinancialWarehouse, crawl_financials, load_batch_financials
+
+        html = FIXTURE_HTML.read_text(encoding="utf-8")
+        crawl_financials(["000001"], out_dir=tmp_path / "batch", parse_workers=0, fetch=lambda t: html)
+        wh = FinancialWarehouse(tmp_path / "fin.sqlite")
+        wh.add_batch(load_batch_financials(tmp_path / "batch"))
+
+        result = wh.screen(years=2)
+
+        assert result["ticker"].tolist() == ["000001"]
+        assert result["debt_ratio"].item() == 50
+        assert result["revenue_cagr"].item() == pytest.approx((1320 / 1000) ** 0.5 * 100 - 100)
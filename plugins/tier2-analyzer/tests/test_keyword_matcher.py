@@ -0,0 +1,127 @@
+"""SI+ 다중 키워드 매처 테스트
+
+KeywordMatcher 결과가 기존 `kw in text` 반복과 같은지 (오토마톤/정규식 경로 모두)
+"""
+import random
+
+import pytest
+
+from utils.si_plus.base import (
+    BULLISH_KEYWORDS,
+    BEARISH_KEYWORDS,
+    RUMOR_INDICATORS,
+    FACT_INDICATORS,
+    SPAM_PATTERNS,
+)
+from utils.si_plus.keyword_matcher import (
+    AHOCORASICK_AVAILABLE,
+    KeywordMatcher,
+    get_default_matcher,
+)
+from utils.si_plus.telegram_collector import filter_messages_by_ticker
+
+CATEGORIES = {
+    "bullish": BULLISH_KEYWORDS,
+    "bearish": BEARISH_KEYWORDS,
+    "rumor": RUMOR_INDICATORS,
+    "fact": FACT_INDICATORS,
+    "spam": SPAM_PATTERNS,
+}
+
+ENGINES = [False] + ([True] if AHOCORASICK_AVAILABLE else [])
+
+
+def legacy_scan(text: str) -> dict:
+    """기존 방식 (스팸만 대소문자 무시)"""
+    return {
+        name: [kw for kw in keywords if (kw.lower() in text.lower() if name == "spam" else kw in text)]
+        for name, keywords in CATEGORIES.items()
+    }
+
+
+def _random_texts(count: int) -> list:
+    rng = random.Random(0)
+    words = [kw for keywords in CATEGORIES.values() for kw in keywords]
+    words += ["삼성전자", "오늘", "IR", "ir", "Ir", "HTTP", "Bit.Ly", "İ", "급", "상"]
+    texts = []
+    for _ in range(count):
+        text = "".join(rng.choice(words) + rng.choice(["", " "]) for _ in range(rng.randint(0, 10)))
+        texts.append(text.upper() if rng.random() < 0.2 else text)
+    return texts
+
+
+@pytest.mark.parametrize("use_automaton", ENGINES)
+class TestKeywordMatcher:
+    """KeywordMatcher.scan"""
+
+    def test_matches_legacy_scan(self, use_automaton):
+        """무작위 문장에서 기존 `kw in text` 결과와 동일"""
+        matcher = KeywordMatcher(CATEGORIES, ignore_case=("spam",), use_automaton=use_automaton)
+        for text in _random_texts(2000):
+            assert matcher.scan(text) == legacy_scan(text), text
+
+    def test_overlapping_and_prefix_keywords(self, use_automaton):
+        """겹치는 키워드/접두사 키워드 모두 검출, 카테고리 내 선언 순서 유지"""
+        matcher = KeywordMatcher(
+            {"a": ["상한가", "상한", "한가", "가"], "b": ["한가", "없음"]},
+            use_automaton=use_automaton,
+        )
+        assert matcher.scan("오늘 상한가") == {"a": ["상한가", "상한", "한가", "가"], "b": ["한가"]}
+
+    def test_case_sensitive_by_default(self, use_automaton):
+        """ignore_case에 없는 카테고리는 대소문자 구분"""
+        matcher = KeywordMatcher({"fact": ["IR"], "spam": ["bit.ly"]}, ignore_case=("spam",), use_automaton=use_automaton)
+        assert matcher.scan("ir 자료 BIT.LY/abc") == {"fact": [], "spam": ["bit.ly"]}
+        assert matcher.scan("IR 자료") == {"fact": ["IR"], "spam": []}
+
+    def test_regex_metacharacters_escaped(self, use_automaton):
+        """정규식 특수문자가 든 키워드도 문자 그대로 비교"""
+        matcher = KeywordMatcher({"spam": ["bit.ly", "t.me/", "(광고)", "a|b"]}, ignore_case=("spam",), use_automaton=use_automaton)
+        assert matcher.scan("bitxly tame/ 광고 a") == {"spam": []}
+        assert matcher.scan("(광고) T.ME/x a|b") == {"spam": ["t.me/", "(광고)", "a|b"]}
+
+    def test_case_changing_lowercase(self, use_automaton):
+        """소문자 변환으로 길이가 바뀌는 문자('İ')가 있어도 동일 결과"""
+        matcher = KeywordMatcher({"fact": ["IR"], "spam": ["http"]}, ignore_case=("spam",), use_automaton=use_automaton)
+        assert matcher.scan("İ IR HTTP") == {"fact": ["IR"], "spam": ["http"]}
+
+    def test_empty_inputs(self, use_automaton):
+        """빈 텍스트/빈 키워드 목록"""
+        matcher = KeywordMatcher({"a": [], "b": ["", "급등"]}, use_automaton=use_automaton)
+        assert matcher.scan("") == {"a": [], "b": []}
+        assert matcher.scan("급등") == {"a": [], "b": ["급등"]}
+
+
+class TestDefaultMatcher:
+    """base 키워드 목록 공용 매처"""
+
+    def test_default_matcher_is_shared(self):
+        assert get_default_matcher() is get_default_matcher()
+
+    def test_default_matcher_categories(self):
+        assert set(get_default_matcher().categories) == set(CATEGORIES)
+
+    @pytest.mark.skipif(AHOCORASICK_AVAILABLE, reason="pyahocorasick 설치됨")
+    def test_automaton_requires_pyahocorasick(self):
+        with pytest.raises(ImportError):
+            KeywordMatcher({"a": ["급등"]}, use_automaton=True)
+
+
+class TestFilterMessagesByTicker:
+    """filter_messages_by_ticker (KeywordMatcher 사용)"""
+
+    def test_direct_and_theme_matches(self):
+        messages = [
+            {"text": "삼성전자 005930 급등"},
+            {"text": "반도체 업황 개선"},
+            {"text": "관련 없음"},
+        ]
+        result = filter_messages_by_ticker(messages, "005930", aliases=["삼성전자"], theme_keywords=["반도체"])
+
+        assert [m["match_type"] for m in result] == ["direct", "theme"]
+        assert result[0]["matched_keywords"] == ["005930", "삼성전자"]
+        assert result[1]["matched_keywords"] == ["반도체"]
+
+    def test_no_theme_keywords(self):
+        result = filter_messages_by_ticker([{"text": "반도체"}], "005930")
+        assert result == []
@@ -0,0 +1,417 @@
+"""SI+ 메시지 아카이브 / 증분 수집 테스트"""
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from utils.si_plus.message_archive import MessageArchive, message_key, telegram_scope
+
+
+def _telegram_msg(msg_id: int, channel: str = "siglab", keyword: str = "삼성전자") -> dict:
+    return {
+        "id": msg_id,
+        "text": f"{keyword} 메시지 {msg_id}",
+        "date": f"2026-01-15 10:{msg_id % 60:02d}:00",
+        "views": 0,
+        "forwards": 0,
+        "source": "telegram",
+        "channel": channel,
+        "keyword": keyword,
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return MessageArchive(tmp_path / "messages.sqlite")
+
+
+class TestMessageArchive:
+    """MessageArchive 테스트"""
+
+    def test_default_path_under_cache_dir(self, isolated_cache_dir):
+        """기본 경로는 캐시 디렉토리 아래"""
+        assert MessageArchive().path.parent == isolated_cache_dir
+
+    def test_record_and_watermark(self, archive):
+        """저장 후 범위별 마지막 id 기록, 최신 id 순 조회"""
+        scope = telegram_scope("siglab", "삼성전자")
+        added = archive.record("telegram", scope, [_telegram_msg(3), _telegram_msg(7), _telegram_msg(5)])
+
+        assert added == 3
+        assert archive.watermark("telegram", scope) == 7
+        assert archive.watermark("telegram", telegram_scope("siglab", "반도체")) is None
+        assert [m["id"] for m in archive.get_messages("telegram", scope)] == [7, 5, 3]
+        assert [m["id"] for m in archive.get_messages("telegram", scope, limit=2)] == [7, 5]
+
+    def test_record_is_idempotent(self, archive):
+        """같은 메시지 재저장은 중복 없이 갱신, watermark는 줄지 않음"""
+        scope = telegram_scope("siglab", "삼성전자")
+        archive.record("telegram", scope, [_telegram_msg(1), _telegram_msg(9)])
+        updated = {**_telegram_msg(1), "views": 100}
+
+        assert archive.record("telegram", scope, [updated]) == 0
+        assert archive.count("telegram") == 2
+        assert archive.watermark("telegram", scope) == 9
+        assert archive.get_messages("telegram", scope)[-1]["views"] == 100
+
+    def test_telegram_ids_are_per_channel(self, archive):
+        """텔레그램 message id는 채널별이므로 다른 채널의 같은 id는 별도 메시지"""
+        archive.record("telegram", telegram_scope("a", "kw"), [_telegram_msg(1, channel="a", keyword="kw")])
+        archive.record("telegram", telegram_scope("b", "kw"), [_telegram_msg(1, channel="b", keyword="kw")])
+
+        assert archive.count() == 2
+        assert message_key(_telegram_msg(1, channel="a")) == "a/1"
+
+
+class TestArchiveSearch:
+    """아카이브 전문 검색"""
+
+    @pytest.fixture
+    def filled(self, archive):
+        archive.record("telegram", telegram_scope("a", "반도체"), [
+            {**_telegram_msg(1, channel="a"), "text": "삼성전자HBM3E 엔비디아 퀄테스트 통과"},
+            {**_telegram_msg(2, channel="a"), "text": "SK하이닉스 hbm 증설 발표"},
+            {**_telegram_msg(3, channel="a"), "text": "반도체 업황 AI 수요"},
+        ])
+        archive.record("telegram", telegram_scope("b", "반도체"), [
+            {**_telegram_msg(4, channel="b"), "text": "HBM 단가 인상 루머"},
+        ])
+        archive.record("naver", "005930", [
+            {"id": "900", "text": "HBM 언제 오르냐", "title": "HBM 언제 오르냐", "source": "naver", "ticker": "005930"},
+        ])
+        return archive
+
+    def test_fts_available(self, archive):
+        """이 환경의 SQLite는 FTS5 trigram 지원"""
+        assert archive.fts
+
+    def test_substring_without_spaces(self, filled):
+        """띄어쓰기 없이 붙은 한국어/영문 부분 문자열 매칭, 대소문자 무시, 최신 id 순"""
+        assert [m["id"] for m in filled.search("퀄테스트")] == [1]
+        assert [m["id"] for m in filled.search("전자HBM")] == [1]
+        assert [m["id"] for m in filled.search("hbm", source="telegram")] == [4, 2, 1]
+        assert [m["id"] for m in filled.search("HBM")] == ["900", 4, 2, 1]
+
+    def test_short_query_scans(self, filled):
+        """3글자 미만 검색어는 본문 스캔으로 처리"""
+        assert [m["id"] for m in filled.search("AI")] == [3]
+        assert [m["id"] for m in filled.search("루머")] == [4]
+
+    def test_field_filters_and_limit(self, filled):
+        """필드 조건 / limit"""
+        assert [m["id"] for m in filled.search("HBM", source="telegram", channel="a")] == [2, 1]
+        assert [m["id"] for m in filled.search("HBM", source="naver", ticker="005930")] == ["900"]
+        assert [m["id"] for m in filled.search("HBM", limit=2)] == ["900", 4]
+        assert filled.search("  ") == []
+
+    def test_index_follows_updates(self, filled):
+        """본문이 바뀐 메시지는 새 본문으로 검색"""
+        filled.record("telegram", telegram_scope("a", "반도체"), [
+            {**_telegram_msg(3, channel="a"), "text": "반도체 업황 개선"},
+        ])
+        assert filled.search("AI 수요") == []
+        assert [m["id"] for m in filled.search("업황 개선")] == [3]
+
+    def test_index_built_for_existing_db(self, tmp_path):
+        """인덱스 없이 만들어진 기존 아카이브도 열 때 인덱스 생성"""
+        import sqlite3
+        from utils.si_plus.message_archive import SCHEMA
+
+        path = tmp_path / "old.sqlite"
+        with sqlite3.connect(path) as conn:
+            conn.executescript(SCHEMA)
+            conn.execute(
+                "INSERT INTO messages (source, key, num_id, text, data) VALUES (?, ?, ?, ?, ?)",
+                ("naver", "1", 1, "엔비디아 수혜주", '{"id": "1", "text": "엔비디아 수혜주"}'),
+            )
+        assert [m["id"] for m in MessageArchive(path).search("비디아")] == ["1"]
+
+    def test_incomplete_fetch_keeps_watermark(self, archive):
+        """실패한 수집은 메시지만 저장, watermark/확인 시각은 그대로"""
+        scope = telegram_scope("a", "kw")
+        archive.record("telegram", scope, [_telegram_msg(1, channel="a")], complete=False)
+        archive.record("telegram", scope, [], complete=False)
+
+        assert archive.watermark("telegram", scope) is None
+        assert not archive.is_fresh("telegram", scope, 600)
+        assert [m["id"] for m in archive.get_messages("telegram", scope)] == [1]
+
+    def test_is_fresh(self, archive):
+        """최근 수집 여부 (새 메시지가 없어도 확인 시각 갱신)"""
+        scope = telegram_scope("a", "kw")
+        assert not archive.is_fresh("telegram", scope, 600)
+        archive.record("telegram", scope, [_telegram_msg(1, channel="a")])
+        assert archive.is_fresh("telegram", scope, 600)
+        assert not archive.is_fresh("telegram", scope, 0)
+
+
+class TestTelegramIncremental:
+    """TelegramCollector + 아카이브"""
+
+    @staticmethod
+    def _client(history):
+        """min_id 이후 메시지만 최신순으로 돌려주는 가짜 클라이언트"""
+        client = MagicMock()
+        client.get_entity = AsyncMock(return_value=MagicMock())
+        client.calls = []
+
+        def _iter_messages(entity, search, limit, min_id=0):
+            client.calls.append(min_id)
+
+            async def _gen():
+                for msg_id in sorted(history, reverse=True)[:limit]:
+                    if msg_id <= min_id:
+                        break
+                    msg = MagicMock()
+                    msg.id = msg_id
+                    msg.text = f"{search} 메시지 {msg_id}"
+                    msg.date.strftime.return_value = "2026-01-15 10:00:00"
+                    msg.views = 0
+                    msg.forwards = 0
+                    yield msg
+            return _gen()
+
+        client.iter_messages = _iter_messages
+        return client
+
+    @pytest.mark.asyncio
+    async def test_second_search_uses_min_id(self, archive):
+        """두 번째 검색은 min_id 이후만 받고 아카이브와 합쳐 반환"""
+        from utils.si_plus import TelegramCollector
+
+        history = [1, 2, 3]
+        client = self._client(history)
+        collector = TelegramCollector(["siglab"], archive=archive, fresh_seconds=0)
+
+        with patch('utils.si_plus.telegram_collector.get_client') as mock_get_client:
+            mock_get_client.return_value.__aenter__ = AsyncMock(return_value=client)
+            mock_get_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            first = await collector.search_messages("siglab", "삼성전자", limit=10)
+            history.extend([4, 5])
+            second = await collector.search_messages("siglab", "삼성전자", limit=10)
+
+        assert client.calls == [0, 3]
+        assert [m["id"] for m in first] == [3, 2, 1]
+        assert [m["id"] for m in second] == [5, 4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_catchup_beyond_limit(self, archive):
+        """지난 수집 이후 메시지가 limit보다 많아도 지난 수집 지점까지 모두 받음"""
+        from utils.si_plus import TelegramCollector
+
+        history = list(range(1, 101))
+        client = self._client(history)
+        collector = TelegramCollector(["siglab"], archive=archive, fresh_seconds=0)
+        scope = telegram_scope("siglab", "삼성전자")
+
+        with patch('utils.si_plus.telegram_collector.get_client') as mock_get_client:
+            mock_get_client.return_value.__aenter__ = AsyncMock(return_value=client)
+            mock_get_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            await collector.search_messages("siglab", "삼성전자", limit=20)
+            history[:] = range(1, 301)
+            result = await collector.search_messages("siglab", "삼성전자", limit=20)
+
+        assert [m["id"] for m in result] == list(range(300, 280, -1))
+        assert archive.watermark("telegram", scope) == 300
+        assert {m["id"] for m in archive.get_messages("telegram", scope)} >= set(range(81, 301))
+
+    @pytest.mark.asyncio
+    async def test_catchup_cap_keeps_watermark(self, archive):
+        """catchup_messages를 넘으면 watermark를 올리지 않고 다음 수집에서 빠진 구간을 받음"""
+        from utils.si_plus import TelegramCollector
+
+        history = list(range(1, 101))
+        client = self._client(history)
+        collector = TelegramCollector(["siglab"], archive=archive, fresh_seconds=0, catchup_messages=50)
+        scope = telegram_scope("siglab", "삼성전자")
+
+        with patch('utils.si_plus.telegram_collector.get_client') as mock_get_client:
+            mock_get_client.return_value.__aenter__ = AsyncMock(return_value=client)
+            mock_get_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            await collector.search_messages("siglab", "삼성전자", limit=20)
+            history[:] = range(1, 301)
+            await collector.search_messages("siglab", "삼성전자", limit=20)
+            assert archive.watermark("telegram", scope) == 100
+
+            collector.catchup_messages = 1000
+            await collector.search_messages("siglab", "삼성전자", limit=20)
+
+        assert client.calls == [0, 100, 100]
+        assert archive.watermark("telegram", scope) == 300
+        assert {m["id"] for m in archive.get_messages("telegram", scope)} >= set(range(81, 301))
+
+    @pytest.mark.asyncio
+    async def test_fresh_search_answered_locally(self, archive):
+        """최근 검색한 키워드는 네트워크 없이 응답, 다른 키워드로 받은 메시지도 본문 검색으로 포함"""
+        from utils.si_plus import TelegramCollector
+
+        archive.record("telegram", telegram_scope("siglab", "삼성전자"), [
+            {**_telegram_msg(1), "text": "삼성전자 HBM 공급"},
+            {**_telegram_msg(2), "text": "삼성전자 배당"},
+        ])
+        archive.record("telegram", telegram_scope("siglab", "HBM"), [{**_telegram_msg(3), "text": "HBM 수요 급증"}])
+        archive.record("telegram", telegram_scope("siglab", "005930"), [{**_telegram_msg(4), "text": "005930 공시"}])
+        collector = TelegramCollector(["siglab"], archive=archive)
+
+        with patch('utils.si_plus.telegram_collector.get_client') as mock_get_client:
+            result = await collector.collect("005930", aliases=["삼성전자"], theme_keywords=["HBM"])
+            hbm_search = await collector.search_messages("siglab", "HBM", limit=10)
+
+        mock_get_client.assert_not_called()
+        hbm = [m for m in result["messages"] if m["matched_keyword"] == "HBM"]
+        assert sorted(m["id"] for m in result["messages"]) == [1, 2, 3, 4]
+        assert [m["id"] for m in hbm] == [3]
+        assert [m["id"] for m in hbm_search] == [3, 1]
+        assert all(m["keyword"] == "HBM" for m in hbm_search)
+
+    @pytest.mark.asyncio
+    async def test_archive_served_when_offline(self, archive):
+        """세션 연결 실패 시에도 아카이브 메시지 반환, 실패한 검색은 fresh로 기록하지 않음"""
+        from utils.si_plus import TelegramCollector
+
+        scope = telegram_scope("siglab", "반도체")
+        archive.record("telegram", scope, [_telegram_msg(1, keyword="삼성전자")])
+        collector = TelegramCollector(["siglab"], archive=archive, fresh_seconds=0)
+
+        with patch('utils.si_plus.telegram_collector.get_client', side_effect=ValueError("no credentials")) as mock_get_client:
+            result = await collector.search_messages("siglab", "반도체", limit=10)
+            collector.fresh_seconds = 600
+            new_scope = await collector.search_messages("siglab", "HBM", limit=10)
+
+        assert mock_get_client.call_count == 2
+        assert [m["id"] for m in result] == [1]
+        assert result[0]["keyword"] == "반도체"
+        assert new_scope == []
+        assert not archive.is_fresh("telegram", telegram_scope("siglab", "HBM"), 600)
+
+
+def _board_html(post_ids) -> str:
+    rows = "".join(
+        f"""
+        <tr>
+            <td>01.15 12:30</td>
+            <td class="title"><a href="/item/board_read.naver?code=005930&nid={nid}">글 {nid}</a></td>
+            <td>user</td>
+            <td>10</td>
+            <td>1</td>
+        </tr>"""
+        for nid in post_ids
+    )
+    return f'<table class="type2"><tbody>{rows}</tbody></table>'
+
+
+class TestNaverIncremental:
+    """NaverCollector + 아카이브"""
+
+    def test_stops_at_known_post(self, archive):
+        """지난 수집의 마지막 게시물이 나온 페이지에서 중단"""
+        from utils.si_plus import NaverCollector
+
+        collector = NaverCollector(archive=archive, fresh_seconds=0)
+        pages = {1: _board_html(range(120, 100, -1)), 2: _board_html(range(100, 80, -1))}
+
+        def fake_get(url, params=None, **kwargs):
+            response = MagicMock()
+            response.text = pages[params["page"]]
+            return response
+
+        with patch("utils.si_plus.naver_collector.http_get", side_effect=fake_get) as mock_get:
+            first = collector.get_discussion_board("005930", limit=40)
+            assert mock_get.call_count == 2
+
+            pages[1] = _board_html(list(range(125, 120, -1)) + list(range(120, 105, -1)))
+            mock_get.reset_mock()
+            second = collector.get_discussion_board("005930", limit=40)
+
+        assert [int(p["id"]) for p in first] == list(range(120, 80, -1))
+        assert mock_get.call_count == 1
+        assert [int(p["id"]) for p in second] == list(range(125, 85, -1))
+        assert archive.watermark("naver", "005930") == 125
+
+    @staticmethod
+    def _board(posts):
+        """최신순 게시물 목록 → 페이지(20개) 응답, 마지막 페이지 이후는 게시물 표 없음"""
+        def fake_get(url, params=None, **kwargs):
+            ordered = sorted(posts, reverse=True)
+            start = (params["page"] - 1) * 20
+            response = MagicMock()
+            response.text = _board_html(ordered[start:start + 20]) if start < len(ordered) else "<html></html>"
+            return response
+        return fake_get
+
+    def test_catchup_beyond_limit(self, archive):
+        """지난 수집 이후 게시물이 limit보다 많아도 지난 수집 게시물까지 모두 받음"""
+        from utils.si_plus import NaverCollector
+
+        collector = NaverCollector(archive=archive, fresh_seconds=0)
+        posts = list(range(1, 101))
+
+        with patch("utils.si_plus.naver_collector.http_get", side_effect=self._board(posts)):
+            collector.get_discussion_board("005930", limit=20)
+            assert archive.watermark("naver", "005930") == 100
+            posts[:] = range(1, 301)
+            result = collector.get_discussion_board("005930", limit=20)
+
+        assert [int(p["id"]) for p in result] == list(range(300, 280, -1))
+        assert archive.watermark("naver", "005930") == 300
+        assert {int(p["id"]) for p in archive.get_messages("naver", "005930")} == set(range(81, 301))
+
+    def test_catchup_cap_keeps_watermark(self, archive):
+        """catchup_pages를 넘으면 watermark를 올리지 않고 다음 수집에서 빠진 구간을 받음"""
+        from utils.si_plus import NaverCollector
+
+        collector = NaverCollector(archive=archive, fresh_seconds=0, catchup_pages=3)
+        posts = list(range(1, 101))
+
+        with patch("utils.si_plus.naver_collector.http_get", side_effect=self._board(posts)):
+            collector.get_discussion_board("005930", limit=20)
+            posts[:] = range(1, 301)
+            collector.get_discussion_board("005930", limit=20)
+            assert archive.watermark("naver", "005930") == 100
+
+            collector.catchup_pages = 50
+            collector.get_discussion_board("005930", limit=20)
+
+        assert archive.watermark("naver", "005930") == 300
+        assert {int(p["id"]) for p in archive.get_messages("naver", "005930")} == set(range(81, 301))
+
+    def test_search_discussions_from_archive(self, archive):
+        """최근 수집한 토론방은 요청 없이 저장된 게시물 전체에서 검색"""
+        from utils.si_plus import NaverCollector
+
+        archive.record("naver", "005930", [
+            {"id": str(nid), "text": f"글 {nid}" + (" 엔비디아" if nid % 10 == 0 else ""),
+             "title": f"글 {nid}", "source": "naver", "ticker": "005930"}
+            for nid in range(1, 201)
+        ])
+        collector = NaverCollector(archive=archive)
+
+        with patch("utils.si_plus.naver_collector.http_get") as mock_get:
+            result = collector.search_discussions("비디아", ticker="005930", limit=5)
+            anywhere = collector.search_discussions("비디아", limit=50)
+
+        mock_get.assert_not_called()
+        assert [p["id"] for p in result] == ["200", "190", "180", "170", "160"]
+        assert len(anywhere) == 20
+
+    def test_failed_page_keeps_watermark(self, archive):
+        """중간 페이지가 실패하면 받은 게시물만 저장하고 다음 수집에서 빠진 구간을 다시 받음"""
+        from utils.si_plus import NaverCollector
+
+        collector = NaverCollector(archive=archive)
+        page1 = _board_html(range(120, 100, -1))
+
+        def fake_get(url, params=None, **kwargs):
+            if params["page"] == 2:
+                raise ConnectionError("timeout")
+            response = MagicMock()
+            response.text = page1
+            return response
+
+        with patch("utils.si_plus.naver_collector.http_get", side_effect=fake_get):
+            result = collector.get_discussion_board("005930", limit=40)
+
+        assert len(result) == 20
+        assert archive.watermark("naver", "005930") is None
+        assert not archive.is_fresh("naver", "005930", 600)
@@ -0,0 +1,130 @@
+"""SI+ 컬럼형 메시지 저장소 테스트"""
+import pandas as pd
+import pytest
+
+from utils.si_plus.message_store import MessageStore
+
+
+def _telegram(count: int = 6) -> list:
+    return [
+        {
+            "id": i,
+            "text": f"삼성전자 메시지 {i}",
+            "date": f"2026-01-0{1 + i % 3} 09:00:00",
+            "views": i * 10,
+            "forwards": 0,
+            "source": "telegram",
+            "channel": ("siglab", "FastStockNews")[i % 2],
+            "keyword": "삼성전자",
+            "match_type": "direct" if i % 3 else "theme",
+            "matched_keyword": "삼성전자" if i % 3 else "HBM",
+        }
+        for i in range(count)
+    ]
+
+
+def _naver(count: int = 4) -> list:
+    return [
+        {
+            "id": str(1000 + i),
+            "text": f"종토방 글 {i}",
+            "title": f"종토방 글 {i}",
+            "date": "2026-01-02 10:00",
+            "views": 5,
+            "score": 1,
+            "url": f"https://finance.naver.com/item/board_read.naver?nid={1000 + i}",
+            "source": "naver",
+            "ticker": "005930",
+            "match_type": "direct",
+            "matched_keyword": "005930",
+        }
+        for i in range(count)
+    ]
+
+
+class TestMessageStore:
+    """MessageStore 테스트"""
+
+    def test_round_trip(self):
+        """dict 리스트 → 저장소 → dict 리스트 동일"""
+        messages = _telegram() + _naver()
+        store = MessageStore.from_messages(messages)
+        assert len(store) == len(messages)
+        assert store.to_messages() == messages
+        assert list(store) == messages
+
+    def test_indexing_and_slicing(self):
+        """인덱싱/음수 인덱스/슬라이스"""
+        messages = _telegram()
+        store = MessageStore.from_messages(messages)
+        assert store[0] == messages[0]
+        assert store[-1] == messages[-1]
+        assert isinstance(store[1:3], MessageStore)
+        assert list(store[1:3]) == messages[1:3]
+        with pytest.raises(IndexError):
+            store[len(messages)]
+
+    def test_repeated_strings_are_categorical(self):
+        """반복 문자열 컬럼은 범주형"""
+        store = MessageStore.from_messages(_telegram(20))
+        for column in ("source", "channel", "keyword", "match_type"):
+            assert isinstance(store.frame[column].dtype, pd.CategoricalDtype)
+
+    def test_missing_keys_and_none_values(self):
+        """없던 키는 생략, 값이 None인 키는 그대로"""
+        store = MessageStore.from_messages([
+            {"id": "a", "text": "x", "author": None, "source": "reddit"},
+            {"id": "b", "text": "y", "channel": "siglab", "source": "telegram"},
+        ])
+        assert store[0] == {"id": "a", "text": "x", "author": None, "source": "reddit"}
+        assert store[1] == {"id": "b", "text": "y", "channel": "siglab", "source": "telegram"}
+        assert list(store[1:]) == [store[1]]
+        assert list(store.filter(source="telegram")) == [store[1]]
+
+    def test_values_and_types_preserved(self):
+        """정수/실수 혼합, NaN, bool, 큰 정수, 중첩 값도 원래 값/타입 그대로"""
+        import json
+
+        messages = [
+            {"id": 1, "score": 3, "ratio": 0.5, "flag": True, "big": 2**70, "meta": {"k": [1]}, "nan": float("nan")},
+            {"id": 2, "score": 2.5, "ratio": None, "flag": False, "big": 1, "meta": None, "nan": None},
+        ]
+        result = MessageStore.from_messages(messages).to_messages()
+
+        assert [type(m["score"]) for m in result] == [int, float]
+        assert [type(m["flag"]) for m in result] == [bool, bool]
+        assert result[0]["nan"] != result[0]["nan"] and result[1]["nan"] is None
+        assert json.dumps(result[1]) == json.dumps(messages[1])
+        assert [{k: v for k, v in m.items() if k != "nan"} for m in result] == [
+            {k: v for k, v in m.items() if k != "nan"} for m in messages
+        ]
+
+    def test_concat_mixed_sources(self):
+        """소스별 저장소 합치기 (컬럼 구성/카테고리가 달라도 됨)"""
+        telegram, naver = _telegram(), _naver()
+        store = MessageStore.concat([MessageStore.from_messages(telegram), MessageStore.from_messages(naver), []])
+        assert list(store) == telegram + naver
+        mixed = [{"id": 1, "views": 10}, {"id": 2, "views": 1.5, "author": None}]
+        assert list(MessageStore.concat([mixed[:1], mixed[1:]])) == mixed
+        assert isinstance(store.frame["source"].dtype, pd.CategoricalDtype)
+
+    def test_count_by(self):
+        """컬럼별 건수 (필터 포함)"""
+        store = MessageStore.from_messages(_telegram(6) + _naver(4))
+        assert store.count_by("source") == {"telegram": 6, "naver": 4}
+        assert store.count_by("matched_keyword", match_type="theme") == {"HBM": 2}
+        assert store.count_by("missing") == {}
+
+    def test_filter(self):
+        """컬럼 값 필터"""
+        store = MessageStore.from_messages(_telegram(6) + _naver(4))
+        assert [m["id"] for m in store.filter(source="telegram", match_type="theme")] == [0, 3]
+        assert len(store.filter(subreddit="stocks")) == 0
+
+    def test_empty(self):
+        """빈 저장소"""
+        store = MessageStore.from_messages([])
+        assert len(store) == 0
+        assert not store
+        assert list(store) == []
+        assert store.count_by("source") == {}
@@ -1,5 +1,7 @@
 # plugins/tier2-analyzer/tests/test_peer_comparison.py
 """피어 비교 기능 테스트"""
+import time
+
 import pytest
 
 
@@ -54,3 +56,149 @@ class TestGetSectorAverage:
 
         result = get_sector_average(tickers=[])
         assert result is None
+
+
+class TestPeerComparisonBatch:
+    """시세 일괄 조회 기반 피어 비교 테스트 (네트워크 mock)"""
+
+    QUOTES = {
+        "000001": {"name": "대상", "per": 20.0, "pbr": 2.0, "market_cap": 100},
+        "000002": {"name": "피어A", "per": 10.0, "pbr": 1.0, "market_cap": 50},
+        "000003": {"name": "피어B", "per": 15.0, "pbr": None, "market_cap": 70},
+    }
+
+    @pytest.fixture
+    def quote_mock(self, mocker):
+        from utils.fi_plus import peer_comparison
+
+        name_mock = mocker.patch.object(peer_comparison, "get_ticker_name", return_value="pykrx명")
+        quote = mocker.patch.object(peer_comparison, "get_naver_quote",
+                                    side_effect=lambda t, **kwargs: self.QUOTES.get(t))
+        return quote, name_mock
+
+    def test_fetches_each_ticker_once(self, quote_mock):
+        """대상/피어 시세는 종목당 한 번만 조회 (섹터 평균 재조회 없음)"""
+        from utils.fi_plus import get_peer_comparison, peer_comparison
+
+        quote, name_mock = quote_mock
+        result = get_peer_comparison("000001", ["000002", "000003", "000001"])
+
+        assert sorted(c.args[0] for c in quote.call_args_list) == ["000001", "000002", "000003"]
+        assert all(c.kwargs == {"fields": peer_comparison.QUOTE_FIELDS} for c in quote.call_args_list)
+        name_mock.assert_not_called()
+        assert result["target"]["name"] == "대상"
+        assert [p["ticker"] for p in result["peers"]] == ["000002", "000003", "000001"]
+
+    def test_sector_average_from_fetched_quotes(self, quote_mock):
+        """섹터 평균과 프리미엄은 이미 받은 시세로 계산"""
+        from utils.fi_plus import get_peer_comparison
+
+        result = get_peer_comparison("000001", ["000002", "000003"])
+
+        assert result["sector_avg"] == {"per": 15.0, "pbr": 1.5}
+        assert result["premium_discount"] == {"per": 33.3, "pbr": 33.3}
+
+    def test_failed_peer_skipped(self, quote_mock):
+        """조회 실패 피어는 제외"""
+        from utils.fi_plus import get_peer_comparison
+
+        result = get_peer_comparison("000001", ["000002", "999999"])
+
+        assert [p["ticker"] for p in result["peers"]] == ["000002"]
+
+    def test_quotes_fetched_concurrently(self, mocker):
+        """피어 수와 무관하게 대략 한 번의 왕복 시간"""
+        from utils.fi_plus import peer_comparison
+
+        def slow(ticker, **kwargs):
+            time.sleep(0.2)
+            return {"name": ticker, "per": 10.0, "pbr": 1.0}
+
+        mocker.patch.object(peer_comparison, "get_naver_quote", side_effect=slow)
+
+        start = time.perf_counter()
+        result = peer_comparison.get_peer_comparison("000001", [f"00000{i}" for i in range(2, 8)])
+        elapsed = time.perf_counter() - start
+
+        assert len(result["peers"]) == 6
+        assert elapsed < 0.6
+
+
+class TestTier1Bridge:
+    """Tier 1 모듈 공유 테스트"""
+
+    def test_shares_tier1_http_client(self):
+        """Tier 2 http_client와 Tier 1 스크래퍼가 같은 HTTP 레이어 사용"""
+        from utils.http_client import http_get
+        from utils.fi_plus import peer_comparison
+
+        assert peer_comparison._web_scraper.http_get is http_get
+
+    def test_load_is_cached(self):
+        """같은 모듈은 한 번만 로드"""
+        from utils.tier1_bridge import load_tier1_module
+
+        assert load_tier1_module("http_client") is load_tier1_module("http_client")
+        assert load_tier1_module("does_not_exist") is None
+
+    def test_tier1_imports_resolve_to_tier1(self):
+        """Tier 1 모듈 내부 import(지연 import 포함)가 Tier 2 utils가 아닌 Tier 1 모듈로 해석"""
+        from utils.tier1_bridge import load_tier1_module
+
+        web_scraper = load_tier1_module("web_scraper")
+        ohlcv_store = load_tier1_module("ohlcv_store")
+
+        assert web_scraper.get_cache_dir is ohlcv_store.get_cache_dir
+        assert load_tier1_module("market_snapshot").get_naver_stock_list is web_scraper.get_naver_stock_list
+
+    def test_tier1_ohlcv_cache_through_bridge(self, tmp_path, monkeypatch):
+        """브리지로 로드한 data_fetcher도 일봉 디스크 캐시 사용"""
+        from unittest.mock import patch
+
+        import pandas as pd
+        from utils.tier1_bridge import load_tier1_module
+
+        monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(tmp_path))
+        data_fetcher = load_tier1_module("data_fetcher")
+        index = pd.bdate_range(end=pd.Timestamp.now().normalize() - pd.Timedelta(days=1), periods=30)
+        df = pd.DataFrame(
+            {"시가": 1.0, "고가": 1.0, "저가": 1.0, "종가": 1.0, "거래량": 1, "거래대금": 1, "등락률": 0.0},
+            index=index,
+        )
+
+        with patch.object(data_fetcher, "stock") as mock_stock:
+            mock_stock.get_market_ohlcv_by_date.return_value = df
+            result = data_fetcher.get_ohlcv("005930", days=5)
+
+        assert result is not None and len(result) == 5
+        assert list(tmp_path.rglob("005930*"))
+
+    def test_ticker_name_uses_tier1_master(self, tmp_path, monkeypatch):
+        """peer_comparison.get_ticker_name도 Tier 1 종목 마스터로 조회 (종목별 pykrx 호출 없음)"""
+        from unittest.mock import patch
+
+        from utils.fi_plus import peer_comparison
+        from utils.tier1_bridge import load_tier1_module
+
+        monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(tmp_path))
+        data_fetcher = load_tier1_module("data_fetcher")
+        ticker_master = load_tier1_module("ticker_master")
+        listing = {"KOSPI": {"005930": "삼성전자", "000660": "SK하이닉스"}, "KOSDAQ": {"247540": "에코프로비엠"}}
+        names = {code: name for rows in listing.values() for code, name in rows.items()}
+
+        ticker_master.clear_ticker_master()
+        try:
+            with patch.object(data_fetcher, "stock") as mock_stock, \
+                    patch.object(load_tier1_module("web_scraper"), "get_krx_listing_dates", return_value={}):
+                mock_stock.get_market_ticker_list.side_effect = lambda date, market: list(listing[market])
+                mock_stock.get_market_ticker_name.side_effect = names.get
+
+                assert peer_comparison.get_ticker_name("000660") == "SK하이닉스"
+                built_calls = mock_stock.get_market_ticker_name.call_count
+                assert peer_comparison.get_ticker_name("247540") == "에코프로비엠"
+
+            assert built_calls == len(names)
+            assert mock_stock.get_market_ticker_name.call_count == built_calls
+            assert len(ticker_master.get_ticker_master(lambda market: None)) == len(names)
+        finally:
+            ticker_master.clear_ticker_master()
@@ -0,0 +1,151 @@
+"""업종 밸류에이션 엔진 테스트"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def snapshot():
+    """반도체 5종목 + 제약 2종목 + 업종 미분류 1종목"""
+    return pd.DataFrame({
+        "ticker": ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "C1"],
+        "name": ["a1", "a2", "a3", "a4", "a5", "b1", "b2", "c1"],
+        "market": ["KOSPI"] * 8,
+        "sector": ["반도체"] * 5 + ["제약"] * 2 + [None],
+        "per": [5.0, 10.0, 10.0, 20.0, 100.0, 30.0, np.nan, 8.0],
+        "pbr": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 1.0],
+        "market_cap": [100.0, 200.0, 300.0, 400.0, 500.0, 50.0, 60.0, 10.0],
+    })
+
+
+class TestSectorValuation:
+    """SectorValuation 조회 테스트"""
+
+    def test_median_and_trimmed_mean(self, snapshot):
+        """중앙값/절사평균 (이상치 제거)"""
+        from utils.fi_plus import SectorValuation
+
+        engine = SectorValuation(snapshot)
+
+        assert engine.median("반도체", "per") == 10.0
+        assert engine.trimmed_mean("반도체", "per", trim=0.2) == pytest.approx(np.mean([10.0, 10.0, 20.0]))
+        assert engine.trimmed_mean("반도체", "per", trim=0.0) == pytest.approx(29.0)
+
+    def test_percentile_rank_ties_use_mid_rank(self, snapshot):
+        """동률은 중간 순위"""
+        from utils.fi_plus import SectorValuation
+
+        engine = SectorValuation(snapshot)
+
+        assert engine.percentile_rank("A1", "per") == 10.0
+        assert engine.percentile_rank("A2", "per") == 40.0
+        assert engine.percentile_rank("A5", "per") == 90.0
+
+    def test_missing_values_excluded(self, snapshot):
+        """결측 PER은 분포와 순위에서 제외"""
+        from utils.fi_plus import SectorValuation
+
+        engine = SectorValuation(snapshot)
+
+        assert engine.median("제약", "per") == 30.0
+        assert engine.percentile_rank("B2", "per") is None
+
+    def test_summary_unsectored_ticker(self, snapshot):
+        """업종 미분류 종목은 값만 반환"""
+        from utils.fi_plus import SectorValuation
+
+        engine = SectorValuation(snapshot)
+        summary = engine.summary("C1")
+
+        assert summary["sector"] is None
+        assert summary["per"]["value"] == 8.0
+        assert summary["per"]["percentile"] is None
+        assert engine.summary("UNKNOWN") is None
+
+    def test_invalid_metric_raises(self, snapshot):
+        from utils.fi_plus import SectorValuation
+
+        with pytest.raises(ValueError):
+            SectorValuation(snapshot).median("반도체", "roe")
+
+
+class TestGetSectorSnapshot:
+    """스냅샷 생성/캐시 테스트 (네트워크 mock)"""
+
+    @pytest.fixture
+    def sources(self, mocker):
+        from utils.fi_plus import sector_valuation
+
+        mocker.patch.dict(sector_valuation._instances, clear=True)
+        stock_list = mocker.patch.object(
+            sector_valuation, "get_naver_stock_list",
+            side_effect=lambda market: [{"code": "000001", "name": "가", "per": 12.0, "market_cap": 1000}]
+            if market == "KOSPI"
+            else [{"code": "000002", "name": "나", "per": -3.0, "market_cap": 50}],
+        )
+        mocker.patch.object(sector_valuation, "get_naver_sector_map", return_value={"000001": "반도체"})
+        quotes = mocker.patch.object(sector_valuation, "get_naver_polling_quotes", return_value={
+            "000001": {"per": 12.1, "pbr": 1.2},
+            "000002": {"pbr": 0.0},
+        })
+        return stock_list, quotes
+
+    def test_builds_and_caches_daily(self, sources, isolated_cache_dir):
+        """같은 날짜는 캐시된 스냅샷 사용"""
+        from utils.fi_plus import get_sector_snapshot
+
+        stock_list, quotes = sources
+        first = get_sector_snapshot()
+        second = get_sector_snapshot(date=datetime.now().strftime("%Y%m%d"))
+
+        assert quotes.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+        row = first.set_index("ticker").loc["000002"]
+        assert row["market"] == "KOSDAQ"
+        assert np.isnan(row["per"]) and np.isnan(row["pbr"])
+        assert row["market_cap"] == 50
+        # PER/시가총액은 목록 값, PBR만 폴링 (전 종목 한 번에)
+        assert first.set_index("ticker").loc["000001", "per"] == 12.0
+        assert quotes.call_args[0][0] == ["000001", "000002"]
+
+    def test_get_sector_valuation_reuses_instance(self, sources):
+        """같은 날짜 엔진은 한 번만 생성"""
+        from utils.fi_plus import get_sector_valuation
+
+        engine = get_sector_valuation()
+
+        assert get_sector_valuation() is engine
+        assert engine.summary("000001")["sector"] == "반도체"
+
+    @pytest.mark.parametrize("failed_source, empty", [
+        ("get_naver_sector_map", None),
+        ("get_naver_polling_quotes", {}),
+    ])
+    def test_degraded_snapshot_not_cached(self, sources, mocker, isolated_cache_dir, failed_source, empty):
+        """업종 분류/폴링 조회가 실패한 스냅샷은 저장/재사용하지 않고 다음 호출에서 다시 생성"""
+        from utils.fi_plus import get_sector_snapshot, get_sector_valuation, sector_valuation
+
+        stock_list, _ = sources
+        source = mocker.patch.object(sector_valuation, failed_source, return_value=empty)
+
+        degraded = get_sector_snapshot()
+        engine = get_sector_valuation()
+
+        assert degraded is not None
+        assert not (isolated_cache_dir / "sector").exists()
+        assert get_sector_valuation() is not engine
+        assert source.call_count == 3
+
+    def test_past_date_read_from_cache_only(self, sources, isolated_cache_dir):
+        """과거 날짜는 저장된 스냅샷만 조회 (오늘 시세로 만들어 과거 날짜로 저장하지 않음)"""
+        from utils.fi_plus import get_sector_snapshot, get_sector_valuation
+
+        stock_list, quotes = sources
+
+        assert get_sector_snapshot(date="20250102") is None
+        assert get_sector_snapshot(date="20250102", refresh=True) is None
+        assert get_sector_valuation(date="20250102") is None
+        stock_list.assert_not_called()
+        assert not (isolated_cache_dir / "sector").exists()
@@ -16,6 +16,10 @@ from utils.si_plus.base import (
     is_spam,
     filter_spam,
     SentimentResult,
+    annotate_message,
+    count_themes,
+    SentimentAggregator,
+    MessageClassifier,
 )
 
 
@@ -452,3 +456,113 @@ class TestSpamFiltering:
         ]
         filtered = filter_spam(messages)
         assert len(filtered) == 0
+
+
+# ============================================================
+# 단일 패스 분류 테스트
+# ============================================================
+
+def _sample_messages():
+    return [
+        {"text": "삼성전자 급등 돌파 매수", "source": "telegram", "match_type": "direct"},
+        {"text": "반도체 하락 폭락 우려", "source": "naver", "match_type": "theme", "matched_keyword": "반도체"},
+        {"text": "HBM 카더라 소문", "source": "naver", "match_type": "theme", "matched_keyword": "HBM"},
+        {"text": "공시 확정 실적 발표", "source": "telegram", "match_type": "direct"},
+        {"text": "무료 대출 상담", "source": "naver", "match_type": "direct"},
+        {"text": "그냥 잡담", "source": "telegram", "match_type": "theme", "matched_keyword": "반도체"},
+    ]
+
+
+class TestAnnotateMessage:
+    """annotate_message 테스트"""
+
+    def test_hits_match_keyword_lists(self):
+        """카테고리별 키워드가 기존 목록 검사와 동일"""
+        text = "급등 카더라 공시 무료 대출"
+        record = annotate_message(text)
+        assert record.spam == is_spam(text)
+        assert record.bullish == [kw for kw in BULLISH_KEYWORDS if kw in text]
+        assert record.rumor == [ind for ind in RUMOR_INDICATORS if ind in text]
+        assert record.fact == [ind for ind in FACT_INDICATORS if ind in text]
+
+    def test_sentiment_and_fact_ratio(self):
+        """센티먼트 부호와 팩트 비율"""
+        assert annotate_message("급등 돌파").sentiment == 1
+        assert annotate_message("폭락").sentiment == -1
+        assert annotate_message("그냥 잡담").sentiment == 0
+        assert annotate_message("그냥 잡담").fact_ratio is None
+
+
+class TestSentimentAggregator:
+    """SentimentAggregator 테스트"""
+
+    def test_matches_analyze_sentiment(self):
+        """증분 집계 결과가 analyze_sentiment와 같음"""
+        messages = _sample_messages() * 4
+        aggregator = SentimentAggregator()
+        for msg in messages:
+            aggregator.add(msg, annotate_message(msg["text"]))
+        assert aggregator.result() == analyze_sentiment(messages)
+
+    def test_top_entries_capped(self):
+        """top 의견은 5개까지만"""
+        aggregator = SentimentAggregator()
+        for _ in range(20):
+            msg = {"text": "급등", "match_type": "direct"}
+            aggregator.add(msg, annotate_message(msg["text"]))
+        result = aggregator.result()
+        assert result["bullish_count"] == 20
+        assert len(result["top_bullish"]) == 5
+
+
+class TestMessageClassifier:
+    """MessageClassifier 테스트"""
+
+    def test_matches_separate_passes(self):
+        """스팸 제거/센티먼트/루머 분류를 따로 돌린 결과와 같음"""
+        messages = _sample_messages()
+        classifier = MessageClassifier()
+        classifier.extend(messages)
+        result = classifier.result()
+
+        clean = filter_spam(messages)
+        assert result["messages"] == clean
+        assert result["spam_count"] == len(messages) - len(clean)
+        assert result["sentiment"] == analyze_sentiment(clean)
+        rumors = [m for m in clean if classify_rumor(m["text"])["is_rumor"]]
+        assert result["rumor_count"] == len(rumors)
+        assert [r["text"] for r in result["rumors"]] == [m["text"] for m in rumors]
+        assert all("rumor_confidence" in r for r in result["rumors"])
+        assert all("fact_confidence" in f for f in result["facts"])
+
+    def test_does_not_copy_messages(self):
+        """스팸 제외 메시지는 원본 dict 그대로"""
+        messages = _sample_messages()
+        classifier = MessageClassifier()
+        classifier.extend(messages)
+        assert all(any(m is orig for orig in messages) for m in classifier.result()["messages"])
+
+    def test_theme_and_source_aggregates(self):
+        """테마별 건수/소스별 센티먼트"""
+        classifier = MessageClassifier()
+        classifier.extend(_sample_messages())
+        result = classifier.result()
+
+        clean = filter_spam(_sample_messages())
+        assert result["theme_counts"] == count_themes(clean) == {"반도체": 2, "HBM": 1}
+        naver = [m for m in clean if m["source"] == "naver"]
+        assert result["source_sentiment"]["naver"] == analyze_sentiment(naver)
+
+    def test_samples_capped(self):
+        """루머/팩트 샘플은 top_n개까지만"""
+        classifier = MessageClassifier(top_n=3)
+        classifier.extend([{"text": "카더라"}] * 10)
+        result = classifier.result()
+        assert result["rumor_count"] == 10
+        assert len(result["rumors"]) == 3
+
+    def test_empty(self):
+        """메시지 없음"""
+        result = MessageClassifier().result()
+        assert result["messages"] == []
+        assert result["sentiment"] == {}
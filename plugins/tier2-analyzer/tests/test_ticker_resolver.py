@@ -0,0 +1,98 @@
+"""SI+ 종목 검색어 해석 테스트 (Tier 1 종목 마스터 연동)"""
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+
+ROWS = {
+    "KOSPI": [
+        {"code": "005930", "name": "삼성전자", "listing_date": "1975-06-11"},
+        {"code": "000660", "name": "SK하이닉스", "listing_date": "1996-12-26"},
+    ],
+    "KOSDAQ": [
+        {"code": "102370", "name": "케이옥션", "listing_date": "2023-02-06"},
+    ],
+}
+
+
+@pytest.fixture
+def master_rows(tmp_path, monkeypatch):
+    """마스터 생성용 종목 목록 mock (Tier 1 캐시 디렉토리 격리)"""
+    from utils.si_plus import ticker_resolver
+
+    monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(tmp_path / "tier1"))
+    ticker_resolver._ticker_master.clear_ticker_master()
+    with patch.object(ticker_resolver, "_fetch_rows", side_effect=lambda market: ROWS[market]) as mock:
+        yield mock
+    ticker_resolver._ticker_master.clear_ticker_master()
+
+
+class TestResolveTicker:
+    """resolve_ticker / resolve_aliases 테스트"""
+
+    def test_name_and_alias_to_code(self, master_rows):
+        """종목명/약칭 → 종목코드, 종목코드는 그대로"""
+        from utils.si_plus import resolve_ticker
+
+        assert resolve_ticker("SK하이닉스") == "000660"
+        assert resolve_ticker("삼전") == "005930"
+        assert resolve_ticker("005930") == "005930"
+        assert resolve_ticker("없는종목") is None
+
+    def test_aliases_from_master(self, master_rows):
+        """종목코드 → 종목명 + 약칭"""
+        from utils.si_plus import resolve_aliases
+
+        assert resolve_aliases("005930") == ["삼성전자", "삼전"]
+        assert resolve_aliases("999999") == []
+
+    def test_master_built_once(self, master_rows):
+        """여러 번 조회해도 마스터는 한 번만 생성"""
+        from utils.si_plus import resolve_aliases, resolve_ticker
+
+        resolve_ticker("삼성전자")
+        resolve_aliases("000660")
+        resolve_ticker("케이옥션")
+
+        assert master_rows.call_count == 2  # 시장별 1회
+
+    def test_search_terms_keep_explicit_aliases(self, master_rows):
+        """호출자가 지정한 별칭은 유지"""
+        from utils.si_plus import resolve_search_terms
+
+        assert resolve_search_terms("삼전") == ("005930", ["삼성전자", "삼전"])
+        assert resolve_search_terms("삼성전자", ["삼성"]) == ("005930", ["삼성"])
+
+    def test_search_terms_without_master(self):
+        """마스터 생성 실패 시 입력값 그대로 사용"""
+        from utils.si_plus import ticker_resolver
+
+        with patch.object(ticker_resolver, "get_master", return_value=None):
+            assert ticker_resolver.resolve_search_terms("삼성전자") == ("삼성전자", ["삼성전자"])
+            assert ticker_resolver.resolve_search_terms("005930") == ("005930", [])
+
+
+class TestCollectAllSourcesAliases:
+    """collect_all_sources 별칭 자동 채움 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_name_query_resolved_before_collect(self, master_rows):
+        """종목명으로 요청 → 종목코드 + 마스터 별칭으로 수집"""
+        from utils.si_plus import collect_all_sources
+
+        with patch('utils.si_plus.unified_collector.NaverCollector') as mock_naver:
+            instance = MagicMock()
+            instance.source_name = "naver"
+            instance.collect = AsyncMock(return_value={
+                "source": "naver",
+                "ticker": "000660",
+                "messages": [],
+                "stats": {"total_messages": 0, "direct_count": 0, "theme_count": 0},
+            })
+            mock_naver.return_value = instance
+
+            result = await collect_all_sources(ticker="하이닉스", enable_reddit=False)
+
+        kwargs = instance.collect.call_args.kwargs
+        assert kwargs["ticker"] == "000660"
+        assert kwargs["aliases"] == ["SK하이닉스", "하이닉스", "하닉"]
+        assert result["aliases"] == ["SK하이닉스", "하이닉스", "하닉"]
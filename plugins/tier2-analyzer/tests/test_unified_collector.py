@@ -124,7 +124,7 @@ class TestUnifiedCollectorCollect:
     @pytest.mark.asyncio
     async def test_collect_with_mock_collector(self):
         """Mock 수집기로 테스트"""
-        from utils.si_plus import UnifiedCollector
+        from utils.si_plus import MessageStore, UnifiedCollector
         from utils.si_plus.base import BaseCollector
 
         # Mock 수집기 생성
@@ -154,6 +154,13 @@ class TestUnifiedCollectorCollect:
         assert result["stats"]["total_messages"] == 2
         assert result["stats"]["by_source"]["mock"] == 2
         assert len(result["combined"]["messages"]) == 2
+        assert isinstance(result["combined"]["messages"], list)
+
+        # columnar=True면 컬럼형 저장소 (리스트처럼 순회, 같은 메시지)
+        columnar = await collector.collect(ticker="005930", columnar=True)
+        assert isinstance(columnar["combined"]["messages"], MessageStore)
+        assert list(columnar["combined"]["messages"]) == result["combined"]["messages"]
+        assert [m["text"] for m in columnar["sources"][0]["messages"]] == ["급등 예상!", "폭락 주의!"]
 
     @pytest.mark.asyncio
     async def test_collect_sentiment_analysis(self):
@@ -211,6 +218,99 @@ class TestUnifiedCollectorCollect:
         assert len(result["combined"]["facts"]) >= 1
 
 
+    @pytest.mark.asyncio
+    async def test_collect_runs_sources_concurrently(self):
+        """소스들은 동시에 수집 (전체 지연 ≈ 가장 느린 소스)"""
+        import asyncio
+        import time
+        from utils.si_plus import UnifiedCollector
+        from utils.si_plus.base import BaseCollector
+
+        class SlowCollector(BaseCollector):
+            def __init__(self, name):
+                self.source_name = name
+
+            async def collect(self, ticker, **kwargs):
+                await asyncio.sleep(0.2)
+                return {
+                    "source": self.source_name,
+                    "ticker": ticker,
+                    "messages": [],
+                    "stats": {"total_messages": 0, "direct_count": 0, "theme_count": 0},
+                }
+
+        collector = UnifiedCollector(enable_naver=False)
+        collector.collectors = [SlowCollector("a"), SlowCollector("b"), SlowCollector("c")]
+
+        start = time.perf_counter()
+        result = await collector.collect(ticker="005930")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert [r["source"] for r in result["sources"]] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_collect_timeout_returns_partial_result(self):
+        """제한 시간 초과 소스는 제외하고 나머지 결과 반환"""
+        import asyncio
+        from utils.si_plus import UnifiedCollector
+        from utils.si_plus.base import BaseCollector
+
+        class FastCollector(BaseCollector):
+            source_name = "fast"
+
+            async def collect(self, ticker, **kwargs):
+                return {
+                    "source": "fast",
+                    "ticker": ticker,
+                    "messages": [{"text": "급등 예상!", "date": "2024-01-15"}],
+                    "stats": {"total_messages": 1, "direct_count": 1, "theme_count": 0},
+                }
+
+        class HangingCollector(BaseCollector):
+            source_name = "hanging"
+
+            async def collect(self, ticker, **kwargs):
+                await asyncio.sleep(10)
+
+        collector = UnifiedCollector(enable_naver=False, source_timeout=0.1)
+        collector.collectors = [HangingCollector(), FastCollector()]
+
+        result = await collector.collect(ticker="005930")
+
+        assert result["stats"]["total_messages"] == 1
+        assert result["stats"]["failed_sources"] == {"hanging": "timeout"}
+        assert "fast" in result["stats"]["by_source"]
+
+    @pytest.mark.asyncio
+    async def test_blocking_collector_does_not_block_event_loop(self):
+        """Naver 수집기의 블로킹 스크래핑은 스레드 풀에서 실행"""
+        import asyncio
+        import time
+        from utils.si_plus import NaverCollector
+
+        collector = NaverCollector()
+
+        def _slow_board(ticker, limit=50):
+            time.sleep(0.2)
+            return []
+
+        ticker_done_at = None
+
+        async def _ticker():
+            nonlocal ticker_done_at
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+            ticker_done_at = time.perf_counter()
+
+        with patch.object(collector, 'get_discussion_board', side_effect=_slow_board):
+            start = time.perf_counter()
+            await asyncio.gather(collector.collect(ticker="005930"), _ticker())
+
+        # 이벤트 루프가 막혔다면 _ticker는 0.2초 이후에야 끝남
+        assert ticker_done_at - start < 0.15
+
+
 class TestUnifiedCollectorReport:
     """UnifiedCollector 리포트 생성 테스트"""
 
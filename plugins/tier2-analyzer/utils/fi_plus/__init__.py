@@ -10,6 +10,9 @@ from .fnguide import (
     get_annual_balance_sheet,
     get_annual_cash_flow,
     format_period_label,
+    clear_fnguide_cache,
+    crawl_financials,
+    load_batch_financials,
     # 하위 호환성
     get_fnguide_full_financials,
     get_fnguide_annual_income,
@@ -18,11 +21,19 @@ from .fnguide import (
     get_fnguide_annual_cash_flow,
 )
 
+from .warehouse import FinancialWarehouse
+
 from .peer_comparison import (
     get_peer_comparison,
     get_sector_average,
 )
 
+from .sector_valuation import (
+    SectorValuation,
+    get_sector_snapshot,
+    get_sector_valuation,
+)
+
 __all__ = [
     "get_full_financials",
     "get_annual_income",
@@ -30,11 +41,18 @@ __all__ = [
     "get_annual_balance_sheet",
     "get_annual_cash_flow",
     "format_period_label",
+    "clear_fnguide_cache",
+    "crawl_financials",
+    "load_batch_financials",
     "get_fnguide_full_financials",
     "get_fnguide_annual_income",
     "get_fnguide_quarterly",
     "get_fnguide_annual_balance_sheet",
     "get_fnguide_annual_cash_flow",
+    "FinancialWarehouse",
     "get_peer_comparison",
     "get_sector_average",
+    "SectorValuation",
+    "get_sector_snapshot",
+    "get_sector_valuation",
 ]
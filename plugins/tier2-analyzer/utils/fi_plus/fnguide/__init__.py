@@ -8,8 +8,8 @@ from datetime import datetime
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
 
+from ...http_client import http_get
 from .parser import (
     extract_company_name,
     parse_fnguide_table,
@@ -20,6 +20,8 @@ from .parser import (
     CASH_FLOW_METRICS,
     METRIC_MAPPINGS,
 )
+from .page_cache import get_parsed_page, clear_fnguide_cache
+from .batch import crawl_financials, load_batch_financials
 
 logger = logging.getLogger(__name__)
 
@@ -30,18 +32,22 @@ REQUEST_HEADERS = {
 }
 
 
-def _fetch_fnguide_page(ticker: str) -> Optional[BeautifulSoup]:
-    """FnGuide 페이지 가져오기"""
+def _fetch_fnguide_page(ticker: str) -> Optional[str]:
+    """FnGuide 페이지 HTML 가져오기 (파싱은 page_cache에서 필요한 테이블만)"""
     url = f"{FNGUIDE_URL}?pGB=1&gicode=A{ticker}"
     try:
-        response = requests.get(url, headers=REQUEST_HEADERS, timeout=10)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        response = http_get(url, headers=REQUEST_HEADERS, timeout=10)
+        return response.text
     except requests.RequestException as e:
         logger.warning("FnGuide 요청 실패 (ticker=%s): %s", ticker, e)
         return None
 
 
+def _get_page(ticker: str) -> Optional[dict]:
+    """파싱된 FnGuide 페이지 (종목별 TTL 캐시 공유)"""
+    return get_parsed_page(ticker, _fetch_fnguide_page)
+
+
 def _detect_accumulated_periods(annual_data: Optional[dict], quarterly_data: Optional[dict]) -> dict:
     """누적 기간 감지 (4분기 미완료 연도)
 
@@ -70,19 +76,17 @@ def _detect_accumulated_periods(annual_data: Optional[dict], quarterly_data: Opt
 
 
 def get_full_financials(ticker: str) -> Optional[dict]:
-    """전체 재무제표 데이터 (단일 HTTP 요청)"""
-    soup = _fetch_fnguide_page(ticker)
-    if not soup:
-        return None
-
-    name = extract_company_name(soup)
-    if not name:
+    """전체 재무제표 데이터 (단일 HTTP 요청, 개별 재무제표 함수와 캐시 공유)"""
+    page = _get_page(ticker)
+    if not page:
         return None
 
-    income_annual = parse_fnguide_table(soup, "divSonikY", INCOME_METRICS_ANNUAL)
-    income_quarterly = parse_fnguide_table(soup, "divSonikQ", INCOME_METRICS_QUARTERLY)
-    balance_annual = parse_fnguide_table(soup, "divDaechaY", BALANCE_SHEET_METRICS)
-    cash_annual = parse_fnguide_table(soup, "divCashY", CASH_FLOW_METRICS)
+    name = page["name"]
+    tables = page["tables"]
+    income_annual = tables["divSonikY"]
+    income_quarterly = tables["divSonikQ"]
+    balance_annual = tables["divDaechaY"]
+    cash_annual = tables["divCashY"]
 
     if not income_annual and not balance_annual and not cash_annual:
         return None
@@ -117,15 +121,12 @@ def get_full_financials(ticker: str) -> Optional[dict]:
 
 def get_annual_income(ticker: str) -> Optional[dict]:
     """연간 손익계산서"""
-    soup = _fetch_fnguide_page(ticker)
-    if not soup:
-        return None
-
-    name = extract_company_name(soup)
-    if not name:
+    page = _get_page(ticker)
+    if not page:
         return None
 
-    annual_data = parse_fnguide_table(soup, "divSonikY", INCOME_METRICS_ANNUAL)
+    name = page["name"]
+    annual_data = page["tables"]["divSonikY"]
     if not annual_data:
         return None
 
@@ -134,15 +135,12 @@ def get_annual_income(ticker: str) -> Optional[dict]:
 
 def get_quarterly_income(ticker: str) -> Optional[dict]:
     """분기 손익계산서"""
-    soup = _fetch_fnguide_page(ticker)
-    if not soup:
+    page = _get_page(ticker)
+    if not page:
         return None
 
-    name = extract_company_name(soup)
-    if not name:
-        return None
-
-    quarterly_data = parse_fnguide_table(soup, "divSonikQ", INCOME_METRICS_QUARTERLY)
+    name = page["name"]
+    quarterly_data = page["tables"]["divSonikQ"]
     if not quarterly_data:
         return None
 
@@ -152,15 +150,12 @@ def get_quarterly_income(ticker: str) -> Optional[dict]:
 
 def get_annual_balance_sheet(ticker: str) -> Optional[dict]:
     """연간 재무상태표"""
-    soup = _fetch_fnguide_page(ticker)
-    if not soup:
-        return None
-
-    name = extract_company_name(soup)
-    if not name:
+    page = _get_page(ticker)
+    if not page:
         return None
 
-    annual_data = parse_fnguide_table(soup, "divDaechaY", BALANCE_SHEET_METRICS)
+    name = page["name"]
+    annual_data = page["tables"]["divDaechaY"]
     if not annual_data:
         return None
 
@@ -170,15 +165,12 @@ def get_annual_balance_sheet(ticker: str) -> Optional[dict]:
 
 def get_annual_cash_flow(ticker: str) -> Optional[dict]:
     """연간 현금흐름표"""
-    soup = _fetch_fnguide_page(ticker)
-    if not soup:
-        return None
-
-    name = extract_company_name(soup)
-    if not name:
+    page = _get_page(ticker)
+    if not page:
         return None
 
-    annual_data = parse_fnguide_table(soup, "divCashY", CASH_FLOW_METRICS)
+    name = page["name"]
+    annual_data = page["tables"]["divCashY"]
     if not annual_data:
         return None
 
@@ -335,6 +327,9 @@ __all__ = [
     "get_annual_balance_sheet",
     "get_annual_cash_flow",
     "format_period_label",
+    "clear_fnguide_cache",
+    "crawl_financials",
+    "load_batch_financials",
     "get_fnguide_full_financials",
     "get_fnguide_annual_income",
     "get_fnguide_quarterly",
@@ -0,0 +1,232 @@
+"""FnGuide 재무제표 일괄 수집
+
+시장 전체 종목의 재무제표를 한 번에 모을 때 사용한다.
+- 다운로드: 스레드 풀 (동시 요청 수 제한, 호스트별 속도 제한은 http_client가 담당)
+- 파싱: 프로세스 풀 (CPU 작업을 GIL 밖에서 병렬 처리)
+- 저장: 청크마다 long 포맷 파트 파일 (Parquet, pyarrow 없으면 pickle)
+- 재개: 청크 저장 후 체크포인트(JSON) 갱신 → 중단 후 다시 실행하면 남은 종목만 수집
+"""
+
+import json
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+from .page_cache import PAGE_TABLES, get_cache_dir, write_atomic
+from .parser import parse_fnguide_page
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# div id → 저장 시 재무제표 구분
+STATEMENTS = {
+    "divSonikY": "income_annual",
+    "divSonikQ": "income_quarterly",
+    "divDaechaY": "balance_annual",
+    "divCashY": "cash_flow_annual",
+}
+
+COLUMNS = ["ticker", "name", "statement", "period", "metric", "value"]
+CHECKPOINT_FILE = "checkpoint.json"
+
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_CHUNK_SIZE = 50
+
+
+def _default_fetch(ticker: str) -> Optional[str]:
+    from . import _fetch_fnguide_page
+    return _fetch_fnguide_page(ticker)
+
+
+def parse_financial_rows(ticker: str, html: str) -> list:
+    """
+    FnGuide 페이지 → long 포맷 행 (프로세스 풀에서 실행)
+
+    Returns:
+        [(ticker, name, statement, period, metric, value), ...]
+
+    Raises:
+        ValueError: 회사명 또는 재무제표 테이블이 없는 페이지 (오류/빈 페이지 → 재시도 대상)
+    """
+    page = parse_fnguide_page(html, PAGE_TABLES)
+    if not page:
+        raise ValueError("회사명 없음")
+
+    rows = []
+    for div_id, statement in STATEMENTS.items():
+        for period, metrics in (page["tables"].get(div_id) or {}).items():
+            for metric, value in metrics.items():
+                rows.append((ticker, page["name"], statement, period, metric, value))
+    if not rows:
+        raise ValueError("재무제표 테이블 없음")
+    return rows
+
+
+def _load_checkpoint(out_dir: Path) -> dict:
+    path = out_dir / CHECKPOINT_FILE
+    if path.exists():
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            logger.warning("체크포인트 손상, 처음부터 수집: %s", path)
+    return {"done": [], "failed": [], "parts": 0}
+
+
+def _save_checkpoint(out_dir: Path, checkpoint: dict) -> None:
+    write_atomic(
+        out_dir / CHECKPOINT_FILE,
+        lambda tmp: tmp.write_text(json.dumps(checkpoint, ensure_ascii=False), encoding="utf-8"),
+    )
+
+
+def _write_part(out_dir: Path, index: int, rows: list) -> None:
+    """청크 결과를 파트 파일로 저장 (같은 번호는 덮어씀 → 중단 후 재실행해도 중복 없음)"""
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    if PARQUET_AVAILABLE:
+        write_atomic(out_dir / f"part-{index:05d}.parquet", lambda tmp: df.to_parquet(tmp, index=False))
+    else:
+        write_atomic(out_dir / f"part-{index:05d}.pkl", df.to_pickle)
+
+
+def _crawl_chunk(
+    chunk: list,
+    fetch: Callable[[str], Optional[str]],
+    fetch_pool: ThreadPoolExecutor,
+    parse_pool: Optional[ProcessPoolExecutor],
+) -> tuple:
+    """청크 다운로드 + 파싱 (받는 대로 파싱 작업 제출)
+
+    Returns:
+        (행 리스트, 완료 종목, 실패 종목)
+    """
+    rows, done, failed = [], [], []
+    parse_futures: dict = {}
+
+    fetch_futures = {fetch_pool.submit(fetch, ticker): ticker for ticker in chunk}
+    for future in as_completed(fetch_futures):
+        ticker = fetch_futures[future]
+        try:
+            html = future.result()
+        except Exception as e:
+            logger.warning("FnGuide 다운로드 실패 (ticker=%s): %s", ticker, e)
+            html = None
+        if not html:
+            failed.append(ticker)
+            continue
+
+        if parse_pool is None:
+            parsed: Future = Future()
+            try:
+                parsed.set_result(parse_financial_rows(ticker, html))
+            except Exception as e:
+                parsed.set_exception(e)
+        else:
+            parsed = parse_pool.submit(parse_financial_rows, ticker, html)
+        parse_futures[parsed] = ticker
+
+    for future in as_completed(parse_futures):
+        ticker = parse_futures[future]
+        try:
+            rows.extend(future.result())
+            done.append(ticker)
+        except Exception as e:
+            logger.warning("FnGuide 파싱 실패 (ticker=%s): %s", ticker, e)
+            failed.append(ticker)
+
+    return rows, done, failed
+
+
+def crawl_financials(
+    tickers: list,
+    out_dir: Optional[Path] = None,
+    fetch_workers: int = DEFAULT_FETCH_WORKERS,
+    parse_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    fetch: Optional[Callable[[str], Optional[str]]] = None,
+) -> dict:
+    """
+    여러 종목의 FnGuide 재무제표 일괄 수집
+
+    Args:
+        tickers: 종목코드 리스트
+        out_dir: 저장 디렉토리 (기본: local/cache/fnguide_batch)
+        fetch_workers: 동시 다운로드 수
+        parse_workers: 파싱 프로세스 수 (None이면 CPU 수, 0이면 현재 프로세스에서 파싱)
+        chunk_size: 파트 파일/체크포인트 단위 종목 수
+        resume: 체크포인트의 완료 종목 건너뛰기 (False면 처음부터)
+        fetch: 페이지 다운로드 함수 fetch(ticker) -> HTML or None (기본: FnGuide 요청)
+
+    Returns:
+        {
+            "out_dir": str,
+            "total": 전체 종목 수,
+            "skipped": 이전 실행에서 완료되어 건너뛴 수,
+            "done": 이번 실행 완료 수,
+            "failed": 실패 종목 리스트 (다음 실행 때 재시도),
+        }
+    """
+    out_dir = Path(out_dir) if out_dir else get_cache_dir() / "fnguide_batch"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fetch = fetch or _default_fetch
+
+    if resume:
+        checkpoint = _load_checkpoint(out_dir)
+    else:
+        checkpoint = {"done": [], "failed": [], "parts": 0}
+        for part in out_dir.glob("part-*"):
+            part.unlink()
+    completed = set(checkpoint["done"])
+    pending = [t for t in dict.fromkeys(tickers) if t not in completed]
+    stats = {"out_dir": str(out_dir), "total": len(set(tickers)), "skipped": len(set(tickers)) - len(pending),
+             "done": 0, "failed": []}
+
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers != 0 else None
+    try:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start:start + chunk_size]
+                rows, done, failed = _crawl_chunk(chunk, fetch, fetch_pool, parse_pool)
+
+                if rows:
+                    _write_part(out_dir, checkpoint["parts"], rows)
+                    checkpoint["parts"] += 1
+                checkpoint["done"].extend(done)
+                checkpoint["failed"] = sorted((set(checkpoint["failed"]) - set(done)) | set(failed))
+                _save_checkpoint(out_dir, checkpoint)
+
+                stats["done"] += len(done)
+                stats["failed"].extend(failed)
+                logger.info("FnGuide 일괄 수집 %d/%d (실패 %d)",
+                            start + len(chunk), len(pending), len(stats["failed"]))
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
+
+    return stats
+
+
+def load_batch_financials(out_dir: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    """
+    일괄 수집 결과 로드
+
+    Args:
+        out_dir: crawl_financials 저장 디렉토리 (기본: local/cache/fnguide_batch)
+
+    Returns:
+        long 포맷 DataFrame (ticker, name, statement, period, metric, value) or None (결과 없음)
+    """
+    out_dir = Path(out_dir) if out_dir else get_cache_dir() / "fnguide_batch"
+    parts = sorted(out_dir.glob("part-*.parquet")) + sorted(out_dir.glob("part-*.pkl"))
+    if not parts:
+        return None
+    frames = [pd.read_parquet(p) if p.suffix == ".parquet" else pd.read_pickle(p) for p in parts]
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,156 @@
+"""FnGuide 파싱 결과 캐시
+
+종목별로 FnGuide 페이지를 한 번만 받아 파싱한 결과(회사명 + 재무제표 테이블)를
+TTL 동안 메모리(+ 디스크)에 보관한다. 연간/분기 손익, 재무상태표, 현금흐름표,
+통합 조회가 같은 캐시를 공유하므로 두 번째 재무제표 요청부터는 딕셔너리 조회만 한다.
+- 메모리: 프로세스 내 dict (스레드 안전)
+- 디스크: local/cache/fnguide/{ticker}.json (TIER2_ANALYZER_CACHE_DIR 환경 변수로 변경)
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from ...tier1_bridge import load_tier1_module
+from .parser import (
+    parse_fnguide_page,
+    INCOME_METRICS_QUARTERLY,
+    INCOME_METRICS_ANNUAL,
+    BALANCE_SHEET_METRICS,
+    CASH_FLOW_METRICS,
+)
+
+logger = logging.getLogger(__name__)
+
+_ohlcv_store = load_tier1_module("ohlcv_store")
+if _ohlcv_store is None:
+    raise ImportError("stock-analyzer-advanced/utils/ohlcv_store.py not found")
+
+# 임시 파일(호출마다 고유 이름) → rename 원자적 저장 (Tier 1 캐시와 같은 구현)
+write_atomic = _ohlcv_store.write_atomic
+
+CACHE_DIR_ENV = "TIER2_ANALYZER_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[3] / "local" / "cache"
+
+# 재무제표는 분기 단위로 바뀌므로 반나절 동안 재사용
+DEFAULT_TTL = 12 * 3600
+
+# 캐시할 테이블 (div id → 추출 메트릭)
+PAGE_TABLES = {
+    "divSonikY": INCOME_METRICS_ANNUAL,
+    "divSonikQ": INCOME_METRICS_QUARTERLY,
+    "divDaechaY": BALANCE_SHEET_METRICS,
+    "divCashY": CASH_FLOW_METRICS,
+}
+
+_memory: dict = {}
+_lock = threading.Lock()
+
+
+def get_cache_dir() -> Path:
+    """캐시 루트 디렉토리 (환경 변수 우선)"""
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def _disk_path(ticker: str) -> Path:
+    return get_cache_dir() / "fnguide" / f"{ticker}.json"
+
+
+def _is_fresh(entry: dict, ttl: float, now: float) -> bool:
+    return now - entry["fetched_at"] < ttl
+
+
+def _load_disk(ticker: str) -> Optional[dict]:
+    path = _disk_path(ticker)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def _save_disk(ticker: str, entry: dict) -> None:
+    """임시 파일 → rename으로 원자적 저장 (실패해도 메모리 캐시는 유지)"""
+    path = _disk_path(ticker)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(entry, ensure_ascii=False)
+        write_atomic(path, lambda tmp: tmp.write_text(payload, encoding="utf-8"))
+    except Exception as e:
+        logger.warning("FnGuide 캐시 저장 실패 (ticker=%s): %s", ticker, e)
+
+
+def get_parsed_page(
+    ticker: str,
+    fetch: Callable[[str], Optional[str]],
+    ttl: float = DEFAULT_TTL,
+    use_disk: bool = True,
+) -> Optional[dict]:
+    """
+    캐시된 FnGuide 파싱 결과 조회 (만료/미보유 시 fetch 후 파싱)
+
+    Args:
+        ticker: 종목코드
+        fetch: 페이지 다운로드 함수 fetch(ticker) -> HTML or None
+        ttl: 캐시 유효 시간 (초)
+        use_disk: 디스크 캐시 사용 여부
+
+    Returns:
+        {"name": str, "tables": {div_id: dict or None}} 사본 or None (조회 실패)
+    """
+    now = time.time()
+    with _lock:
+        entry = _memory.get(ticker)
+    if entry is None and use_disk:
+        entry = _load_disk(ticker)
+        if entry is not None and _is_fresh(entry, ttl, now):
+            with _lock:
+                _memory[ticker] = entry
+
+    if entry is None or not _is_fresh(entry, ttl, now):
+        html = fetch(ticker)
+        if not html:
+            return None
+        parsed = parse_fnguide_page(html, PAGE_TABLES)
+        if not parsed:
+            return None
+        entry = {"fetched_at": now, **parsed}
+        with _lock:
+            _memory[ticker] = entry
+        if use_disk:
+            _save_disk(ticker, entry)
+
+    # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 사본 반환
+    return copy.deepcopy({"name": entry["name"], "tables": entry["tables"]})
+
+
+def clear_fnguide_cache(ticker: Optional[str] = None) -> int:
+    """
+    FnGuide 캐시 삭제 (메모리 + 디스크)
+
+    Args:
+        ticker: 종목코드 (None이면 전체)
+
+    Returns:
+        삭제한 디스크 파일 수
+    """
+    with _lock:
+        if ticker:
+            _memory.pop(ticker, None)
+        else:
+            _memory.clear()
+
+    cache_dir = get_cache_dir() / "fnguide"
+    if not cache_dir.exists():
+        return 0
+    removed = 0
+    for path in cache_dir.glob(f"{ticker}.json" if ticker else "*.json"):
+        path.unlink()
+        removed += 1
+    return removed
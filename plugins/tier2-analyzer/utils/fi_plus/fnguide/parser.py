@@ -6,11 +6,26 @@ FnGuide 재무제표 테이블을 파싱하기 위한 공통 함수들
 import logging
 import re
 from typing import Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from ...tier1_bridge import load_tier1_module
+
 logger = logging.getLogger(__name__)
 
+_financial_scraper = load_tier1_module("financial_scraper")
+if _financial_scraper is None:
+    raise ImportError("stock-analyzer-advanced/utils/financial_scraper.py not found")
+# 회사명 추출(h1.giName → title 정규식)은 Tier 1 재무 스크래퍼와 같은 구현
+extract_company_name_from_html = _financial_scraper.extract_company_name_from_html
+name_from_title = _financial_scraper.name_from_title
+
 # 월 -> 분기 변환 맵 (결산월 기준)
 MONTH_TO_QUARTER = {3: 1, 6: 2, 9: 3, 12: 4}
 
@@ -71,20 +86,80 @@ def extract_company_name(soup: BeautifulSoup) -> Optional[str]:
 
     title = soup.find("title")
     if title:
-        title_text = title.text.strip()
-        match = re.match(r"([^(]+)\(", title_text)
-        if match:
-            return match.group(1).strip()
-        if " - " in title_text:
-            return title_text.split(" - ")[0].strip()
-        if "FnGuide" in title_text:
-            parts = title_text.replace("FnGuide", "").strip(" -")
-            if parts:
-                return parts
+        return name_from_title(title.text.strip())
 
     return None
 
 
+def parse_fnguide_page(html: str, tables: dict) -> Optional[dict]:
+    """
+    FnGuide 페이지에서 필요한 테이블만 파싱
+
+    페이지 전체 트리를 만들지 않고 지정한 div 하위만 처리한다.
+    - lxml 설치 시: lxml 파싱 + XPath로 div 선택
+    - 미설치 시: BeautifulSoup + SoupStrainer로 해당 div만 트리 생성
+
+    Args:
+        html: 페이지 HTML
+        tables: {div_id: 추출 메트릭 리스트}
+
+    Returns:
+        {"name": str, "tables": {div_id: dict or None}} or None (회사명 없음)
+    """
+    name = extract_company_name_from_html(html)
+    if not name:
+        return None
+
+    if LXML_AVAILABLE:
+        parsed = _parse_tables_lxml(html, tables)
+    else:
+        parsed = _parse_tables_strained(html, tables)
+    return {"name": name, "tables": parsed}
+
+
+def _parse_tables_strained(html: str, tables: dict) -> dict:
+    """SoupStrainer 백엔드: 대상 div만 트리로 만든 뒤 기존 파서 적용"""
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("div", id=list(tables)))
+    return {div_id: parse_fnguide_table(soup, div_id, metrics) for div_id, metrics in tables.items()}
+
+
+def _parse_tables_lxml(html: str, tables: dict) -> dict:
+    """lxml 백엔드: XPath로 div 안의 첫 테이블만 선택"""
+    root = lxml_html.fromstring(html)
+    result = {}
+    for div_id, metrics in tables.items():
+        found = root.xpath("(//div[@id=$div_id]//table)[1]", div_id=div_id)
+        if not found:
+            result[div_id] = None
+            continue
+        table = found[0]
+
+        headers = []
+        for th in table.xpath("(.//thead)[1]//th"):
+            text = th.text_content().strip()
+            if text:
+                headers.append(text)
+
+        data_rows = {}
+        for tr in table.xpath("(.//tbody)[1]//tr"):
+            is_bold = "rowBold" in (tr.get("class") or "").split()
+            cells = tr.xpath(".//th | .//td")
+            if len(cells) < 2:
+                continue
+
+            row_name = next((t.strip() for t in cells[0].itertext() if t.strip()), "")
+            row_name = row_name.replace("\xa0", "").strip()
+            if not is_bold and row_name not in metrics:
+                continue
+
+            values = [parse_numeric_value(cell.get("title") or cell.text_content().strip()) for cell in cells[1:]]
+            if row_name and values:
+                data_rows[row_name] = values
+
+        result[div_id] = _build_periods(headers, data_rows, div_id)
+    return result
+
+
 def parse_fnguide_table(
     soup: BeautifulSoup, div_id: str, target_metrics: list
 ) -> Optional[dict]:
@@ -98,11 +173,13 @@ def parse_fnguide_table(
         return None
 
     headers = _extract_headers(table)
-    if len(headers) < 2:
-        return None
-
     data_rows = _extract_data_rows(table, target_metrics)
-    if not data_rows:
+    return _build_periods(headers, data_rows, div_id)
+
+
+def _build_periods(headers: list, data_rows: dict, div_id: str) -> Optional[dict]:
+    """헤더/행 값 → {기간: {영문 키: 값}} (파서 백엔드 공통)"""
+    if len(headers) < 2 or not data_rows:
         return None
 
     result = {}
@@ -3,37 +3,22 @@
 동종업계 밸류에이션 비교 기능
 """
 
-import importlib.util
 import logging
-from typing import Optional, List
-from pathlib import Path
-
-logger = logging.getLogger(__name__)
-
-# Tier 1 utils 경로
-TIER1_UTILS = Path(__file__).parent.parent.parent.parent / "stock-analyzer-advanced" / "utils"
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+from ..tier1_bridge import load_tier1_module
 
-def _load_tier1_module(module_name: str):
-    """Tier 1 모듈 동적 로드"""
-    module_path = TIER1_UTILS / f"{module_name}.py"
-    if not module_path.exists():
-        return None
-    spec = importlib.util.spec_from_file_location(f"tier1_{module_name}", str(module_path))
-    if spec and spec.loader:
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    return None
+logger = logging.getLogger(__name__)
 
 
-_web_scraper = _load_tier1_module("web_scraper")
-_data_fetcher = _load_tier1_module("data_fetcher")
+_web_scraper = load_tier1_module("web_scraper")
+_data_fetcher = load_tier1_module("data_fetcher")
 
-if _web_scraper and hasattr(_web_scraper, "get_naver_stock_info"):
-    get_naver_stock_info = _web_scraper.get_naver_stock_info
+if _web_scraper and hasattr(_web_scraper, "get_naver_quote"):
+    get_naver_quote = _web_scraper.get_naver_quote
 else:
-    def get_naver_stock_info(ticker):
+    def get_naver_quote(ticker, **kwargs):
         return None
 
 if _data_fetcher and hasattr(_data_fetcher, "get_ticker_name"):
@@ -43,47 +28,88 @@ else:
         return None
 
 
-def get_peer_comparison(ticker: str, peers: List[str], include_sector_avg: bool = True) -> Optional[dict]:
-    """피어 그룹 밸류에이션 비교"""
+# 동시 시세 조회 수 (호스트별 속도 제한은 http_client가 담당)
+DEFAULT_WORKERS = 8
+
+# 비교 테이블에 필요한 시세 항목 (시장 스냅샷이 있으면 폴링 API 요청 하나로 조회)
+QUOTE_FIELDS = ("name", "per", "pbr", "market_cap")
+
+
+def _fetch_one(ticker: str) -> Optional[dict]:
     try:
-        target_info = get_naver_stock_info(ticker)
-        target_name = get_ticker_name(ticker)
+        return get_naver_quote(ticker, fields=QUOTE_FIELDS)
     except Exception as e:
         logger.error(f"Exception fetching ticker {ticker}: {e}")
         return None
 
+
+def fetch_quotes(tickers: List[str], workers: int = DEFAULT_WORKERS) -> Dict[str, Optional[dict]]:
+    """
+    여러 종목 시세 동시 조회 (중복 종목은 한 번만)
+
+    Args:
+        tickers: 종목코드 리스트
+        workers: 동시 조회 수
+
+    Returns:
+        {ticker: get_naver_quote 결과 or None}
+    """
+    unique = list(dict.fromkeys(tickers))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as executor:
+        return dict(zip(unique, executor.map(_fetch_one, unique)))
+
+
+def _valuation(ticker: str, info: dict) -> dict:
+    """시세 → 비교 테이블 행 (종목명은 시세 응답 우선, 없을 때만 pykrx 조회)"""
+    name = info.get("name")
+    if not name:
+        try:
+            name = get_ticker_name(ticker)
+        except Exception:
+            name = None
+    return {
+        "ticker": ticker,
+        "name": name,
+        "per": info.get("per"),
+        "pbr": info.get("pbr"),
+        "market_cap": info.get("market_cap"),
+    }
+
+
+def _average(quotes: Dict[str, Optional[dict]]) -> Optional[dict]:
+    """조회된 시세들의 평균 PER/PBR"""
+    per_values = [info["per"] for info in quotes.values() if info and info.get("per")]
+    pbr_values = [info["pbr"] for info in quotes.values() if info and info.get("pbr")]
+
+    result = {}
+    if per_values:
+        result["per"] = round(sum(per_values) / len(per_values), 2)
+    if pbr_values:
+        result["pbr"] = round(sum(pbr_values) / len(pbr_values), 2)
+
+    return result if result else None
+
+
+def get_peer_comparison(
+    ticker: str,
+    peers: List[str],
+    include_sector_avg: bool = True,
+    workers: int = DEFAULT_WORKERS,
+) -> Optional[dict]:
+    """피어 그룹 밸류에이션 비교 (대상 + 피어 시세를 한 번에 동시 조회, 섹터 평균도 같은 결과 사용)"""
+    quotes = fetch_quotes([ticker] + peers, workers=workers)
+
+    target_info = quotes.get(ticker)
     if not target_info:
         logger.warning(f"Failed to fetch stock info for ticker: {ticker}")
         return None
 
-    target = {
-        "ticker": ticker,
-        "name": target_name or target_info.get("name"),
-        "per": target_info.get("per"),
-        "pbr": target_info.get("pbr"),
-        "market_cap": target_info.get("market_cap"),
-    }
+    target = _valuation(ticker, target_info)
+    peer_data = [_valuation(p, quotes[p]) for p in dict.fromkeys(peers) if quotes.get(p)]
 
-    peer_data = []
-    for peer_ticker in peers:
-        try:
-            peer_info = get_naver_stock_info(peer_ticker)
-            peer_name = get_ticker_name(peer_ticker)
-        except Exception as e:
-            logger.error(f"Exception fetching peer ticker {peer_ticker}: {e}")
-            continue
-
-        if peer_info:
-            peer_data.append({
-                "ticker": peer_ticker,
-                "name": peer_name or peer_info.get("name"),
-                "per": peer_info.get("per"),
-                "pbr": peer_info.get("pbr"),
-                "market_cap": peer_info.get("market_cap"),
-            })
-
-    all_tickers = [ticker] + peers
-    sector_avg = get_sector_average(all_tickers) if include_sector_avg else {}
+    sector_avg = _average(quotes) if include_sector_avg else {}
 
     premium_discount = {}
     if sector_avg and target.get("per") and sector_avg.get("per") and sector_avg["per"] != 0:
@@ -94,29 +120,8 @@ def get_peer_comparison(ticker: str, peers: List[str], include_sector_avg: bool
     return {"target": target, "peers": peer_data, "sector_avg": sector_avg, "premium_discount": premium_discount}
 
 
-def get_sector_average(tickers: List[str]) -> Optional[dict]:
+def get_sector_average(tickers: List[str], workers: int = DEFAULT_WORKERS) -> Optional[dict]:
     """종목 리스트의 평균 밸류에이션"""
     if not tickers:
         return None
-
-    per_values, pbr_values = [], []
-
-    for ticker in tickers:
-        try:
-            info = get_naver_stock_info(ticker)
-        except Exception:
-            continue
-
-        if info:
-            if info.get("per"):
-                per_values.append(info["per"])
-            if info.get("pbr"):
-                pbr_values.append(info["pbr"])
-
-    result = {}
-    if per_values:
-        result["per"] = round(sum(per_values) / len(per_values), 2)
-    if pbr_values:
-        result["pbr"] = round(sum(pbr_values) / len(pbr_values), 2)
-
-    return result if result else None
+    return _average(fetch_quotes(tickers, workers=workers))
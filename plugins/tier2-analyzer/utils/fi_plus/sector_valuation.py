@@ -0,0 +1,301 @@
+"""업종 밸류에이션 엔진
+
+전 종목 PER/PBR/시가총액 스냅샷을 하루 단위로 캐시하고
+업종별로 정렬된 배열(+ 누적합)을 미리 만들어 두어
+백분위, 중앙값, 절사평균 조회를 즉시(O(log n)) 처리한다.
+- 종목 목록/PER/시가총액: get_naver_stock_list (KOSPI/KOSDAQ 시가총액 페이지, 당일 캐시)
+- 업종: get_naver_sector_map (네이버 업종 분류)
+- PBR: get_naver_polling_quotes (폴링 API, 요청 하나에 여러 종목)
+- 저장 위치: local/cache/sector/{YYYYMMDD}.parquet|pkl (TIER2_ANALYZER_CACHE_DIR 환경 변수로 변경)
+- 현재 시세로만 만들 수 있으므로 생성은 오늘 날짜만, 과거 날짜는 그날 저장한 스냅샷만 조회
+"""
+
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..tier1_bridge import load_tier1_module
+from .fnguide.page_cache import get_cache_dir, write_atomic
+from .peer_comparison import DEFAULT_WORKERS
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_web_scraper = load_tier1_module("web_scraper")
+
+if _web_scraper and hasattr(_web_scraper, "get_naver_stock_list"):
+    get_naver_stock_list = _web_scraper.get_naver_stock_list
+else:
+    def get_naver_stock_list(market):
+        return None
+
+if _web_scraper and hasattr(_web_scraper, "get_naver_sector_map"):
+    get_naver_sector_map = _web_scraper.get_naver_sector_map
+else:
+    def get_naver_sector_map(workers=8):
+        return None
+
+if _web_scraper and hasattr(_web_scraper, "get_naver_polling_quotes"):
+    get_naver_polling_quotes = _web_scraper.get_naver_polling_quotes
+else:
+    def get_naver_polling_quotes(tickers, workers=8):
+        return {}
+
+MARKETS = ("KOSPI", "KOSDAQ")
+METRICS = ("per", "pbr", "market_cap")
+SNAPSHOT_COLUMNS = ["ticker", "name", "market", "sector", *METRICS]
+DEFAULT_TRIM = 0.1
+
+_instances: Dict[str, "SectorValuation"] = {}
+_lock = threading.Lock()
+
+
+def _snapshot_path(date: str) -> Path:
+    ext = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+    return get_cache_dir() / "sector" / f"{date}{ext}"
+
+
+def _positive(value) -> float:
+    """0/음수/결측 → NaN (적자 PER, 미상장 등은 비교에서 제외)"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return np.nan
+    return value if value > 0 else np.nan
+
+
+def _is_complete(snapshot: pd.DataFrame) -> bool:
+    """업종/PBR이 모두 비어 있지 않은지 (업종 분류/폴링 조회 실패 스냅샷은 저장하지 않음)"""
+    return bool(snapshot["sector"].notna().any() and snapshot["pbr"].notna().any())
+
+
+def build_sector_snapshot(markets: Tuple[str, ...] = MARKETS, workers: int = DEFAULT_WORKERS) -> Optional[pd.DataFrame]:
+    """
+    전 종목 업종/밸류에이션 스냅샷 생성 (네트워크)
+
+    Args:
+        markets: 대상 시장
+        workers: 동시 요청 수
+
+    Returns:
+        DataFrame (ticker, name, market, sector, per, pbr, market_cap) or None
+    """
+    sector_map = get_naver_sector_map(workers=workers) or {}
+
+    # PER/시가총액은 시가총액 페이지 목록에 이미 있음 (종목 페이지를 종목마다 받지 않음)
+    rows = []
+    for market in markets:
+        for item in get_naver_stock_list(market) or []:
+            rows.append({
+                "ticker": item["code"],
+                "name": item["name"],
+                "market": market,
+                "per": _positive(item.get("per")),
+                "market_cap": _positive(item.get("market_cap")),
+            })
+    if not rows:
+        return None
+
+    universe = pd.DataFrame(rows).drop_duplicates("ticker").reset_index(drop=True)
+    quotes = get_naver_polling_quotes(universe["ticker"].tolist(), workers=workers) or {}
+
+    universe["sector"] = [sector_map.get(t) for t in universe["ticker"]]
+    universe["pbr"] = [_positive((quotes.get(t) or {}).get("pbr")) for t in universe["ticker"]]
+    return universe[SNAPSHOT_COLUMNS]
+
+
+def get_sector_snapshot(
+    date: Optional[str] = None,
+    refresh: bool = False,
+    markets: Tuple[str, ...] = MARKETS,
+    workers: int = DEFAULT_WORKERS,
+) -> Optional[pd.DataFrame]:
+    """
+    일별 캐시된 업종 스냅샷 (없으면 생성 후 저장)
+
+    Args:
+        date: 스냅샷 날짜 YYYYMMDD (기본 오늘, 다른 날짜는 저장된 스냅샷만 조회)
+        refresh: True면 캐시 무시하고 다시 생성 (오늘 날짜만)
+        markets: 대상 시장
+        workers: 동시 요청 수
+
+    Returns:
+        스냅샷 DataFrame or None (생성 실패, 저장되지 않은 과거 날짜)
+        업종 또는 PBR이 모두 비어 있는 스냅샷은 반환만 하고 저장하지 않는다.
+    """
+    today = datetime.now().strftime("%Y%m%d")
+    date = date or today
+    path = _snapshot_path(date)
+
+    if path.exists() and (not refresh or date != today):
+        try:
+            return pd.read_parquet(path) if PARQUET_AVAILABLE else pd.read_pickle(path)
+        except Exception as e:
+            logger.warning("업종 스냅샷 로드 실패 (date=%s): %s", date, e)
+
+    if date != today:
+        # 지금 시세로 만든 스냅샷을 다른 날짜로 저장하지 않음
+        return None
+
+    snapshot = build_sector_snapshot(markets=markets, workers=workers)
+    if snapshot is None:
+        return None
+    if not _is_complete(snapshot):
+        logger.warning("업종 스냅샷에 업종 또는 PBR이 없어 저장하지 않음 (date=%s)", date)
+        return snapshot
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if PARQUET_AVAILABLE:
+            write_atomic(path, lambda tmp: snapshot.to_parquet(tmp, index=False))
+        else:
+            write_atomic(path, snapshot.to_pickle)
+    except Exception as e:
+        logger.warning("업종 스냅샷 저장 실패 (date=%s): %s", date, e)
+    return snapshot
+
+
+class SectorValuation:
+    """업종별 밸류에이션 분포 (정렬 배열 + 누적합으로 즉시 조회)"""
+
+    def __init__(self, snapshot: pd.DataFrame):
+        """
+        Args:
+            snapshot: get_sector_snapshot 결과
+        """
+        self.snapshot = snapshot.set_index("ticker")
+        self._sorted: Dict[Tuple[str, str], np.ndarray] = {}
+        self._cumsum: Dict[Tuple[str, str], np.ndarray] = {}
+
+        for sector, group in snapshot.dropna(subset=["sector"]).groupby("sector"):
+            for metric in METRICS:
+                values = group[metric].to_numpy(dtype=float)
+                values = np.sort(values[~np.isnan(values)])
+                self._sorted[(sector, metric)] = values
+                self._cumsum[(sector, metric)] = np.concatenate(([0.0], np.cumsum(values)))
+
+    @property
+    def sectors(self) -> list:
+        return sorted({sector for sector, _ in self._sorted})
+
+    def sector_of(self, ticker: str) -> Optional[str]:
+        if ticker not in self.snapshot.index:
+            return None
+        sector = self.snapshot.at[ticker, "sector"]
+        return sector if isinstance(sector, str) else None
+
+    def _values(self, sector: Optional[str], metric: str) -> np.ndarray:
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}: {metric}")
+        return self._sorted.get((sector, metric), np.empty(0))
+
+    def median(self, sector: str, metric: str = "per") -> Optional[float]:
+        """업종 중앙값"""
+        values = self._values(sector, metric)
+        if len(values) == 0:
+            return None
+        return float(np.median(values))
+
+    def trimmed_mean(self, sector: str, metric: str = "per", trim: float = DEFAULT_TRIM) -> Optional[float]:
+        """
+        업종 절사평균
+
+        Args:
+            sector: 업종명
+            metric: "per", "pbr", "market_cap"
+            trim: 양쪽에서 잘라낼 비율 (0 ~ 0.5 미만)
+
+        Returns:
+            절사평균 or None (데이터 없음)
+        """
+        values = self._values(sector, metric)
+        n = len(values)
+        cut = int(n * trim)
+        if n - 2 * cut <= 0:
+            return None
+        total = self._cumsum[(sector, metric)]
+        return float((total[n - cut] - total[cut]) / (n - 2 * cut))
+
+    def percentile_rank(self, ticker: str, metric: str = "per") -> Optional[float]:
+        """
+        업종 내 백분위 (0~100, 동률은 중간 순위)
+
+        Returns:
+            백분위 or None (업종/값 없음)
+        """
+        sector = self.sector_of(ticker)
+        values = self._values(sector, metric)
+        value = self.snapshot.at[ticker, metric] if sector else np.nan
+        if len(values) == 0 or np.isnan(value):
+            return None
+        left = np.searchsorted(values, value, side="left")
+        right = np.searchsorted(values, value, side="right")
+        return float((left + right) / 2 / len(values) * 100)
+
+    def summary(self, ticker: str, trim: float = DEFAULT_TRIM) -> Optional[dict]:
+        """
+        종목의 업종 대비 밸류에이션 요약
+
+        Returns:
+            {
+                "ticker": "005930",
+                "name": "삼성전자",
+                "sector": "반도체와반도체장비",
+                "per": {"value": 12.5, "percentile": 40.0, "median": 15.2, "trimmed_mean": 16.8, "count": 80},
+                "pbr": {...},
+                "market_cap": {...},
+            }
+            or None (스냅샷에 없음)
+        """
+        if ticker not in self.snapshot.index:
+            return None
+        sector = self.sector_of(ticker)
+        result = {"ticker": ticker, "name": self.snapshot.at[ticker, "name"], "sector": sector}
+        for metric in METRICS:
+            value = self.snapshot.at[ticker, metric]
+            result[metric] = {
+                "value": None if np.isnan(value) else float(value),
+                "percentile": self.percentile_rank(ticker, metric),
+                "median": self.median(sector, metric),
+                "trimmed_mean": self.trimmed_mean(sector, metric, trim),
+                "count": len(self._values(sector, metric)),
+            }
+        return result
+
+
+def get_sector_valuation(date: Optional[str] = None, refresh: bool = False) -> Optional[SectorValuation]:
+    """
+    날짜별 SectorValuation (프로세스 내 재사용)
+
+    Args:
+        date: 스냅샷 날짜 YYYYMMDD (기본 오늘)
+        refresh: True면 스냅샷을 다시 생성
+
+    Returns:
+        SectorValuation or None (스냅샷 생성 실패)
+        업종/PBR이 빠진 스냅샷의 엔진은 재사용하지 않는다 (다음 호출에서 다시 생성).
+    """
+    date = date or datetime.now().strftime("%Y%m%d")
+    with _lock:
+        if not refresh and date in _instances:
+            return _instances[date]
+
+    snapshot = get_sector_snapshot(date=date, refresh=refresh)
+    if snapshot is None:
+        return None
+
+    engine = SectorValuation(snapshot)
+    if _is_complete(snapshot):
+        with _lock:
+            _instances[date] = engine
+    return engine
@@ -0,0 +1,246 @@
+"""재무제표 저장소 (SQLite, long 포맷)
+
+get_full_financials 결과나 일괄 수집(crawl_financials) 결과를
+(ticker, statement, period, metric, value) 행으로 저장해 두고
+재스크래핑 없이 종목 횡단 조회/스크리닝을 한다.
+- 저장 위치: local/cache/financials.sqlite (TIER2_ANALYZER_CACHE_DIR 환경 변수로 변경)
+- statement: income_annual / income_quarterly / balance_annual / cash_flow_annual
+"""
+
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pandas as pd
+
+from .fnguide.page_cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = "financials.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS financials (
+    ticker TEXT NOT NULL,
+    statement TEXT NOT NULL,
+    period TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (ticker, statement, period, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_financials_period ON financials (period, statement, metric);
+CREATE TABLE IF NOT EXISTS companies (
+    ticker TEXT PRIMARY KEY,
+    name TEXT,
+    updated_at TEXT
+);
+"""
+
+# get_full_financials 결과 경로 → statement
+RESULT_SECTIONS = {
+    ("income_statement", "annual"): "income_annual",
+    ("income_statement", "quarterly"): "income_quarterly",
+    ("balance_sheet", "annual"): "balance_annual",
+    ("cash_flow", "annual"): "cash_flow_annual",
+}
+
+# 완결 연도 기준 매출 CAGR + 최신 부채비율
+# (분기 데이터상 4분기가 없는 연도는 누적 실적이므로 제외, _detect_accumulated_periods와 동일 기준)
+SCREEN_SQL = """
+WITH revenue AS (
+    SELECT ticker, period, value FROM financials
+    WHERE statement = 'income_annual' AND metric = 'revenue' AND value IS NOT NULL
+),
+partial AS (
+    SELECT ticker, substr(period, 1, 4) AS year FROM financials
+    WHERE statement = 'income_quarterly'
+    GROUP BY ticker, year
+    HAVING max(period) NOT LIKE '%Q4'
+),
+complete AS (
+    SELECT r.* FROM revenue r
+    WHERE NOT EXISTS (SELECT 1 FROM partial p WHERE p.ticker = r.ticker AND p.year = r.period)
+),
+latest AS (
+    SELECT ticker, max(period) AS period FROM complete GROUP BY ticker
+),
+growth AS (
+    SELECT l.ticker, l.period, cagr(s.value, e.value, :years) AS revenue_cagr
+    FROM latest l
+    JOIN complete e ON e.ticker = l.ticker AND e.period = l.period
+    JOIN complete s ON s.ticker = l.ticker AND s.period = CAST(CAST(l.period AS INTEGER) - :years AS TEXT)
+),
+balance AS (
+    SELECT ticker, max(period) AS period FROM financials
+    WHERE statement = 'balance_annual' GROUP BY ticker
+),
+leverage AS (
+    SELECT b.ticker,
+           100.0 * max(CASE WHEN f.metric = 'total_liabilities' THEN f.value END)
+                 / nullif(max(CASE WHEN f.metric = 'total_equity' THEN f.value END), 0) AS debt_ratio
+    FROM balance b
+    JOIN financials f ON f.ticker = b.ticker AND f.statement = 'balance_annual' AND f.period = b.period
+    GROUP BY b.ticker
+)
+SELECT g.ticker, c.name, g.period, g.revenue_cagr, v.debt_ratio
+FROM growth g
+LEFT JOIN leverage v ON v.ticker = g.ticker
+LEFT JOIN companies c ON c.ticker = g.ticker
+WHERE (:min_cagr IS NULL OR g.revenue_cagr > :min_cagr)
+  AND (:max_debt IS NULL OR v.debt_ratio < :max_debt)
+ORDER BY g.revenue_cagr DESC
+"""
+
+
+def _cagr(start: Optional[float], end: Optional[float], years: int) -> Optional[float]:
+    """연평균 성장률 (%) - 시작/끝 값이 양수일 때만"""
+    if start is None or end is None or start <= 0 or end <= 0 or years <= 0:
+        return None
+    return ((end / start) ** (1 / years) - 1) * 100
+
+
+def financials_to_rows(data: dict) -> list:
+    """
+    get_full_financials 결과 → long 포맷 행
+
+    Returns:
+        [(ticker, statement, period, metric, value), ...]
+    """
+    rows = []
+    for (section, freq), statement in RESULT_SECTIONS.items():
+        for period, metrics in ((data.get(section) or {}).get(freq) or {}).items():
+            for metric, value in metrics.items():
+                rows.append((data["ticker"], statement, period, metric, value))
+    return rows
+
+
+class FinancialWarehouse:
+    """재무제표 long 포맷 저장소"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: local/cache/financials.sqlite)
+        """
+        self.path = Path(path) if path else get_cache_dir() / DB_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 (스레드 간 공유 없음), 정상 종료 시 commit"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.create_function("cagr", 3, _cagr, deterministic=True)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _upsert(self, companies: list, rows: list) -> None:
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO companies (ticker, name, updated_at) VALUES (?, ?, ?)",
+                [(ticker, name, now) for ticker, name in companies],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO financials (ticker, statement, period, metric, value) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def add_financials(self, data: dict) -> int:
+        """
+        get_full_financials 결과 저장 (같은 키는 덮어씀)
+
+        Returns:
+            저장한 행 수
+        """
+        rows = financials_to_rows(data)
+        self._upsert([(data["ticker"], data.get("name"))], rows)
+        return len(rows)
+
+    def add_batch(self, df: pd.DataFrame) -> int:
+        """
+        crawl_financials 결과(load_batch_financials DataFrame) 저장
+
+        Returns:
+            저장한 행 수
+        """
+        companies = df[["ticker", "name"]].drop_duplicates("ticker").itertuples(index=False, name=None)
+        values = df["value"].astype(object).where(df["value"].notna(), None)
+        rows = list(zip(df["ticker"], df["statement"], df["period"], df["metric"], values))
+        self._upsert(list(companies), rows)
+        return len(rows)
+
+    def refresh(self, tickers: list, workers: int = 4) -> dict:
+        """
+        get_full_financials로 종목들을 다시 받아 저장
+
+        Args:
+            tickers: 종목코드 리스트
+            workers: 동시 조회 수
+
+        Returns:
+            {"stored": [성공 종목], "failed": [실패 종목]}
+        """
+        from .fnguide import get_full_financials
+
+        result = {"stored": [], "failed": []}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for ticker, data in zip(tickers, executor.map(get_full_financials, tickers)):
+                if data:
+                    self.add_financials(data)
+                    result["stored"].append(ticker)
+                else:
+                    result["failed"].append(ticker)
+        return result
+
+    def query(self, sql: str, params: Optional[dict] = None) -> pd.DataFrame:
+        """임의 SQL 조회 (cagr(start, end, years) 함수 사용 가능)"""
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=params or {})
+
+    def get_metric(self, statement: str, metric: str, period: Optional[str] = None) -> pd.DataFrame:
+        """
+        항목 횡단 조회
+
+        Args:
+            statement: income_annual / income_quarterly / balance_annual / cash_flow_annual
+            metric: 영문 키 (예: "revenue")
+            period: 기간 (None이면 전체, 예: "2024", "2024Q3")
+
+        Returns:
+            ticker × period 피벗 DataFrame
+        """
+        df = self.query(
+            "SELECT ticker, period, value FROM financials "
+            "WHERE statement = :statement AND metric = :metric AND (:period IS NULL OR period = :period)",
+            {"statement": statement, "metric": metric, "period": period},
+        )
+        return df.pivot(index="ticker", columns="period", values="value")
+
+    def screen(
+        self,
+        min_revenue_cagr: Optional[float] = None,
+        max_debt_ratio: Optional[float] = None,
+        years: int = 3,
+    ) -> pd.DataFrame:
+        """
+        매출 CAGR / 부채비율 스크리닝
+
+        Args:
+            min_revenue_cagr: 최소 매출 CAGR (%, 초과)
+            max_debt_ratio: 최대 부채비율 (%, 미만)
+            years: CAGR 기간 (최신 완결 연도 기준 N년)
+
+        Returns:
+            DataFrame (ticker, name, period, revenue_cagr, debt_ratio), CAGR 내림차순
+        """
+        return self.query(SCREEN_SQL, {"years": years, "min_cagr": min_revenue_cagr, "max_debt": max_debt_ratio})
@@ -0,0 +1,19 @@
+"""공유 HTTP 클라이언트 (Tier 1 utils.http_client 재사용)
+
+Tier 1 스크래퍼와 같은 모듈 인스턴스를 쓰므로
+호스트별 커넥션 풀, rate limit, 메트릭이 두 플러그인 사이에서 공유된다.
+Tier 1 스크래퍼의 `from .http_client import ...`도 같은 모듈(tier1_utils.http_client)을 가리킨다.
+"""
+
+from .tier1_bridge import load_tier1_module
+
+_http_client = load_tier1_module("http_client")
+if _http_client is None:
+    raise ImportError("stock-analyzer-advanced/utils/http_client.py not found")
+
+http_get = _http_client.http_get
+get_session = _http_client.get_session
+get_metrics = _http_client.get_metrics
+reset_metrics = _http_client.reset_metrics
+set_rate_limit = _http_client.set_rate_limit
+TokenBucket = _http_client.TokenBucket
@@ -19,6 +19,11 @@ from .base import (
     # 분석 함수
     analyze_sentiment,
     classify_rumor,
+    annotate_message,
+    count_themes,
+    MessageRecord,
+    SentimentAggregator,
+    MessageClassifier,
     get_sentiment_label,
     format_unified_report,
     # 스팸 필터링
@@ -29,6 +34,19 @@ from .base import (
     SentimentResult,
 )
 
+# 다중 키워드 매처
+from .keyword_matcher import (
+    AHOCORASICK_AVAILABLE,
+    KeywordMatcher,
+    get_default_matcher,
+)
+
+# 컬럼형 메시지 저장소
+from .message_store import MessageStore
+
+# 메시지 아카이브 (증분 수집)
+from .message_archive import MessageArchive
+
 # 텔레그램 수집기
 from .telegram_collector import (
     TelegramCollector,
@@ -61,6 +79,13 @@ from .unified_collector import (
     collect_all_sources_sync,
 )
 
+# 종목 검색어 해석 (종목 마스터)
+from .ticker_resolver import (
+    resolve_ticker,
+    resolve_aliases,
+    resolve_search_terms,
+)
+
 # 리포트 생성기
 from .report_generator import generate_report
 
@@ -85,11 +110,24 @@ __all__ = [
     # 분석 함수
     "analyze_sentiment",
     "classify_rumor",
+    "annotate_message",
+    "count_themes",
+    "MessageRecord",
+    "SentimentAggregator",
+    "MessageClassifier",
     "get_sentiment_label",
     "format_unified_report",
     # 스팸 필터링
     "is_spam",
     "filter_spam",
+    # 다중 키워드 매처
+    "AHOCORASICK_AVAILABLE",
+    "KeywordMatcher",
+    "get_default_matcher",
+    # 컬럼형 메시지 저장소
+    "MessageStore",
+    # 메시지 아카이브
+    "MessageArchive",
     # 기본 클래스
     "BaseCollector",
     "SentimentResult",
@@ -104,6 +142,10 @@ __all__ = [
     "search_reddit",
     "get_naver_discussions",
     "generate_report",
+    # 종목 검색어 해석
+    "resolve_ticker",
+    "resolve_aliases",
+    "resolve_search_terms",
     # 컨텍스트 추출기
     "StockContext",
     "extract_context_from_analysis",
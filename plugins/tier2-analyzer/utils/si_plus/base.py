@@ -2,9 +2,14 @@
 
 센티먼트 분석, 루머 분류 등 공통 기능
 """
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, NamedTuple, Tuple
+
+from .keyword_matcher import get_default_matcher
 
 # ============================================================
 # 센티먼트 키워드
@@ -64,11 +69,7 @@ def is_spam(text: str) -> bool:
     Returns:
         스팸이면 True
     """
-    text_lower = text.lower()
-    for pattern in SPAM_PATTERNS:
-        if pattern.lower() in text_lower:
-            return True
-    return False
+    return bool(get_default_matcher().scan(text)["spam"])
 
 
 def filter_spam(messages: List[dict]) -> List[dict]:
@@ -144,126 +145,304 @@ class BaseCollector(ABC):
         pass
 
 
+# requests/time.sleep 기반 수집기용 스레드 풀 (이벤트 루프 블로킹 방지)
+_BLOCKING_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="siplus-blocking")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    블로킹 함수를 스레드 풀에서 실행하고 결과를 await
+
+    Args:
+        func: 동기 함수 (requests 호출, time.sleep 포함 가능)
+
+    Returns:
+        func 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BLOCKING_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
 # ============================================================
 # 공통 분석 함수
 # ============================================================
 
-def analyze_sentiment(messages: List[dict], prioritize_direct: bool = True) -> dict:
+class MessageRecord(NamedTuple):
+    """메시지 1건의 분류 결과 (키워드 스캔 1회)"""
+    spam: bool
+    bullish: List[str]
+    bearish: List[str]
+    rumor: List[str]
+    fact: List[str]
+
+    @property
+    def sentiment(self) -> int:
+        """1: 상승, -1: 하락, 0: 중립"""
+        if len(self.bullish) > len(self.bearish):
+            return 1
+        if len(self.bearish) > len(self.bullish):
+            return -1
+        return 0
+
+    @property
+    def fact_ratio(self) -> Optional[float]:
+        """팩트 지표 비율 (루머/팩트 지표가 없으면 None)"""
+        total = len(self.rumor) + len(self.fact)
+        return len(self.fact) / total if total else None
+
+
+def annotate_message(text: str) -> MessageRecord:
     """
-    메시지에서 센티먼트 분석
+    메시지 텍스트를 한 번 훑어 스팸/센티먼트/루머 키워드 분류
 
     Args:
-        messages: 메시지 리스트
-        prioritize_direct: True면 top_bullish/bearish에서 직접 매칭 우선
+        text: 메시지 텍스트
 
     Returns:
-        센티먼트 분석 결과
+        MessageRecord
     """
-    bullish_count = 0
-    bearish_count = 0
-    neutral_count = 0
+    hits = get_default_matcher().scan(text)
+    return MessageRecord(
+        spam=bool(hits["spam"]),
+        bullish=hits["bullish"],
+        bearish=hits["bearish"],
+        rumor=hits["rumor"],
+        fact=hits["fact"],
+    )
 
-    # 직접 매칭과 테마 매칭 분리
-    direct_bullish = []
-    direct_bearish = []
-    theme_bullish = []
-    theme_bearish = []
 
-    for msg in messages:
-        text = msg.get("text", "")
-        match_type = msg.get("match_type", "direct")
+class SentimentAggregator:
+    """
+    센티먼트 증분 집계 (analyze_sentiment와 같은 결과)
+
+    메시지를 하나씩 add()로 넣고 result()로 결과 조회.
+    top 의견은 직접/테마 매칭별로 필요한 개수(5개)까지만 보관하고,
+    결과에서는 직접 매칭을 먼저, 부족하면 테마 매칭으로 채운다.
+    """
+
+    TOP_N = 5
+
+    def __init__(self):
+        self.bullish_count = 0
+        self.bearish_count = 0
+        self.neutral_count = 0
+        # (상승/하락, 직접/테마) → top 후보
+        self._top: Dict[Tuple[bool, bool], List[dict]] = {
+            (bullish, direct): [] for bullish in (True, False) for direct in (True, False)
+        }
 
-        bull_hits = sum(1 for kw in BULLISH_KEYWORDS if kw in text)
-        bear_hits = sum(1 for kw in BEARISH_KEYWORDS if kw in text)
+    @property
+    def total(self) -> int:
+        return self.bullish_count + self.bearish_count + self.neutral_count
+
+    def add(self, msg: dict, record: MessageRecord) -> None:
+        """
+        메시지 1건 반영
+
+        Args:
+            msg: 메시지
+            record: annotate_message 결과
+        """
+        sentiment = record.sentiment
+        if sentiment == 0:
+            self.neutral_count += 1
+            return
+
+        bullish = sentiment > 0
+        if bullish:
+            self.bullish_count += 1
+        else:
+            self.bearish_count += 1
 
-        entry = {
+        match_type = msg.get("match_type", "direct")
+        top = self._top[(bullish, match_type == "direct")]
+        if len(top) >= self.TOP_N:
+            return
+        text = msg.get("text", "")
+        top.append({
             "text": text[:100] + "..." if len(text) > 100 else text,
             "date": msg.get("date"),
             "source": msg.get("source", "unknown"),
             "match_type": match_type,
             "matched_keyword": msg.get("matched_keyword", ""),
-            "keywords": [],
-        }
+            "keywords": record.bullish if bullish else record.bearish,
+        })
 
-        if bull_hits > bear_hits:
-            bullish_count += 1
-            entry["keywords"] = [kw for kw in BULLISH_KEYWORDS if kw in text]
-            if match_type == "direct":
-                direct_bullish.append(entry)
-            else:
-                theme_bullish.append(entry)
-        elif bear_hits > bull_hits:
-            bearish_count += 1
-            entry["keywords"] = [kw for kw in BEARISH_KEYWORDS if kw in text]
-            if match_type == "direct":
-                direct_bearish.append(entry)
-            else:
-                theme_bearish.append(entry)
-        else:
-            neutral_count += 1
-
-    # top 선택: 직접 매칭 우선, 부족하면 테마로 채움
-    if prioritize_direct:
-        top_bullish = direct_bullish[:5]
-        if len(top_bullish) < 5:
-            top_bullish.extend(theme_bullish[:5 - len(top_bullish)])
-        top_bearish = direct_bearish[:5]
-        if len(top_bearish) < 5:
-            top_bearish.extend(theme_bearish[:5 - len(top_bearish)])
-    else:
-        top_bullish = (direct_bullish + theme_bullish)[:5]
-        top_bearish = (direct_bearish + theme_bearish)[:5]
-
-    total = len(messages)
-    score = (bullish_count - bearish_count) / total if total > 0 else 0.0
+    def _top_entries(self, bullish: bool) -> List[dict]:
+        direct = self._top[(bullish, True)]
+        theme = self._top[(bullish, False)]
+        # 직접 매칭 우선, 부족하면 테마로 채움
+        return (direct + theme)[:self.TOP_N]
 
-    return {
-        "score": round(score, 3),
-        "bullish_count": bullish_count,
-        "bearish_count": bearish_count,
-        "neutral_count": neutral_count,
-        "total_messages": total,
-        "top_bullish": top_bullish,
-        "top_bearish": top_bearish,
-    }
+    def result(self) -> dict:
+        """
+        Returns:
+            센티먼트 분석 결과 (analyze_sentiment 반환 형식)
+        """
+        total = self.total
+        score = (self.bullish_count - self.bearish_count) / total if total > 0 else 0.0
 
+        return {
+            "score": round(score, 3),
+            "bullish_count": self.bullish_count,
+            "bearish_count": self.bearish_count,
+            "neutral_count": self.neutral_count,
+            "total_messages": total,
+            "top_bullish": self._top_entries(True),
+            "top_bearish": self._top_entries(False),
+        }
 
-def classify_rumor(text: str) -> dict:
+
+def analyze_sentiment(messages: List[dict], prioritize_direct: bool = True) -> dict:
     """
-    메시지를 루머 vs 팩트로 분류
+    메시지에서 센티먼트 분석
 
     Args:
-        text: 메시지 텍스트
+        messages: 메시지 리스트
+        prioritize_direct: 호환용 인자 (효과 없음 - top_bullish/bearish는 항상 직접 매칭 우선)
 
     Returns:
-        분류 결과
+        센티먼트 분석 결과
     """
-    rumor_hits = [ind for ind in RUMOR_INDICATORS if ind in text]
-    fact_hits = [ind for ind in FACT_INDICATORS if ind in text]
+    aggregator = SentimentAggregator()
+    for msg in messages:
+        aggregator.add(msg, annotate_message(msg.get("text", "")))
+    return aggregator.result()
 
-    rumor_score = len(rumor_hits)
-    fact_score = len(fact_hits)
-    total = rumor_score + fact_score
 
-    if total == 0:
+def _rumor_result(record: MessageRecord) -> dict:
+    fact_ratio = record.fact_ratio
+    if fact_ratio is None:
         return {
             "is_rumor": False,
             "confidence": 0.5,
             "indicators": [],
         }
 
-    fact_ratio = fact_score / total
-
     return {
         "is_rumor": fact_ratio < 0.5,
         "confidence": max(fact_ratio, 1 - fact_ratio),
         "indicators": {
-            "rumor": rumor_hits,
-            "fact": fact_hits,
+            "rumor": record.rumor,
+            "fact": record.fact,
         },
     }
 
 
+def classify_rumor(text: str) -> dict:
+    """
+    메시지를 루머 vs 팩트로 분류
+
+    Args:
+        text: 메시지 텍스트
+
+    Returns:
+        분류 결과
+    """
+    return _rumor_result(annotate_message(text))
+
+
+def count_themes(messages: List[dict]) -> Dict[str, int]:
+    """테마 매칭 메시지의 매칭 키워드별 건수"""
+    theme_counts: Dict[str, int] = {}
+    for msg in messages:
+        if msg.get("match_type") == "theme":
+            kw = msg.get("matched_keyword", "기타")
+            theme_counts[kw] = theme_counts.get(kw, 0) + 1
+    return theme_counts
+
+
+class MessageClassifier:
+    """
+    수집 메시지 단일 패스 분류
+
+    메시지마다 키워드 스캔을 한 번만 하고(annotate_message) 그 결과로
+    스팸 제거, 전체/소스별 센티먼트, 루머/팩트, 테마별 건수를 함께 집계한다.
+    메시지 dict는 복사하지 않으며, 루머/팩트 샘플(top_n개)만 신뢰도를 붙인 사본을 만든다.
+    """
+
+    def __init__(self, top_n: int = 10):
+        """
+        Args:
+            top_n: 보관할 루머/팩트 샘플 수
+        """
+        self.top_n = top_n
+        self.messages: List[dict] = []
+        self.spam_count = 0
+        self.rumor_count = 0
+        self.rumors: List[dict] = []
+        self.facts: List[dict] = []
+        self.theme_counts: Dict[str, int] = {}
+        self.sentiment = SentimentAggregator()
+        self.source_sentiment: Dict[str, SentimentAggregator] = {}
+
+    def add(self, msg: dict) -> MessageRecord:
+        """
+        메시지 1건 분류 및 집계 반영
+
+        Args:
+            msg: 메시지
+
+        Returns:
+            MessageRecord (스팸이면 집계에서 제외)
+        """
+        record = annotate_message(msg.get("text", ""))
+        if record.spam:
+            self.spam_count += 1
+            return record
+
+        self.messages.append(msg)
+        self.sentiment.add(msg, record)
+        source = msg.get("source", "unknown")
+        if source not in self.source_sentiment:
+            self.source_sentiment[source] = SentimentAggregator()
+        self.source_sentiment[source].add(msg, record)
+
+        fact_ratio = record.fact_ratio
+        if fact_ratio is not None and fact_ratio < 0.5:
+            self.rumor_count += 1
+            if len(self.rumors) < self.top_n:
+                self.rumors.append({**msg, "rumor_confidence": max(fact_ratio, 1 - fact_ratio)})
+        elif len(self.facts) < self.top_n:
+            confidence = 0.5 if fact_ratio is None else max(fact_ratio, 1 - fact_ratio)
+            self.facts.append({**msg, "fact_confidence": confidence})
+
+        if msg.get("match_type") == "theme":
+            kw = msg.get("matched_keyword", "기타")
+            self.theme_counts[kw] = self.theme_counts.get(kw, 0) + 1
+        return record
+
+    def extend(self, messages: List[dict]) -> None:
+        """메시지 여러 건 분류"""
+        for msg in messages:
+            self.add(msg)
+
+    def result(self) -> dict:
+        """
+        Returns:
+            {
+                "messages": 스팸 제외 메시지 (원본 dict),
+                "spam_count", "rumor_count",
+                "sentiment": 전체 센티먼트 (메시지 없으면 {}),
+                "source_sentiment": {소스: 센티먼트},
+                "rumors", "facts": 샘플 (top_n개),
+                "theme_counts": {테마 키워드: 건수},
+            }
+        """
+        return {
+            "messages": self.messages,
+            "spam_count": self.spam_count,
+            "rumor_count": self.rumor_count,
+            "sentiment": self.sentiment.result() if self.messages else {},
+            "source_sentiment": {
+                source: aggregator.result() for source, aggregator in self.source_sentiment.items()
+            },
+            "rumors": self.rumors,
+            "facts": self.facts,
+            "theme_counts": self.theme_counts,
+        }
+
+
 def get_sentiment_label(score: float) -> str:
     """센티먼트 점수를 레이블로 변환"""
     if score >= 0.3:
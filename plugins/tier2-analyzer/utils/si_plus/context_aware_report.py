@@ -15,8 +15,9 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 load_dotenv(Path.cwd() / ".env")
 
+from .message_archive import MessageArchive
 from .unified_collector import collect_all_sources
-from .base import analyze_sentiment, get_sentiment_label
+from .base import analyze_sentiment, count_themes, get_sentiment_label
 from .context_extractor import (
     StockContext,
     extract_context_from_analysis,
@@ -83,6 +84,7 @@ async def generate_context_aware_report(
         enable_reddit=True,
         enable_naver=True,
         limit_per_source=100,
+        archive=MessageArchive(),  # 재실행 시 지난 수집 이후 메시지만 받음
     )
 
     # 4. 리포트 생성
@@ -265,11 +267,9 @@ def _generate_narrative_report(ctx: StockContext, result: Dict) -> str:
     lines.append("")
 
     all_messages = combined.get("messages", [])
-    theme_counts = {}
-    for msg in all_messages:
-        if msg.get("match_type") == "theme":
-            kw = msg.get("matched_keyword", "기타")
-            theme_counts[kw] = theme_counts.get(kw, 0) + 1
+    theme_counts = combined.get("theme_counts")
+    if theme_counts is None:
+        theme_counts = count_themes(all_messages)
 
     if theme_counts:
         lines.append("| 테마 | 언급 수 | 비중 |")
@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import Optional, Dict, List
 from dataclasses import dataclass
 
+from .ticker_resolver import resolve_aliases
+
 
 @dataclass
 class StockContext:
@@ -202,7 +204,11 @@ def _generate_aliases(stock_name: str, ticker: str) -> List[str]:
         aliases.append(stock_name.replace('케이', 'K'))
         aliases.append(stock_name.replace('케이', 'K-'))
 
-    return aliases
+    # 종목 마스터의 종목명/약칭 (예: 삼성전자 -> 삼전)
+    if ticker:
+        aliases.extend(resolve_aliases(ticker))
+
+    return list(dict.fromkeys(a for a in aliases if a))
 
 
 def _extract_summary(content: str) -> str:
@@ -0,0 +1,143 @@
+"""SI+ 다중 키워드 매처
+
+센티먼트(상승/하락), 루머/팩트 지표, 스팸 패턴처럼 여러 키워드 목록을
+텍스트 한 번 훑기로 모두 찾는다 (키워드마다 `kw in text`를 반복하지 않음).
+- pyahocorasick 설치 시: Aho-Corasick 오토마톤
+- 미설치 시: 전체 키워드를 긴 것부터 묶은 정규식 하나 (모든 위치에서 lookahead로 매칭해 겹치는 키워드도 찾음)
+결과는 `kw in text`와 같다: 카테고리별로 텍스트에 포함된 키워드를 선언 순서대로 반환.
+"""
+
+import functools
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# (카테고리, 카테고리 내 순서, 원래 키워드, 대소문자 구분 여부)
+_Target = Tuple[str, int, str, bool]
+
+
+class KeywordMatcher:
+    """카테고리별 키워드 목록을 한 번에 찾는 매처"""
+
+    def __init__(
+        self,
+        categories: Dict[str, Iterable[str]],
+        ignore_case: Iterable[str] = (),
+        use_automaton: Optional[bool] = None,
+    ):
+        """
+        Args:
+            categories: {카테고리: 키워드 목록}
+            ignore_case: 대소문자를 무시할 카테고리 (예: 스팸 URL 패턴)
+            use_automaton: Aho-Corasick 사용 여부 (None이면 설치 여부에 따름)
+        """
+        ignore_case = set(ignore_case)
+        self.categories = {name: list(keywords) for name, keywords in categories.items()}
+        self.use_automaton = AHOCORASICK_AVAILABLE if use_automaton is None else use_automaton
+        if self.use_automaton and not AHOCORASICK_AVAILABLE:
+            raise ImportError("pyahocorasick is not installed")
+
+        # 소문자 키 → 해당 키에 걸리는 (카테고리, 순서, 키워드, 대소문자 구분)
+        self._targets: Dict[str, List[_Target]] = {}
+        for name, keywords in self.categories.items():
+            for index, keyword in enumerate(keywords):
+                if keyword:
+                    self._targets.setdefault(keyword.lower(), []).append(
+                        (name, index, keyword, name not in ignore_case)
+                    )
+
+        self._pattern = None
+        # 위치마다 가장 긴 키만 잡히므로, 같은 위치에서 시작하는 더 짧은 키(접두어)를 함께 후보로
+        self._prefixes: Dict[str, List[str]] = {
+            key: [other for other in self._targets if key.startswith(other)] for key in self._targets
+        }
+        if self._targets:
+            keys = sorted(self._targets, key=len, reverse=True)
+            first_chars = "".join(sorted({re.escape(key[0]) for key in keys}))
+            # 첫 글자 문자 클래스로 키워드가 시작할 수 없는 위치를 빠르게 건너뜀
+            self._pattern = re.compile(f"(?=[{first_chars}])(?=({'|'.join(map(re.escape, keys))}))")
+
+        self._automaton = None
+        if self.use_automaton and self._targets:
+            self._automaton = ahocorasick.Automaton()
+            for key in self._targets:
+                self._automaton.add_word(key, key)
+            self._automaton.make_automaton()
+
+    def _scan_regex(self, text: str, lowered: str) -> Dict[str, List[str]]:
+        """
+        오토마톤 없이 정규식 한 번 훑기
+
+        소문자 텍스트에 포함된 키를 모두 찾은 뒤, 대소문자 구분 키워드만 원문에서 `kw in text`로 확인
+        """
+        found = set()
+        if self._pattern is not None:
+            prefixes = self._prefixes
+            for key in set(self._pattern.findall(lowered)):
+                for candidate in prefixes[key]:
+                    for target in self._targets[candidate]:
+                        if not target[3] or target[2] in text:
+                            found.add(target)
+        return self._collect(found)
+
+    def _collect(self, found) -> Dict[str, List[str]]:
+        """찾은 (카테고리, 순서, 키워드, ...) → {카테고리: 선언 순서 키워드}"""
+        hits: Dict[str, List[str]] = {name: [] for name in self.categories}
+        for name, index, keyword, _ in sorted(found, key=lambda t: (t[0], t[1])):
+            hits[name].append(keyword)
+        return hits
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """
+        텍스트 한 번 훑기로 모든 카테고리 키워드 검색
+
+        Args:
+            text: 메시지 텍스트
+
+        Returns:
+            {카테고리: [포함된 키워드 (선언 순서, 중복 없음)]}
+        """
+        lowered = text.lower()
+        # 소문자 변환으로 길이가 바뀌는 문자(예: 'İ')가 있으면 위치가 어긋나므로 정규식 경로 사용 (위치 무관)
+        if self._automaton is None or len(lowered) != len(text):
+            return self._scan_regex(text, lowered)
+
+        found = set()
+        for end, key in self._automaton.iter(lowered):
+            start = end - len(key) + 1
+            for target in self._targets[key]:
+                if target in found:
+                    continue
+                _, _, keyword, case_sensitive = target
+                if case_sensitive and text[start:start + len(keyword)] != keyword:
+                    continue
+                found.add(target)
+        return self._collect(found)
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_matcher() -> KeywordMatcher:
+    """base 모듈 키워드 목록(상승/하락/루머/팩트/스팸)으로 만든 공용 매처 (최초 호출 시 생성)"""
+    from .base import (
+        BULLISH_KEYWORDS,
+        BEARISH_KEYWORDS,
+        RUMOR_INDICATORS,
+        FACT_INDICATORS,
+        SPAM_PATTERNS,
+    )
+
+    return KeywordMatcher(
+        {
+            "bullish": BULLISH_KEYWORDS,
+            "bearish": BEARISH_KEYWORDS,
+            "rumor": RUMOR_INDICATORS,
+            "fact": FACT_INDICATORS,
+            "spam": SPAM_PATTERNS,
+        },
+        ignore_case=("spam",),
+    )
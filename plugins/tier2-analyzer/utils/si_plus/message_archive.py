@@ -0,0 +1,297 @@
+"""SI+ 메시지 아카이브 (SQLite)
+
+수집한 메시지를 (source, key)로 저장하고, 검색 범위(scope)별로
+마지막으로 받은 메시지 id(high-water mark)를 기록한다.
+다음 수집은 그 이후 메시지만 받아 아카이브와 합친다.
+- 텔레그램: scope = "채널/키워드", 다음 검색은 min_id 이후만
+- 네이버: scope = 종목코드(토론방), 다음 수집은 이미 받은 게시물에 닿으면 중단
+- 본문 전문 검색: FTS5 trigram 인덱스 (띄어쓰기 없는 한국어도 부분 문자열로 매칭)
+  FTS5/trigram이 없는 SQLite이거나 3글자 미만 검색어는 본문 전체 스캔
+- 저장 위치: local/cache/si_plus_messages.sqlite (TIER2_ANALYZER_CACHE_DIR 환경 변수로 변경)
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from ..fi_plus.fnguide.page_cache import get_cache_dir
+
+DB_FILE = "si_plus_messages.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    seq INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    num_id INTEGER,
+    date TEXT,
+    text TEXT,
+    data TEXT NOT NULL,
+    UNIQUE (source, key)
+);
+CREATE TABLE IF NOT EXISTS scope_messages (
+    source TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (source, scope, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS watermarks (
+    source TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    last_id INTEGER NOT NULL,
+    updated_at TEXT,
+    PRIMARY KEY (source, scope)
+) WITHOUT ROWID;
+"""
+
+# messages.seq를 rowid로 쓰는 external content 인덱스 (본문은 messages에만 저장)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE messages_fts USING fts5(
+    text, content='messages', content_rowid='seq', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text) VALUES (new.seq, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.seq, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF text ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.seq, old.text);
+    INSERT INTO messages_fts (rowid, text) VALUES (new.seq, new.text);
+END;
+"""
+
+# trigram 토크나이저는 3글자 미만 검색어를 매칭하지 못함
+FTS_MIN_QUERY_LENGTH = 3
+
+UPSERT_SQL = """
+INSERT INTO messages (source, key, num_id, date, text, data) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (source, key) DO UPDATE SET
+    num_id = excluded.num_id, date = excluded.date, text = excluded.text, data = excluded.data
+"""
+
+
+def telegram_scope(channel: str, keyword: str) -> str:
+    """텔레그램 검색 범위 키"""
+    return f"{channel}/{keyword}"
+
+
+def message_key(msg: dict) -> str:
+    """
+    소스 내 메시지 고유 키
+
+    텔레그램 message id는 채널별로 매겨지므로 채널을 붙인다.
+    """
+    if msg.get("source") == "telegram":
+        return f"{msg.get('channel')}/{msg.get('id')}"
+    return str(msg.get("id"))
+
+
+def _num_id(msg: dict) -> Optional[int]:
+    try:
+        return int(msg.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
+class MessageArchive:
+    """수집 메시지 저장소 + 검색 범위별 high-water mark"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: local/cache/si_plus_messages.sqlite)
+        """
+        self.path = Path(path) if path else get_cache_dir() / DB_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            self.fts = self._init_fts(conn)
+
+    @staticmethod
+    def _init_fts(conn: sqlite3.Connection) -> bool:
+        """
+        전문 검색 인덱스 준비 (없으면 만들고 기존 메시지로 채움)
+
+        Returns:
+            FTS5 trigram 인덱스 사용 가능 여부
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            # FTS5 미포함 빌드 또는 trigram 미지원 (SQLite < 3.34)
+            return False
+        conn.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+        return True
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 (스레드 간 공유 없음), 정상 종료 시 commit"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def watermark(self, source: str, scope: str) -> Optional[int]:
+        """
+        검색 범위의 마지막 수집 메시지 id
+
+        Returns:
+            id or None (수집 기록 없음)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_id FROM watermarks WHERE source = ? AND scope = ?", (source, scope)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, source: str, scope: str, messages: List[dict], complete: bool = True) -> int:
+        """
+        수집 결과 저장 + high-water mark 갱신 (한 트랜잭션)
+
+        Args:
+            source: "telegram" / "naver" / "reddit"
+            scope: 검색 범위 (telegram_scope(), 네이버는 종목코드)
+            messages: 이번에 받은 메시지 (이미 있는 메시지는 조회수 등 갱신)
+            complete: 수집이 오류 없이 끝났는지. False면 메시지만 저장하고
+                high-water mark/확인 시각은 그대로 둔다 (다음 수집이 빠진 구간부터 다시 받도록)
+
+        Returns:
+            이 범위에 새로 추가된 메시지 수
+        """
+        rows = [
+            (source, message_key(msg), _num_id(msg), msg.get("date"), msg.get("text"),
+             json.dumps(msg, ensure_ascii=False, default=str))
+            for msg in messages
+        ]
+        ids = [row[2] for row in rows if row[2] is not None]
+        with self._connect() as conn:
+            conn.executemany(UPSERT_SQL, rows)
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO scope_messages (source, scope, key) VALUES (?, ?, ?)",
+                [(source, scope, row[1]) for row in rows],
+            )
+            added = conn.total_changes - before
+            if not complete:
+                return added
+            now = datetime.now().isoformat(timespec="seconds")
+            if ids:
+                conn.execute(
+                    "INSERT INTO watermarks (source, scope, last_id, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (source, scope) DO UPDATE SET "
+                    "last_id = max(last_id, excluded.last_id), updated_at = excluded.updated_at",
+                    (source, scope, max(ids), now),
+                )
+            else:
+                # 새 메시지가 없어도 확인한 시각은 갱신
+                conn.execute(
+                    "UPDATE watermarks SET updated_at = ? WHERE source = ? AND scope = ?",
+                    (now, source, scope),
+                )
+        return added
+
+    def is_fresh(self, source: str, scope: str, max_age: float) -> bool:
+        """
+        검색 범위를 max_age초 이내에 수집했는지 (네트워크 요청 생략 판단용)
+
+        Args:
+            source: 소스
+            scope: 검색 범위
+            max_age: 허용 경과 시간 (초, 0 이하면 항상 False)
+        """
+        if max_age <= 0:
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT updated_at FROM watermarks WHERE source = ? AND scope = ?", (source, scope)
+            ).fetchone()
+        if not row or not row[0]:
+            return False
+        return (datetime.now() - datetime.fromisoformat(row[0])).total_seconds() <= max_age
+
+    def get_messages(self, source: str, scope: str, limit: Optional[int] = None) -> List[dict]:
+        """
+        검색 범위에 저장된 메시지 (최신 id 순)
+
+        Args:
+            source: 소스
+            scope: 검색 범위
+            limit: 최대 메시지 수 (None이면 전체)
+
+        Returns:
+            메시지 dict 리스트
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT m.data FROM scope_messages s "
+                "JOIN messages m ON m.source = s.source AND m.key = s.key "
+                "WHERE s.source = ? AND s.scope = ? "
+                "ORDER BY m.num_id DESC, m.date DESC LIMIT ?",
+                (source, scope, -1 if limit is None else limit),
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def search(
+        self,
+        query: str,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+        **fields,
+    ) -> List[dict]:
+        """
+        저장된 전체 메시지 본문 검색 (대소문자 무시 부분 문자열, 최신 id 순)
+
+        Args:
+            query: 검색어
+            source: 소스 (None이면 전체)
+            limit: 최대 메시지 수 (None이면 전체)
+            **fields: 메시지 필드 값 조건 (예: channel="siglab", ticker="005930")
+
+        Returns:
+            메시지 dict 리스트
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if self.fts and len(query) >= FTS_MIN_QUERY_LENGTH:
+            # 검색어 전체를 하나의 구(phrase)로 매칭
+            where = ["m.seq IN (SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?)"]
+            params: list = ['"' + query.replace('"', '""') + '"']
+        else:
+            where = ["instr(lower(m.text), lower(?)) > 0"]
+            params = [query]
+        if source is not None:
+            where.append("m.source = ?")
+            params.append(source)
+        for name, value in fields.items():
+            where.append("json_extract(m.data, ?) = ?")
+            params.extend([f"$.{name}", value])
+        params.append(-1 if limit is None else limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT m.data FROM messages m WHERE {' AND '.join(where)} "
+                "ORDER BY m.num_id DESC, m.date DESC LIMIT ?",
+                params,
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def count(self, source: Optional[str] = None) -> int:
+        """저장된 메시지 수"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT count(*) FROM messages WHERE ? IS NULL OR source = ?", (source, source)
+            ).fetchone()[0]
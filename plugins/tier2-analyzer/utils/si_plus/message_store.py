@@ -0,0 +1,247 @@
+"""SI+ 컬럼형 메시지 저장소
+
+수집기가 만든 메시지 dict 리스트를 컬럼(pandas) 단위로 보관한다.
+- source/channel/keyword/match_type처럼 반복되는 문자열: 범주형(dictionary encoding)
+- text/date/url 등 나머지 문자열: Arrow 문자열 배열 (pyarrow 없으면 object)
+- 정수만 있는 컬럼: nullable Int64, 실수만 있는 컬럼: float64
+- 그 밖의 값(정수/실수 혼합, bool, dict 등): object 그대로
+메시지마다 dict + 키 문자열을 들고 있지 않으므로 수십만 건도 메모리가 작고,
+건수 집계는 pandas group-by로 한 번에 계산한다.
+
+MessageStore는 Sequence라서 기존 메시지 리스트처럼 len/인덱싱/슬라이싱/for 순회가 된다.
+순회/인덱싱 시 행마다 새 dict를 만들어 돌려주며, 키가 없던 메시지는 컬럼별 마스크로 기억해
+원래 dict와 같은 키/값(None 값 포함)을 돌려준다.
+"""
+
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRINGS = True
+except ImportError:
+    ARROW_STRINGS = False
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 범주형으로 저장
+CATEGORY_RATIO = 0.5
+
+
+# 메시지에 키가 없음을 나타내는 표식 (값 None과 구분)
+_MISSING = object()
+
+
+def _encode(values: list):
+    """
+    컬럼 값 리스트 → pandas 배열 (None은 결측)
+
+    디코딩했을 때 원래 값/타입이 그대로 나오는 형식만 쓰고, 아니면 object로 보관한다.
+    """
+    present = [v for v in values if v is not None]
+    types = {type(v) for v in present}
+    if types == {int}:
+        try:
+            return pd.array(values, dtype="Int64")
+        except (OverflowError, TypeError):
+            pass  # int64 범위 밖
+    elif types == {float} and all(v == v for v in present):
+        # NaN 값이 있으면 None(결측)과 구분되지 않으므로 object로
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    elif types == {str}:
+        if len(set(present)) <= len(values) * CATEGORY_RATIO:
+            return pd.Categorical(values)
+        if ARROW_STRINGS:
+            return pd.array(values, dtype="string[pyarrow]")
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _decode(series: pd.Series) -> list:
+    """컬럼 → 파이썬 값 리스트 (결측은 None)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories.tolist()
+        return [categories[code] if code >= 0 else None for code in series.cat.codes.tolist()]
+    if series.dtype == np.float64:
+        return [None if v != v else v for v in series.tolist()]
+    if series.dtype == object:
+        return series.tolist()
+    return series.to_numpy(dtype=object, na_value=None).tolist()
+
+
+class MessageStore(Sequence):
+    """컬럼형 메시지 컬렉션 (메시지 dict 리스트와 같은 순회 API)"""
+
+    def __init__(
+        self,
+        frame: Optional[pd.DataFrame] = None,
+        absent: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            frame: 메시지 컬럼 DataFrame (보통 from_messages/concat으로 생성)
+            absent: 컬럼별 키 없음 마스크 (bool 배열, 모든 메시지에 있는 컬럼은 생략)
+        """
+        self._frame = frame if frame is not None else pd.DataFrame()
+        self._absent = absent or {}
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[dict]) -> "MessageStore":
+        """
+        메시지 dict 리스트 → MessageStore
+
+        Args:
+            messages: 메시지 dict 리스트 (키 구성이 달라도 됨 - 없는 키는 결측)
+
+        Returns:
+            MessageStore
+        """
+        if isinstance(messages, MessageStore):
+            return messages
+        messages = list(messages)
+        columns: Dict[str, None] = {}
+        for msg in messages:
+            for key in msg:
+                columns.setdefault(key)
+
+        data = {}
+        absent = {}
+        for key in columns:
+            values = [msg.get(key, _MISSING) for msg in messages]
+            mask = np.fromiter((v is _MISSING for v in values), dtype=bool, count=len(values))
+            if mask.any():
+                absent[key] = mask
+                values = [None if v is _MISSING else v for v in values]
+            data[key] = _encode(values)
+        return cls(pd.DataFrame(data, index=pd.RangeIndex(len(messages))), absent)
+
+    @classmethod
+    def concat(cls, stores: Iterable["MessageStore"]) -> "MessageStore":
+        """
+        여러 저장소를 하나로 (범주형 컬럼은 카테고리 합집합으로 유지)
+
+        Args:
+            stores: MessageStore 또는 메시지 리스트
+
+        Returns:
+            MessageStore
+        """
+        stores = [cls.from_messages(store) for store in stores]
+        stores = [store for store in stores if len(store)]
+        if not stores:
+            return cls()
+
+        data = {}
+        absent = {}
+        for name in dict.fromkeys(column for store in stores for column in store.columns):
+            parts = [store.frame[name] if name in store.frame else None for store in stores]
+            mask = np.concatenate([store._absent_mask(name) for store in stores])
+            if mask.any():
+                absent[name] = mask
+            dtypes = {str(part.dtype) for part in parts if part is not None}
+            if all(part is not None for part in parts) and len(dtypes) == 1:
+                if dtypes == {"category"}:
+                    data[name] = union_categoricals([part.array for part in parts])
+                else:
+                    data[name] = pd.concat(parts, ignore_index=True).array
+                continue
+            # 컬럼이 없는 저장소가 있거나 저장 형식이 다르면 값으로 다시 인코딩
+            values = []
+            for store, part in zip(stores, parts):
+                values.extend(_decode(part) if part is not None else [None] * len(store))
+            data[name] = _encode(values)
+        return cls(pd.DataFrame(data, index=pd.RangeIndex(sum(len(store) for store in stores))), absent)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """컬럼 DataFrame (벡터 연산/집계용, 수정하지 말 것)"""
+        return self._frame
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._frame.columns)
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._take(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MessageStore index out of range")
+        return next(iter(self._take(slice(index, index + 1))))
+
+    def __iter__(self) -> Iterator[dict]:
+        names = self.columns
+        values = [_decode(self._frame[name]) for name in names]
+        if not self._absent:
+            for row in zip(*values):
+                yield dict(zip(names, row))
+            return
+        masks = [self._absent_mask(name).tolist() for name in names]
+        for row, row_absent in zip(zip(*values), zip(*masks)):
+            yield {name: value for name, value, missing in zip(names, row, row_absent) if not missing}
+
+    def __repr__(self) -> str:
+        return f"MessageStore({len(self)} messages, columns={self.columns})"
+
+    def _absent_mask(self, name: str) -> np.ndarray:
+        """컬럼의 키 없음 마스크 (컬럼 자체가 없으면 전부 True)"""
+        if name not in self._frame:
+            return np.ones(len(self), dtype=bool)
+        mask = self._absent.get(name)
+        return mask if mask is not None else np.zeros(len(self), dtype=bool)
+
+    def _take(self, rows) -> "MessageStore":
+        """행 선택 (slice 또는 bool 마스크)"""
+        frame = self._frame.iloc[rows] if isinstance(rows, slice) else self._frame[rows]
+        absent = {name: mask[rows] for name, mask in self._absent.items()}
+        return MessageStore(frame.reset_index(drop=True), {k: v for k, v in absent.items() if v.any()})
+
+    def to_messages(self) -> List[dict]:
+        """메시지 dict 리스트로 변환"""
+        return list(self)
+
+    def filter(self, **equals) -> "MessageStore":
+        """
+        컬럼 값이 일치하는 메시지만
+
+        Args:
+            **equals: 컬럼=값 (예: match_type="theme")
+
+        Returns:
+            MessageStore
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in equals.items():
+            if column not in self._frame:
+                return self._take(slice(0, 0))
+            mask &= (self._frame[column] == value).fillna(False).to_numpy(dtype=bool)
+        return self._take(mask)
+
+    def count_by(self, column: str, **equals) -> Dict[object, int]:
+        """
+        컬럼 값별 메시지 수 (group-by)
+
+        Args:
+            column: 집계 컬럼 (예: "source", "matched_keyword")
+            **equals: 사전 필터 (filter와 동일)
+
+        Returns:
+            {값: 건수} (건수 내림차순, 결측 제외)
+        """
+        store = self.filter(**equals) if equals else self
+        if column not in store.frame:
+            return {}
+        counts = store.frame[column].value_counts(sort=True)
+        return {value: int(count) for value, count in counts.items() if count > 0}
+
+    def memory_usage(self) -> int:
+        """컬럼 데이터 메모리 (bytes)"""
+        masks = sum(mask.nbytes for mask in self._absent.values())
+        return int(self._frame.memory_usage(index=True, deep=True).sum()) + masks
@@ -5,30 +5,53 @@
 - 뉴스 댓글
 """
 import re
-import time
-import requests
 from typing import Optional, List, Dict
 from bs4 import BeautifulSoup
 
-from .base import BaseCollector
+from ..http_client import http_get, get_session
+from .base import BaseCollector, run_blocking
+from .message_archive import MessageArchive
 
 # 네이버 금융 설정
 FINANCE_URL = "https://finance.naver.com"
 MOBILE_URL = "https://m.stock.naver.com"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+REQUEST_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+# 아카이브 사용 시 이 시간(초) 안에 수집한 토론방은 네트워크 없이 아카이브로 응답
+ARCHIVE_FRESH_SECONDS = 600
+
+# 지난 수집 이후 게시물을 받을 때 1회 최대 페이지 수 (페이지당 20개)
+# (limit와 무관하게 지난 수집 게시물까지 받고, 이 수를 넘으면 watermark를 올리지 않음)
+CATCHUP_MAX_PAGES = 50
 
 
 class NaverCollector(BaseCollector):
-    """네이버 금융 수집기"""
+    """네이버 금융 수집기
+
+    archive를 주면 종목 토론방별로 지난 수집 때 받은 게시물에 닿을 때까지만
+    페이지를 받고, 나머지는 아카이브에서 채운다. fresh_seconds 안에 수집한
+    토론방은 페이지를 받지 않고, 키워드 검색은 아카이브 전문 검색으로 답한다.
+    지난 수집 이후 게시물은 limit와 무관하게 catchup_pages 페이지까지 받고,
+    지난 수집 게시물에 닿지 못하면 watermark를 올리지 않는다.
+    """
 
     source_name = "naver"
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": USER_AGENT,
-            "Accept-Language": "ko-KR,ko;q=0.9",
-        })
+    def __init__(
+        self,
+        archive: Optional[MessageArchive] = None,
+        fresh_seconds: float = ARCHIVE_FRESH_SECONDS,
+        catchup_pages: int = CATCHUP_MAX_PAGES,
+    ):
+        # 호스트별 공유 세션 (커넥션 풀 재사용, rate limit은 http_get이 적용)
+        self.session = get_session("finance.naver.com")
+        self.archive = archive
+        self.fresh_seconds = fresh_seconds
+        self.catchup_pages = catchup_pages
 
     def get_discussion_board(
         self,
@@ -43,13 +66,25 @@ class NaverCollector(BaseCollector):
             limit: 최대 게시물 수
 
         Returns:
-            게시물 리스트
+            게시물 리스트 (archive 사용 시 아카이브 포함 최신 limit개)
         """
+        if self.archive is not None and self.archive.is_fresh("naver", ticker, self.fresh_seconds):
+            archived = self.archive.get_messages("naver", ticker, limit)
+            if len(archived) >= limit:
+                return archived
+
         messages = []
+        complete = True
         page = 1
         max_pages = (limit // 20) + 1
-
-        while len(messages) < limit and page <= max_pages:
+        # 지난 수집의 마지막 게시물 id (nid는 작성 순으로 증가)
+        known_id = self.archive.watermark("naver", ticker) if self.archive is not None else None
+        # 지난 수집이 있으면 limit와 무관하게 그 게시물에 닿을 때까지 받음 (중간을 건너뛰지 않도록)
+        reached = known_id is None
+        if known_id is not None:
+            max_pages = max(max_pages, self.catchup_pages)
+
+        while (known_id is not None or len(messages) < limit) and page <= max_pages:
             try:
                 url = f"{FINANCE_URL}/item/board.naver"
                 params = {
@@ -57,17 +92,22 @@ class NaverCollector(BaseCollector):
                     "page": page,
                 }
 
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
+                response = http_get(
+                    url, params=params, headers=REQUEST_HEADERS,
+                    timeout=10, session=self.session,
+                )
 
                 soup = BeautifulSoup(response.text, "html.parser")
 
                 # 토론방 게시물 파싱
                 table = soup.select_one("table.type2")
                 if not table:
+                    # 첫 페이지부터 없으면 오류 페이지, 이후 페이지면 토론방 끝
+                    complete = reached = page > 1
                     break
 
                 rows = table.select("tbody tr")
+                oldest_id = None
 
                 for row in rows:
                     try:
@@ -96,8 +136,14 @@ class NaverCollector(BaseCollector):
                         good_elem = cols[4]
                         good = self._parse_number(good_elem.get_text(strip=True))
 
+                        post_id = self._extract_post_id(href)
+                        if known_id is not None and post_id.isdigit():
+                            oldest_id = int(post_id)
+                            if oldest_id <= known_id:
+                                continue
+
                         messages.append({
-                            "id": self._extract_post_id(href),
+                            "id": post_id,
                             "text": title,
                             "title": title,
                             "date": self._normalize_date(date),
@@ -112,13 +158,25 @@ class NaverCollector(BaseCollector):
                         continue
 
                 page += 1
-                time.sleep(0.3)
+                # 페이지 마지막 게시물이 이미 받은 게시물이면 그 뒤 페이지도 모두 받은 것
+                if oldest_id is not None and oldest_id <= known_id:
+                    reached = True
+                    break
 
             except Exception as e:
                 print(f"[Naver] Error fetching discussion board for {ticker}: {e}")
+                complete = False
                 break
 
-        return messages[:limit]
+        if self.archive is None:
+            return messages[:limit]
+        if complete and not reached:
+            print(f"[Naver] {ticker}: 지난 수집 이후 게시물이 {max_pages}페이지를 넘어 "
+                  "watermark 유지 (다음 수집에서 다시 받음)")
+        # 중간에 실패하거나 지난 수집 게시물에 닿지 못하면 받은 게시물만 저장
+        # (watermark를 올리면 못 받은 페이지가 영영 빠짐)
+        self.archive.record("naver", ticker, messages, complete=complete and reached)
+        return self.archive.get_messages("naver", ticker, limit)
 
     def search_discussions(
         self,
@@ -132,6 +190,8 @@ class NaverCollector(BaseCollector):
         Note: 네이버 종토방은 종목별로 분리되어 있어서
               특정 키워드 검색이 제한적입니다.
               ticker가 주어지면 해당 종목 토론방에서 필터링합니다.
+              archive 사용 시 토론방 최신 게시물만 갱신하고 지금까지 저장된
+              게시물 전체에서 검색하며, ticker 없이도 저장된 게시물에서 검색합니다.
 
         Args:
             query: 검색 쿼리
@@ -141,6 +201,12 @@ class NaverCollector(BaseCollector):
         Returns:
             검색 결과 리스트
         """
+        if self.archive is not None:
+            if ticker:
+                self.get_discussion_board(ticker, limit=limit * 2)
+                return self.archive.search(query, source="naver", limit=limit, ticker=ticker)
+            return self.archive.search(query, source="naver", limit=limit)
+
         if ticker:
             # 종목 토론방에서 키워드 필터링
             all_posts = self.get_discussion_board(ticker, limit=limit * 2)
@@ -173,8 +239,8 @@ class NaverCollector(BaseCollector):
         """
         all_messages = []
 
-        # 1. 종목 토론방 전체 게시물
-        board_posts = self.get_discussion_board(ticker, limit=limit_per_keyword)
+        # 1. 종목 토론방 전체 게시물 (블로킹 스크래핑은 스레드 풀에서)
+        board_posts = await run_blocking(self.get_discussion_board, ticker, limit=limit_per_keyword)
 
         for post in board_posts:
             post["match_type"] = "direct"
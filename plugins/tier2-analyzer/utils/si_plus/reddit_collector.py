@@ -4,11 +4,10 @@ Reddit API를 사용한 서브레딧 게시물/댓글 수집
 - 무료 API (rate limit 있음)
 - 인증 없이 public 데이터 접근 가능
 """
-import time
-import requests
 from typing import Optional, List, Dict
 
-from .base import BaseCollector
+from ..http_client import http_get, get_session
+from .base import BaseCollector, run_blocking
 
 # Reddit API 설정
 BASE_URL = "https://www.reddit.com"
@@ -29,8 +28,8 @@ class RedditCollector(BaseCollector):
 
     def __init__(self, subreddits: Optional[List[str]] = None):
         self.subreddits = subreddits or DEFAULT_SUBREDDITS
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": USER_AGENT})
+        # 호스트별 공유 세션 (Reddit 1초 1요청 제한은 http_get의 rate limit이 적용)
+        self.session = get_session("www.reddit.com")
 
     def search_subreddit(
         self,
@@ -65,8 +64,10 @@ class RedditCollector(BaseCollector):
         messages = []
 
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = http_get(
+                url, params=params, headers={"User-Agent": USER_AGENT},
+                timeout=10, session=self.session,
+            )
             data = response.json()
 
             for post in data.get("data", {}).get("children", []):
@@ -86,9 +87,6 @@ class RedditCollector(BaseCollector):
                     "author": post_data.get("author"),
                 })
 
-            # Rate limiting (Reddit은 1초에 1요청 권장)
-            time.sleep(1)
-
         except Exception as e:
             print(f"[Reddit] Error searching '{query}' in r/{subreddit}: {e}")
 
@@ -122,8 +120,10 @@ class RedditCollector(BaseCollector):
         messages = []
 
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = http_get(
+                url, params=params, headers={"User-Agent": USER_AGENT},
+                timeout=10, session=self.session,
+            )
             data = response.json()
 
             for post in data.get("data", {}).get("children", []):
@@ -142,8 +142,6 @@ class RedditCollector(BaseCollector):
                     "author": post_data.get("author"),
                 })
 
-            time.sleep(1)
-
         except Exception as e:
             print(f"[Reddit] Error in global search for '{query}': {e}")
 
@@ -183,7 +181,9 @@ class RedditCollector(BaseCollector):
 
         for keyword in all_keywords:
             # 전체 Reddit 검색 (한국 주식은 여러 서브레딧에 분산)
-            messages = self.search_all(
+            # 블로킹 요청은 스레드 풀에서 실행 (키워드 단위라 취소 시 남은 검색은 생략됨)
+            messages = await run_blocking(
+                self.search_all,
                 query=keyword,
                 limit=limit_per_keyword,
                 time_filter="month",
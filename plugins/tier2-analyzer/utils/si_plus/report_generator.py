@@ -18,8 +18,9 @@ load_dotenv(env_path)
 # cwd에서도 .env 로드 (fallback)
 load_dotenv(Path.cwd() / ".env")
 
+from .message_archive import MessageArchive
 from .unified_collector import collect_all_sources
-from .base import analyze_sentiment, get_sentiment_label
+from .base import analyze_sentiment, count_themes, get_sentiment_label
 
 
 async def generate_report(
@@ -68,6 +69,7 @@ async def generate_report(
         enable_reddit=True,
         enable_naver=True,
         limit_per_source=100,
+        archive=MessageArchive(),  # 재실행 시 지난 수집 이후 메시지만 받음
     )
 
     # 리포트 생성
@@ -164,6 +166,7 @@ async def generate_report(
     lines.append("## 3. 소스별 분석")
     lines.append("")
 
+    source_sentiment = combined.get("source_sentiment", {})
     for source_result in result.get("sources", []):
         source = source_result.get("source", "unknown")
         messages = source_result.get("messages", [])
@@ -171,13 +174,14 @@ async def generate_report(
         if not messages:
             continue
 
-        s_sentiment = analyze_sentiment(messages)
+        # collect()가 집계해 둔 소스별 센티먼트 (스팸 제외) 우선
+        s_sentiment = source_sentiment.get(source) or analyze_sentiment(messages)
         s_label = get_sentiment_label(s_sentiment["score"])
 
         lines.append(f"### {source.capitalize()}")
         lines.append("")
         lines.append(f"- **센티먼트**: {s_label} ({s_sentiment['score']:+.2f})")
-        lines.append(f"- **메시지 수**: {len(messages)}개")
+        lines.append(f"- **메시지 수**: {s_sentiment['total_messages']}개")
         lines.append(f"- **상승/하락/중립**: {s_sentiment['bullish_count']}/{s_sentiment['bearish_count']}/{s_sentiment['neutral_count']}")
         lines.append("")
 
@@ -246,12 +250,10 @@ async def generate_report(
     lines.append("")
 
     # 테마별 메시지 카운트
-    theme_counts = {}
     all_messages = combined.get("messages", [])
-    for msg in all_messages:
-        if msg.get("match_type") == "theme":
-            kw = msg.get("matched_keyword", "기타")
-            theme_counts[kw] = theme_counts.get(kw, 0) + 1
+    theme_counts = combined.get("theme_counts")
+    if theme_counts is None:
+        theme_counts = count_themes(all_messages)
 
     if theme_counts:
         lines.append("| 테마 | 언급 수 |")
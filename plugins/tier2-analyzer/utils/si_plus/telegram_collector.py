@@ -5,7 +5,7 @@ Telethon을 사용한 텔레그램 채널 메시지 수집 및 분석
 """
 import os
 import asyncio
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 
@@ -19,6 +19,7 @@ load_dotenv(Path.cwd() / ".env")
 
 try:
     from telethon import TelegramClient
+    from telethon.errors import FloodWaitError
     from telethon.tl.types import Channel, Message
     TELETHON_AVAILABLE = True
 except ImportError:
@@ -33,10 +34,23 @@ from .base import (
     FACT_INDICATORS,
     analyze_sentiment,
     classify_rumor,
+    run_blocking,
 )
+from .keyword_matcher import KeywordMatcher
+from .message_archive import MessageArchive, telegram_scope
 
 SESSION_NAME = "session_siplus"
 
+# FloodWait가 이 시간(초) 이하면 대기 후 재시도, 초과하면 해당 검색 포기
+FLOOD_WAIT_MAX_SECONDS = 60
+
+# 아카이브 사용 시 이 시간(초) 안에 검색한 (채널, 키워드)는 네트워크 없이 아카이브로 응답
+ARCHIVE_FRESH_SECONDS = 600
+
+# 지난 수집 이후 메시지를 받을 때 검색 1회의 최대 메시지 수
+# (limit와 무관하게 지난 수집 지점까지 받고, 이 수를 넘으면 watermark를 올리지 않음)
+CATCHUP_MAX_MESSAGES = 1000
+
 
 @asynccontextmanager
 async def get_client():
@@ -61,12 +75,63 @@ async def get_client():
 
 
 class TelegramCollector(BaseCollector):
-    """텔레그램 채널 수집기"""
+    """텔레그램 채널 수집기
+
+    collect() 1회 동안 클라이언트 하나만 연결하고(채널 entity도 캐싱),
+    채널×키워드 검색은 max_concurrency 만큼만 동시에 실행한다.
+    archive를 주면 (채널, 키워드)별로 지난 수집 이후(min_id) 메시지만 받아 아카이브와 합치고,
+    아카이브 전문 검색으로 다른 키워드 검색 때 받은 메시지까지 찾아 준다.
+    fresh_seconds 안에 검색한 (채널, 키워드)는 네트워크 요청 없이 아카이브로만 응답한다.
+    지난 수집 이후 메시지는 limit와 무관하게 catchup_messages개까지 받고, 지난 수집 지점에
+    닿지 못하면 watermark를 올리지 않아 다음 수집이 빠진 구간을 다시 받는다.
+    """
 
     source_name = "telegram"
 
-    def __init__(self, channels: Optional[List[str]] = None):
+    def __init__(
+        self,
+        channels: Optional[List[str]] = None,
+        max_concurrency: int = 4,
+        archive: Optional[MessageArchive] = None,
+        fresh_seconds: float = ARCHIVE_FRESH_SECONDS,
+        catchup_messages: int = CATCHUP_MAX_MESSAGES,
+    ):
         self.channels = channels or []
+        self.max_concurrency = max(1, max_concurrency)
+        self.archive = archive
+        self.fresh_seconds = fresh_seconds
+        self.catchup_messages = catchup_messages
+        self._client = None
+        self._entities: Dict[str, object] = {}
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        수집 1회 동안 공유하는 클라이언트 세션
+
+        이미 열린 세션이 있으면 그대로 재사용하고,
+        세션이 닫히면 entity 캐시도 함께 비운다.
+        """
+        if self._client is not None:
+            yield self._client
+            return
+
+        async with get_client() as client:
+            self._client = client
+            self._entities = {}
+            try:
+                yield client
+            finally:
+                self._client = None
+                self._entities = {}
+
+    async def _get_entity(self, client, channel: str):
+        """채널 entity 조회 (세션 내 캐싱)"""
+        entity = self._entities.get(channel)
+        if entity is None:
+            entity = await client.get_entity(channel)
+            self._entities[channel] = entity
+        return entity
 
     async def search_messages(
         self,
@@ -83,38 +148,162 @@ class TelegramCollector(BaseCollector):
             limit: 최대 메시지 수
 
         Returns:
-            매칭된 메시지 리스트
+            매칭된 메시지 리스트 (archive 사용 시 아카이브 포함 최신 limit개)
         """
         messages = []
+        fetched = False
+        complete = False
+        scope = telegram_scope(channel, keyword)
+        min_id = None
+        if self.archive is not None:
+            if await run_blocking(self._is_fresh, scope):
+                return await run_blocking(self._merge_archive, channel, keyword, None, limit)
+            min_id = await run_blocking(self.archive.watermark, "telegram", scope)
 
         try:
-            async with get_client() as client:
-                entity = await client.get_entity(channel)
-
-                # Search API 사용 - 키워드로 직접 검색
-                async for msg in client.iter_messages(
-                    entity,
-                    search=keyword,  # 핵심: search 파라미터로 서버사이드 검색
-                    limit=limit,
-                ):
-                    if not msg.text:
-                        continue
-
-                    messages.append({
-                        "id": msg.id,
-                        "text": msg.text,
-                        "date": msg.date.strftime("%Y-%m-%d %H:%M:%S"),
-                        "views": getattr(msg, 'views', 0) or 0,
-                        "forwards": getattr(msg, 'forwards', 0) or 0,
-                        "source": "telegram",
-                        "channel": channel,
-                        "keyword": keyword,
-                    })
+            async with self.session() as client:
+                entity = await self._get_entity(client, channel)
+
+                for attempt in range(2):
+                    try:
+                        messages, complete = await self._iter_search(
+                            client, entity, channel, keyword, limit, min_id,
+                        )
+                        fetched = True
+                        break
+                    except Exception as e:
+                        # FloodWait: 서버가 지정한 시간만큼 쉬고 1회 재시도
+                        if attempt == 0 and _is_flood_wait(e):
+                            await asyncio.sleep(e.seconds)
+                            continue
+                        raise
 
         except Exception as e:
             print(f"[Telegram] Error searching '{keyword}' in @{channel}: {e}")
 
-        return messages
+        if self.archive is None:
+            return messages
+        if fetched and not complete:
+            print(f"[Telegram] '{keyword}' in @{channel}: 지난 수집 이후 메시지가 "
+                  f"{self.catchup_messages}개를 넘어 watermark 유지 (다음 수집에서 다시 받음)")
+        # 검색 실패 시에는 저장하지 않음 (확인 시각이 갱신되어 fresh로 취급되지 않도록)
+        return await run_blocking(
+            self._merge_archive, channel, keyword, messages if fetched else None, limit, complete,
+        )
+
+    def _is_fresh(self, scope: str) -> bool:
+        """검색 범위를 fresh_seconds 안에 수집했는지"""
+        return self.archive.is_fresh("telegram", scope, self.fresh_seconds)
+
+    def _merge_archive(
+        self,
+        channel: str,
+        keyword: str,
+        messages: Optional[List[dict]],
+        limit: int,
+        complete: bool = True,
+    ) -> List[dict]:
+        """
+        새로 받은 메시지를 아카이브에 저장하고 해당 검색의 최신 limit개 반환
+
+        이 키워드로 받은 메시지에 더해, 다른 키워드 검색으로 저장된 같은 채널 메시지 중
+        본문에 키워드가 있는 것도 포함한다. messages가 None이면 저장 없이 조회만 한다.
+        complete가 False(지난 수집 지점까지 못 받음)면 watermark는 그대로 둔다.
+        """
+        scope = telegram_scope(channel, keyword)
+        if messages is not None:
+            self.archive.record("telegram", scope, messages, complete=complete)
+        merged = {}
+        for msg in self.archive.get_messages("telegram", scope, limit):
+            merged[msg["id"]] = msg
+        for msg in self.archive.search(keyword, source="telegram", limit=limit, channel=channel):
+            merged.setdefault(msg["id"], msg)
+
+        archived = sorted(merged.values(), key=lambda m: m["id"], reverse=True)[:limit]
+        for msg in archived:
+            # 다른 키워드 검색으로 먼저 저장된 메시지일 수 있음
+            msg["keyword"] = keyword
+        return archived
+
+    async def _iter_search(
+        self,
+        client,
+        entity,
+        channel: str,
+        keyword: str,
+        limit: int,
+        min_id: Optional[int] = None,
+    ) -> Tuple[List[dict], bool]:
+        """
+        서버사이드 검색 결과를 메시지 dict 리스트로 변환
+
+        min_id가 있으면 limit 대신 catchup_messages개까지 받아 min_id 직전까지 이어 받는다.
+
+        Returns:
+            (메시지 리스트, min_id까지 모두 받았는지 - min_id 없으면 항상 True)
+        """
+        messages = []
+
+        # Search API 사용 - 키워드로 직접 검색 (핵심: search 파라미터로 서버사이드 검색)
+        kwargs = {"search": keyword, "limit": limit}
+        if min_id:
+            kwargs["min_id"] = min_id
+            kwargs["limit"] = max(limit, self.catchup_messages)
+        received = 0
+        async for msg in client.iter_messages(entity, **kwargs):
+            received += 1
+            if not msg.text:
+                continue
+
+            messages.append({
+                "id": msg.id,
+                "text": msg.text,
+                "date": msg.date.strftime("%Y-%m-%d %H:%M:%S"),
+                "views": getattr(msg, 'views', 0) or 0,
+                "forwards": getattr(msg, 'forwards', 0) or 0,
+                "source": "telegram",
+                "channel": channel,
+                "keyword": keyword,
+            })
+
+        # 요청한 수를 다 채웠으면 min_id 직전까지 닿았는지 알 수 없음
+        return messages, not min_id or received < kwargs["limit"]
+
+    async def _search_channel(
+        self,
+        channel: str,
+        keywords: List[str],
+        limit: int,
+        semaphore: asyncio.Semaphore,
+    ) -> List[List[dict]]:
+        """한 채널의 키워드 검색을 동시 실행 (키워드 순서대로 결과 반환)"""
+        async def _bounded(keyword: str) -> List[dict]:
+            async with semaphore:
+                return await self.search_messages(channel, keyword, limit=limit)
+
+        # entity를 먼저 한 번만 조회해 두면 키워드 검색들이 캐시를 공유
+        try:
+            async with semaphore:
+                await self._get_entity(self._client, channel)
+        except Exception as e:
+            print(f"[Telegram] Error resolving @{channel}: {e}")
+            return [[] for _ in keywords]
+
+        return await asyncio.gather(*(_bounded(kw) for kw in keywords))
+
+    async def _all_fresh(self, keywords: List[str]) -> bool:
+        """모든 (채널, 키워드) 검색이 아카이브에서 응답 가능한지"""
+        if self.archive is None:
+            return False
+
+        def _check() -> bool:
+            return all(
+                self._is_fresh(telegram_scope(channel, keyword))
+                for channel in self.channels
+                for keyword in keywords
+            )
+
+        return await run_blocking(_check)
 
     async def collect(
         self,
@@ -147,19 +336,35 @@ class TelegramCollector(BaseCollector):
         all_messages = []
         channel_stats = {}
 
-        for channel in self.channels:
+        channel_results = []
+        if self.channels and await self._all_fresh(all_keywords):
+            # 모든 검색이 아카이브로 응답 가능하면 클라이언트 연결 생략
+            channel_results = await asyncio.gather(*(
+                asyncio.gather(*(
+                    self.search_messages(channel, keyword, limit=limit_per_keyword)
+                    for keyword in all_keywords
+                ))
+                for channel in self.channels
+            ))
+        elif self.channels:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            try:
+                async with self.session():
+                    channel_results = await asyncio.gather(*(
+                        self._search_channel(channel, all_keywords, limit_per_keyword, semaphore)
+                        for channel in self.channels
+                    ))
+            except Exception as e:
+                print(f"[Telegram] Error opening session: {e}")
+                channel_results = [[[] for _ in all_keywords] for _ in self.channels]
+
+        for channel, keyword_results in zip(self.channels, channel_results):
             channel_messages = []
             keyword_counts = {}
+            seen_ids = set()
 
-            for keyword in all_keywords:
-                messages = await self.search_messages(
-                    channel,
-                    keyword,
-                    limit=limit_per_keyword,
-                )
-
+            for keyword, messages in zip(all_keywords, keyword_results):
                 # 중복 제거 (message id 기준)
-                seen_ids = {m["id"] for m in channel_messages}
                 for msg in messages:
                     if msg["id"] not in seen_ids:
                         # 매칭 타입 분류
@@ -192,6 +397,13 @@ class TelegramCollector(BaseCollector):
         }
 
 
+def _is_flood_wait(error: Exception) -> bool:
+    """대기 후 재시도할 만한 FloodWaitError 여부"""
+    if not TELETHON_AVAILABLE or not isinstance(error, FloodWaitError):
+        return False
+    return error.seconds <= FLOOD_WAIT_MAX_SECONDS
+
+
 # ============================================================
 # Legacy functions (하위 호환성 유지)
 # ============================================================
@@ -248,12 +460,13 @@ def filter_messages_by_ticker(
     direct_keywords = [ticker]
     if aliases:
         direct_keywords.extend(aliases)
+    matcher = KeywordMatcher({"direct": direct_keywords, "theme": theme_keywords or []})
 
     filtered = []
     for msg in messages:
-        text = msg.get("text", "")
+        hits = matcher.scan(msg.get("text", ""))
 
-        direct_match = [kw for kw in direct_keywords if kw in text]
+        direct_match = hits["direct"]
         if direct_match:
             filtered.append({
                 **msg,
@@ -262,14 +475,13 @@ def filter_messages_by_ticker(
             })
             continue
 
-        if theme_keywords:
-            theme_match = [kw for kw in theme_keywords if kw in text]
-            if theme_match:
-                filtered.append({
-                    **msg,
-                    "match_type": "theme",
-                    "matched_keywords": theme_match,
-                })
+        theme_match = hits["theme"]
+        if theme_match:
+            filtered.append({
+                **msg,
+                "match_type": "theme",
+                "matched_keywords": theme_match,
+            })
 
     return filtered
 
@@ -0,0 +1,108 @@
+"""SI+ 종목 검색어 해석
+
+Tier 1 종목 마스터(ticker_master)로 종목코드 ↔ 종목명/별칭을 해석한다.
+- 종목명/별칭으로 들어온 검색 대상 → 종목코드
+- 별칭을 지정하지 않은 수집 요청 → 마스터의 종목명/약칭으로 채움
+마스터는 Tier 1과 같은 디스크 캐시(거래일 단위)를 공유한다.
+"""
+
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from ..tier1_bridge import load_tier1_module
+
+logger = logging.getLogger(__name__)
+
+_ticker_master = load_tier1_module("ticker_master")
+_web_scraper = load_tier1_module("web_scraper")
+
+_CODE_PATTERN = re.compile(r"^[0-9A-Z]{6}$")
+
+
+def _fetch_rows(market: str) -> Optional[list]:
+    """마스터용 시장별 종목 목록 (네이버 시가총액 페이지 + KRX 상장일)"""
+    stocks = _web_scraper.get_naver_stock_list(market)
+    if not stocks:
+        return None
+    listing_dates = {}
+    if hasattr(_web_scraper, "get_krx_listing_dates"):
+        listing_dates = _web_scraper.get_krx_listing_dates(market) or {}
+    return [
+        {"code": s["code"], "name": s["name"], "listing_date": listing_dates.get(s["code"])}
+        for s in stocks
+    ]
+
+
+def get_master(refresh: bool = False):
+    """
+    거래일 단위 종목 마스터
+
+    Args:
+        refresh: True면 당일 마스터가 있어도 다시 생성
+
+    Returns:
+        TickerMaster or None (Tier 1 모듈 없음/생성 실패)
+    """
+    if _ticker_master is None or _web_scraper is None:
+        return None
+    try:
+        return _ticker_master.get_ticker_master(_fetch_rows, refresh=refresh)
+    except Exception as e:
+        logger.warning("종목 마스터 조회 실패: %s", e)
+        return None
+
+
+def is_ticker_code(text: str) -> bool:
+    """6자리 종목코드 형식인지"""
+    return bool(_CODE_PATTERN.match(text))
+
+
+def resolve_ticker(query: str) -> Optional[str]:
+    """
+    종목코드 또는 종목명/별칭 → 종목코드
+
+    Args:
+        query: "005930", "삼성전자", "삼전" 등
+
+    Returns:
+        종목코드 or None (마스터에 없음)
+    """
+    if is_ticker_code(query):
+        return query
+    master = get_master()
+    return master.code(query) if master is not None else None
+
+
+def resolve_aliases(ticker: str) -> List[str]:
+    """
+    종목 검색용 별칭 (종목명 + 약칭)
+
+    Args:
+        ticker: 종목코드
+
+    Returns:
+        ["삼성전자", "삼전"] (마스터에 없으면 빈 리스트)
+    """
+    master = get_master()
+    return master.aliases(ticker) if master is not None else []
+
+
+def resolve_search_terms(query: str, aliases: Optional[List[str]] = None) -> Tuple[str, List[str]]:
+    """
+    수집 요청의 (종목코드, 별칭) 확정
+
+    Args:
+        query: 종목코드 또는 종목명/별칭
+        aliases: 호출자가 지정한 별칭 (None이면 마스터 별칭 사용)
+
+    Returns:
+        (종목코드 - 해석 실패 시 query 그대로, 별칭 리스트)
+    """
+    ticker = resolve_ticker(query) or query
+    if aliases is None:
+        aliases = resolve_aliases(ticker)
+        # 종목명으로 요청했는데 마스터가 없으면 입력값 자체를 별칭으로 사용
+        if not aliases and ticker == query and not is_ticker_code(query):
+            aliases = [query]
+    return ticker, aliases
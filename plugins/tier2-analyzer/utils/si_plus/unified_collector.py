@@ -3,19 +3,24 @@
 여러 소스에서 센티먼트 데이터를 수집하고 통합 분석
 """
 import asyncio
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 from .base import (
     BaseCollector,
-    analyze_sentiment,
-    classify_rumor,
+    MessageClassifier,
+    run_blocking,
     get_sentiment_label,
     format_unified_report,
-    filter_spam,
 )
+from .message_archive import MessageArchive
+from .message_store import MessageStore
 from .telegram_collector import TelegramCollector
 from .reddit_collector import RedditCollector
 from .naver_collector import NaverCollector
+from .ticker_resolver import is_ticker_code, resolve_search_terms
+
+# 소스당 기본 수집 제한 시간 (초)
+DEFAULT_SOURCE_TIMEOUT = 90.0
 
 
 class UnifiedCollector:
@@ -24,6 +29,9 @@ class UnifiedCollector:
 
     여러 소스(Telegram, Reddit, Naver)에서
     센티먼트 데이터를 수집하고 통합 분석
+
+    소스들은 동시에 수집되며(전체 지연 = 가장 느린 소스),
+    제한 시간을 넘긴 소스는 제외하고 나머지 결과로 분석한다.
     """
 
     def __init__(
@@ -31,23 +39,28 @@ class UnifiedCollector:
         telegram_channels: Optional[List[str]] = None,
         reddit_subreddits: Optional[List[str]] = None,
         enable_naver: bool = True,
+        source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+        archive: Optional[MessageArchive] = None,
     ):
         """
         Args:
             telegram_channels: 텔레그램 채널 리스트
             reddit_subreddits: Reddit 서브레딧 리스트
             enable_naver: 네이버 종토방 수집 여부
+            source_timeout: 소스당 수집 제한 시간(초), None이면 무제한
+            archive: 메시지 아카이브 (텔레그램/네이버는 지난 수집 이후 메시지만 받음)
         """
+        self.source_timeout = source_timeout
         self.collectors: List[BaseCollector] = []
 
         if telegram_channels:
-            self.collectors.append(TelegramCollector(telegram_channels))
+            self.collectors.append(TelegramCollector(telegram_channels, archive=archive))
 
         if reddit_subreddits is not None:  # 빈 리스트도 허용 (전체 검색)
             self.collectors.append(RedditCollector(reddit_subreddits))
 
         if enable_naver:
-            self.collectors.append(NaverCollector())
+            self.collectors.append(NaverCollector(archive=archive))
 
     async def collect(
         self,
@@ -55,60 +68,64 @@ class UnifiedCollector:
         aliases: Optional[List[str]] = None,
         theme_keywords: Optional[List[str]] = None,
         limit_per_source: int = 50,
+        source_timeout: Optional[float] = None,
+        columnar: bool = False,
     ) -> Dict:
         """
-        모든 소스에서 수집
+        모든 소스에서 동시 수집
 
         Args:
             ticker: 종목코드
             aliases: 종목 별칭
             theme_keywords: 테마 키워드
             limit_per_source: 소스당 최대 메시지 수
+            source_timeout: 소스당 제한 시간(초), None이면 생성 시 설정값 사용
+            columnar: True면 소스별/통합 messages를 MessageStore(컬럼형)로 반환
+                (대량 수집 결과를 오래 들고 있을 때 메모리 절약, 기본은 dict 리스트)
 
         Returns:
-            통합 수집 결과
+            통합 수집 결과 (실패/시간초과 소스는 stats["failed_sources"]에 기록)
         """
-        results = []
+        timeout = self.source_timeout if source_timeout is None else source_timeout
 
-        for collector in self.collectors:
-            try:
-                result = await collector.collect(
-                    ticker=ticker,
-                    aliases=aliases,
-                    theme_keywords=theme_keywords,
-                    limit_per_keyword=limit_per_source,
-                )
-                results.append(result)
-                print(f"[{collector.source_name}] 수집 완료: {result['stats']['total_messages']}개")
+        outcomes = await asyncio.gather(*(
+            self._collect_source(
+                collector,
+                timeout,
+                ticker=ticker,
+                aliases=aliases,
+                theme_keywords=theme_keywords,
+                limit_per_keyword=limit_per_source,
+            )
+            for collector in self.collectors
+        ))
 
-            except Exception as e:
-                print(f"[{collector.source_name}] 수집 실패: {e}")
-                continue
+        results = []
+        failed_sources = {}
+        for collector, (result, error) in zip(self.collectors, outcomes):
+            if error:
+                failed_sources[collector.source_name] = error
+            else:
+                results.append(result)
 
-        # 모든 메시지 통합
-        all_messages = []
+        # 모든 메시지를 한 번씩 분류 (스팸/센티먼트/루머/테마 집계)
+        classifier = MessageClassifier()
         for result in results:
-            all_messages.extend(result.get("messages", []))
+            classifier.extend(result.get("messages", []))
+        classified = classifier.result()
 
-        # 스팸 필터링
-        spam_count = len(all_messages)
-        all_messages = filter_spam(all_messages)
-        spam_count = spam_count - len(all_messages)
+        all_messages = classified["messages"]
+        if columnar:
+            # 메시지 dict 리스트 → 컬럼형 저장소 (결과를 들고 있는 동안 메모리 절약)
+            all_messages = MessageStore.from_messages(all_messages)
+            for result in results:
+                result["messages"] = MessageStore.from_messages(result.get("messages", []))
+
+        spam_count = classified["spam_count"]
         if spam_count > 0:
             print(f"[Spam Filter] {spam_count}개 스팸 제거됨")
 
-        # 통합 분석
-        sentiment = analyze_sentiment(all_messages) if all_messages else {}
-
-        # 루머 분류
-        rumors = []
-        facts = []
-        for msg in all_messages:
-            classification = classify_rumor(msg.get("text", ""))
-            if classification["is_rumor"]:
-                rumors.append({**msg, "rumor_confidence": classification["confidence"]})
-            else:
-                facts.append({**msg, "fact_confidence": classification["confidence"]})
+        sentiment = classified["sentiment"]
 
         return {
             "ticker": ticker,
@@ -119,8 +136,10 @@ class UnifiedCollector:
                 "messages": all_messages,
                 "sentiment": sentiment,
                 "sentiment_label": get_sentiment_label(sentiment.get("score", 0)) if sentiment else "N/A",
-                "rumors": rumors[:10],
-                "facts": facts[:10],
+                "rumors": classified["rumors"],
+                "facts": classified["facts"],
+                "theme_counts": classified["theme_counts"],
+                "source_sentiment": classified["source_sentiment"],
             },
             "stats": {
                 "total_messages": len(all_messages),
@@ -134,10 +153,35 @@ class UnifiedCollector:
                 "theme_count": sum(
                     r.get("stats", {}).get("theme_count", 0) for r in results
                 ),
-                "rumor_ratio": len(rumors) / len(all_messages) if all_messages else 0,
+                "rumor_ratio": classified["rumor_count"] / len(all_messages) if all_messages else 0,
+                "failed_sources": failed_sources,
             },
         }
 
+    @staticmethod
+    async def _collect_source(
+        collector: BaseCollector,
+        timeout: Optional[float],
+        **kwargs,
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        단일 소스 수집 (제한 시간 적용)
+
+        Returns:
+            (결과, None) 또는 (None, 실패 사유)
+        """
+        try:
+            result = await asyncio.wait_for(collector.collect(**kwargs), timeout=timeout)
+        except asyncio.TimeoutError:
+            print(f"[{collector.source_name}] 수집 시간 초과 ({timeout}초)")
+            return None, "timeout"
+        except Exception as e:
+            print(f"[{collector.source_name}] 수집 실패: {e}")
+            return None, str(e) or type(e).__name__
+
+        print(f"[{collector.source_name}] 수집 완료: {result['stats']['total_messages']}개")
+        return result, None
+
     def generate_report(
         self,
         result: Dict,
@@ -171,18 +215,24 @@ async def collect_all_sources(
     enable_reddit: bool = True,
     enable_naver: bool = True,
     limit_per_source: int = 50,
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+    archive: Optional[MessageArchive] = None,
+    columnar: bool = False,
 ) -> Dict:
     """
     모든 소스에서 센티먼트 수집 (편의 함수)
 
     Args:
-        ticker: 종목코드
-        aliases: 종목 별칭
+        ticker: 종목코드 (종목명/별칭도 가능 - 종목 마스터로 종목코드 변환)
+        aliases: 종목 별칭 (None이면 종목 마스터의 종목명/약칭 사용)
         theme_keywords: 테마 키워드
         telegram_channels: 텔레그램 채널 (없으면 텔레그램 스킵)
         enable_reddit: Reddit 수집 여부
         enable_naver: 네이버 수집 여부
         limit_per_source: 소스당 최대 메시지 수
+        source_timeout: 소스당 제한 시간(초)
+        archive: 메시지 아카이브 (지정 시 텔레그램/네이버는 증분 수집)
+        columnar: True면 messages를 MessageStore로 반환 (UnifiedCollector.collect 참고)
 
     Returns:
         통합 수집 결과
@@ -202,13 +252,19 @@ async def collect_all_sources(
         telegram_channels=telegram_channels,
         reddit_subreddits=[] if enable_reddit else None,
         enable_naver=enable_naver,
+        source_timeout=source_timeout,
+        archive=archive,
     )
 
+    if aliases is None or not is_ticker_code(ticker):
+        ticker, aliases = await run_blocking(resolve_search_terms, ticker, aliases)
+
     return await collector.collect(
         ticker=ticker,
         aliases=aliases,
         theme_keywords=theme_keywords,
         limit_per_source=limit_per_source,
+        columnar=columnar,
     )
 
 
@@ -220,6 +276,9 @@ def collect_all_sources_sync(
     enable_reddit: bool = True,
     enable_naver: bool = True,
     limit_per_source: int = 50,
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+    archive: Optional[MessageArchive] = None,
+    columnar: bool = False,
 ) -> Dict:
     """
     모든 소스에서 센티먼트 수집 (동기 래퍼)
@@ -232,4 +291,7 @@ def collect_all_sources_sync(
         enable_reddit=enable_reddit,
         enable_naver=enable_naver,
         limit_per_source=limit_per_source,
+        source_timeout=source_timeout,
+        archive=archive,
+        columnar=columnar,
     ))
@@ -0,0 +1,56 @@
+"""Tier 1 모듈 로더
+
+Tier 1(stock-analyzer-advanced)과 Tier 2는 둘 다 최상위 패키지명이 `utils`라
+Tier 1 utils 디렉토리를 별도 패키지 `tier1_utils`로 등록하고 그 하위 모듈로 로드한다.
+Tier 1 모듈끼리는 패키지 상대 import(`from .ohlcv_store import ...`)를 쓰므로
+함수 안의 지연 import까지 모두 Tier 1 모듈로 해석된다.
+로드한 모듈은 sys.modules에 `tier1_utils.<name>`으로 등록하여 한 번만 실행되게 하고,
+세션/rate limit 같은 모듈 상태를 Tier 1 코드와 공유한다.
+"""
+
+import importlib
+import sys
+import threading
+import types
+from pathlib import Path
+
+# Tier 1 utils 경로
+TIER1_UTILS = Path(__file__).parent.parent.parent / "stock-analyzer-advanced" / "utils"
+
+# Tier 1 utils를 등록할 패키지명
+TIER1_PACKAGE = "tier1_utils"
+
+_package_lock = threading.Lock()
+
+
+def _tier1_package() -> types.ModuleType:
+    """
+    Tier 1 utils 패키지 모듈 (하위 모듈 검색 경로만 지정)
+
+    Tier 1 `utils/__init__.py`는 모든 모듈(pykrx 등 선택 의존성 포함)을 import하므로
+    실행하지 않고, 필요한 하위 모듈만 import 시점에 로드되게 한다.
+    """
+    with _package_lock:
+        package = sys.modules.get(TIER1_PACKAGE)
+        if package is None:
+            package = types.ModuleType(TIER1_PACKAGE, "Tier 1 (stock-analyzer-advanced) utils")
+            package.__path__ = [str(TIER1_UTILS)]
+            package.__package__ = TIER1_PACKAGE
+            sys.modules[TIER1_PACKAGE] = package
+        return package
+
+
+def load_tier1_module(module_name: str):
+    """
+    Tier 1 모듈 동적 로드 (캐시)
+
+    Args:
+        module_name: Tier 1 utils 모듈명 (예: "web_scraper")
+
+    Returns:
+        로드된 모듈 or None (파일 없음)
+    """
+    if not (TIER1_UTILS / f"{module_name}.py").exists():
+        return None
+    _tier1_package()
+    return importlib.import_module(f"{TIER1_PACKAGE}.{module_name}")